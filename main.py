@@ -3,16 +3,40 @@
 # 이 파일을 직접 실행하면 웹 서버가 구동됩니다.
 
 import uvicorn
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from pqc_inspector_server.core.config import settings
 from pqc_inspector_server.api.endpoints import api_router
+from pqc_inspector_server.core.container import get_container
+from pqc_inspector_server.services.job_queue import get_job_queue
+from pqc_inspector_server.services.local_embedding import warm_up_embedding_backend
+from pqc_inspector_server.services.loop_monitor import get_loop_lag_monitor
+
+
+# 0. 애플리케이션 수명주기(lifespan) 관리
+# 서버 시작 시 오케스트레이터, 에이전트, API 클라이언트 등 공유 객체를 한 번만 만들고,
+# 종료 시 열린 커넥션들을 정리합니다.
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    container = get_container()
+    container.startup()
+    await warm_up_embedding_backend()  # EMBEDDING_BACKEND=local이면 첫 RAG 검색 전에 모델을 미리 로드
+    if settings.EVENT_LOOP_MONITOR_ENABLED:
+        get_loop_lag_monitor().start()  # 이벤트 루프 지연 측정 (/metrics/event-loop)
+    if get_job_queue() is None:
+        container.scheduler.start()  # 분석 작업 워커 시작 (공유 대기열 사용 시 pqc_worker.py가 처리)
+    yield
+    await get_loop_lag_monitor().stop()
+    await container.shutdown()
+
 
 # 1. FastAPI 애플리케이션 객체 생성
 # 이 'app' 객체가 전체 웹 애플리케이션의 중심이 됩니다.
 app = FastAPI(
     title=settings.PROJECT_NAME,
     description="비양자내성암호(Non-PQC) 탐지를 위한 AI 기반 분석 서버",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan
 )
 
 # 2. 루트(Root) 엔드포인트 정의
@@ -2,13 +2,22 @@
 # 🔧 어셈블리 및 바이너리 파일 분석을 담당하는 전문 에이전트입니다.
 
 from .base_agent import BaseAgent
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Sequence, Set
 from ..core.config import settings
+from ..services.ai_service import AIService
+from ..services.binary_format import BinaryInfo, parse_binary
+from ..services.preprocessing import ExtractedString, SectionRange, extract_strings
+from ..services.signature_scanner import get_signature_scanner
+from ..services.validation_policy import PUBLIC_KEY_HIT_RE
+from ..services.constant_scanner import format_constant_evidence, get_constant_scanner
+from bisect import bisect_right
+import asyncio
 import json
+import time
 
 class AssemblyBinaryAgent(BaseAgent):
-    def __init__(self):
-        super().__init__(settings.BINARY_MODEL, "assembly_binary")
+    def __init__(self, ai_service: Optional[AIService] = None):
+        super().__init__(settings.BINARY_MODEL, "assembly_binary", ai_service)
         print("AssemblyBinaryAgent가 초기화되었습니다.")
 
     def _get_system_prompt(self) -> str:
@@ -29,16 +38,47 @@ class AssemblyBinaryAgent(BaseAgent):
     "confidence_score": 0.0-1.0
 }"""
 
-    async def analyze(self, file_content: bytes, file_name: str) -> Dict[str, Any]:
+    async def analyze(self, file_content: bytes, file_name: str, scan: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         print(f"BinaryAgent: '{file_name}' 파일 분석 중...")
         
         try:
+            # ELF/PE/Mach-O 헤더에서 링크 라이브러리/임포트/익스포트 심볼과 섹션 범위 추출
+            # 심볼 테이블이 큰 바이너리는 파싱에 시간이 걸리므로 스레드에서 실행합니다.
+            binary_info = None
+            if settings.BINARY_FORMAT_PARSING_ENABLED:
+                binary_info = await asyncio.to_thread(parse_binary, file_content)
+            symbol_evidence = self._format_binary_info(binary_info) if binary_info and binary_info.has_symbols else ""
+
             # 바이너리 파일의 경우 헥스 덤프 또는 문자열 추출
-            content_text = self._extract_strings_from_binary(file_content)
+            # 심볼 근거가 있으면 문자열은 시그니처가 일치하는 것만 짧게 보냅니다.
+            # 파일 전체를 훑는 CPU 작업이므로 이벤트 루프를 막지 않도록 스레드에서 실행합니다.
+            content_text = await asyncio.to_thread(
+                self._extract_strings_from_binary,
+                file_content,
+                sections=binary_info.sections if binary_info else None,
+                relevant_only=bool(symbol_evidence)
+            )
+            strings_limit = settings.BINARY_STRINGS_WITH_SYMBOLS_CHARS if symbol_evidence else 3000
+
+            # 원시 바이트에서 암호 상수(S-box, 초기값, 공개 지수 등) 검색
+            # 오케스트레이터의 사전 스캔에 상수 스캔 결과가 있으면 파일을 다시 훑지 않습니다.
+            constant_evidence = []
+            if settings.CONSTANT_SCAN_ENABLED:
+                constant_scan = scan.get("constant_scan") if scan else None
+                if constant_scan is None:
+                    constant_scan = await asyncio.to_thread(get_constant_scanner().scan, file_content)
+                constant_evidence = format_constant_evidence(constant_scan)
+                print(f"   🧬 암호 상수 스캔: {len(constant_scan['hits'])}종 일치 ({constant_scan['duration']:.3f}초)")
+            if constant_evidence:
+                constant_hint = "\n[정적 상수 스캔 결과]\n" + "\n".join(constant_evidence) + "\n"
+            else:
+                constant_hint = ""
+
+            symbol_hint = f"\n[바이너리 구조 정보]\n{symbol_evidence}\n\n" if symbol_evidence else ""
 
             # RAG 컨텍스트 검색 (개선: top_k=2, 길이 1500자)
             print(f"   🧠 RAG 컨텍스트 검색 중...")
-            rag_context = await self._get_rag_context(content_text[:1500], top_k=2)
+            rag_context = await self._get_rag_context((symbol_evidence + "\n" + content_text)[:1500], top_k=2)
 
             # 조건부 RAG 사용: 컨텍스트가 의미있을 때만 포함
             if rag_context and "관련 지식이 없습니다" not in rag_context:
@@ -58,17 +98,17 @@ class AssemblyBinaryAgent(BaseAgent):
 {context_hint}
 [분석 대상 바이너리]
 파일명: {file_name}
-추출된 문자열:
+{symbol_hint}추출된 문자열:
 ```
-{content_text[:3000]}  # 처음 3000자 분석 (확장됨)
+{content_text[:strings_limit]}
 ```
-
+{constant_hint}
 중요: 위의 힌트는 참고만 하고, 실제 바이너리 문자열을 직접 분석하여 암호화 알고리즘 사용 여부를 판단하세요.
 발견된 문자열이 실제로 암호화 알고리즘과 관련이 있는지 신중히 평가하세요.
 
 JSON 형식으로만 응답해주세요."""
 
-            llm_response = await self._call_llm(prompt)
+            llm_response = await self._call_llm(prompt, file_content=symbol_evidence + "\n" + content_text, scan=scan)
             
             if llm_response.get("success"):
                 try:
@@ -89,6 +129,10 @@ JSON 형식으로만 응답해주세요."""
                             else:
                                 result["evidence"] = str(result["evidence"])
 
+                        # 상수 스캔 일치 위치를 근거에 덧붙입니다.
+                        if constant_evidence:
+                            result["evidence"] = "\n".join([result.get("evidence") or ""] + constant_evidence).strip()
+
                         return result
                     else:
                         raise ValueError("JSON 형식을 찾을 수 없음")
@@ -104,44 +148,115 @@ JSON 형식으로만 응답해주세요."""
             print(f"BinaryAgent 분석 중 오류: {e}")
             return self._get_default_result(file_name, f"분석 오류: {str(e)}")
 
-    def _extract_strings_from_binary(self, file_content: bytes) -> str:
+    def _extract_strings_from_binary(
+        self,
+        file_content: bytes,
+        sections: Optional[Sequence[SectionRange]] = None,
+        relevant_only: bool = False
+    ) -> str:
         """
-        바이너리에서 의미있는 문자열을 추출합니다.
+        바이너리 전체에서 ASCII/UTF-16LE 문자열을 추출하여 "[오프셋 (섹션)] 문자열" 형식의 텍스트로 반환합니다.
 
-        스캔 범위 확장:
-        - 바이너리 스캔: 5KB → 50KB
-        - 최대 문자열 수: 50개 → 200개
+        파일 전체를 bytes 정규식으로 한 번에 훑으며, 시그니처가 일치하는 문자열을 먼저 고른 뒤 나머지 문자열로
+        최대 BINARY_MAX_STRINGS개까지 채웁니다 (.rodata 깊숙한 곳의 암호 문자열도 프롬프트에 포함).
+        sections가 주어지면 각 문자열에 소속 섹션 이름을 붙이고, relevant_only이면 시그니처 일치 문자열만 반환합니다.
         """
         try:
-            # 출력 가능한 ASCII 문자열 추출 (최소 길이 4)
-            strings = []
-            current_string = ""
+            start = time.perf_counter()
+            strings = extract_strings(
+                memoryview(file_content),
+                min_length=settings.BINARY_STRING_MIN_LENGTH,
+                utf16=settings.BINARY_EXTRACT_UTF16,
+                sections=sections
+            )
 
-            # 스캔 범위 확장: 5KB → 50KB
-            scan_size = min(len(file_content), 50000)
+            relevant = self._signature_matches([extracted.text for extracted in strings])
+            # 시그니처 일치 문자열 중에서는 긴 문자열(의미 있는 심볼/메시지일 가능성이 높음)을 먼저 고릅니다.
+            ordered = sorted(relevant, key=lambda index: (-len(strings[index].text), index))
+            if not relevant_only:
+                ordered += [index for index in range(len(strings)) if index not in relevant]
 
-            for byte in file_content[:scan_size]:
-                if 32 <= byte <= 126:  # 출력 가능한 ASCII
-                    current_string += chr(byte)
-                else:
-                    if len(current_string) >= 4:
-                        strings.append(current_string)
-                    current_string = ""
+            selected = []
+            seen = set()
+            for index in ordered:
+                extracted = strings[index]
+                if extracted.text in seen:
+                    continue
+                seen.add(extracted.text)
+                selected.append(extracted)
+                if len(selected) >= settings.BINARY_MAX_STRINGS:
+                    break
+            # 프롬프트 앞부분에 시그니처 일치 문자열을, 그 뒤에 나머지를 각각 파일 내 순서로 배치합니다.
+            relevant_texts = {strings[index].text for index in relevant}
+            selected.sort(key=lambda extracted: (extracted.text not in relevant_texts, extracted.offset))
 
-            if len(current_string) >= 4:
-                strings.append(current_string)
-
-            # 최대 문자열 수 확장: 50개 → 200개
-            result = "\n".join(strings[:200])
+            result = "\n".join(self._format_string(extracted) for extracted in selected) or "(시그니처 일치 문자열 없음)"
 
             # 통계 출력
-            print(f"   📊 바이너리 스캔 완료: {scan_size:,}바이트, {len(strings)}개 문자열 추출 (상위 200개 사용)")
+            utf16_count = sum(1 for extracted in strings if extracted.encoding == "utf-16le")
+            print(f"   📊 바이너리 스캔 완료: {len(file_content):,}바이트, {len(strings)}개 문자열 추출 "
+                  f"(UTF-16LE {utf16_count}개, 시그니처 일치 {len(relevant)}개, 상위 {len(selected)}개 사용, "
+                  f"{(time.perf_counter() - start) * 1000:.1f}ms)")
 
             return result
 
         except Exception as e:
             return f"문자열 추출 실패: {str(e)}"
 
+    @staticmethod
+    def _signature_matches(texts: List[str]) -> Set[int]:
+        """시그니처가 일치하는 텍스트의 인덱스 집합 (한 줄씩 이어 붙여 한 번에 검색)"""
+        joined = "\n".join(texts)
+        line_starts = []
+        position = 0
+        for text in texts:
+            line_starts.append(position)
+            position += len(text) + 1
+        return {
+            bisect_right(line_starts, offset) - 1
+            for offset in get_signature_scanner().match_offsets(joined)
+        }
+
+    def _format_binary_info(self, info: BinaryInfo) -> str:
+        """
+        헤더 파싱 결과를 프롬프트용 요약으로 만듭니다.
+        링크된 라이브러리는 최대 20개, 임포트/익스포트는 시그니처가 일치하는 심볼을 합계 최대 BINARY_MAX_SYMBOLS개까지 넣습니다.
+        """
+        lines = [f"형식: {info.describe()}"]
+        if info.libraries:
+            lines.append(f"링크된 라이브러리: {', '.join(info.libraries[:20])}")
+
+        # 임포트와 익스포트가 심볼 수 상한을 나눠 씁니다.
+        limit = max(1, settings.BINARY_MAX_SYMBOLS // 2)
+        for label, symbols in (("임포트", info.imports), ("익스포트", info.exports)):
+            if not symbols:
+                continue
+            # 시그니처 일치 심볼 중 공개키 알고리즘(RSA/EC/DH 등) 관련 심볼을 먼저 보여줍니다.
+            relevant = sorted(
+                self._signature_matches(symbols),
+                key=lambda index: (not PUBLIC_KEY_HIT_RE.search(symbols[index].lower()), index)
+            )
+            shown = ", ".join(symbols[index] for index in relevant[:limit]) or "없음"
+            if len(relevant) > limit:
+                shown += f" 외 {len(relevant) - limit}개"
+            lines.append(f"{label} 심볼 (암호 관련 {len(relevant)}개 / 전체 {len(symbols)}개): {shown}")
+            if label == "임포트" and not relevant:
+                # 암호 관련 임포트가 없을 때는 바이너리 성격을 알 수 있도록 일부만 보여줍니다.
+                lines.append(f"기타 임포트 (일부): {', '.join(symbols[:10])}")
+
+        print(f"   🧩 {info.describe()}: 라이브러리 {len(info.libraries)}개, 임포트 {len(info.imports)}개, "
+              f"익스포트 {len(info.exports)}개, 섹션 {len(info.sections)}개")
+        return "\n".join(lines)
+
+    @staticmethod
+    def _format_string(extracted: ExtractedString) -> str:
+        location = f"0x{extracted.offset:08x}"
+        if extracted.section:
+            location += f" {extracted.section}"
+        if extracted.encoding != "ascii":
+            location += f" {extracted.encoding}"
+        return f"[{location}] {extracted.text}"
+
     def _get_default_result(self, file_name: str, error_detail: str) -> Dict[str, Any]:
         """기본/오류 결과를 반환합니다."""
         return {
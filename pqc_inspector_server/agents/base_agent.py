@@ -1,10 +1,13 @@
 # File: pqc_inspector_server/agents/base_agent.py
 # 🤖 모든 전문 분석 에이전트들이 상속받을 추상 기본 클래스입니다.
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional
 from ..services.ai_service import AIService, get_ai_service
 from ..services.knowledge_manager import KnowledgeManager
+from ..services.model_cascade import get_cascade_model, get_model_cascade
+from ..services.signature_scanner import get_signature_scanner
 from ..api.schemas import AgentAnalysisResult
 
 class BaseAgent(ABC):
@@ -13,10 +16,11 @@ class BaseAgent(ABC):
     모든 에이전트는 'analyze' 메소드를 반드시 구현해야 합니다.
     """
     
-    def __init__(self, model_name: str, agent_type: str):
+    def __init__(self, model_name: str, agent_type: str, ai_service: Optional[AIService] = None):
         self.model_name = model_name
         self.agent_type = agent_type
-        self.ai_service = get_ai_service()
+        # 애플리케이션 컨테이너가 넘겨준 AIService를 사용해야 캐시/요청 한도/서킷 브레이커를 오케스트레이터와 공유합니다.
+        self.ai_service = ai_service or get_ai_service()
         self.system_prompt = self._get_system_prompt()
         self.knowledge_manager: Optional[KnowledgeManager] = None
 
@@ -31,29 +35,66 @@ class BaseAgent(ABC):
         pass
     
     @abstractmethod
-    async def analyze(self, file_content: bytes, file_name: str) -> Dict[str, Any]:
+    async def analyze(
+        self,
+        file_content: bytes,
+        file_name: str,
+        scan: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """
         파일 내용을 분석하여 결과를 딕셔너리 형태로 반환합니다.
 
         Args:
             file_content (bytes): 분석할 파일의 내용입니다.
             file_name (str): 분석할 파일의 이름입니다.
+            scan (dict, optional): 오케스트레이터가 이미 실행한 시그니처 사전 스캔 결과입니다.
 
         Returns:
             Dict[str, Any]: AgentAnalysisResult 스키마와 호환되는 분석 결과
         """
         pass
     
-    async def _call_llm(self, prompt: str) -> Dict[str, Any]:
+    async def _call_llm(
+        self,
+        prompt: str,
+        use_cache: bool = True,
+        file_content: Optional[str] = None,
+        scan: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """
         AI 모델을 호출하고 응답을 받습니다.
+        use_cache=False이면 응답 캐시를 우회하며, 주 모델 실패 시 에이전트별 폴백 체인을 사용합니다.
+        에이전트 응답은 JSON이므로 최상위 객체가 닫히는 즉시 스트림을 종료합니다.
+        캐스케이드 모드에서는 저렴한 모델을 먼저 호출하고, 답이 불확실하거나 정적 스캔과
+        어긋날 때만 에이전트의 기본 모델로 다시 호출합니다.
+        정적 스캔은 오케스트레이터가 넘겨준 scan을 그대로 쓰고, 없을 때만 file_content를 스레드에서
+        스캔합니다 (사전 필터 통계에는 포함하지 않음).
         """
+        cheap_model = get_cascade_model(self.agent_type)
+        if not cheap_model or cheap_model == self.model_name:
+            return await self._generate(self.model_name, prompt, use_cache)
+
+        if scan is None and file_content is not None:
+            scan = await asyncio.to_thread(get_signature_scanner().scan, file_content, record_stats=False)
+        return await get_model_cascade().run(
+            agent_type=self.agent_type,
+            cheap_model=cheap_model,
+            strong_model=self.model_name,
+            call=lambda model: self._generate(model, prompt, use_cache),
+            scan=scan
+        )
+
+    async def _generate(self, model: str, prompt: str, use_cache: bool) -> Dict[str, Any]:
+        # 캐스케이드 1단계 모델은 실패 시 폴백 체인 대신 바로 2단계로 넘어가도록 역할을 지정하지 않습니다.
         return await self.ai_service.generate_response(
-            model=self.model_name,
+            model=model,
             prompt=prompt,
-            system_prompt=self.system_prompt
+            system_prompt=self.system_prompt,
+            use_cache=use_cache,
+            role=self.agent_type if model == self.model_name else None,
+            stop_at_json=True
         )
-    
+
     def _get_similarity_threshold(self) -> float:
         """
         에이전트별 RAG 유사도 임계값을 반환합니다.
@@ -2,13 +2,14 @@
 # 📜 로그 및 설정 파일 분석을 담당하는 전문 에이전트입니다.
 
 from .base_agent import BaseAgent
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from ..core.config import settings
+from ..services.ai_service import AIService
 import json
 
 class LogsConfigAgent(BaseAgent):
-    def __init__(self):
-        super().__init__(settings.LOG_CONF_MODEL, "logs_config")
+    def __init__(self, ai_service: Optional[AIService] = None):
+        super().__init__(settings.LOG_CONF_MODEL, "logs_config", ai_service)
         print("LogsConfigAgent가 초기화되었습니다.")
 
     def _get_system_prompt(self) -> str:
@@ -30,7 +31,7 @@ class LogsConfigAgent(BaseAgent):
     "confidence_score": 0.0-1.0
 }"""
 
-    async def analyze(self, file_content: bytes, file_name: str) -> Dict[str, Any]:
+    async def analyze(self, file_content: bytes, file_name: str, scan: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         print(f"LogConfAgent: '{file_name}' 파일 분석 중...")
 
         try:
@@ -68,7 +69,7 @@ JSON 형식으로만 응답해주세요."""
 
 JSON 형식으로만 응답해주세요."""
 
-            llm_response = await self._call_llm(prompt)
+            llm_response = await self._call_llm(prompt, file_content=content_text, scan=scan)
 
             if llm_response.get("success"):
                 try:
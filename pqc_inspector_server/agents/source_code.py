@@ -2,13 +2,17 @@
 # 👨‍💻 소스코드 분석을 담당하는 전문 에이전트입니다.
 
 from .base_agent import BaseAgent
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 from ..core.config import settings
+from ..services.ai_service import AIService
+from ..services.code_chunker import CodeChunk, merge_chunk_results, score_chunks, select_chunks, split_code_chunks
+from ..services.signature_scanner import get_signature_scanner
+import asyncio
 import json
 
 class SourceCodeAgent(BaseAgent):
-    def __init__(self):
-        super().__init__(settings.SOURCE_CODE_MODEL, "source_code")
+    def __init__(self, ai_service: Optional[AIService] = None):
+        super().__init__(settings.SOURCE_CODE_MODEL, "source_code", ai_service)
         print("SourceCodeAgent가 초기화되었습니다.")
 
     def _get_system_prompt(self) -> str:
@@ -31,17 +35,69 @@ Response format (JSON ONLY):
     "confidence_score": number_between_0_and_1
 }"""
 
-    async def analyze(self, file_content: bytes, file_name: str) -> Dict[str, Any]:
+    async def analyze(self, file_content: bytes, file_name: str, scan: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         print(f"   🔬 SourceCodeAgent 분석 시작: {file_name}")
 
         try:
             content_text = self._parse_file_content(file_content)
             print(f"   📝 소스코드 파싱 완료 (길이: {len(content_text)} chars)")
 
+            if settings.SOURCE_CODE_CHUNKING_ENABLED and len(content_text) > settings.SOURCE_CODE_CHUNK_MAX_CHARS:
+                return await self._analyze_chunked(content_text, file_name)
+
             # RAG 컨텍스트 검색
             print(f"   🧠 RAG 컨텍스트 검색 중...")
             rag_context = await self._get_rag_context(content_text[:1000], top_k=3)
+            return await self._analyze_code(content_text[:2000], file_name, rag_context, scan)
 
+        except Exception as e:
+            print(f"   ❌ SourceCodeAgent 분석 중 오류: {e}")
+            return self._get_default_result(file_name, f"분석 오류: {str(e)}")
+
+    async def _analyze_chunked(self, content_text: str, file_name: str) -> Dict[str, Any]:
+        """
+        큰 파일을 함수/클래스 경계의 청크로 나누고, 암호 관련도가 높은 상위 청크만 동시에 분석한 뒤 결과를 병합합니다.
+        """
+        # 큰 파일 전체를 훑는 CPU 작업이므로 이벤트 루프를 막지 않도록 스레드에서 실행합니다.
+        chunks = await asyncio.to_thread(self._split_and_score, content_text)
+        selected = select_chunks(chunks, settings.SOURCE_CODE_MAX_CHUNKS, settings.SOURCE_CODE_CHUNK_TOKEN_BUDGET)
+        print(f"   ✂️ 청크 분할: {len(chunks)}개 중 암호 관련 상위 {len(selected)}개 분석 "
+              f"({', '.join(chunk.line_range for chunk in selected) or '없음'})")
+
+        if not selected:
+            # 암호 관련 청크가 없으면 파일 앞부분만 분석합니다.
+            rag_context = await self._get_rag_context(content_text[:1000], top_k=3)
+            return await self._analyze_code(content_text[:settings.SOURCE_CODE_CHUNK_MAX_CHARS], file_name, rag_context)
+
+        # RAG 컨텍스트는 관련도가 가장 높은 청크로 한 번만 검색하여 모든 청크 프롬프트에 공유합니다.
+        top_chunk = max(selected, key=lambda chunk: (chunk.score, -chunk.index))
+        print(f"   🧠 RAG 컨텍스트 검색 중... (기준 청크 {top_chunk.line_range})")
+        rag_context = await self._get_rag_context(top_chunk.text[:1000], top_k=3)
+
+        chunk_results = await asyncio.gather(*(
+            self._analyze_code(chunk.text, f"{file_name} ({chunk.line_range})", rag_context, chunk.scan)
+            for chunk in selected
+        ))
+        merged = merge_chunk_results(list(chunk_results), selected, len(chunks))
+        if merged is None:
+            return self._get_default_result(file_name, "모든 청크 분석 실패")
+
+        print(f"   🧩 청크 결과 병합: 취약점 {merged['is_pqc_vulnerable']}, 알고리즘 {merged['detected_algorithms']}")
+        return merged
+
+    def _split_and_score(self, content_text: str) -> List[CodeChunk]:
+        """함수/클래스 경계로 청크를 나누고 시그니처 스캔으로 관련도를 매깁니다."""
+        return score_chunks(split_code_chunks(content_text, settings.SOURCE_CODE_CHUNK_MAX_CHARS), get_signature_scanner())
+
+    async def _analyze_code(
+        self,
+        code: str,
+        file_name: str,
+        rag_context: str,
+        scan: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """코드 조각 하나에 대해 LLM을 호출하고 JSON 결과를 파싱합니다. scan은 캐스케이드 판단에 쓸 정적 스캔 결과입니다."""
+        try:
             # RAG가 포함된 강화된 프롬프트 생성
             prompt = f"""Analyze the following source code file for non-quantum-resistant cryptography usage.
 
@@ -52,7 +108,7 @@ Based on the expert knowledge above, analyze this code:
 File: {file_name}
 Code:
 ```
-{content_text[:2000]}
+{code}
 ```
 
 You MUST respond ONLY with valid JSON in exactly this format:
@@ -68,7 +124,7 @@ You MUST respond ONLY with valid JSON in exactly this format:
 Do not include any explanation or text outside the JSON."""
 
             print(f"   🤖 {self.model_name} 모델 호출 준비 중...")
-            llm_response = await self._call_llm(prompt)
+            llm_response = await self._call_llm(prompt, file_content=code, scan=scan)
 
             if llm_response.get("success"):
                 print(f"   ✅ {self.model_name} 응답 수신 완료")
@@ -2,12 +2,28 @@
 # 🌐 사용자의 HTTP 요청을 처리하는 API 엔드포인트를 정의하는 파일입니다.
 # FastAPI의 APIRouter를 사용하여 관련 엔드포인트들을 그룹화합니다.
 
-from fastapi import APIRouter, UploadFile, File, Depends, HTTPException, BackgroundTasks
+from fastapi import APIRouter, UploadFile, File, Depends, HTTPException, Query
 from typing import Annotated
 import uuid
 
-from .schemas import AnalysisRequestResponse, AnalysisResultSchema
+from .schemas import AnalysisRequestResponse, AnalysisResultSchema, TaskStatusResponse
 from ..orchestrator.controller import OrchestratorController, get_orchestrator_controller
+from ..services.ai_service import AIService
+from ..services.job_scheduler import JobScheduler, JobPriority, QueueFullError
+from ..services.job_queue import get_job_queue
+from ..services.result_store import TaskStatus
+from ..services.signature_scanner import get_signature_scanner
+from ..services.file_classifier import get_file_classifier
+from ..services.validation_policy import get_validation_policy
+from ..services.model_cascade import get_model_cascade
+from ..services.constant_scanner import get_constant_scanner
+from ..services.embedding_cache import get_embedding_cache
+from ..services.embedding_service import get_embedding_model_name
+from ..services.local_embedding import get_local_embedding_backend
+from ..services.embedding_batcher import get_embedding_batcher
+from ..services.loop_monitor import get_loop_lag_monitor
+from ..core.config import settings
+from ..core.container import get_shared_ai_service, get_shared_job_scheduler
 
 # API 라우터 객체 생성
 api_router = APIRouter()
@@ -15,26 +31,56 @@ api_router = APIRouter()
 # --- 엔드포인트 정의 ---
 @api_router.post("/analyze", response_model=AnalysisRequestResponse, status_code=202)
 async def analyze_file(
-    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
-    orchestrator: OrchestratorController = Depends(get_orchestrator_controller)
+    priority: str = Query("interactive", description="작업 우선순위 (interactive, bulk)"),
+    orchestrator: OrchestratorController = Depends(get_orchestrator_controller),
+    scheduler: JobScheduler = Depends(get_shared_job_scheduler)
 ):
     """
     파일을 업로드하여 비양자내성암호(Non-PQC) 사용 여부 분석을 요청합니다.
     
     분석은 백그라운드에서 처리되며, 요청 즉시 작업 ID를 반환합니다.
+    작업 대기열이 가득 차면 429 응답과 Retry-After 헤더를 반환합니다.
     """
     if not file.filename:
         raise HTTPException(status_code=400, detail="파일 이름이 없습니다.")
 
+    try:
+        job_priority = JobPriority.from_name(priority)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     task_id = str(uuid.uuid4())
     
     # 파일 내용을 미리 읽어서 백그라운드 태스크에 전달
     file_content = await file.read()
     filename = file.filename
+
+    # 작업을 pending 상태로 등록한 뒤 백그라운드 분석을 시작합니다.
+    await orchestrator.submit_task(task_id)
     
-    # 실제 분석 작업은 백그라운드에서 실행하여 응답 시간을 단축합니다.
-    background_tasks.add_task(orchestrator.start_analysis_with_content, filename, file_content, task_id)
+    # 실제 분석 작업은 작업 스케줄러의 워커(또는 공유 대기열을 구독하는 pqc_worker 프로세스)가 실행합니다.
+    job_queue = get_job_queue()
+    try:
+        if job_queue is None:
+            scheduler.submit(
+                task_id,
+                lambda: orchestrator.start_analysis_with_content(filename, file_content, task_id),
+                priority=job_priority
+            )
+        else:
+            await job_queue.enqueue(task_id, {"filename": filename}, data=file_content, priority=job_priority)
+    except QueueFullError as e:
+        await orchestrator.result_store.update(task_id, TaskStatus.FAILED, error=str(e))
+        raise HTTPException(
+            status_code=429,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)}
+        )
+    except Exception as e:
+        # 대기열 연결 오류 등으로 등록하지 못한 작업이 pending 상태로 영원히 남지 않도록 실패로 기록합니다.
+        await orchestrator.result_store.update(task_id, TaskStatus.FAILED, error=f"작업 대기열 등록 실패: {e}")
+        raise HTTPException(status_code=503, detail="분석 작업을 대기열에 등록하지 못했습니다. 잠시 후 다시 시도하세요.")
     
     return {"task_id": task_id, "message": "파일 분석 요청이 성공적으로 접수되었습니다. 백그라운드에서 분석이 진행됩니다."}
 
@@ -54,6 +100,21 @@ async def get_analysis_report(
     return result
 
 
+@api_router.get("/status/{task_id}", response_model=TaskStatusResponse)
+async def get_task_status(
+    task_id: str,
+    orchestrator: OrchestratorController = Depends(get_orchestrator_controller)
+):
+    """
+    주어진 작업 ID의 진행 상태(pending, running, done, failed)를 조회합니다.
+    """
+    record = await orchestrator.get_task_status(task_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail="해당 ID의 작업을 찾을 수 없습니다.")
+
+    return record
+
+
 @api_router.post("/analyze/db")
 async def analyze_from_database(
     file_id: int,
@@ -82,20 +143,122 @@ async def analyze_from_database(
         "message": "분석이 성공적으로 완료되었습니다.",
         "file_id": file_id,
         "scan_id": scan_id,
-        "analysis_preview": result.get("analysis", "")[:200] + "..."
+        "analysis_preview": result.get("analysis", "")[:200] + "...",
+        "agent_statuses": result.get("agent_statuses", {}),
+        "timings": result.get("timings", {})
     }
 
 
+@api_router.get("/metrics/llm")
+async def get_llm_metrics(
+    ai_service: AIService = Depends(get_shared_ai_service)
+):
+    """
+    LLM 호출 관련 지표(응답 캐시 적중률, 커넥션 풀 상태 등)를 조회합니다.
+    """
+    return ai_service.get_metrics()
+
+
+@api_router.get("/metrics/jobs")
+async def get_job_metrics(
+    scheduler: JobScheduler = Depends(get_shared_job_scheduler)
+):
+    """
+    분석 작업 스케줄러 지표(대기열 길이, 대기 시간, 처리/거부 건수)를 조회합니다.
+    공유 대기열을 사용하면 대기/임대/실패 작업 수도 함께 반환합니다.
+    """
+    job_queue = get_job_queue()
+    if job_queue is None:
+        return scheduler.get_stats()
+    return {"shared_queue": await job_queue.get_stats()}
+
+
+@api_router.get("/metrics/prefilter")
+async def get_prefilter_metrics():
+    """
+    시그니처 사전 필터 지표(검사 건수, LLM 없이 판정된 비율, 누적 스캔 시간)를 조회합니다.
+    """
+    return get_signature_scanner().get_stats()
+
+
+@api_router.get("/metrics/classifier")
+async def get_classifier_metrics():
+    """
+    로컬 파일 분류기 지표(판정 출처별 건수, 평균 분류 시간, 학습 샘플 수)를 조회합니다.
+    """
+    return get_file_classifier().get_stats()
+
+
+@api_router.get("/metrics/validation")
+async def get_validation_metrics():
+    """
+    오케스트레이터 검증 정책 지표(검증/생략 건수, 생략 비율, 사유별 건수)를 조회합니다.
+    """
+    return get_validation_policy().get_stats()
+
+
+@api_router.get("/metrics/cascade")
+async def get_cascade_metrics():
+    """
+    모델 캐스케이드 지표(에이전트별 1단계 채택률, 2단계 전환 사유, 단계별 평균 지연 시간)를 조회합니다.
+    """
+    return get_model_cascade().get_stats()
+
+
+@api_router.get("/metrics/constants")
+async def get_constant_metrics():
+    """
+    암호 상수 바이트 스캐너 지표(패턴 수, 스캔 횟수/바이트, 처리량)를 조회합니다.
+    """
+    return get_constant_scanner().get_stats()
+
+
+@api_router.get("/metrics/embedding-cache")
+async def get_embedding_cache_metrics():
+    """
+    임베딩 캐시 지표(적중/미적중 수, 적중률, 저장 항목 수, 벡터 파일 크기)를 조회합니다.
+    """
+    cache = get_embedding_cache()
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.get_stats()}
+
+
+@api_router.get("/metrics/embedding-backend")
+async def get_embedding_backend_metrics():
+    """
+    현재 임베딩 백엔드와 모델, 마이크로 배치 지표(평균 배치 크기, 대기 시간),
+    로컬 백엔드 사용 시 모델 로드 시간과 추론 처리량을 조회합니다.
+    """
+    info = {"backend": settings.EMBEDDING_BACKEND, "model": get_embedding_model_name()}
+    if settings.EMBEDDING_MICROBATCH_ENABLED:
+        info["micro_batching"] = get_embedding_batcher().get_stats()
+    if settings.EMBEDDING_BACKEND == "local":
+        try:
+            info["local"] = get_local_embedding_backend().get_stats()
+        except Exception as e:
+            info["error"] = str(e)
+    return info
+
+
+@api_router.get("/metrics/event-loop")
+async def get_event_loop_metrics():
+    """
+    이벤트 루프 지연 지표(평균/최대/최근 p99 지연, 경고 임계값을 넘은 횟수)를 조회합니다.
+    """
+    return {"enabled": settings.EVENT_LOOP_MONITOR_ENABLED, **get_loop_lag_monitor().get_stats()}
+
+
 # --- 에이전트별 직접 분석 엔드포인트 (벤치마크용) ---
 from .schemas import AgentAnalysisResult
-from ..agents.source_code import SourceCodeAgent
-from ..agents.assembly_binary import AssemblyBinaryAgent
-from ..agents.logs_config import LogsConfigAgent
+from ..agents.base_agent import BaseAgent
+from ..core.container import get_source_code_agent, get_assembly_binary_agent, get_logs_config_agent
 
 
 @api_router.post("/analyze/source_code", response_model=AgentAnalysisResult)
 async def analyze_with_source_code_agent(
-    file: UploadFile = File(...)
+    file: UploadFile = File(...),
+    agent: BaseAgent = Depends(get_source_code_agent)
 ):
     """
     SourceCodeAgent를 직접 호출하여 소스코드 파일을 분석합니다.
@@ -106,7 +269,6 @@ async def analyze_with_source_code_agent(
 
     try:
         file_content = await file.read()
-        agent = SourceCodeAgent()
         result = await agent.analyze(file_content, file.filename)
         return AgentAnalysisResult(**result)
     except Exception as e:
@@ -115,7 +277,8 @@ async def analyze_with_source_code_agent(
 
 @api_router.post("/analyze/assembly_binary", response_model=AgentAnalysisResult)
 async def analyze_with_assembly_binary_agent(
-    file: UploadFile = File(...)
+    file: UploadFile = File(...),
+    agent: BaseAgent = Depends(get_assembly_binary_agent)
 ):
     """
     AssemblyBinaryAgent를 직접 호출하여 어셈블리/바이너리 파일을 분석합니다.
@@ -126,7 +289,6 @@ async def analyze_with_assembly_binary_agent(
 
     try:
         file_content = await file.read()
-        agent = AssemblyBinaryAgent()
         result = await agent.analyze(file_content, file.filename)
         return AgentAnalysisResult(**result)
     except Exception as e:
@@ -135,7 +297,8 @@ async def analyze_with_assembly_binary_agent(
 
 @api_router.post("/analyze/logs_config", response_model=AgentAnalysisResult)
 async def analyze_with_logs_config_agent(
-    file: UploadFile = File(...)
+    file: UploadFile = File(...),
+    agent: BaseAgent = Depends(get_logs_config_agent)
 ):
     """
     LogsConfigAgent를 직접 호출하여 로그/설정 파일을 분석합니다.
@@ -146,7 +309,6 @@ async def analyze_with_logs_config_agent(
 
     try:
         file_content = await file.read()
-        agent = LogsConfigAgent()
         result = await agent.analyze(file_content, file.filename)
 
         # 결과 로깅
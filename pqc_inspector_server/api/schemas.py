@@ -17,6 +17,7 @@ class AnalysisResultBase(BaseModel):
     evidence: Optional[str] = Field(None, description="탐지의 근거가 되는 코드 라인 또는 문자열")
     confidence_score: Optional[float] = Field(None, description="탐지 결과에 대한 신뢰도 점수 (0.0 ~ 1.0)", ge=0.0, le=1.0)
     orchestrator_summary: Optional[str] = Field(None, description="오케스트레이터 AI의 종합 검증 의견")
+    verdict_source: Optional[str] = Field("llm", description="판정 출처 (llm: 에이전트/오케스트레이터, prefilter: 시그니처 사전 필터)")
 
 class AnalysisResultCreate(AnalysisResultBase):
     # 외부 API에 저장 시 필요한 데이터
@@ -35,6 +36,14 @@ class AnalysisRequestResponse(BaseModel):
     task_id: str = Field(..., description="백그라운드에서 실행될 분석 작업의 고유 ID")
     message: str = Field(..., description="요청 접수 완료 메시지")
 
+# --- 작업 상태 응답 스키마 ---
+class TaskStatusResponse(BaseModel):
+    task_id: str = Field(..., description="분석 작업 ID")
+    status: str = Field(..., description="작업 상태 (pending, running, done, failed)")
+    error: Optional[str] = Field(None, description="실패 시 오류 메시지")
+    created_at: float = Field(..., description="작업 등록 시각 (Unix time)")
+    updated_at: float = Field(..., description="마지막 상태 변경 시각 (Unix time)")
+
 # --- 에이전트 응답 스키마 ---
 class AgentAnalysisResult(BaseModel):
     is_pqc_vulnerable: bool = Field(..., description="비양자내성암호 사용 여부")
@@ -44,6 +53,7 @@ class AgentAnalysisResult(BaseModel):
     evidence: Optional[str] = Field(None, description="탐지의 근거")
     confidence_score: Optional[float] = Field(0.0, description="신뢰도 점수", ge=0.0, le=1.0)
     orchestrator_summary: Optional[str] = Field(None, description="오케스트레이터 검증 의견")
+    verdict_source: Optional[str] = Field("llm", description="판정 출처 (llm, prefilter)")
 
 # --- 오류 응답 스키마 ---
 class ErrorResponse(BaseModel):
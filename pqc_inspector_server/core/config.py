@@ -3,6 +3,7 @@
 # Pydantic의 BaseSettings를 사용하여 타입 검증과 기본값 설정을 쉽게 처리합니다.
 
 from functools import lru_cache
+from typing import Dict, List
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
@@ -41,6 +42,195 @@ class Settings(BaseSettings):
     # 레거시 Ollama 설정 (백업용)
     OLLAMA_BASE_URL: str = "http://localhost:11434"
 
+    # --- 에이전트 실행 설정 ---
+    # True이면 analyze_from_db에서 세 에이전트를 동시에 실행합니다 (False이면 순차 실행)
+    AGENT_CONCURRENT_FANOUT: bool = True
+    # 에이전트 1개당 최대 실행 시간 (초). 초과 시 해당 에이전트만 타임아웃 처리됩니다.
+    AGENT_TIMEOUT_SECONDS: float = 180.0
+
+    # --- HTTP 커넥션 풀 설정 (AI API 호출용) ---
+    HTTP_POOL_MAX_CONNECTIONS: int = 100
+    HTTP_POOL_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_POOL_KEEPALIVE_EXPIRY: float = 30.0  # 유휴 keep-alive 커넥션 유지 시간 (초)
+    HTTP_POOL_HTTP2: bool = False  # HTTP/2 사용 (httpx[http2] 필요)
+
+    # --- LLM 응답 캐시 설정 ---
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_TTL_SECONDS: float = 7 * 24 * 3600  # 캐시 항목 유효 기간 (초)
+    LLM_CACHE_MEMORY_MAX_ENTRIES: int = 1024  # 메모리 LRU 계층 최대 항목 수
+    LLM_CACHE_DISK_ENABLED: bool = True
+    LLM_CACHE_DB_PATH: str = "data/cache/llm_responses.sqlite3"
+    LLM_CACHE_DISK_MAX_MB: int = 256  # 디스크 계층 최대 크기 (MB)
+    # 동시에 들어온 동일 프롬프트 호출을 하나의 API 요청으로 합침 (singleflight)
+    LLM_SINGLEFLIGHT_ENABLED: bool = True
+
+    # --- LLM 요청 제한 설정 (0 = 제한 없음) ---
+    # 한도를 넘는 요청은 실패하지 않고 토큰 버킷에서 대기합니다.
+    LLM_RATE_LIMIT_ENABLED: bool = True
+    LLM_ESTIMATED_OUTPUT_TOKENS: int = 1024  # TPM 계산 시 응답 토큰 추정치
+    OPENAI_MAX_CONCURRENCY: int = 8
+    OPENAI_RPM: int = 500
+    OPENAI_TPM: int = 200000
+    GOOGLE_MAX_CONCURRENCY: int = 8
+    GOOGLE_RPM: int = 1000
+    GOOGLE_TPM: int = 1000000
+    OLLAMA_MAX_CONCURRENCY: int = 2
+    OLLAMA_RPM: int = 0
+    OLLAMA_TPM: int = 0
+    # 모델별 개별 제한 (JSON), 예: {"gpt-4-turbo": {"max_concurrency": 4, "rpm": 100, "tpm": 30000}}
+    LLM_MODEL_LIMITS: Dict[str, Dict[str, int]] = {}
+
+    # --- LLM 호출 복원력 설정 ---
+    LLM_REQUEST_TIMEOUT_SECONDS: float = 60.0  # OpenAI/Gemini 요청 1회당 타임아웃
+    LLM_OLLAMA_TIMEOUT_SECONDS: float = 120.0  # 로컬 Ollama 요청 1회당 타임아웃
+    # 일시적 오류(타임아웃, 429, 5xx) 재시도 - 지수 백오프 + 지터
+    LLM_RETRY_MAX_ATTEMPTS: int = 3
+    LLM_RETRY_BASE_DELAY: float = 0.5
+    LLM_RETRY_MAX_DELAY: float = 8.0
+    LLM_RETRY_BUDGET_SECONDS: float = 120.0  # 재시도를 포함한 전체 대기 시간 상한
+    # 헤지 요청: 응답이 최근 p95 지연 시간을 넘기면 동일 요청을 한 번 더 전송
+    LLM_HEDGE_ENABLED: bool = False
+    LLM_HEDGE_MIN_DELAY_SECONDS: float = 2.0
+    LLM_HEDGE_MIN_SAMPLES: int = 20  # p95 계산에 필요한 최소 표본 수
+    # 제공자별 서킷 브레이커
+    LLM_CIRCUIT_FAILURE_THRESHOLD: int = 5  # 연속 실패 횟수
+    LLM_CIRCUIT_RESET_SECONDS: float = 30.0  # 열림 상태 유지 시간
+
+    # --- 제공자 폴백 체인 설정 ---
+    # 주 모델이 요청 한도 초과, 서킷 브레이커 열림, 응답 지연 등으로 실패하면 순서대로 다음 모델을 시도합니다.
+    LLM_FAILOVER_ENABLED: bool = True
+    LLM_FAILOVER_ATTEMPT_TIMEOUT_SECONDS: float = 45.0  # 다음 후보가 있을 때 모델 1개에 허용하는 최대 시간
+    ORCHESTRATOR_FALLBACK_MODELS: List[str] = ["gemini-2.0-flash-exp", "llama3:8b"]
+    SOURCE_CODE_FALLBACK_MODELS: List[str] = ["gpt-4-turbo", "llama3:8b"]
+    BINARY_FALLBACK_MODELS: List[str] = ["gpt-4-turbo", "llama3:8b"]
+    LOG_CONF_FALLBACK_MODELS: List[str] = ["gpt-4-turbo", "llama3:8b"]
+
+    # --- 스트리밍 응답 설정 ---
+    # 에이전트 호출 시 스트리밍으로 응답을 받고 최상위 JSON 객체가 닫히면 생성을 조기 종료합니다.
+    LLM_STREAMING_ENABLED: bool = True
+
+    # --- 분석 작업 결과 저장소 설정 ---
+    # "sqlite": 여러 uvicorn 워커가 공유하고 재시작 후에도 유지, "memory": 프로세스 내 저장,
+    # "redis": 여러 머신의 API 서버/워커가 공유 (REDIS_URL 사용)
+    RESULT_STORE_BACKEND: str = "sqlite"
+    RESULT_STORE_DB_PATH: str = "data/state/task_results.sqlite3"
+    RESULT_STORE_TTL_SECONDS: float = 24 * 3600  # 작업 결과 보관 기간 (초)
+    RESULT_STORE_MEMORY_MAX_ENTRIES: int = 10000  # 메모리 백엔드 최대 작업 수
+
+    # --- 분석 작업 스케줄러 설정 ---
+    # /analyze 요청은 제한된 대기열에 들어가고 워커 수만큼만 동시에 분석됩니다.
+    JOB_WORKERS: int = 4
+    JOB_QUEUE_MAX_SIZE: int = 100  # 가득 차면 429 + Retry-After로 응답
+
+    # --- 공유 작업 대기열 / 워커 프로세스 설정 ---
+    # "local": API 프로세스 안의 스케줄러가 직접 분석, "sqlite"/"redis": 대기열에 넣고 pqc_worker.py가 분석
+    JOB_QUEUE_BACKEND: str = "local"
+    JOB_QUEUE_DB_PATH: str = "data/state/job_queue.sqlite3"
+    JOB_QUEUE_RETRY_AFTER_SECONDS: int = 30  # 공유 대기열이 가득 찼을 때 Retry-After 값
+    JOB_LEASE_SECONDS: float = 300.0  # 가시성 타임아웃: 워커가 이 시간 동안 연장하지 않으면 다른 워커가 재처리
+    JOB_MAX_ATTEMPTS: int = 3  # 작업 1개당 최대 시도 횟수 (워커 비정상 종료 포함)
+    WORKER_CONCURRENCY: int = 4  # 워커 프로세스 1개가 동시에 처리하는 작업 수
+    WORKER_POLL_INTERVAL_SECONDS: float = 1.0
+    REDIS_URL: str = "redis://localhost:6379/0"
+
+    # --- 시그니처 사전 필터 설정 ---
+    # 에이전트(LLM) 호출 전에 지식 베이스 키워드와 기본 패턴으로 파일을 검사하여,
+    # 암호 관련 시그니처가 전혀 없는 파일은 LLM 없이 즉시 "비양자내성암호 미탐지"로 판정합니다.
+    PREFILTER_ENABLED: bool = True
+    PREFILTER_KNOWLEDGE_BASE_DIR: str = "data/rag_knowledge_base"
+    PREFILTER_FILE_TYPES: List[str] = ["source_code", "assembly_binary", "logs_config"]
+    PREFILTER_CLEAN_CONFIDENCE: float = 0.9  # 사전 필터 판정 결과의 신뢰도
+
+    # --- 로컬 파일 분류기 설정 ---
+    # 매직 바이트/확장자/내용 패턴/나이브 베이즈로 파일 타입을 분류하고, 신뢰도가 임계값 미만일 때만 LLM에 묻습니다.
+    FILE_CLASSIFIER_ENABLED: bool = True
+    FILE_CLASSIFIER_CONFIDENCE_THRESHOLD: float = 0.8
+    FILE_CLASSIFIER_TRAINING_DATA: str = "data/fine_tuning_data/orchestrator_classification.jsonl"
+
+    # --- 오케스트레이터 검증 정책 설정 ---
+    # 에이전트 신뢰도가 높고 시그니처 사전 스캔과 일치하는 판정은 검증 LLM 호출을 생략합니다.
+    VALIDATION_POLICY_ENABLED: bool = True
+    VALIDATION_SKIP_MIN_CONFIDENCE: float = 0.85
+    # 파일 타입별 최소 신뢰도 (JSON), 예: {"assembly_binary": 0.9}
+    VALIDATION_FILE_TYPE_MIN_CONFIDENCE: Dict[str, float] = {"assembly_binary": 0.9}
+    VALIDATION_ALWAYS_FILE_TYPES: List[str] = []  # 항상 검증할 파일 타입
+    VALIDATION_QA_SAMPLE_RATE: float = 0.05  # 조건을 만족해도 품질 점검을 위해 검증하는 비율
+
+    # --- 모델 캐스케이드 설정 ---
+    # 에이전트 호출 시 저렴한 모델(로컬 Ollama 등)을 먼저 실행하고, 응답 신뢰도가 낮거나 JSON 파싱에 실패하거나
+    # 시그니처 정적 스캔과 어긋날 때만 에이전트의 기본 모델로 다시 실행합니다.
+    LLM_CASCADE_ENABLED: bool = False
+    LLM_CASCADE_MIN_CONFIDENCE: float = 0.8  # 1단계 응답을 채택하는 최소 confidence_score
+    SOURCE_CODE_CASCADE_MODEL: str = "llama3:8b"
+    BINARY_CASCADE_MODEL: str = "llama3:8b"
+    LOG_CONF_CASCADE_MODEL: str = "llama3:8b"
+
+    # --- 소스코드 청크 분석 설정 ---
+    # 청크 크기보다 긴 소스코드는 함수/클래스 경계로 나누고, 암호 관련도가 높은 상위 청크만 동시에 분석하여 병합합니다.
+    SOURCE_CODE_CHUNKING_ENABLED: bool = True
+    SOURCE_CODE_CHUNK_MAX_CHARS: int = 2000  # 청크 1개의 최대 길이 (이보다 짧은 파일은 한 번에 분석)
+    SOURCE_CODE_MAX_CHUNKS: int = 4  # 파일 1개당 LLM에 보내는 최대 청크 수
+    SOURCE_CODE_CHUNK_TOKEN_BUDGET: int = 4000  # 선택된 청크 코드의 합계 토큰 상한 (문자 4개 ≈ 토큰 1개)
+
+    # --- 바이너리 문자열 추출 설정 ---
+    # 바이너리 전체에서 문자열을 추출하고, 시그니처가 일치하는 문자열을 우선하여 프롬프트에 넣습니다.
+    BINARY_STRING_MIN_LENGTH: int = 4
+    BINARY_EXTRACT_UTF16: bool = True  # UTF-16LE 문자열(Windows PE 리소스 등)도 추출
+    BINARY_MAX_STRINGS: int = 200  # 프롬프트에 사용할 최대 문자열 수
+
+    # --- 바이너리 형식 파싱 설정 ---
+    # ELF/PE/Mach-O 헤더에서 링크 라이브러리, 임포트/익스포트 심볼, 섹션 범위를 추출하여 프롬프트 근거로 사용합니다.
+    BINARY_FORMAT_PARSING_ENABLED: bool = True
+    BINARY_MAX_SYMBOLS: int = 40  # 프롬프트에 넣는 암호 관련 심볼 최대 수 (임포트/익스포트가 절반씩)
+    BINARY_STRINGS_WITH_SYMBOLS_CHARS: int = 1000  # 심볼 근거가 있을 때 프롬프트에 넣는 문자열 최대 길이
+
+    # --- 임베딩 배치 수집 설정 ---
+    # 문서 수집 시 청크를 제공자 한도에 맞는 배치로 임베딩하고, 여러 배치를 동시에 요청하며, 벡터 DB에는 큰 배치로 씁니다.
+    EMBEDDING_BATCH_SIZE: int = 256  # 임베딩 요청 1회당 최대 텍스트 수 (OpenAI 한도 2048)
+    EMBEDDING_BATCH_MAX_TOKENS: int = 100000  # 임베딩 요청 1회당 추정 토큰 상한 (OpenAI 한도 300000)
+    EMBEDDING_MAX_CONCURRENCY: int = 4  # 동시에 진행하는 임베딩 배치 수
+    # 벡터 DB upsert 1회당 최대 문서 수. Chroma는 쓰기 호출 동안 GIL을 잡고 있어 스레드 풀에서 실행해도
+    # 호출 하나의 시간만큼 이벤트 루프가 멈추므로, 너무 크게 잡지 않습니다 (384차원 기준 100개 ≈ 0.1초).
+    VECTOR_STORE_WRITE_BATCH_SIZE: int = 100
+
+    # --- 임베딩 캐시 설정 ---
+    # (임베딩 모델, sha256(텍스트)) 키로 벡터를 디스크에 저장하여 재구축/반복 쿼리 시 API 호출을 생략합니다.
+    EMBEDDING_CACHE_ENABLED: bool = True
+    EMBEDDING_CACHE_DB_PATH: str = "data/cache/embeddings.sqlite3"  # 인덱스 (모델, 해시 → 오프셋)
+    EMBEDDING_CACHE_VECTORS_PATH: str = "data/cache/embedding_vectors.bin"  # 벡터 데이터 (mmap으로 읽음)
+    EMBEDDING_CACHE_DTYPE: str = "float32"  # float32 또는 float16 (절반 크기, 정밀도 약간 손실)
+    EMBEDDING_CACHE_MAX_MB: int = 1024  # 벡터 파일이 이 크기를 넘으면 새 항목을 저장하지 않음 (0 = 제한 없음)
+
+    # --- 임베딩 백엔드 설정 ---
+    # "openai"는 OpenAI 임베딩 API를, "local"은 sentence-transformers 모델을 CPU에서 직접 실행합니다 (오프라인/저지연).
+    # 벡터 DB 컬렉션에는 생성에 사용한 임베딩 모델이 기록되며, 다른 모델로 만든 컬렉션의 검색/추가는 거부됩니다.
+    EMBEDDING_BACKEND: str = "openai"  # openai 또는 local
+    OPENAI_EMBEDDING_MODEL: str = "text-embedding-3-small"
+    LOCAL_EMBEDDING_MODEL: str = "sentence-transformers/all-MiniLM-L6-v2"  # 모델 이름 또는 로컬 경로
+    LOCAL_EMBEDDING_DEVICE: str = "cpu"
+    LOCAL_EMBEDDING_RUNTIME: str = "torch"  # torch 또는 onnx (sentence-transformers 3.2 이상, onnxruntime 필요)
+    LOCAL_EMBEDDING_BATCH_SIZE: int = 32  # 모델 추론 1회당 텍스트 수
+    LOCAL_EMBEDDING_THREADS: int = 1  # 추론 전용 스레드 수 (이벤트 루프를 막지 않도록 별도 실행기에서 실행)
+    LOCAL_EMBEDDING_WARMUP: bool = True  # 서버/워커 시작 시 모델을 미리 로드하고 추론 한 번 실행
+
+    # --- 임베딩 마이크로 배치 설정 ---
+    # 동시에 들어온 단일 텍스트 임베딩 요청(RAG 검색 쿼리)을 잠시 모아 한 번의 배치 요청으로 보냅니다.
+    EMBEDDING_MICROBATCH_ENABLED: bool = True
+    EMBEDDING_MICROBATCH_WAIT_MS: float = 5.0  # 첫 요청 후 배치를 모으는 최대 대기 시간
+    EMBEDDING_MICROBATCH_MAX_SIZE: int = 64  # 이 수만큼 모이면 대기 시간 전이라도 즉시 전송
+
+    # --- 벡터 DB 실행기 / 이벤트 루프 모니터 설정 ---
+    # 동기식 Chroma 호출을 전용 스레드 풀에서 실행하여 검색/대량 추가 중에도 이벤트 루프가 다른 요청을 처리하도록 합니다.
+    VECTOR_STORE_EXECUTOR_THREADS: int = 4  # 0이면 이벤트 루프에서 직접 실행 (비교 측정용)
+    EVENT_LOOP_MONITOR_ENABLED: bool = True
+    EVENT_LOOP_MONITOR_INTERVAL_MS: float = 100.0  # 지연 샘플링 간격
+    EVENT_LOOP_LAG_WARN_MS: float = 200.0  # 이 값 이상 막히면 경고를 출력
+
+    # --- 암호 상수 바이트 스캔 설정 ---
+    # 바이너리 원본 바이트에서 암호 매직 상수(빅/리틀 엔디언)를 찾아 에이전트 근거와 사전 필터에 사용합니다.
+    CONSTANT_SCAN_ENABLED: bool = True
+    CONSTANT_SCAN_DATABASE_PATH: str = "data/rag_knowledge_base/assembly_binary/crypto_constants_database.json"
+
 # @lru_cache 데코레이터를 사용하여 Settings 객체를 한 번만 생성하도록 캐싱합니다.
 # 이렇게 하면 애플리케이션 전체에서 동일한 설정 객체를 공유하게 됩니다.
 @lru_cache()
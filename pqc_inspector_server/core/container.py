@@ -0,0 +1,164 @@
+# File: pqc_inspector_server/core/container.py
+# 📦 애플리케이션 수명주기(lifespan) 동안 공유되는 장기 객체들을 보관하는 컨테이너입니다.
+# 요청마다 오케스트레이터/에이전트/API 클라이언트를 새로 만들지 않고 한 번 생성한 인스턴스를 재사용하며,
+# 서버 종료 시 열린 커넥션을 정리합니다.
+
+import threading
+from functools import lru_cache
+from typing import Dict, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..agents.base_agent import BaseAgent
+    from ..db.api_client import ExternalAPIClient
+    from ..orchestrator.controller import OrchestratorController
+    from ..services.ai_service import AIService
+    from ..services.job_scheduler import JobScheduler
+
+
+class AppContainer:
+    def __init__(self):
+        self.api_client: Optional["ExternalAPIClient"] = None
+        self.ai_service: Optional["AIService"] = None
+        self.agents: Dict[str, "BaseAgent"] = {}
+        self.orchestrator: Optional["OrchestratorController"] = None
+        self.scheduler: Optional["JobScheduler"] = None
+        self._lock = threading.Lock()
+        self._started = False
+
+    def startup(self):
+        """
+        공유 객체들을 한 번만 생성합니다. lifespan 밖(스크립트 등)에서 먼저 접근해도
+        지연 생성되며, 여러 스레드에서 동시에 호출되어도 한 번만 초기화됩니다.
+        """
+        if self._started:
+            return
+
+        with self._lock:
+            if self._started:
+                return
+
+            from ..agents.source_code import SourceCodeAgent
+            from ..agents.assembly_binary import AssemblyBinaryAgent
+            from ..agents.logs_config import LogsConfigAgent
+            from ..db.api_client import ExternalAPIClient
+            from ..orchestrator.controller import OrchestratorController
+            from ..services.ai_service import AIService
+            from ..services.http_client_pool import get_http_client_pool
+            from ..services.job_scheduler import get_job_scheduler
+
+            get_http_client_pool()  # AI API 호출용 공유 커넥션 풀 준비
+            self.api_client = ExternalAPIClient()
+            self.ai_service = AIService()
+            self.agents = {
+                "source_code": SourceCodeAgent(ai_service=self.ai_service),
+                "assembly_binary": AssemblyBinaryAgent(ai_service=self.ai_service),
+                "logs_config": LogsConfigAgent(ai_service=self.ai_service)
+            }
+            self.orchestrator = OrchestratorController(
+                api_client=self.api_client,
+                agents=self.agents,
+                ai_service=self.ai_service
+            )
+            self.scheduler = get_job_scheduler()
+            self._started = True
+            print("📦 애플리케이션 컨테이너 초기화 완료 (오케스트레이터, 에이전트 3개, API 클라이언트)")
+
+    async def shutdown(self):
+        """
+        작업 스케줄러를 멈추고 공유 대기열, DB API 클라이언트, AI API 커넥션 풀을 닫은 뒤,
+        생성된 적 있는 결과 저장소/LLM 응답 캐시/임베딩 캐시/로컬 임베딩 모델을 정리합니다.
+        """
+        from ..services.embedding_batcher import get_embedding_batcher
+        from ..services.embedding_cache import get_embedding_cache
+        from ..services.http_client_pool import get_http_client_pool
+        from ..services.job_queue import get_job_queue
+        from ..services.job_scheduler import get_job_scheduler
+        from ..services.knowledge_manager import KnowledgeManagerFactory
+        from ..services.llm_cache import get_llm_cache
+        from ..services.local_embedding import get_local_embedding_backend
+        from ..services.result_store import get_result_store
+
+        with self._lock:
+            scheduler = self.scheduler
+            api_client = self.api_client
+            self.scheduler = None
+            self.api_client = None
+            self.ai_service = None
+            self.agents = {}
+            self.orchestrator = None
+            self._started = False
+
+        if scheduler is not None:
+            await scheduler.stop()
+        # 공유 작업 대기열(SQLite/Redis) 연결 종료
+        job_queue = get_job_queue()
+        if job_queue is not None:
+            await job_queue.close()
+            get_job_queue.cache_clear()
+        if api_client is not None:
+            await api_client.close()
+        await get_http_client_pool().aclose()
+
+        # 싱글턴은 한 번도 만들어지지 않았으면 새로 만들지 않도록 lru_cache에 들어 있는 것만 닫습니다.
+        if get_result_store.cache_info().currsize:
+            await get_result_store().close()
+            get_result_store.cache_clear()
+        if get_llm_cache.cache_info().currsize:
+            get_llm_cache().close()  # 버퍼에 남은 last_access 갱신을 기록합니다.
+            get_llm_cache.cache_clear()
+        if get_embedding_cache.cache_info().currsize:
+            embedding_cache = get_embedding_cache()
+            if embedding_cache is not None:
+                embedding_cache.close()
+            get_embedding_cache.cache_clear()
+        if get_local_embedding_backend.cache_info().currsize:
+            get_local_embedding_backend().shutdown()
+            get_local_embedding_backend.cache_clear()
+        # 닫은 객체를 붙잡고 있는 스케줄러/임베딩 배처/지식 매니저도 다음 startup에서 새로 만들도록 비웁니다.
+        get_job_scheduler.cache_clear()
+        get_embedding_batcher.cache_clear()
+        KnowledgeManagerFactory._instances.clear()
+        print("📦 애플리케이션 컨테이너 종료: 열린 커넥션을 정리했습니다.")
+
+    def get_orchestrator(self) -> "OrchestratorController":
+        self.startup()
+        return self.orchestrator
+
+    def get_scheduler(self) -> "JobScheduler":
+        self.startup()
+        return self.scheduler
+
+    def get_ai_service(self) -> "AIService":
+        self.startup()
+        return self.ai_service
+
+    def get_agent(self, agent_type: str) -> "BaseAgent":
+        self.startup()
+        return self.agents[agent_type]
+
+
+# 프로세스 전역에서 하나의 컨테이너만 사용하도록 캐싱합니다.
+@lru_cache()
+def get_container() -> AppContainer:
+    return AppContainer()
+
+
+# --- FastAPI 의존성 주입 함수 ---
+def get_shared_ai_service() -> "AIService":
+    return get_container().get_ai_service()
+
+
+def get_shared_job_scheduler() -> "JobScheduler":
+    return get_container().get_scheduler()
+
+
+def get_source_code_agent() -> "BaseAgent":
+    return get_container().get_agent("source_code")
+
+
+def get_assembly_binary_agent() -> "BaseAgent":
+    return get_container().get_agent("assembly_binary")
+
+
+def get_logs_config_agent() -> "BaseAgent":
+    return get_container().get_agent("logs_config")
@@ -1,33 +1,50 @@
 # File: pqc_inspector_server/orchestrator/controller.py
 # 🧠 파일 분류, 에이전트 호출, 결과 취합 및 DB 저장을 총괄하는 오케스트레이터 컨트롤러입니다.
 
-from fastapi import UploadFile, Depends
-from typing import Optional
+from fastapi import UploadFile
+from typing import Dict, Optional, Tuple
 from datetime import datetime
 
 # --- 의존성 임포트 변경 및 추가 ---
-from ..db.api_client import ExternalAPIClient, get_api_client
+from ..db.api_client import ExternalAPIClient
+from ..agents.base_agent import BaseAgent
 from ..agents.source_code import SourceCodeAgent
 from ..agents.assembly_binary import AssemblyBinaryAgent
 from ..agents.logs_config import LogsConfigAgent
 from ..api.schemas import AnalysisResultCreate
 from ..services.ai_service import AIService, get_ai_service
+from ..services.result_store import ResultStore, TaskStatus, get_result_store
+from ..services.signature_scanner import get_signature_scanner, should_prefilter
+from ..services.constant_scanner import constant_signature_hits, get_constant_scanner
+from ..services.file_classifier import EXTENSION_MAP, get_file_classifier
+from ..services.validation_policy import ValidationPolicy, get_validation_policy
 from ..core.config import settings
+import asyncio
 import json
+import time
 
 class OrchestratorController:
-    # 클래스 레벨에서 작업 결과를 저장 (모든 인스턴스가 공유)
-    _shared_task_results: dict = {}
-
-    def __init__(self, api_client: ExternalAPIClient):
+    def __init__(
+        self,
+        api_client: ExternalAPIClient,
+        agents: Optional[Dict[str, BaseAgent]] = None,
+        ai_service: Optional[AIService] = None,
+        result_store: Optional[ResultStore] = None,
+        validation_policy: Optional[ValidationPolicy] = None
+    ):
         # 의존성 주입을 통해 외부 API 클라이언트와 에이전트들을 초기화합니다.
+        # 애플리케이션 컨테이너가 공유 에이전트/AIService를 넘겨주면 그대로 재사용합니다.
         self.api_client = api_client
-        self.ai_service = get_ai_service()
+        self.ai_service = ai_service or get_ai_service()
+        # 작업 상태/결과 저장소 (TTL 제한 메모리 또는 워커 간 공유 SQLite)
+        self.result_store = result_store or get_result_store()
+        # 오케스트레이터 검증 LLM 호출 생략 여부를 결정하는 정책
+        self.validation_policy = validation_policy or get_validation_policy()
         self.orchestrator_model = settings.ORCHESTRATOR_MODEL
-        self.agents = {
-            "source_code": SourceCodeAgent(),
-            "assembly_binary": AssemblyBinaryAgent(),
-            "logs_config": LogsConfigAgent()
+        self.agents = agents or {
+            "source_code": SourceCodeAgent(ai_service=self.ai_service),
+            "assembly_binary": AssemblyBinaryAgent(ai_service=self.ai_service),
+            "logs_config": LogsConfigAgent(ai_service=self.ai_service)
         }
         print("OrchestratorController가 AI 오케스트레이터와 함께 초기화되었습니다.")
 
@@ -40,10 +57,16 @@ class OrchestratorController:
         print(f"🚀 [DB 기반 분석 시작] File ID: {file_id}, Scan ID: {scan_id}")
         print("=" * 80)
 
+        # 단계별 소요 시간 (초)
+        timings = {}
+        total_start = time.perf_counter()
+
         try:
             # 1단계: DB에서 모든 데이터 가져오기
             print("\n🔍 [1단계] DB에서 데이터 조회 중...")
+            stage_start = time.perf_counter()
             db_data = await self.api_client.get_all_file_data(file_id, scan_id)
+            timings["db_fetch"] = time.perf_counter() - stage_start
 
             assembly_text = db_data.get("assembly_text")
             generated_code = db_data.get("generated_code")
@@ -62,65 +85,64 @@ class OrchestratorController:
             print(f"   - 로그: {len(logs) if logs else 0} bytes")
 
             # 2단계: 각 에이전트로 분석 수행
-            print("\n🔬 [2단계] 에이전트별 분석 시작...")
-            agent_results = []
-
-            # 어셈블리/바이너리 분석
+            agent_inputs = []
             if assembly_text:
-                print("   🤖 Assembly/Binary Agent 분석 중...")
-                assembly_agent = self.agents["assembly_binary"]
-                assembly_result = await assembly_agent.analyze(
-                    assembly_text.encode('utf-8'),
-                    f"file_{file_id}_assembly"
-                )
-                agent_results.append({
-                    "type": "assembly_binary",
-                    "result": assembly_result
-                })
-                print(f"   ✅ Assembly 분석 완료 - 취약점: {assembly_result.get('is_pqc_vulnerable')}")
-
-            # 소스코드 분석
+                agent_inputs.append(("assembly_binary", assembly_text, f"file_{file_id}_assembly"))
             if generated_code:
-                print("   🤖 Source Code Agent 분석 중...")
-                source_agent = self.agents["source_code"]
-                code_result = await source_agent.analyze(
-                    generated_code.encode('utf-8'),
-                    f"file_{file_id}_code.py"
-                )
-                agent_results.append({
-                    "type": "source_code",
-                    "result": code_result
-                })
-                print(f"   ✅ Source Code 분석 완료 - 취약점: {code_result.get('is_pqc_vulnerable')}")
-
-            # 로그 분석
+                agent_inputs.append(("source_code", generated_code, f"file_{file_id}_code.py"))
             if logs:
-                print("   🤖 Logs/Config Agent 분석 중...")
-                logs_agent = self.agents["logs_config"]
-                logs_result = await logs_agent.analyze(
-                    logs.encode('utf-8'),
-                    f"file_{file_id}_logs.log"
-                )
-                agent_results.append({
-                    "type": "logs_config",
-                    "result": logs_result
-                })
-                print(f"   ✅ Logs 분석 완료 - 취약점: {logs_result.get('is_pqc_vulnerable')}")
+                agent_inputs.append(("logs_config", logs, f"file_{file_id}_logs.log"))
+
+            fanout_mode = "concurrent" if settings.AGENT_CONCURRENT_FANOUT else "sequential"
+            print(f"\n🔬 [2단계] 에이전트별 분석 시작... (모드: {fanout_mode})")
+            stage_start = time.perf_counter()
+
+            if settings.AGENT_CONCURRENT_FANOUT:
+                # 모든 에이전트를 동시에 실행 - 벽시계 시간은 가장 느린 에이전트 기준
+                agent_results = list(await asyncio.gather(*[
+                    self._run_agent_stage(agent_type, text, name)
+                    for agent_type, text, name in agent_inputs
+                ]))
+            else:
+                agent_results = []
+                for agent_type, text, name in agent_inputs:
+                    agent_results.append(await self._run_agent_stage(agent_type, text, name))
+
+            timings["agent_stage"] = time.perf_counter() - stage_start
+            timings["agents"] = {item["type"]: item["duration"] for item in agent_results}
 
-            print(f"✅ [2단계 완료] 총 {len(agent_results)}개 에이전트 분석 완료")
+            succeeded = sum(1 for item in agent_results if item["status"] in ("success", "prefiltered"))
+            prefiltered = sum(1 for item in agent_results if item["status"] == "prefiltered")
+            print(f"✅ [2단계 완료] 총 {len(agent_results)}개 에이전트 중 {succeeded}개 성공, 사전 필터 {prefiltered}개 ({timings['agent_stage']:.2f}초)")
 
             # 3단계: AI 오케스트레이터로 종합 분석
-            print("\n🧠 [3단계] AI 오케스트레이터 종합 분석 시작...")
-            comprehensive_analysis = await self._create_comprehensive_analysis(
-                file_id, scan_id, db_data, agent_results
-            )
-            print("✅ [3단계 완료] 종합 분석 완료")
+            stage_start = time.perf_counter()
+            if prefiltered == len(agent_results):
+                # 모든 입력이 사전 필터에서 판정되었으면 종합할 LLM 결과가 없으므로 기본 리포트를 사용합니다.
+                print("\n🔎 [3단계] 모든 입력에서 암호 시그니처 미발견 - 사전 필터 리포트 생성")
+                comprehensive_analysis = self._create_fallback_analysis(file_id, scan_id, agent_results)
+            else:
+                print("\n🧠 [3단계] AI 오케스트레이터 종합 분석 시작...")
+                comprehensive_analysis = await self._create_comprehensive_analysis(
+                    file_id, scan_id, db_data, agent_results
+                )
+            timings["orchestrator"] = time.perf_counter() - stage_start
+            print(f"✅ [3단계 완료] 종합 분석 완료 ({timings['orchestrator']:.2f}초)")
 
             # 4단계: DB에 최종 분석 결과 저장
             print("\n💾 [4단계] DB에 최종 분석 결과 저장 중...")
+            stage_start = time.perf_counter()
             save_success = await self.api_client.save_llm_analysis(
                 file_id, scan_id, comprehensive_analysis
             )
+            timings["db_save"] = time.perf_counter() - stage_start
+            timings["total"] = time.perf_counter() - total_start
+
+            # 에이전트별 실행 상태 (success / prefiltered / timeout / error)
+            agent_statuses = {
+                item["type"]: {"status": item["status"], "error": item["error"]}
+                for item in agent_results
+            }
 
             if save_success:
                 print("✅ [4단계 완료] 분석 결과 저장 성공")
@@ -131,24 +153,84 @@ class OrchestratorController:
                     "success": True,
                     "file_id": file_id,
                     "scan_id": scan_id,
-                    "analysis": comprehensive_analysis
+                    "analysis": comprehensive_analysis,
+                    "agent_statuses": agent_statuses,
+                    "timings": timings
                 }
             else:
                 print("❌ [4단계 실패] DB 저장 실패")
                 return {
                     "success": False,
-                    "error": "분석 결과 DB 저장 실패"
+                    "error": "분석 결과 DB 저장 실패",
+                    "agent_statuses": agent_statuses,
+                    "timings": timings
                 }
 
         except Exception as e:
             print(f"❌ [오류] 분석 중 오류 발생: {e}")
             import traceback
             traceback.print_exc()
+            timings["total"] = time.perf_counter() - total_start
             return {
                 "success": False,
-                "error": str(e)
+                "error": str(e),
+                "timings": timings
             }
 
+    async def _run_agent_stage(self, agent_type: str, content: str, file_name: str) -> dict:
+        """
+        단일 에이전트 분석을 타임아웃과 함께 실행하고 소요 시간을 기록합니다.
+        타임아웃이나 예외가 발생해도 다른 에이전트에 영향을 주지 않도록
+        예외를 전파하지 않고 해당 에이전트의 기본 결과를 반환합니다.
+        """
+        agent = self.agents[agent_type]
+        timeout = settings.AGENT_TIMEOUT_SECONDS
+        start_time = time.perf_counter()
+        status = "success"
+        error = None
+
+        scan, prefilter_result = await self._prefilter(content, file_name, agent_type)
+        if prefilter_result is not None:
+            duration = time.perf_counter() - start_time
+            print(f"   🔎 {agent_type} 사전 필터 판정 - 암호 시그니처 없음 ({duration:.3f}초)")
+            return {
+                "type": agent_type,
+                "result": prefilter_result,
+                "status": "prefiltered",
+                "error": None,
+                "duration": duration
+            }
+
+        print(f"   🤖 {agent.__class__.__name__} 분석 시작...")
+        try:
+            result = await asyncio.wait_for(
+                agent.analyze(content.encode('utf-8'), file_name, scan=scan),
+                timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            status = "timeout"
+            error = f"에이전트 타임아웃 ({timeout:g}초 초과)"
+            result = agent._get_default_result(file_name, error)
+        except Exception as e:
+            status = "error"
+            error = str(e)
+            result = agent._get_default_result(file_name, f"분석 오류: {error}")
+
+        duration = time.perf_counter() - start_time
+
+        if status == "success":
+            print(f"   ✅ {agent_type} 분석 완료 - 취약점: {result.get('is_pqc_vulnerable')} ({duration:.2f}초)")
+        else:
+            print(f"   ⚠️ {agent_type} 분석 실패 [{status}]: {error} ({duration:.2f}초)")
+
+        return {
+            "type": agent_type,
+            "result": result,
+            "status": status,
+            "error": error,
+            "duration": duration
+        }
+
     async def _create_comprehensive_analysis(
         self,
         file_id: int,
@@ -167,6 +249,7 @@ class OrchestratorController:
                 result = agent_result["result"]
                 results_summary.append({
                     "agent_type": agent_type,
+                    "status": agent_result.get("status", "success"),
                     "is_vulnerable": result.get("is_pqc_vulnerable", False),
                     "detected_algorithms": result.get("detected_algorithms", []),
                     "confidence": result.get("confidence_score", 0.0),
@@ -223,7 +306,8 @@ class OrchestratorController:
             orchestrator_response = await self.ai_service.generate_response(
                 model=self.orchestrator_model,
                 prompt=comprehensive_prompt,
-                system_prompt="당신은 양자컴퓨팅 보안 전문가이자 다중 에이전트 분석 결과를 종합하는 오케스트레이터입니다. 여러 소스의 분석 결과를 통합하여 포괄적이고 실용적인 보안 리포트를 작성합니다."
+                system_prompt="당신은 양자컴퓨팅 보안 전문가이자 다중 에이전트 분석 결과를 종합하는 오케스트레이터입니다. 여러 소스의 분석 결과를 통합하여 포괄적이고 실용적인 보안 리포트를 작성합니다.",
+                role="orchestrator"
             )
 
             if orchestrator_response.get("success"):
@@ -260,6 +344,8 @@ class OrchestratorController:
             report_lines.append(f"- **탐지된 알고리즘:** {', '.join(result.get('detected_algorithms', []))}")
             report_lines.append(f"- **신뢰도:** {result.get('confidence_score', 0.0):.2f}")
             report_lines.append(f"- **상세:** {result.get('vulnerability_details', 'N/A')}")
+            if result.get("verdict_source") == "prefilter":
+                report_lines.append(f"- **판정 출처:** 시그니처 사전 필터")
             report_lines.append(f"")
 
         report_lines.append("## 결론")
@@ -310,7 +396,8 @@ JSON 형식으로만 응답:
             ai_response = await self.ai_service.generate_response(
                 model=self.orchestrator_model,
                 prompt=classification_prompt,
-                system_prompt="당신은 파일 타입 분류 전문가입니다. 파일명, 확장자, 내용을 종합적으로 분석하여 정확한 분류를 수행합니다."
+                system_prompt="당신은 파일 타입 분류 전문가입니다. 파일명, 확장자, 내용을 종합적으로 분석하여 정확한 분류를 수행합니다.",
+                role="orchestrator"
             )
 
             if ai_response.get("success"):
@@ -354,16 +441,8 @@ JSON 형식으로만 응답:
         if not filename:
             return "unknown"
 
-        extension_map = {
-            '.py': 'source_code', '.java': 'source_code', '.c': 'source_code', '.cpp': 'source_code',
-            '.go': 'source_code', '.js': 'source_code', '.ts': 'source_code', '.rs': 'source_code',
-            '.log': 'logs_config', '.conf': 'logs_config', '.txt': 'logs_config',
-            '.json': 'logs_config', '.yaml': 'logs_config', '.yml': 'logs_config', '.xml': 'logs_config',
-            '.toml': 'logs_config', '.ini': 'logs_config', '.cfg': 'logs_config', '.config': 'logs_config'
-        }
-
         file_ext = "." + filename.split('.')[-1].lower()
-        file_type = extension_map.get(file_ext, "assembly_binary")
+        file_type = EXTENSION_MAP.get(file_ext, "assembly_binary")
 
         print(f"폴백 분류: '{filename}' → '{file_type}' (확장자 기반)")
         return file_type
@@ -379,32 +458,55 @@ JSON 형식으로만 응답:
         print(f"📏 파일 크기: {len(file_content):,} bytes")
         print("=" * 80)
 
-        # 1단계: AI 기반 파일 분류
-        print("\n🔍 [1단계] AI 오케스트레이터 파일 분류 시작...")
+        await self.result_store.update(task_id, TaskStatus.RUNNING)
+        try:
+            await self._run_analysis(filename, file_content, task_id)
+        except Exception as e:
+            print(f"❌ [실패] 작업 ID [{task_id}] - 예기치 않은 오류: {e}")
+            await self.result_store.update(task_id, TaskStatus.FAILED, error=str(e))
+
+    async def _run_analysis(self, filename: str, file_content: bytes, task_id: str):
+        """분류 → 에이전트 분석 → 검증 → 결과 저장 단계를 수행합니다."""
+        # 1단계: 파일 분류 - 로컬 분류기가 충분히 확신할 때만 그 결과를 쓰고, 아니면 AI 오케스트레이터에게 묻습니다.
+        # 한 번 정한 파일 타입을 사전 필터와 에이전트 선택에 함께 사용합니다.
+        print("\n🔍 [1단계] 파일 분류 시작...")
         file_type = await self._classify_file_type_from_content(filename, file_content)
         print(f"✅ [1단계 완료] 파일 타입: {file_type}")
 
-        agent = self.agents.get(file_type)
+        # 시그니처 사전 필터 - 암호 관련 시그니처가 없으면 LLM 분석/검증을 건너뜁니다.
+        scan, prefilter_result = await self._prefilter(file_content, filename, file_type)
+        agent = self.agents.get(file_type) if prefilter_result is None else None
+
         final_result = None
+        error = None
 
-        if agent:
+        if prefilter_result is not None:
+            print(f"\n🔎 [사전 필터] 암호 시그니처가 없어 LLM 분석을 생략합니다. (타입: {file_type})")
+            final_result = AnalysisResultCreate(file_name=filename, file_type=file_type, **prefilter_result)
+        elif agent:
             try:
                 # 2단계: 전문 에이전트 분석
                 print(f"\n🔬 [2단계] {file_type.upper()} 전문 에이전트 분석 시작...")
                 print(f"🤖 사용 에이전트: {agent.__class__.__name__}")
 
-                agent_result = await agent.analyze(file_content, filename)
+                agent_result = await agent.analyze(file_content, filename, scan=scan)
 
                 print(f"✅ [2단계 완료] 에이전트 분석 결과:")
                 print(f"   - 취약점 발견: {agent_result.get('is_pqc_vulnerable', 'Unknown')}")
                 print(f"   - 신뢰도: {agent_result.get('confidence_score', 0):.2f}")
 
-                # 3단계: AI 오케스트레이터 결과 검증 및 요약
-                print(f"\n🧠 [3단계] AI 오케스트레이터 결과 검증 및 요약 시작...")
-                validated_result = await self._validate_and_summarize_result(
-                    filename, file_type, agent_result, file_content
-                )
-                print(f"✅ [3단계 완료] 오케스트레이터 검증 완료")
+                # 3단계: AI 오케스트레이터 결과 검증 및 요약 (정책에 따라 생략)
+                decision = self.validation_policy.decide(file_type, agent_result, scan)
+                if decision.validate:
+                    print(f"\n🧠 [3단계] AI 오케스트레이터 결과 검증 및 요약 시작... (사유: {decision.describe()})")
+                    validated_result = await self._validate_and_summarize_result(
+                        filename, file_type, agent_result, file_content
+                    )
+                    print(f"✅ [3단계 완료] 오케스트레이터 검증 완료")
+                else:
+                    print(f"\n⏭️ [3단계 생략] 오케스트레이터 검증 생략 (사유: {decision.describe()})")
+                    validated_result = dict(agent_result)
+                    validated_result["orchestrator_summary"] = f"검증 생략: {decision.describe()}"
 
                 # 최종 결과 모델 생성
                 final_result = AnalysisResultCreate(
@@ -423,29 +525,49 @@ JSON 형식으로만 응답:
             except Exception as e:
                 print(f"❌ [오류] 작업 ID [{task_id}] - 분석 중 오류 발생: {e}")
                 # 오류 발생시에도 기본 결과 생성
-                final_result = self._create_error_result(filename, file_type, str(e))
+                error = str(e)
+                final_result = self._create_error_result(filename, file_type, error)
         else:
             print(f"❌ [오류] 작업 ID [{task_id}] - '{file_type}' 타입을 처리할 에이전트가 없습니다.")
-            final_result = self._create_error_result(filename, file_type, "지원하지 않는 파일 타입")
+            error = "지원하지 않는 파일 타입"
+            final_result = self._create_error_result(filename, file_type, error)
 
         if final_result:
-            # 작업 결과를 클래스 레벨 딕셔너리에 저장하여 나중에 조회 가능하도록 함
+            # 작업 결과를 결과 저장소에 저장하여 나중에 조회 가능하도록 함
             # task_id와 analysis_timestamp 추가
             result_dict = final_result.dict()
             result_dict['task_id'] = task_id
             result_dict['analysis_timestamp'] = datetime.utcnow().isoformat()
 
-            OrchestratorController._shared_task_results[task_id] = result_dict
-            print(f"\n💾 [4단계] 분석 결과를 task_id [{task_id}]로 저장 완료")
-            print(f"   현재 저장된 작업 수: {len(OrchestratorController._shared_task_results)}")
+            status = TaskStatus.FAILED if error else TaskStatus.DONE
+            await self.result_store.update(task_id, status, result=result_dict, error=error)
+            print(f"\n💾 [4단계] 분석 결과를 task_id [{task_id}]로 저장 완료 (상태: {status})")
             print("=" * 80)
             print(f"🎉 [완료] 작업 ID [{task_id}] 전체 분석 프로세스 완료!")
             print("=" * 80)
         else:
             print(f"❌ [실패] 작업 ID [{task_id}] - 분석 결과 생성 실패")
             print("=" * 80)
+            await self.result_store.update(task_id, TaskStatus.FAILED, error="분석 결과 생성 실패")
 
     async def _classify_file_type_from_content(self, filename: str, content: bytes) -> str:
+        """
+        파일 내용으로부터 타입을 분류합니다.
+        로컬 분류기의 신뢰도가 임계값 이상이면 그대로 사용하고, 아니면 AI 오케스트레이터에게 묻습니다.
+        """
+        if settings.FILE_CLASSIFIER_ENABLED:
+            local = get_file_classifier().classify(filename, content)
+            if local.confidence >= settings.FILE_CLASSIFIER_CONFIDENCE_THRESHOLD:
+                print(
+                    f"로컬 분류 결과 - 파일: '{filename}' → 타입: '{local.file_type}' "
+                    f"(신뢰도: {local.confidence:.2f}, 근거: {'; '.join(local.reasons)}, {local.duration * 1e6:.0f}µs)"
+                )
+                return local.file_type
+            print(f"로컬 분류 신뢰도 부족 ({local.file_type}, {local.confidence:.2f}) → AI 분류로 전환")
+
+        return await self._classify_with_llm(filename, content)
+
+    async def _classify_with_llm(self, filename: str, content: bytes) -> str:
         """
         AI 오케스트레이터를 사용하여 파일 내용으로부터 타입을 분류합니다.
         """
@@ -480,7 +602,8 @@ JSON 형식으로만 응답:
             ai_response = await self.ai_service.generate_response(
                 model=self.orchestrator_model,
                 prompt=classification_prompt,
-                system_prompt="당신은 파일 타입 분류 전문가입니다. 파일명, 확장자, 내용을 종합적으로 분석하여 정확한 분류를 수행합니다."
+                system_prompt="당신은 파일 타입 분류 전문가입니다. 파일명, 확장자, 내용을 종합적으로 분석하여 정확한 분류를 수행합니다.",
+                role="orchestrator"
             )
 
             if ai_response.get("success"):
@@ -561,7 +684,8 @@ JSON 형식으로만 응답:
             validation_response = await self.ai_service.generate_response(
                 model=self.orchestrator_model,
                 prompt=validation_prompt,
-                system_prompt="당신은 PQC 분석 결과를 검증하고 품질을 보장하는 오케스트레이터입니다. 에이전트 결과를 객관적으로 평가하고 개선된 최종 결과를 제공합니다."
+                system_prompt="당신은 PQC 분석 결과를 검증하고 품질을 보장하는 오케스트레이터입니다. 에이전트 결과를 객관적으로 평가하고 개선된 최종 결과를 제공합니다.",
+                role="orchestrator"
             )
 
             if validation_response.get("success"):
@@ -594,6 +718,39 @@ JSON 형식으로만 응답:
             agent_result["orchestrator_summary"] = f"검증 중 오류 발생: {str(e)}"
             return agent_result
 
+    async def _prefilter(self, content, file_name: str, file_type: str) -> Tuple[Optional[dict], Optional[dict]]:
+        """
+        시그니처 사전 필터를 실행하고 (스캔 결과, 즉시 판정 결과)를 반환합니다.
+        암호 관련 시그니처가 하나도 없을 때만 즉시 판정 결과가 있으며, 비활성화 시 둘 다 None입니다.
+        스캔 결과는 검증 정책에서 에이전트 판정과의 일치 여부를 확인하는 데 사용됩니다.
+        파일 전체를 훑는 스캔은 이벤트 루프를 막지 않도록 스레드에서 실행합니다.
+        """
+        if not should_prefilter(file_type):
+            return None, None
+
+        scan = await asyncio.to_thread(self._scan_signatures, content, file_type)
+        if scan["has_hits"]:
+            top_hits = ", ".join(hit["signature"] for hit in scan["hits"][:5])
+            print(f"   🔎 사전 필터 통과 - {file_name}: 시그니처 {len(scan['hits'])}종 발견 ({top_hits})")
+            return scan, None
+        return scan, get_signature_scanner().make_clean_result(file_name, scan)
+
+    def _scan_signatures(self, content, file_type: str) -> dict:
+        """
+        시그니처 스캔 (바이너리는 암호 상수 스캔 결과도 합침)
+        상수 스캔 원본 결과는 "constant_scan"에 담아 에이전트가 같은 파일을 다시 스캔하지 않게 합니다.
+        """
+        scan = get_signature_scanner().scan(content)
+        if file_type == "assembly_binary" and settings.CONSTANT_SCAN_ENABLED:
+            # 바이너리는 문자열이 없어도 암호 상수(S-box, 공개 지수 등)가 있으면 에이전트 분석 대상입니다.
+            data = content if isinstance(content, bytes) else content.encode("utf-8", errors="ignore")
+            constant_scan = get_constant_scanner().scan(data)
+            scan = {**scan, "constant_scan": constant_scan}
+            constant_hits = constant_signature_hits(constant_scan)
+            if constant_hits:
+                scan = {**scan, "hits": scan["hits"] + constant_hits, "has_hits": True}
+        return scan
+
     def _create_error_result(self, filename: str, file_type: str, error_detail: str) -> AnalysisResultCreate:
         """오류 발생시 기본 결과를 생성합니다."""
         return AnalysisResultCreate(
@@ -607,24 +764,35 @@ JSON 형식으로만 응답:
             confidence_score=0.0
         )
 
+    async def submit_task(self, task_id: str):
+        """분석 작업을 pending 상태로 등록합니다."""
+        await self.result_store.create(task_id)
+
+    async def get_task_status(self, task_id: str):
+        """
+        작업 상태 레코드(pending, running, done, failed)를 조회합니다.
+        """
+        return await self.result_store.get(task_id)
+
     async def get_analysis_result(self, task_id: str):
         """
         주어진 작업 ID에 해당하는 분석 결과를 조회합니다.
         """
         print(f"📊 [조회] 작업 ID [{task_id}] 결과 조회 시도...")
-        print(f"   현재 저장된 작업 수: {len(OrchestratorController._shared_task_results)}")
-        print(f"   저장된 task_id 목록: {list(OrchestratorController._shared_task_results.keys())}")
 
-        result = OrchestratorController._shared_task_results.get(task_id)
+        record = await self.result_store.get(task_id)
+        result = record.get("result") if record else None
 
         if result:
             print(f"✅ [조회 성공] 작업 ID [{task_id}] 결과 반환")
             return result
         else:
-            print(f"❌ [조회 실패] 작업 ID [{task_id}] 결과가 없거나 아직 분석 중")
+            status = record["status"] if record else "없음"
+            print(f"❌ [조회 실패] 작업 ID [{task_id}] 결과가 없거나 아직 분석 중 (상태: {status})")
             return None
 
 # FastAPI의 의존성 주입(Dependency Injection) 시스템을 위한 함수입니다.
-# 외부 API 클라이언트를 컨트롤러에 주입합니다.
-def get_orchestrator_controller(api_client: ExternalAPIClient = Depends(get_api_client)):
-    return OrchestratorController(api_client=api_client)
+# 요청마다 새로 만들지 않고 애플리케이션 컨테이너의 공유 인스턴스를 반환합니다.
+def get_orchestrator_controller() -> OrchestratorController:
+    from ..core.container import get_container
+    return get_container().get_orchestrator()
@@ -3,8 +3,18 @@
 
 import httpx
 import json
-from typing import Dict, Any, Optional
+import time
+from typing import Dict, Any, List, Optional
 from ..core.config import settings
+from .http_client_pool import get_http_client_pool
+from .llm_cache import get_llm_cache, make_cache_key
+from .singleflight import get_llm_singleflight
+from .json_stream import IncrementalJSONObjectParser
+from .rate_limiter import get_rate_limiter_registry, estimate_tokens
+from .resilience import (
+    get_resilience_registry, get_retry_policy, hedged_call, is_retryable, is_provider_failure
+)
+import asyncio
 
 class AIService:
     def __init__(self):
@@ -13,46 +23,316 @@ class AIService:
         self.openai_base_url = "https://api.openai.com/v1"
         self.google_base_url = "https://generativelanguage.googleapis.com/v1beta"
         self.ollama_base_url = settings.OLLAMA_BASE_URL
+        self.http_pool = get_http_client_pool()
+        self.cache = get_llm_cache()
+        self.singleflight = get_llm_singleflight()
+        self.rate_limiters = get_rate_limiter_registry()
+        self.resilience = get_resilience_registry()
         print("AIService가 초기화되었습니다.")
 
-    async def generate_response(self, model: str, prompt: str, system_prompt: Optional[str] = None) -> Dict[str, Any]:
+    async def generate_response(
+        self,
+        model: str,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.1,
+        use_cache: bool = True,
+        role: Optional[str] = None,
+        stop_at_json: bool = False
+    ) -> Dict[str, Any]:
         """
         상용 AI 모델에게 프롬프트를 전송하고 응답을 받습니다.
+        동일한 (모델, 시스템 프롬프트, 프롬프트, temperature) 호출은 응답 캐시에서 반환하며,
+        use_cache=False로 호출하면 캐시를 우회합니다.
+        같은 프롬프트로 동시에 들어온 호출은 하나의 실제 API 요청을 함께 기다립니다.
+        role(orchestrator, source_code, assembly_binary, logs_config)을 지정하면
+        주 모델 실패 시 해당 역할의 폴백 체인 순서대로 다른 제공자를 시도합니다.
+        stop_at_json=True이면 스트리밍으로 응답을 받다가 최상위 JSON 객체가 닫히는 즉시 생성을 중단합니다.
         """
-        try:
-            print(f"🤖 AI 모델 호출 시작: {model}")
-            print(f"📝 프롬프트 길이: {len(prompt)} characters")
+        stop_at_json = stop_at_json and settings.LLM_STREAMING_ENABLED
+        # 조기 종료 응답은 뒤쪽 설명이 잘린 형태이므로 전체 응답과 캐시 키를 구분합니다.
+        extra = {"stop_at_json": True} if stop_at_json else {}
+        request_key = make_cache_key(model, prompt, system_prompt, temperature, **extra)
 
-            import time
+        cache_key = None
+        if use_cache and settings.LLM_CACHE_ENABLED:
+            cache_key = request_key
             start_time = time.time()
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                duration = time.time() - start_time
+                print(f"⚡ LLM 캐시 적중 ({cached['cache_tier']}): {model} ({duration * 1000:.1f}ms)")
+                return {**cached, "cached": True, "actual_duration": duration}
 
-            if model.startswith("gpt-"):
-                response = await self._call_openai(model, prompt, system_prompt)
-            elif model.startswith("gemini-"):
-                response = await self._call_google(model, prompt, system_prompt)
-            elif ":" in model:  # Ollama 모델 (예: llama3:8b)
-                response = await self._call_ollama(model, prompt, system_prompt)
-            else:
-                raise ValueError(f"지원하지 않는 모델: {model}")
+        if not settings.LLM_SINGLEFLIGHT_ENABLED:
+            return await self._generate_uncached(model, prompt, system_prompt, temperature, cache_key, role, stop_at_json)
+
+        response, shared = await self.singleflight.do(
+            request_key,
+            lambda: self._generate_uncached(model, prompt, system_prompt, temperature, cache_key, role, stop_at_json)
+        )
+        if shared:
+            print(f"🔗 진행 중인 동일 요청에 합류: {model}")
+            return {**response, "coalesced": True}
+        return response
+
+    async def _generate_uncached(
+        self,
+        model: str,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: float,
+        cache_key: Optional[str],
+        role: Optional[str] = None,
+        stop_at_json: bool = False
+    ) -> Dict[str, Any]:
+        """
+        폴백 체인의 모델을 순서대로 호출하여 처음 성공한 응답을 반환합니다.
+        주 모델이 응답한 경우에만 결과를 캐시에 저장합니다.
+        """
+        chain = self._get_model_chain(model, role)
+        failover_path = []
+        response: Dict[str, Any] = {"success": False, "error": "호출 가능한 모델 없음", "content": None}
+        start_time = time.time()
+
+        print(f"📝 프롬프트 길이: {len(prompt)} characters")
+
+        for index, candidate in enumerate(chain):
+            is_last = index == len(chain) - 1
+            try:
+                provider = self._get_provider(candidate)
+                print(f"🤖 AI 모델 호출 시작: {candidate}" + (f" (폴백 {index}/{len(chain) - 1})" if index else ""))
+
+                call = self._call_with_resilience(provider, candidate, prompt, system_prompt, temperature, stop_at_json)
+                if is_last:
+                    response = await call
+                else:
+                    # 느린 제공자에 묶이지 않도록 다음 후보가 있으면 시도 시간 상한을 둡니다.
+                    response = await asyncio.wait_for(call, timeout=settings.LLM_FAILOVER_ATTEMPT_TIMEOUT_SECONDS)
+
+            except asyncio.TimeoutError:
+                response = {
+                    "success": False,
+                    "error": f"{candidate} 응답 지연 ({settings.LLM_FAILOVER_ATTEMPT_TIMEOUT_SECONDS:g}초 초과)",
+                    "content": None
+                }
+            except Exception as e:
+                response = {"success": False, "error": str(e), "content": None}
+
+            if response.get("success"):
+                response["provider"] = provider
+                response["model"] = candidate
+                break
+
+            failover_path.append({"model": candidate, "error": response.get("error")})
+            if not is_last:
+                print(f"↪️ {candidate} 실패, 다음 모델로 전환: {response.get('error')}")
+
+        duration = time.time() - start_time
+
+        if response.get("success"):
+            print(f"✅ AI 응답 완료 ({response['model']}): {duration:.2f}초")
+            print(f"📊 응답 길이: {len(response.get('content') or '')} characters")
+            self.resilience.record_answer(response["model"], fallback_used=response["model"] != model)
+        else:
+            print(f"❌ AI 모델 '{model}' 호출 실패 ({duration:.2f}초): {response.get('error')}")
+
+        response["actual_duration"] = duration
+        response["requested_model"] = model
+        response["fallback_used"] = response.get("success", False) and response.get("model") != model
+        if failover_path:
+            response["failover_path"] = failover_path
 
-            end_time = time.time()
-            duration = end_time - start_time
+        # 주 모델이 성공한 응답만 캐시에 저장
+        if cache_key and response.get("success") and response.get("content") and not response["fallback_used"]:
+            await self.cache.set(cache_key, model, {
+                "success": True,
+                "content": response["content"],
+                "model": model,
+                "provider": response["provider"],
+                "usage": response.get("usage", {})
+            })
 
-            print(f"✅ AI 응답 완료: {duration:.2f}초")
-            print(f"📊 응답 길이: {len(response.get('content', ''))} characters")
+        return response
 
-            response["actual_duration"] = duration
+    def _get_model_chain(self, model: str, role: Optional[str]) -> List[str]:
+        """주 모델 뒤에 역할별 폴백 모델을 중복 없이 이어 붙인 호출 순서를 반환합니다."""
+        chain = [model]
+        if role and settings.LLM_FAILOVER_ENABLED:
+            fallback_models = {
+                "orchestrator": settings.ORCHESTRATOR_FALLBACK_MODELS,
+                "source_code": settings.SOURCE_CODE_FALLBACK_MODELS,
+                "assembly_binary": settings.BINARY_FALLBACK_MODELS,
+                "logs_config": settings.LOG_CONF_FALLBACK_MODELS
+            }.get(role, [])
+            chain.extend(m for m in fallback_models if m and m not in chain)
+        return chain
+
+    async def _call_with_resilience(
+        self,
+        provider: str,
+        model: str,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: float,
+        stop_at_json: bool = False
+    ) -> Dict[str, Any]:
+        """
+        서킷 브레이커 확인 후 일시적 오류에 한해 지수 백오프 + 지터로 재시도합니다.
+        충분한 지연 시간 표본이 쌓이면 p95를 넘긴 요청에 헤지 요청을 추가로 보냅니다.
+        """
+        breaker = self.resilience.breaker(provider)
+        latency = self.resilience.latency(model)
+        policy = get_retry_policy()
+        started = time.monotonic()
+        response: Dict[str, Any] = {}
+
+        for attempt in range(policy.max_attempts):
+            if not breaker.allow_request():
+                self.resilience.stats["circuit_rejections"] += 1
+                return {
+                    "success": False,
+                    "error": f"서킷 브레이커 열림: {provider} 제공자 호출 차단",
+                    "content": None,
+                    "circuit_open": True
+                }
+
+            # 반열림 상태에서 허용된 요청은 시험 요청입니다. 어떤 경로로 끝나든(취소 포함) 시험 상태를 정리해야
+            # 브레이커가 이후 요청을 영구히 차단하지 않습니다.
+            probing = breaker.state == breaker.HALF_OPEN
+            try:
+                call = lambda: self._call_limited(provider, model, prompt, system_prompt, temperature, stop_at_json)
+                hedge_p95 = latency.percentile(0.95) if len(latency) >= settings.LLM_HEDGE_MIN_SAMPLES else None
+
+                attempt_start = time.monotonic()
+                if settings.LLM_HEDGE_ENABLED and hedge_p95 is not None:
+                    hedge_delay = max(hedge_p95, settings.LLM_HEDGE_MIN_DELAY_SECONDS)
+                    response = await hedged_call(call, hedge_delay)
+                    if response.get("hedged"):
+                        self.resilience.stats["hedges"] += 1
+                        if response.get("hedge_won"):
+                            self.resilience.stats["hedge_wins"] += 1
+                else:
+                    response = await call()
+
+                if response.get("success"):
+                    breaker.record_success()
+                    latency.record(time.monotonic() - attempt_start)
+                    response["attempts"] = attempt + 1
+                    return response
+
+                if is_provider_failure(response):
+                    breaker.record_failure()
+            finally:
+                if probing:
+                    breaker.release_probe()
+
+            if not is_retryable(response) or attempt + 1 >= policy.max_attempts:
+                break
+
+            delay = policy.backoff(attempt, response.get("retry_after"))
+            if time.monotonic() - started + delay > policy.budget_seconds:
+                print(f"⏱️ 재시도 예산({policy.budget_seconds:.0f}초) 초과로 재시도 중단: {model}")
+                break
+
+            self.resilience.stats["retries"] += 1
+            print(f"🔁 일시적 오류로 재시도 {attempt + 1}/{policy.max_attempts - 1} ({delay:.2f}초 후): {response.get('error')}")
+            await asyncio.sleep(delay)
+
+        response["attempts"] = attempt + 1
+        return response
+
+    async def _call_limited(
+        self,
+        provider: str,
+        model: str,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: float,
+        stop_at_json: bool = False
+    ) -> Dict[str, Any]:
+        """
+        요청 한도 안에서 제공자 API를 한 번 호출합니다.
+        네트워크 오류와 타임아웃은 예외 대신 재시도 가능한 실패 응답으로 변환합니다.
+        """
+        try:
+            if not settings.LLM_RATE_LIMIT_ENABLED:
+                return await self._call_provider(provider, model, prompt, system_prompt, temperature, stop_at_json)
+
+            # 제공자/모델별 동시성 · RPM · TPM 한도 내에서 대기 후 호출
+            limiter = self.rate_limiters.get(provider, model)
+            estimated = estimate_tokens(prompt, system_prompt) + settings.LLM_ESTIMATED_OUTPUT_TOKENS
+            async with limiter.limit(estimated) as queue_wait:
+                if queue_wait > 0.001:
+                    print(f"🚦 요청 한도 대기: {limiter.name} ({queue_wait:.2f}초)")
+                response = await self._call_provider(provider, model, prompt, system_prompt, temperature, stop_at_json)
+            limiter.record_usage(estimated, self._get_total_tokens(response.get("usage")))
+            response["queue_wait"] = queue_wait
             return response
 
-        except Exception as e:
-            print(f"❌ AI 모델 '{model}' 호출 중 오류 발생: {e}")
+        except (httpx.TimeoutException, httpx.TransportError) as e:
             return {
                 "success": False,
-                "error": str(e),
-                "content": None
+                "error": f"{provider} 연결 오류: {e.__class__.__name__} {e}",
+                "content": None,
+                "transient": True
             }
 
-    async def _call_openai(self, model: str, prompt: str, system_prompt: Optional[str] = None) -> Dict[str, Any]:
+    def _get_provider(self, model: str) -> str:
+        """모델 이름으로 제공자를 판별합니다."""
+        if model.startswith("gpt-"):
+            return "openai"
+        elif model.startswith("gemini-"):
+            return "google"
+        elif ":" in model:  # Ollama 모델 (예: llama3:8b)
+            return "ollama"
+        raise ValueError(f"지원하지 않는 모델: {model}")
+
+    async def _call_provider(
+        self,
+        provider: str,
+        model: str,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: float,
+        stop_at_json: bool = False
+    ) -> Dict[str, Any]:
+        """제공자별 API 호출 메소드로 분기합니다."""
+        if stop_at_json:
+            return await self._call_streaming(provider, model, prompt, system_prompt, temperature)
+        if provider == "openai":
+            return await self._call_openai(model, prompt, system_prompt, temperature)
+        elif provider == "google":
+            return await self._call_google(model, prompt, system_prompt, temperature)
+        return await self._call_ollama(model, prompt, system_prompt, temperature)
+
+    def _parse_retry_after(self, response: httpx.Response) -> Optional[float]:
+        """Retry-After 헤더(초 단위)를 파싱합니다."""
+        value = response.headers.get("retry-after")
+        try:
+            return float(value) if value is not None else None
+        except ValueError:
+            return None
+
+    def _get_total_tokens(self, usage: Optional[Dict[str, Any]]) -> int:
+        """제공자별 usage 형식에서 전체 토큰 수를 추출합니다."""
+        if not usage:
+            return 0
+        return int(usage.get("total_tokens") or usage.get("totalTokenCount") or 0)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        AI 호출 관련 프로세스 전역 지표(캐시, 커넥션 풀)를 반환합니다.
+        """
+        return {
+            "cache": self.cache.get_stats(),
+            "singleflight": self.singleflight.get_stats(),
+            "rate_limits": self.rate_limiters.get_stats(),
+            "resilience": self.resilience.get_stats(),
+            "http_pool": self.http_pool.get_stats()
+        }
+
+    async def _call_openai(self, model: str, prompt: str, system_prompt: Optional[str] = None, temperature: float = 0.1) -> Dict[str, Any]:
         """OpenAI API 호출"""
         messages = []
 
@@ -61,86 +341,90 @@ class AIService:
 
         messages.append({"role": "user", "content": prompt})
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.openai_base_url}/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {self.openai_api_key}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": model,
-                    "messages": messages,
-                    "temperature": 0.1
-                },
-                timeout=60.0
-            )
+        client = self.http_pool.get_client(self.openai_base_url)
+        response = await client.post(
+            f"{self.openai_base_url}/chat/completions",
+            headers={
+                "Authorization": f"Bearer {self.openai_api_key}",
+                "Content-Type": "application/json"
+            },
+            json={
+                "model": model,
+                "messages": messages,
+                "temperature": temperature
+            },
+            timeout=settings.LLM_REQUEST_TIMEOUT_SECONDS
+        )
 
-            if response.status_code == 200:
-                data = response.json()
-                return {
-                    "success": True,
-                    "content": data["choices"][0]["message"]["content"],
-                    "model": model,
-                    "usage": data.get("usage", {})
-                }
-            else:
-                return {
-                    "success": False,
-                    "error": f"OpenAI API 오류: {response.status_code} - {response.text}",
-                    "content": None
-                }
+        if response.status_code == 200:
+            data = response.json()
+            return {
+                "success": True,
+                "content": data["choices"][0]["message"]["content"],
+                "model": model,
+                "usage": data.get("usage", {})
+            }
+        else:
+            return {
+                "success": False,
+                "error": f"OpenAI API 오류: {response.status_code} - {response.text}",
+                "content": None,
+                "status_code": response.status_code,
+                "retry_after": self._parse_retry_after(response)
+            }
 
-    async def _call_google(self, model: str, prompt: str, system_prompt: Optional[str] = None) -> Dict[str, Any]:
+    async def _call_google(self, model: str, prompt: str, system_prompt: Optional[str] = None, temperature: float = 0.1) -> Dict[str, Any]:
         """Google Gemini API 호출"""
         # Gemini API는 시스템 프롬프트를 사용자 프롬프트와 함께 처리
         full_prompt = prompt
         if system_prompt:
             full_prompt = f"{system_prompt}\n\n{prompt}"
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.google_base_url}/models/{model}:generateContent",
-                headers={
-                    "Content-Type": "application/json"
-                },
-                params={"key": self.google_api_key},
-                json={
-                    "contents": [{
-                        "parts": [{"text": full_prompt}]
-                    }],
-                    "generationConfig": {
-                        "temperature": 0.1,
-                        "maxOutputTokens": 4096
-                    }
-                },
-                timeout=60.0
-            )
-
-            if response.status_code == 200:
-                data = response.json()
-                if "candidates" in data and len(data["candidates"]) > 0:
-                    content = data["candidates"][0]["content"]["parts"][0]["text"]
-                    return {
-                        "success": True,
-                        "content": content,
-                        "model": model,
-                        "usage": data.get("usageMetadata", {})
-                    }
-                else:
-                    return {
-                        "success": False,
-                        "error": "Google API에서 유효한 응답을 받지 못했습니다",
-                        "content": None
-                    }
+        client = self.http_pool.get_client(self.google_base_url)
+        response = await client.post(
+            f"{self.google_base_url}/models/{model}:generateContent",
+            headers={
+                "Content-Type": "application/json"
+            },
+            params={"key": self.google_api_key},
+            json={
+                "contents": [{
+                    "parts": [{"text": full_prompt}]
+                }],
+                "generationConfig": {
+                    "temperature": temperature,
+                    "maxOutputTokens": 4096
+                }
+            },
+            timeout=settings.LLM_REQUEST_TIMEOUT_SECONDS
+        )
+
+        if response.status_code == 200:
+            data = response.json()
+            if "candidates" in data and len(data["candidates"]) > 0:
+                content = data["candidates"][0]["content"]["parts"][0]["text"]
+                return {
+                    "success": True,
+                    "content": content,
+                    "model": model,
+                    "usage": data.get("usageMetadata", {})
+                }
             else:
                 return {
                     "success": False,
-                    "error": f"Google API 오류: {response.status_code} - {response.text}",
+                    "error": "Google API에서 유효한 응답을 받지 못했습니다",
                     "content": None
                 }
+        else:
+            return {
+                "success": False,
+                "error": f"Google API 오류: {response.status_code} - {response.text}",
+                "content": None,
+                "status_code": response.status_code,
+                "retry_after": self._parse_retry_after(response)
+            }
 
-    async def _call_ollama(self, model: str, prompt: str, system_prompt: Optional[str] = None) -> Dict[str, Any]:
+    async def _call_ollama(self, model: str, prompt: str, system_prompt: Optional[str] = None, temperature: float = 0.1) -> Dict[str, Any]:
         """Ollama API 호출"""
         messages = []
 
@@ -149,42 +433,215 @@ class AIService:
 
         messages.append({"role": "user", "content": prompt})
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.ollama_base_url}/api/chat",
-                headers={
+        client = self.http_pool.get_client(self.ollama_base_url)
+        response = await client.post(
+            f"{self.ollama_base_url}/api/chat",
+            headers={
+                "Content-Type": "application/json"
+            },
+            json={
+                "model": model,
+                "messages": messages,
+                "stream": False,
+                "options": {
+                    "temperature": temperature
+                }
+            },
+            timeout=settings.LLM_OLLAMA_TIMEOUT_SECONDS
+        )
+
+        if response.status_code == 200:
+            data = response.json()
+            return {
+                "success": True,
+                "content": data["message"]["content"],
+                "model": model,
+                "usage": {
+                    "prompt_tokens": data.get("prompt_eval_count", 0),
+                    "completion_tokens": data.get("eval_count", 0),
+                    "total_tokens": data.get("prompt_eval_count", 0) + data.get("eval_count", 0)
+                }
+            }
+        else:
+            return {
+                "success": False,
+                "error": f"Ollama API 오류: {response.status_code} - {response.text}",
+                "content": None,
+                "status_code": response.status_code,
+                "retry_after": self._parse_retry_after(response)
+            }
+
+    async def _call_streaming(
+        self,
+        provider: str,
+        model: str,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: float
+    ) -> Dict[str, Any]:
+        """
+        제공자의 스트리밍 API로 응답을 받으며 최상위 JSON 객체가 완성되면 스트림을 닫습니다.
+        스트림을 닫으면 서버 측 생성도 중단되어 뒤에 붙는 설명 문장의 출력 토큰을 절약합니다.
+        """
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+
+        if provider == "openai":
+            base_url = self.openai_base_url
+            request = {
+                "url": f"{self.openai_base_url}/chat/completions",
+                "headers": {
+                    "Authorization": f"Bearer {self.openai_api_key}",
                     "Content-Type": "application/json"
                 },
-                json={
+                "json": {
                     "model": model,
                     "messages": messages,
-                    "stream": False,
-                    "options": {
-                        "temperature": 0.1
+                    "temperature": temperature,
+                    "stream": True,
+                    "stream_options": {"include_usage": True}
+                },
+                "timeout": settings.LLM_REQUEST_TIMEOUT_SECONDS
+            }
+            provider_name = "OpenAI"
+        elif provider == "google":
+            # Gemini API는 시스템 프롬프트를 사용자 프롬프트와 함께 처리
+            full_prompt = f"{system_prompt}\n\n{prompt}" if system_prompt else prompt
+            base_url = self.google_base_url
+            request = {
+                "url": f"{self.google_base_url}/models/{model}:streamGenerateContent",
+                "headers": {"Content-Type": "application/json"},
+                "params": {"key": self.google_api_key, "alt": "sse"},
+                "json": {
+                    "contents": [{
+                        "parts": [{"text": full_prompt}]
+                    }],
+                    "generationConfig": {
+                        "temperature": temperature,
+                        "maxOutputTokens": 4096
                     }
                 },
-                timeout=120.0
-            )
-
-            if response.status_code == 200:
-                data = response.json()
-                return {
-                    "success": True,
-                    "content": data["message"]["content"],
+                "timeout": settings.LLM_REQUEST_TIMEOUT_SECONDS
+            }
+            provider_name = "Google"
+        else:
+            base_url = self.ollama_base_url
+            request = {
+                "url": f"{self.ollama_base_url}/api/chat",
+                "headers": {"Content-Type": "application/json"},
+                "json": {
                     "model": model,
-                    "usage": {
-                        "prompt_tokens": data.get("prompt_eval_count", 0),
-                        "completion_tokens": data.get("eval_count", 0),
-                        "total_tokens": data.get("prompt_eval_count", 0) + data.get("eval_count", 0)
+                    "messages": messages,
+                    "stream": True,
+                    "options": {
+                        "temperature": temperature
                     }
-                }
-            else:
+                },
+                "timeout": settings.LLM_OLLAMA_TIMEOUT_SECONDS
+            }
+            provider_name = "Ollama"
+
+        parser = IncrementalJSONObjectParser()
+        usage: Dict[str, Any] = {}
+        early_stop = False
+
+        client = self.http_pool.get_client(base_url)
+        async with client.stream("POST", **request) as response:
+            if response.status_code != 200:
+                await response.aread()
                 return {
                     "success": False,
-                    "error": f"Ollama API 오류: {response.status_code} - {response.text}",
-                    "content": None
+                    "error": f"{provider_name} API 오류: {response.status_code} - {response.text}",
+                    "content": None,
+                    "status_code": response.status_code,
+                    "retry_after": self._parse_retry_after(response)
                 }
 
+            async for line in response.aiter_lines():
+                chunk = self._parse_stream_line(provider, line)
+                if chunk is None:
+                    continue
+                text, chunk_usage = chunk
+                if chunk_usage:
+                    usage = chunk_usage
+                if parser.feed(text):
+                    # 컨텍스트를 빠져나가면 응답이 닫히고 서버의 나머지 생성이 취소됩니다.
+                    early_stop = True
+                    break
+
+        content = parser.text_until_complete if early_stop else parser.text
+        if not content:
+            return {
+                "success": False,
+                "error": f"{provider_name} API에서 유효한 응답을 받지 못했습니다",
+                "content": None
+            }
+
+        if early_stop:
+            print(f"✂️ JSON 객체 완성 시점에 스트림 조기 종료: {model} ({len(content)} characters)")
+        if not usage:
+            # 조기 종료 시 제공자가 사용량을 보내기 전이므로 추정치를 사용합니다.
+            prompt_tokens = estimate_tokens(prompt, system_prompt)
+            completion_tokens = estimate_tokens(content)
+            usage = {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+                "estimated": True
+            }
+
+        return {
+            "success": True,
+            "content": content,
+            "model": model,
+            "usage": usage,
+            "streamed": True,
+            "early_stop": early_stop
+        }
+
+    def _parse_stream_line(self, provider: str, line: str) -> Optional[tuple]:
+        """
+        스트림 한 줄(OpenAI/Gemini SSE, Ollama NDJSON)에서 (텍스트 조각, 사용량)을 추출합니다.
+        내용이 없는 줄은 None을 반환합니다.
+        """
+        line = line.strip()
+        if provider in ("openai", "google"):
+            if not line.startswith("data:"):
+                return None
+            line = line[5:].strip()
+            if line == "[DONE]":
+                return None
+        if not line:
+            return None
+
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError:
+            return None
+
+        if provider == "openai":
+            choices = data.get("choices") or []
+            delta = (choices[0].get("delta") or {}) if choices else {}
+            text = delta.get("content") or ""
+            return text, data.get("usage") or {}
+        if provider == "google":
+            candidates = data.get("candidates") or []
+            parts = candidates[0].get("content", {}).get("parts", []) if candidates else []
+            text = "".join(part.get("text", "") for part in parts)
+            return text, data.get("usageMetadata") or {}
+
+        text = (data.get("message") or {}).get("content", "")
+        usage = {}
+        if data.get("done"):
+            usage = {
+                "prompt_tokens": data.get("prompt_eval_count", 0),
+                "completion_tokens": data.get("eval_count", 0),
+                "total_tokens": data.get("prompt_eval_count", 0) + data.get("eval_count", 0)
+            }
+        return text, usage
+
 # 의존성 주입을 위한 함수
 def get_ai_service():
     return AIService()
\ No newline at end of file
@@ -0,0 +1,438 @@
+# File: pqc_inspector_server/services/binary_format.py
+# 🧩 ELF / PE / Mach-O 헤더를 순수 파이썬(struct + memoryview)으로 파싱하여
+# 링크된 라이브러리, 동적 임포트, 익스포트 심볼, 섹션 범위를 추출합니다.
+# 헤더와 심볼 테이블은 memoryview에서 복사 없이 읽고, 문자열 테이블만 한 번 bytes로 복사합니다.
+# 추출 결과는 AssemblyBinaryAgent 프롬프트의 고신호 근거(수백 바이트)와 문자열 추출의 섹션 태깅에 사용됩니다.
+
+import struct
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from .preprocessing import BinaryBuffer, SectionRange
+
+# 손상되었거나 악의적인 헤더로 인한 과도한 반복을 막기 위한 상한
+MAX_SECTIONS = 4096
+MAX_SYMBOLS = 200000
+MAX_LOAD_COMMANDS = 4096
+MAX_IMPORTS_PER_LIBRARY = 20000
+MAX_NAME_BYTES = 1024
+
+ELF_MACHINES = {
+    0x03: "x86", 0x3e: "x86-64", 0x28: "ARM", 0xb7: "AArch64", 0xf3: "RISC-V",
+    0x08: "MIPS", 0x14: "PowerPC", 0x15: "PowerPC64", 0x16: "s390"
+}
+ELF_TYPES = {1: "재배치 오브젝트", 2: "실행 파일", 3: "공유 라이브러리", 4: "코어 덤프"}
+PE_MACHINES = {0x14c: "x86", 0x8664: "x86-64", 0x1c0: "ARM", 0x1c4: "ARMv7", 0xaa64: "ARM64"}
+MACHO_CPUS = {
+    7: "x86", 0x01000007: "x86-64", 12: "ARM", 0x0100000c: "ARM64", 18: "PowerPC", 0x01000012: "PowerPC64"
+}
+MACHO_FILE_TYPES = {1: "오브젝트", 2: "실행 파일", 6: "동적 라이브러리", 8: "번들"}
+
+
+class BinaryFormatError(ValueError):
+    """헤더가 손상되었거나 범위를 벗어난 경우"""
+
+
+@dataclass
+class BinaryInfo:
+    format: str  # "ELF", "PE", "Mach-O"
+    arch: str
+    bits: int
+    kind: str = ""  # 실행 파일 / 공유 라이브러리 등
+    sections: List[SectionRange] = field(default_factory=list)
+    libraries: List[str] = field(default_factory=list)
+    imports: List[str] = field(default_factory=list)  # PE는 "라이브러리!함수" 형식
+    exports: List[str] = field(default_factory=list)
+
+    @property
+    def has_symbols(self) -> bool:
+        return bool(self.libraries or self.imports or self.exports)
+
+    def describe(self) -> str:
+        kind = f" {self.kind}" if self.kind else ""
+        return f"{self.format} {self.bits}-bit {self.arch}{kind}"
+
+
+def _unique(names) -> List[str]:
+    """순서를 유지하며 빈 이름과 중복을 제거합니다."""
+    return [name for name in dict.fromkeys(names) if name]
+
+
+def _check_range(view: memoryview, offset: int, size: int) -> None:
+    if offset < 0 or size < 0 or offset + size > len(view):
+        raise BinaryFormatError(f"범위를 벗어난 헤더 참조: 0x{offset:x}+{size}")
+
+
+def _table(view: memoryview, offset: int, count: int, entry_size: int, fmt: str) -> Iterator[tuple]:
+    """고정 크기 레코드 배열을 복사 없이 순회합니다."""
+    record = struct.Struct(fmt)
+    _check_range(view, offset, count * entry_size)
+    if entry_size == record.size:
+        return record.iter_unpack(view[offset:offset + count * entry_size])
+    return (record.unpack_from(view, offset + index * entry_size) for index in range(count))
+
+
+def _string_reader(view: memoryview, offset: int, size: int) -> Callable[[int], str]:
+    """문자열 테이블을 한 번 복사해 두고 오프셋으로 NUL 종료 문자열을 읽는 함수를 반환합니다."""
+    offset = max(0, min(offset, len(view)))
+    table = bytes(view[offset:offset + max(0, size)])
+
+    def read(position: int) -> str:
+        if position < 0 or position >= len(table):
+            return ""
+        end = table.find(b"\0", position, position + MAX_NAME_BYTES)
+        return table[position:end if end >= 0 else position + MAX_NAME_BYTES].decode("utf-8", errors="replace")
+
+    return read
+
+
+def _cstring(view: memoryview, offset: int) -> str:
+    """임의 위치의 NUL 종료 문자열을 읽습니다 (PE 이름 테이블처럼 흩어진 문자열용)."""
+    if offset < 0 or offset >= len(view):
+        return ""
+    chunk = bytes(view[offset:offset + MAX_NAME_BYTES])
+    end = chunk.find(b"\0")
+    return chunk[:end if end >= 0 else len(chunk)].decode("utf-8", errors="replace")
+
+
+# --- ELF ---
+
+def _parse_elf(view: memoryview) -> BinaryInfo:
+    if len(view) < 52:
+        raise BinaryFormatError("ELF 헤더가 너무 짧습니다")
+    bits = {1: 32, 2: 64}.get(view[4])
+    endian = {1: "<", 2: ">"}.get(view[5])
+    if bits is None or endian is None:
+        raise BinaryFormatError("알 수 없는 ELF 클래스/엔디언")
+
+    if bits == 64:
+        (e_type, e_machine, _, _, _, e_shoff, _, _, _, _, e_shentsize, e_shnum, e_shstrndx) = \
+            struct.unpack_from(endian + "HHIQQQIHHHHHH", view, 16)
+        section_fmt = endian + "IIQQQQIIQQ"
+        symbol_fmt, symbol_size = endian + "IBBHQQ", 24
+        dynamic_fmt, dynamic_size = endian + "qQ", 16
+    else:
+        (e_type, e_machine, _, _, _, e_shoff, _, _, _, _, e_shentsize, e_shnum, e_shstrndx) = \
+            struct.unpack_from(endian + "HHIIIIIHHHHHH", view, 16)
+        section_fmt = endian + "IIIIIIIIII"
+        symbol_fmt, symbol_size = endian + "IIIBBH", 16
+        dynamic_fmt, dynamic_size = endian + "iI", 8
+
+    info = BinaryInfo(
+        format="ELF",
+        arch=ELF_MACHINES.get(e_machine, f"machine 0x{e_machine:x}"),
+        bits=bits,
+        kind=ELF_TYPES.get(e_type, "")
+    )
+    if not e_shoff:
+        # 섹션 헤더가 제거된 바이너리 (sstrip 등)
+        return info
+
+    entry_size = e_shentsize or struct.calcsize(section_fmt)
+    if e_shnum == 0 or e_shstrndx == 0xffff:
+        # 섹션이 많으면 실제 개수/문자열 테이블 인덱스가 0번 섹션 헤더에 들어 있습니다.
+        first = struct.unpack_from(section_fmt, view, e_shoff)
+        e_shnum = e_shnum or first[5]
+        e_shstrndx = first[6] if e_shstrndx == 0xffff else e_shstrndx
+    if e_shnum > MAX_SECTIONS:
+        raise BinaryFormatError(f"섹션 수가 비정상적입니다: {e_shnum}")
+
+    # (name, type, flags, addr, offset, size, link, info, addralign, entsize)
+    headers = list(_table(view, e_shoff, e_shnum, entry_size, section_fmt))
+    if e_shstrndx < len(headers):
+        names_header = headers[e_shstrndx]
+        section_name = _string_reader(view, names_header[4], names_header[5])
+    else:
+        section_name = lambda position: ""  # noqa: E731
+
+    names = [section_name(header[0]) for header in headers]
+    for name, header in zip(names, headers):
+        section_type, offset, size = header[1], header[4], header[5]
+        # SHT_NOBITS(.bss)는 파일에 바이트가 없습니다.
+        if name and section_type != 8 and size > 0 and offset + size <= len(view):
+            info.sections.append((name, offset, offset + size))
+
+    imports: List[str] = []
+    exports: List[str] = []
+    libraries: List[str] = []
+    for header in headers:
+        section_type, offset, size, link, entsize = header[1], header[4], header[5], header[6], header[9]
+        if link >= len(headers) or section_type not in (2, 6, 11):
+            continue
+        strtab = headers[link]
+        read_name = _string_reader(view, strtab[4], strtab[5])
+
+        if section_type == 6:
+            # SHT_DYNAMIC: DT_NEEDED(1) 항목이 링크된 공유 라이브러리 이름입니다.
+            count = size // (entsize or dynamic_size)
+            for tag, value in _table(view, offset, count, entsize or dynamic_size, dynamic_fmt):
+                if tag == 0:
+                    break
+                if tag == 1:
+                    libraries.append(read_name(value))
+            continue
+
+        # SHT_SYMTAB(2) / SHT_DYNSYM(11)
+        count = min(size // (entsize or symbol_size), MAX_SYMBOLS)
+        for symbol in _table(view, offset, count, entsize or symbol_size, symbol_fmt):
+            if bits == 64:
+                st_name, st_info, _, st_shndx, _, _ = symbol
+            else:
+                st_name, _, _, st_info, _, st_shndx = symbol
+            if not st_name:
+                continue
+            bind, kind = st_info >> 4, st_info & 0xf
+            if st_shndx == 0:
+                # 정의되지 않은 심볼 = 다른 라이브러리에서 가져오는 임포트
+                if section_type == 11 or bind in (1, 2):
+                    imports.append(read_name(st_name))
+            elif bind in (1, 2) and kind in (1, 2, 10) and st_shndx != 0xfff1:
+                # 전역/약한 바인딩의 함수(FUNC, GNU_IFUNC)와 객체(OBJECT). SHN_ABS는 심볼 버전 정의라 제외합니다.
+                exports.append(read_name(st_name).split("@", 1)[0])
+
+    info.libraries = _unique(libraries)
+    info.imports = _unique(name.split("@", 1)[0] for name in imports)
+    info.exports = _unique(exports)
+    return info
+
+
+# --- PE ---
+
+def _parse_pe(view: memoryview) -> BinaryInfo:
+    if len(view) < 0x40:
+        raise BinaryFormatError("DOS 헤더가 너무 짧습니다")
+    (pe_offset,) = struct.unpack_from("<I", view, 0x3c)
+    _check_range(view, pe_offset, 24)
+    if bytes(view[pe_offset:pe_offset + 4]) != b"PE\0\0":
+        raise BinaryFormatError("PE 시그니처가 없습니다")
+
+    machine, section_count, _, _, _, optional_size, characteristics = struct.unpack_from("<HHIIIHH", view, pe_offset + 4)
+    optional = pe_offset + 24
+    (magic,) = struct.unpack_from("<H", view, optional)
+    if magic == 0x20b:
+        bits, thunk_fmt, ordinal_flag = 64, "<Q", 1 << 63
+        (image_base,) = struct.unpack_from("<Q", view, optional + 24)
+        (directory_count,) = struct.unpack_from("<I", view, optional + 108)
+        directories_offset = optional + 112
+    elif magic == 0x10b:
+        bits, thunk_fmt, ordinal_flag = 32, "<I", 1 << 31
+        (image_base,) = struct.unpack_from("<I", view, optional + 28)
+        (directory_count,) = struct.unpack_from("<I", view, optional + 92)
+        directories_offset = optional + 96
+    else:
+        raise BinaryFormatError(f"알 수 없는 PE 옵션 헤더: 0x{magic:x}")
+
+    directories = list(_table(view, directories_offset, min(directory_count, 16), 8, "<II"))
+    info = BinaryInfo(
+        format="PE",
+        arch=PE_MACHINES.get(machine, f"machine 0x{machine:x}"),
+        bits=bits,
+        kind="DLL" if characteristics & 0x2000 else "실행 파일"
+    )
+
+    # 섹션 테이블: (이름, 가상 크기, 가상 주소, 파일 내 크기, 파일 내 오프셋)
+    sections: List[Tuple[str, int, int, int, int]] = []
+    for raw_name, virtual_size, virtual_address, raw_size, raw_offset in _table(
+        view, optional + optional_size, min(section_count, MAX_SECTIONS), 40, "<8sIIII"
+    ):
+        name = raw_name.rstrip(b"\0").decode("utf-8", errors="replace")
+        sections.append((name, virtual_size, virtual_address, raw_size, raw_offset))
+        if raw_size and raw_offset + raw_size <= len(view):
+            info.sections.append((name, raw_offset, raw_offset + raw_size))
+
+    def rva_to_offset(rva: int) -> int:
+        for _, virtual_size, virtual_address, raw_size, raw_offset in sections:
+            if virtual_address <= rva < virtual_address + max(virtual_size, raw_size):
+                return rva - virtual_address + raw_offset
+        return rva if rva < len(view) else -1
+
+    def directory(index: int) -> Tuple[int, int]:
+        return directories[index] if index < len(directories) else (0, 0)
+
+    def read_thunks(library: str, thunk_rva: int) -> None:
+        position = rva_to_offset(thunk_rva)
+        thunk_size = struct.calcsize(thunk_fmt)
+        for _ in range(MAX_IMPORTS_PER_LIBRARY):
+            if position < 0 or position + thunk_size > len(view):
+                break
+            (thunk,) = struct.unpack_from(thunk_fmt, view, position)
+            if thunk == 0:
+                break
+            if thunk & ordinal_flag:
+                info.imports.append(f"{library}!#{thunk & 0xffff}")
+            else:
+                # IMAGE_IMPORT_BY_NAME: 힌트(2바이트) 다음에 함수 이름
+                info.imports.append(f"{library}!{_cstring(view, rva_to_offset(thunk & 0x7fffffff) + 2)}")
+            position += thunk_size
+
+    # 일반 임포트 디렉터리 (IMAGE_IMPORT_DESCRIPTOR, 20바이트)
+    import_rva, _ = directory(1)
+    position = rva_to_offset(import_rva) if import_rva else -1
+    while 0 <= position and position + 20 <= len(view):
+        original_first_thunk, _, _, name_rva, first_thunk = struct.unpack_from("<IIIII", view, position)
+        if not name_rva:
+            break
+        library = _cstring(view, rva_to_offset(name_rva)).lower()
+        info.libraries.append(library)
+        read_thunks(library, original_first_thunk or first_thunk)
+        position += 20
+
+    # 지연 로드 임포트 디렉터리 (32바이트). 속성 비트 0이 꺼져 있으면 주소가 RVA가 아닌 VA입니다.
+    delay_rva, _ = directory(13)
+    position = rva_to_offset(delay_rva) if delay_rva else -1
+    while 0 <= position and position + 32 <= len(view):
+        attributes, name_rva, _, _, name_table_rva, _, _, _ = struct.unpack_from("<IIIIIIII", view, position)
+        if not name_rva:
+            break
+        base = 0 if attributes & 1 else image_base
+        library = _cstring(view, rva_to_offset(name_rva - base)).lower()
+        info.libraries.append(library)
+        read_thunks(library, name_table_rva - base)
+        position += 32
+
+    # 익스포트 디렉터리: 이름 RVA 배열
+    export_rva, _ = directory(0)
+    if export_rva:
+        position = rva_to_offset(export_rva)
+        _check_range(view, position, 40)
+        name_count, names_rva = struct.unpack_from("<I4xI", view, position + 24)
+        names_offset = rva_to_offset(names_rva)
+        for (name_rva,) in _table(view, names_offset, min(name_count, MAX_SYMBOLS), 4, "<I"):
+            info.exports.append(_cstring(view, rva_to_offset(name_rva)))
+
+    info.libraries = _unique(info.libraries)
+    info.imports = _unique(info.imports)
+    info.exports = _unique(info.exports)
+    return info
+
+
+# --- Mach-O ---
+
+MACHO_ZEROFILL_TYPES = (0x1, 0xc, 0x12)
+MACHO_DYLIB_COMMANDS = (0xc, 0x20, 0x80000018, 0x8000001f, 0x80000023)
+
+
+def _macho_slice(view: memoryview) -> Tuple[int, int]:
+    """유니버설(fat) 바이너리면 첫 번째 아키텍처 슬라이스의 (오프셋, 크기)를, 아니면 파일 전체를 반환합니다."""
+    (magic,) = struct.unpack_from(">I", view, 0)
+    if magic not in (0xcafebabe, 0xcafebabf):
+        return 0, len(view)
+    (count,) = struct.unpack_from(">I", view, 4)
+    # 0xcafebabe는 Java 클래스 파일과 같으므로 아키텍처 수로 구분합니다.
+    if not 0 < count < 32:
+        raise BinaryFormatError("유니버설 바이너리가 아닙니다")
+    if magic == 0xcafebabe:
+        _, _, offset, size, _ = struct.unpack_from(">iiIII", view, 8)
+    else:
+        _, _, offset, size, _, _ = struct.unpack_from(">iiQQII", view, 8)
+    _check_range(view, offset, size)
+    return offset, size
+
+
+def _parse_macho(view: memoryview) -> BinaryInfo:
+    base, size = _macho_slice(view)
+    macho = view[base:base + size]
+    (magic,) = struct.unpack_from("<I", macho, 0)
+    if magic in (0xfeedface, 0xfeedfacf):
+        endian = "<"
+    else:
+        endian = ">"
+        (magic,) = struct.unpack_from(">I", macho, 0)
+    bits = 64 if magic == 0xfeedfacf else 32
+
+    _, cputype, _, filetype, command_count, _, _ = struct.unpack_from(endian + "IiiIIII", macho, 0)
+    info = BinaryInfo(
+        format="Mach-O",
+        arch=MACHO_CPUS.get(cputype, f"cpu 0x{cputype:x}"),
+        bits=bits,
+        kind=MACHO_FILE_TYPES.get(filetype, "")
+    )
+
+    if bits == 64:
+        segment_command, segment_fmt, section_fmt, section_size = 0x19, endian + "16sQQQQiiII", endian + "16s16sQQI", 80
+        nlist_fmt, nlist_size = endian + "IBBHQ", 16
+    else:
+        segment_command, segment_fmt, section_fmt, section_size = 0x1, endian + "16sIIIIiiII", endian + "16s16sIII", 68
+        nlist_fmt, nlist_size = endian + "IBBHI", 12
+    segment_header_size = 8 + struct.calcsize(segment_fmt)
+    # section_fmt 뒤 align, reloff, nreloc 다음의 flags 위치
+    flags_offset = struct.calcsize(section_fmt) + 12
+
+    position = 32 if bits == 64 else 28
+    for _ in range(min(command_count, MAX_LOAD_COMMANDS)):
+        command, command_size = struct.unpack_from(endian + "II", macho, position)
+        if command_size < 8:
+            raise BinaryFormatError("잘못된 로드 명령 크기")
+
+        if command == segment_command:
+            section_count = struct.unpack_from(segment_fmt, macho, position + 8)[7]
+            for index in range(min(section_count, MAX_SECTIONS)):
+                section_offset = position + segment_header_size + index * section_size
+                section_name, segment_name, _, section_bytes, file_offset = \
+                    struct.unpack_from(section_fmt, macho, section_offset)
+                (flags,) = struct.unpack_from(endian + "I", macho, section_offset + flags_offset)
+                if (flags & 0xff) in MACHO_ZEROFILL_TYPES or not section_bytes or file_offset + section_bytes > size:
+                    continue
+                name = (segment_name.rstrip(b"\0") + b"," + section_name.rstrip(b"\0")).decode("utf-8", errors="replace")
+                info.sections.append((name, base + file_offset, base + file_offset + section_bytes))
+
+        elif command in MACHO_DYLIB_COMMANDS:
+            (name_offset,) = struct.unpack_from(endian + "I", macho, position + 8)
+            path = _cstring(macho[:position + command_size], position + name_offset)
+            info.libraries.append(path)
+
+        elif command == 0x2:
+            # LC_SYMTAB: 외부(N_EXT) 심볼 중 정의되지 않은 것은 임포트, 섹션에 정의된 것은 익스포트
+            symbol_offset, symbol_count, string_offset, string_size = struct.unpack_from(endian + "IIII", macho, position + 8)
+            read_name = _string_reader(macho, string_offset, string_size)
+            for string_index, n_type, _, _, _ in _table(
+                macho, symbol_offset, min(symbol_count, MAX_SYMBOLS), nlist_size, nlist_fmt
+            ):
+                if n_type & 0xe0 or not n_type & 0x01:
+                    continue  # 디버그(STAB) 심볼 또는 내부 심볼
+                name = read_name(string_index)
+                name = name[1:] if name.startswith("_") else name
+                if n_type & 0x0e == 0x0:
+                    info.imports.append(name)
+                elif n_type & 0x0e == 0xe and not n_type & 0x10:
+                    info.exports.append(name)
+
+        position += command_size
+
+    info.libraries = _unique(info.libraries)
+    info.imports = _unique(info.imports)
+    info.exports = _unique(info.exports)
+    return info
+
+
+PARSERS: Dict[str, Callable[[memoryview], BinaryInfo]] = {"ELF": _parse_elf, "PE": _parse_pe, "Mach-O": _parse_macho}
+
+
+def detect_format(data: BinaryBuffer) -> Optional[str]:
+    """매직 바이트로 실행 파일 형식을 판별합니다 ("ELF", "PE", "Mach-O" 또는 None)."""
+    head = bytes(memoryview(data)[:4])
+    if head == b"\x7fELF":
+        return "ELF"
+    if head[:2] == b"MZ":
+        return "PE"
+    if head in (b"\xfe\xed\xfa\xce", b"\xfe\xed\xfa\xcf", b"\xce\xfa\xed\xfe", b"\xcf\xfa\xed\xfe",
+                b"\xca\xfe\xba\xbe", b"\xca\xfe\xba\xbf"):
+        return "Mach-O"
+    return None
+
+
+def parse_binary(data: BinaryBuffer) -> Optional[BinaryInfo]:
+    """
+    ELF / PE / Mach-O 헤더를 파싱하여 BinaryInfo를 반환합니다.
+    지원하지 않는 형식이거나 헤더가 손상된 경우 None을 반환합니다.
+    """
+    binary_format = detect_format(data)
+    if binary_format is None:
+        return None
+    view = memoryview(data).cast("B")
+    try:
+        return PARSERS[binary_format](view)
+    except (struct.error, BinaryFormatError, IndexError) as e:
+        print(f"   ⚠️ {binary_format} 헤더 파싱 실패: {e}")
+        return None
+    finally:
+        view.release()
@@ -0,0 +1,182 @@
+# File: pqc_inspector_server/services/code_chunker.py
+# ✂️ 큰 소스코드 파일을 맵-리듀스 방식으로 분석하기 위한 청크 분할/선별/병합 유틸리티입니다.
+# 함수/클래스 경계에서 파일을 나누고, 시그니처 스캐너로 암호 관련도를 매겨 상위 N개 청크만 LLM에 보내며,
+# 청크별 판정을 결정적인 규칙으로 하나의 결과로 합칩니다.
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+from .signature_scanner import SignatureScanner
+from .validation_policy import PUBLIC_KEY_HIT_RE
+
+# 들여쓰기 4칸 이하에서 시작하는 함수/클래스 정의 (Python, JS/TS, Go, Rust, Java/C#/C/C++, Ruby, PHP)
+BOUNDARY_RE = re.compile(
+    r"^[ \t]{0,4}(?:"
+    r"(?:async[ \t]+)?def[ \t]|class[ \t]|@\w"
+    r"|(?:export[ \t]+)?(?:default[ \t]+)?(?:async[ \t]+)?function\b"
+    r"|func[ \t]|(?:pub(?:\(\w+\))?[ \t]+)?(?:async[ \t]+)?fn[ \t]|impl\b"
+    r"|(?:public|private|protected|internal|static)[ \t]"
+    r"|(?:struct|interface|enum|module|trait|namespace)[ \t]"
+    r"|(?:[\w:<>*&]+[ \t]+){1,4}[*&]*[A-Za-z_][\w:]*[ \t]*\([^;\n]*$"
+    r")",
+    re.MULTILINE
+)
+
+# 토큰 수 추정 (문자 4개 ≈ 토큰 1개)
+CHARS_PER_TOKEN = 4
+# 공개키 알고리즘 시그니처는 다른 암호 시그니처보다 관련도 가중치를 높게 줍니다.
+PUBLIC_KEY_HIT_WEIGHT = 3
+
+
+@dataclass
+class CodeChunk:
+    index: int
+    start_line: int  # 1부터 시작
+    end_line: int
+    text: str
+    score: int = 0
+    signatures: List[str] = field(default_factory=list)
+    scan: Optional[Dict[str, Any]] = None  # 청크의 시그니처 스캔 결과 (캐스케이드 판단에 재사용)
+
+    @property
+    def line_range(self) -> str:
+        return f"L{self.start_line}-{self.end_line}"
+
+
+def _split_oversized(text: str, max_chars: int) -> List[str]:
+    """경계가 없는 긴 구간은 줄 단위로 max_chars 이하가 되도록 나눕니다."""
+    pieces: List[str] = []
+    current: List[str] = []
+    size = 0
+    for line in text.splitlines(keepends=True):
+        if current and size + len(line) > max_chars:
+            pieces.append("".join(current))
+            current, size = [], 0
+        # 한 줄이 max_chars보다 긴 경우(압축된 JS 등)는 잘라서 넣습니다.
+        while len(line) > max_chars:
+            pieces.append(line[:max_chars])
+            line = line[max_chars:]
+        current.append(line)
+        size += len(line)
+    if current:
+        pieces.append("".join(current))
+    return pieces
+
+
+def split_code_chunks(text: str, max_chars: int = 2000) -> List[CodeChunk]:
+    """
+    소스코드를 함수/클래스 경계에서 나누고, 인접한 작은 구간은 max_chars 이내로 묶어 청크 목록을 만듭니다.
+    """
+    starts = sorted({0, *(m.start() for m in BOUNDARY_RE.finditer(text))})
+    segments = [text[start:end] for start, end in zip(starts, starts[1:] + [len(text)])]
+
+    pieces: List[str] = []
+    for segment in segments:
+        if len(segment) > max_chars:
+            pieces.extend(_split_oversized(segment, max_chars))
+        elif pieces and len(pieces[-1]) + len(segment) <= max_chars:
+            pieces[-1] += segment
+        else:
+            pieces.append(segment)
+
+    chunks: List[CodeChunk] = []
+    line = 1
+    for piece in pieces:
+        if not piece:
+            continue
+        line_count = piece.count("\n")
+        end_line = line + line_count - (1 if piece.endswith("\n") else 0)
+        if piece.strip():
+            chunks.append(CodeChunk(index=len(chunks), start_line=line, end_line=max(line, end_line), text=piece))
+        line += line_count
+    return chunks
+
+
+def score_chunks(chunks: List[CodeChunk], scanner: SignatureScanner) -> List[CodeChunk]:
+    """
+    각 청크의 암호 관련도(시그니처 적중 수, 공개키 시그니처 가중)를 계산합니다.
+    파일 단위 사전 필터와 별개인 스캔이므로 사전 필터 통계에는 포함하지 않습니다.
+    """
+    for chunk in chunks:
+        scan = scanner.scan(chunk.text, record_stats=False)
+        chunk.scan = scan
+        chunk.signatures = [hit["signature"] for hit in scan["hits"]]
+        chunk.score = sum(
+            hit["count"] * (PUBLIC_KEY_HIT_WEIGHT if PUBLIC_KEY_HIT_RE.search(hit["signature"]) else 1)
+            for hit in scan["hits"]
+        )
+    return chunks
+
+
+def select_chunks(chunks: List[CodeChunk], max_chunks: int, token_budget: int) -> List[CodeChunk]:
+    """
+    관련도가 높은 순서로 최대 max_chunks개, 합계 token_budget 이내의 청크를 고릅니다.
+    관련도가 0인 청크는 보내지 않으며, 결과는 파일 내 순서로 정렬합니다.
+    """
+    ranked = sorted((chunk for chunk in chunks if chunk.score > 0), key=lambda chunk: (-chunk.score, chunk.index))
+    selected: List[CodeChunk] = []
+    used_tokens = 0
+    for chunk in ranked:
+        if len(selected) >= max_chunks:
+            break
+        tokens = len(chunk.text) // CHARS_PER_TOKEN + 1
+        if selected and used_tokens + tokens > token_budget:
+            continue
+        selected.append(chunk)
+        used_tokens += tokens
+    return sorted(selected, key=lambda chunk: chunk.index)
+
+
+def _confidence(result: Dict[str, Any]) -> float:
+    """LLM이 confidence_score를 문자열로 돌려줘도 비교할 수 있도록 숫자로 변환합니다 (실패 시 0)."""
+    try:
+        return float(result.get("confidence_score") or 0.0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def merge_chunk_results(
+    chunk_results: List[Dict[str, Any]],
+    chunks: List[CodeChunk],
+    total_chunks: int
+) -> Optional[Dict[str, Any]]:
+    """
+    청크별 에이전트 결과를 하나의 결과로 합칩니다 (입력 순서에만 의존하는 결정적 규칙).
+    - 하나라도 취약 판정(신뢰도 > 0)이면 취약, 신뢰도는 취약 판정 청크 중 최댓값
+    - 모두 안전 판정이면 안전, 신뢰도는 청크 중 최솟값
+    - 알고리즘/근거/권장 사항은 청크 순서대로 중복 없이 합칩니다.
+    분석에 성공한 청크가 없으면 None을 반환합니다.
+    """
+    valid = [
+        (chunk, result) for chunk, result in zip(chunks, chunk_results)
+        if isinstance(result.get("is_pqc_vulnerable"), bool) and _confidence(result) > 0.0
+    ]
+    if not valid:
+        return None
+
+    vulnerable = [(chunk, result) for chunk, result in valid if result["is_pqc_vulnerable"]]
+    decisive = vulnerable or valid
+    confidences = [_confidence(result) for _, result in decisive]
+
+    algorithms: List[str] = []
+    recommendations: List[str] = []
+    for _, result in decisive:
+        for algorithm in result.get("detected_algorithms") or []:
+            if algorithm not in algorithms:
+                algorithms.append(algorithm)
+        recommendation = (result.get("recommendations") or "").strip()
+        if recommendation and recommendation not in recommendations:
+            recommendations.append(recommendation)
+
+    details = [f"[{chunk.line_range}] {result.get('vulnerability_details', '')}" for chunk, result in decisive]
+    evidence = [f"[{chunk.line_range}] {result.get('evidence', '')}" for chunk, result in decisive]
+    coverage = f"청크 분석: {len(valid)}/{len(chunks)}개 성공 (전체 {total_chunks}개 청크 중 암호 관련 상위 {len(chunks)}개 분석)"
+
+    return {
+        "is_pqc_vulnerable": bool(vulnerable),
+        "vulnerability_details": "\n".join(details + [coverage]),
+        "detected_algorithms": algorithms,
+        "recommendations": "\n".join(recommendations),
+        "evidence": "\n".join(evidence),
+        "confidence_score": max(confidences) if vulnerable else min(confidences)
+    }
@@ -0,0 +1,328 @@
+# File: pqc_inspector_server/services/constant_scanner.py
+# 🧬 바이너리 원본 바이트에서 암호 알고리즘 매직 상수(RSA e=65537, SHA-256 IV, 곡선 파라미터 등)를 찾는 스캐너입니다.
+# crypto_constants_database.json의 상수를 빅/리틀 엔디언 바이트 패턴으로 만들어 파일 전체를 한 번에 검사하므로,
+# 함수 이름이 제거된(stripped) 바이너리에서도 LLM 없이 암호 구현을 찾아낼 수 있습니다.
+
+import json
+import re
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+from ..core.config import settings
+
+# 다중 패턴 후보 위치 탐색 가속용 (chromadb 의존성으로 보통 설치되어 있음). 없으면 패턴별 bytes.find로 검사합니다.
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# 이보다 짧은 상수(단일 바이트 S-box 항목 등)는 어디에나 나타나므로 패턴으로 쓰지 않습니다.
+MIN_PATTERN_BYTES = 4
+# 후보 위치를 찾을 때 한 번에 처리하는 바이트 수 (임시 배열 메모리 상한)
+SCAN_BLOCK_BYTES = 8 * 1024 * 1024
+ANCHOR_BYTES = 4
+ANCHOR_HASH_BITS = 20
+
+_HEX_TOKEN_RE = re.compile(r"0x([0-9a-fA-F]+)")
+
+
+@dataclass
+class ConstantPattern:
+    pattern: bytes
+    category: str
+    algorithm: str
+    value: str  # 원본 상수 표기 (예: "0x00010001")
+    encoding: str  # "big-endian", "little-endian", "uint8[]", "uint32le[]"
+    quantum_vulnerable: bool
+    confidence: float
+    weak: bool  # 0x00010001처럼 바이트 종류가 적어 우연히 일치하기 쉬운 패턴
+
+
+def _is_weak(pattern: bytes) -> bool:
+    most_common = max(pattern.count(byte) for byte in set(pattern))
+    return (len(pattern) < 8 and len(set(pattern)) <= 2) or len(pattern) - most_common < 2
+
+
+def _parse_hex_value(text: str) -> Optional[bytes]:
+    """'0x6a09e667' 또는 '0xFFFF...C90F...'(앞부분만 주어진 큰 수)를 빅 엔디언 바이트로 변환합니다."""
+    text = text.strip()
+    if " " in text:
+        return _parse_hex_sequence(text)
+    digits = text[2:] if text.lower().startswith("0x") else text
+    digits = digits.split("...")[0]
+    if not digits or any(c not in "0123456789abcdefABCDEF" for c in digits):
+        return None
+    if "..." in text and len(digits) % 2:
+        # 잘린 큰 수는 앞쪽 바이트만 사용합니다.
+        digits = digits[:-1]
+    elif len(digits) % 2:
+        digits = "0" + digits
+    return bytes.fromhex(digits)
+
+
+def _parse_hex_sequence(text: str) -> Optional[bytes]:
+    """'0x00 0x01 0x02 0x03 ... 0xFF' 같은 바이트 나열(등차 생략 포함)을 바이트로 변환합니다."""
+    head, _, tail = text.partition("...")
+    values = [int(token, 16) for token in _HEX_TOKEN_RE.findall(head)]
+    last = [int(token, 16) for token in _HEX_TOKEN_RE.findall(tail)]
+    if not values or any(value > 0xFF for value in values + last):
+        return None
+    if last and len(values) >= 2:
+        step = values[1] - values[0]
+        if step and all(b - a == step for a, b in zip(values, values[1:])):
+            values = list(range(values[0], last[-1] + (1 if step > 0 else -1), step))
+        else:
+            values += last
+    return bytes(values)
+
+
+def _table_encodings(values: List[int]) -> List[Tuple[bytes, str]]:
+    """바이트 값 테이블은 uint8 배열과 uint32 리틀 엔디언 배열 두 가지로 저장될 수 있습니다."""
+    encodings = [(bytes(values), "uint8[]")]
+    if len(values) >= 2:
+        encodings.append((b"".join(value.to_bytes(4, "little") for value in values), "uint32le[]"))
+    return encodings
+
+
+def _value_patterns(entry: Dict[str, Any]) -> List[Tuple[bytes, str, str]]:
+    """상수 항목 하나에서 (패턴, 원본 표기, 인코딩) 목록을 만듭니다."""
+    patterns: List[Tuple[bytes, str, str]] = []
+    values = entry.get("values") or []
+
+    # 순서 키(position/round)가 연속인 단일 바이트 값은 테이블의 연속 구간으로 묶습니다 (예: AES S-box 63 7C 77 7B).
+    runs: Dict[Tuple[str, str], List[Tuple[int, int]]] = defaultdict(list)
+    for value in values:
+        order_key = "position" if "position" in value else "round" if "round" in value else None
+        raw = _parse_hex_value(value["hex"]) if isinstance(value.get("hex"), str) else None
+        if order_key and raw is not None and len(raw) == 1:
+            runs[(order_key, value.get("box", ""))].append((value[order_key], raw[0]))
+        elif isinstance(value.get("permutation"), list):
+            table = [int(item) for item in value["permutation"]]
+            patterns += [(encoded, "permutation", encoding) for encoded, encoding in _table_encodings(table)]
+        elif raw is not None:
+            patterns.append((raw, value["hex"], "big-endian"))
+            if len(raw) > 1 and raw[::-1] != raw:
+                patterns.append((raw[::-1], value["hex"], "little-endian"))
+
+    for (order_key, box), items in runs.items():
+        items.sort()
+        current: List[int] = []
+        previous = None
+        for index, byte in items + [(None, None)]:
+            if previous is not None and index == previous + 1:
+                current.append(byte)
+            else:
+                if len(current) >= MIN_PATTERN_BYTES:
+                    label = f"{box or order_key}[{len(current)} bytes]"
+                    patterns += [(encoded, label, encoding) for encoded, encoding in _table_encodings(current)]
+                current = [byte] if byte is not None else []
+            previous = index
+    return [(pattern, value, encoding) for pattern, value, encoding in patterns if len(pattern) >= MIN_PATTERN_BYTES]
+
+
+def load_constant_patterns(database_path: Union[str, Path]) -> List[ConstantPattern]:
+    """crypto_constants_database.json에서 검색 패턴 목록을 만듭니다."""
+    try:
+        with open(database_path, "r", encoding="utf-8") as f:
+            database = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"⚠️ 암호 상수 데이터베이스 로드 실패 ({database_path}): {e}")
+        return []
+
+    patterns: Dict[bytes, ConstantPattern] = {}
+    for entry in database.get("constants", []):
+        for pattern, value, encoding in _value_patterns(entry):
+            # MD5/SHA-1처럼 같은 상수를 공유하면 먼저 나온 항목만 남기고 알고리즘 이름을 합칩니다.
+            if pattern in patterns:
+                existing = patterns[pattern]
+                if entry["algorithm"] not in existing.algorithm.split("/"):
+                    existing.algorithm += f"/{entry['algorithm']}"
+                    existing.category += f"/{entry['category']}"
+                continue
+            patterns[pattern] = ConstantPattern(
+                pattern=pattern,
+                category=entry["category"],
+                algorithm=entry["algorithm"],
+                value=value,
+                encoding=encoding,
+                quantum_vulnerable=bool(entry.get("quantum_vulnerable")),
+                confidence=float(entry.get("confidence", 0.5)),
+                weak=_is_weak(pattern)
+            )
+    return list(patterns.values())
+
+
+def _anchor_offset(pattern: bytes) -> int:
+    """후보 탐색에 쓸 4바이트 구간: 바이트 종류가 가장 많은(가장 드물게 나타날) 위치를 고릅니다."""
+    windows = range(len(pattern) - ANCHOR_BYTES + 1)
+    return max(windows, key=lambda offset: (len(set(pattern[offset:offset + ANCHOR_BYTES])), -offset))
+
+
+def _anchor_hash(values: "np.ndarray") -> "np.ndarray":
+    return (values * np.uint32(2654435761)) >> np.uint32(32 - ANCHOR_HASH_BITS)
+
+
+class ConstantScanner:
+    def __init__(self, patterns: List[ConstantPattern], max_offsets_per_pattern: int = 8):
+        self.patterns = patterns
+        self.max_offsets_per_pattern = max_offsets_per_pattern
+
+        # 앵커(4바이트 정수) → [(패턴 번호, 앵커 오프셋)]
+        self._anchors: Dict[int, List[Tuple[int, int]]] = defaultdict(list)
+        for index, constant in enumerate(patterns):
+            offset = _anchor_offset(constant.pattern)
+            anchor = int.from_bytes(constant.pattern[offset:offset + ANCHOR_BYTES], "little")
+            self._anchors[anchor].append((index, offset))
+        if NUMPY_AVAILABLE and patterns:
+            self._anchor_values = np.array(sorted(self._anchors), dtype=np.uint32)
+            # 곱셈 해시 20비트 룩업 테이블로 대부분의 위치를 먼저 걸러냅니다.
+            # (하위 비트를 그대로 쓰면 0x00으로 채워진 영역이 모두 후보가 됩니다.)
+            self._hash_table = np.zeros(1 << ANCHOR_HASH_BITS, dtype=bool)
+            self._hash_table[_anchor_hash(self._anchor_values)] = True
+
+        self.stats = {"scanned": 0, "flagged": 0, "scanned_bytes": 0, "total_seconds": 0.0}
+
+    def _match_positions_numpy(self, view: memoryview) -> List[Tuple[int, int]]:
+        """(패턴 번호, 파일 오프셋) 목록을 반환합니다."""
+        data = np.frombuffer(view, dtype=np.uint8)
+        size = len(data)
+        matches: List[Tuple[int, int]] = []
+        for base in range(0, size, SCAN_BLOCK_BYTES):
+            # 4가지 정렬 각각에서 바이트를 복사 없이 리틀 엔디언 uint32로 해석하면 모든 위치의 4바이트 값을 얻습니다.
+            for alignment in range(ANCHOR_BYTES):
+                start = base + alignment
+                words = (min(base + SCAN_BLOCK_BYTES, size - ANCHOR_BYTES + 1) - start + ANCHOR_BYTES - 1) // ANCHOR_BYTES
+                if words <= 0:
+                    continue
+                windows = data[start:start + words * ANCHOR_BYTES].view("<u4")
+                candidates = np.flatnonzero(self._hash_table[_anchor_hash(windows)])
+                candidates = candidates[np.isin(windows[candidates], self._anchor_values)]
+                positions = (candidates * ANCHOR_BYTES + start).tolist()
+                for position, anchor in zip(positions, windows[candidates].tolist()):
+                    for index, anchor_offset in self._anchors[anchor]:
+                        pattern_start = position - anchor_offset
+                        pattern = self.patterns[index].pattern
+                        if pattern_start >= 0 and view[pattern_start:pattern_start + len(pattern)] == pattern:
+                            matches.append((index, pattern_start))
+        return matches
+
+    def _match_positions_find(self, view: memoryview) -> List[Tuple[int, int]]:
+        data = view.tobytes()
+        matches: List[Tuple[int, int]] = []
+        for index, constant in enumerate(self.patterns):
+            position = data.find(constant.pattern)
+            while position != -1:
+                matches.append((index, position))
+                position = data.find(constant.pattern, position + 1)
+        return matches
+
+    def scan(self, content: Union[bytes, bytearray, memoryview, Any]) -> Dict[str, Any]:
+        """
+        바이너리 전체에서 상수 패턴을 찾습니다 (bytes/memoryview/mmap).
+
+        Returns:
+            {"has_hits", "hits": [{"category", "algorithm", "value", "encoding", "count", "offsets", "weak",
+             "quantum_vulnerable", "confidence"}], "algorithms": {알고리즘: 요약}, "scanned_bytes", "duration"}
+        """
+        start = time.perf_counter()
+        view = memoryview(content).cast("B")
+        try:
+            if not self.patterns:
+                matches = []
+            elif NUMPY_AVAILABLE:
+                matches = self._match_positions_numpy(view)
+            else:
+                matches = self._match_positions_find(view)
+            scanned_bytes = len(view)
+        finally:
+            view.release()
+
+        offsets: Dict[int, List[int]] = defaultdict(list)
+        for index, position in sorted(matches, key=lambda match: match[1]):
+            offsets[index].append(position)
+
+        hits = []
+        algorithms: Dict[str, Dict[str, Any]] = {}
+        for index, positions in sorted(offsets.items(), key=lambda item: item[1][0]):
+            constant = self.patterns[index]
+            hits.append({
+                "category": constant.category,
+                "algorithm": constant.algorithm,
+                "value": constant.value,
+                "encoding": constant.encoding,
+                "count": len(positions),
+                "offsets": positions[:self.max_offsets_per_pattern],
+                "weak": constant.weak,
+                "quantum_vulnerable": constant.quantum_vulnerable,
+                "confidence": constant.confidence
+            })
+            summary = algorithms.setdefault(constant.algorithm, {
+                "strong_hits": 0,
+                "weak_hits": 0,
+                "quantum_vulnerable": constant.quantum_vulnerable,
+                "confidence": constant.confidence
+            })
+            summary["weak_hits" if constant.weak else "strong_hits"] += len(positions)
+
+        duration = time.perf_counter() - start
+        self.stats["scanned"] += 1
+        self.stats["flagged"] += bool(hits)
+        self.stats["scanned_bytes"] += scanned_bytes
+        self.stats["total_seconds"] += duration
+
+        return {
+            "has_hits": bool(hits),
+            "hits": hits,
+            "algorithms": algorithms,
+            "scanned_bytes": scanned_bytes,
+            "duration": duration
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        seconds = self.stats["total_seconds"]
+        return {
+            **self.stats,
+            "patterns": len(self.patterns),
+            "throughput_mb_per_second": self.stats["scanned_bytes"] / seconds / (1024 * 1024) if seconds else 0.0
+        }
+
+
+def format_constant_evidence(scan: Dict[str, Any], max_lines: int = 10) -> List[str]:
+    """스캔 결과를 프롬프트/근거용 문장 목록으로 만듭니다 (약한 패턴은 표시)."""
+    lines = []
+    for hit in sorted(scan["hits"], key=lambda hit: (hit["weak"], not hit["quantum_vulnerable"]))[:max_lines]:
+        offsets = ", ".join(f"0x{offset:x}" for offset in hit["offsets"][:3])
+        line = (
+            f"{hit['algorithm']} ({hit['category']}): {hit['value']} {hit['encoding']} "
+            f"@ {offsets}{' 외' if hit['count'] > 3 else ''} 총 {hit['count']}건"
+        )
+        if hit["weak"]:
+            line += " [약한 패턴: 우연히 일치할 수 있음]"
+        lines.append(line)
+    return lines
+
+
+def constant_signature_hits(scan: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    강한 상수 일치를 SignatureScanner.scan() 형식의 hits로 변환합니다 ("const:<알고리즘>").
+    사전 필터와 검증 정책이 상수 스캔 결과도 함께 고려하도록 시그니처 스캔 결과에 합칠 때 사용합니다.
+    """
+    return [
+        {"signature": f"const:{algorithm.lower()}", "count": summary["strong_hits"]}
+        for algorithm, summary in scan["algorithms"].items()
+        if summary["strong_hits"]
+    ]
+
+
+# 프로세스 전역에서 하나의 스캐너만 사용하도록 캐싱합니다 (패턴 테이블은 시작 시 한 번 생성).
+@lru_cache()
+def get_constant_scanner() -> ConstantScanner:
+    scanner = ConstantScanner(load_constant_patterns(settings.CONSTANT_SCAN_DATABASE_PATH))
+    weak = sum(1 for constant in scanner.patterns if constant.weak)
+    print(f"🧬 암호 상수 스캐너 준비: 바이트 패턴 {len(scanner.patterns)}개 (약한 패턴 {weak}개)")
+    return scanner
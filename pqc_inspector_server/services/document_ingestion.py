@@ -45,35 +45,28 @@ class DocumentIngestionPipeline:
             # 4. 지식 매니저 가져오기
             knowledge_manager = await KnowledgeManagerFactory.get_manager(final_agent_type)
 
-            # 5. 청크별로 임베딩 생성 및 저장
-            success_count = 0
+            # 5. 청크 임베딩을 배치로 생성하고 벡터 DB에 대량 저장
             total_chunks = len(processed_doc["chunks"])
-
             print(f"🔄 {total_chunks}개 청크를 {final_agent_type} 에이전트에 추가 중...")
 
-            for chunk in processed_doc["chunks"]:
-                try:
-                    # 메타데이터 생성
-                    metadata = self._create_chunk_metadata(
-                        chunk, processed_doc["file_info"], source_name, confidence
-                    )
-
-                    # 지식 베이스에 추가
-                    success = await knowledge_manager.add_new_knowledge(
-                        content=chunk["content"],
-                        knowledge_type="document_chunk",
-                        category=f"doc_{Path(file_path).stem}",
-                        confidence=confidence,
-                        source=source_name
-                    )
-
-                    if success:
-                        success_count += 1
-                    else:
-                        print(f"⚠️ 청크 {chunk['index']} 추가 실패")
-
-                except Exception as e:
-                    print(f"❌ 청크 {chunk['index']} 처리 중 오류: {e}")
+            file_info = processed_doc["file_info"]
+            items = [
+                {
+                    "content": chunk["content"],
+                    "type": "document_chunk",
+                    "category": f"doc_{Path(file_path).stem}",
+                    "confidence": confidence,
+                    "source": source_name,
+                    "metadata": self._create_chunk_metadata(chunk, file_info, source_name, confidence),
+                    # 같은 파일을 다시 수집하면 청크를 덮어쓰도록 파일/청크 해시로 ID를 만듭니다.
+                    "id": f"{file_info['file_hash']}_{chunk['index']}_{chunk['chunk_hash']}"
+                }
+                for chunk in processed_doc["chunks"]
+            ]
+            bulk_stats = await knowledge_manager.add_knowledge_bulk(items) if items else {
+                "stored": 0, "duration": 0.0, "chunks_per_second": 0.0
+            }
+            success_count = bulk_stats["stored"]
 
             # 6. 결과 반환
             result = {
@@ -85,6 +78,8 @@ class DocumentIngestionPipeline:
                 "failed_chunks": total_chunks - success_count,
                 "source_name": source_name,
                 "document_info": processed_doc["file_info"],
+                "ingestion_seconds": bulk_stats["duration"],
+                "chunks_per_second": bulk_stats["chunks_per_second"],
                 "ingestion_time": datetime.now().isoformat()
             }
 
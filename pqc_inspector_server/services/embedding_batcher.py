@@ -0,0 +1,103 @@
+# File: pqc_inspector_server/services/embedding_batcher.py
+# 📦 동시에 들어오는 단일 텍스트 임베딩 요청(RAG 검색 쿼리)을 모아 한 번의 배치 요청으로 보내는 마이크로 배처입니다.
+# 첫 요청 후 몇 ms 동안(또는 N개가 모일 때까지) 기다렸다가 한 번에 임베딩하고, 결과 벡터를 각 호출자에게 나눠 줍니다.
+# 부하가 높을 때 임베딩 요청 수와 요청당 오버헤드가 크게 줄어듭니다.
+
+import asyncio
+import time
+from functools import lru_cache
+from typing import Awaitable, Callable, Dict, Any, List, Optional, Set, Tuple
+from ..core.config import settings
+
+
+class EmbeddingMicroBatcher:
+    """짧은 시간 창 안에 도착한 단일 텍스트 요청들을 하나의 배치로 합쳐 임베딩합니다."""
+
+    def __init__(
+        self,
+        embed_batch: Callable[[List[str]], Awaitable[List[List[float]]]],
+        max_wait_ms: float = 5.0,
+        max_batch_size: int = 64
+    ):
+        self.embed_batch = embed_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self.max_batch_size = max(1, max_batch_size)
+        self.stats = {"requests": 0, "batches": 0, "texts": 0, "max_batch": 0, "failed_batches": 0,
+                      "total_wait_seconds": 0.0}
+        # (텍스트, 결과 future, 요청 시각) 목록 - 이벤트 루프 안에서만 접근하므로 잠금이 필요 없습니다.
+        self._pending: List[Tuple[str, asyncio.Future, float]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def embed(self, text: str) -> List[float]:
+        """텍스트 하나를 다음 배치에 넣고, 배치가 처리되면 해당 벡터를 반환합니다 (실패 시 빈 목록)."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, future, time.monotonic()))
+        self.stats["requests"] += 1
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        return await future
+
+    def _flush(self):
+        """대기 중인 요청들을 하나의 배치로 떼어 내어 백그라운드에서 임베딩합니다."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.get_running_loop().create_task(self._run(batch))
+        # 완료 전에 작업이 가비지 컬렉션되지 않도록 참조를 유지합니다.
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: List[Tuple[str, asyncio.Future, float]]):
+        now = time.monotonic()
+        # 같은 텍스트는 한 번만 요청합니다.
+        texts = list(dict.fromkeys(text for text, _, _ in batch))
+        self.stats["batches"] += 1
+        self.stats["texts"] += len(texts)
+        self.stats["max_batch"] = max(self.stats["max_batch"], len(batch))
+        self.stats["total_wait_seconds"] += sum(now - queued_at for _, _, queued_at in batch)
+
+        try:
+            embeddings = await self.embed_batch(texts)
+        except Exception as e:
+            print(f"❌ 마이크로 배치 임베딩 중 오류: {e}")
+            embeddings = []
+
+        vectors: Dict[str, List[float]] = dict(zip(texts, embeddings)) if len(embeddings) == len(texts) else {}
+        if not vectors:
+            self.stats["failed_batches"] += 1
+        for text, future, _ in batch:
+            # 기다리던 호출자가 취소되었을 수 있습니다.
+            if not future.done():
+                future.set_result(vectors.get(text, []))
+
+    def get_stats(self) -> Dict[str, Any]:
+        batches = self.stats["batches"]
+        return {
+            **self.stats,
+            "max_wait_ms": self.max_wait * 1000,
+            "max_batch_size": self.max_batch_size,
+            "pending": len(self._pending),
+            "avg_batch_size": self.stats["requests"] / batches if batches else 0.0,
+            "avg_wait_ms": self.stats["total_wait_seconds"] / self.stats["requests"] * 1000 if self.stats["requests"] else 0.0
+        }
+
+
+# 에이전트별 KnowledgeManager가 각자 EmbeddingService를 갖더라도 요청이 한곳에 모이도록 프로세스 전역에서 공유합니다.
+@lru_cache()
+def get_embedding_batcher() -> EmbeddingMicroBatcher:
+    from .embedding_service import EmbeddingService
+
+    service = EmbeddingService()
+    return EmbeddingMicroBatcher(
+        embed_batch=service.create_embeddings,
+        max_wait_ms=settings.EMBEDDING_MICROBATCH_WAIT_MS,
+        max_batch_size=settings.EMBEDDING_MICROBATCH_MAX_SIZE
+    )
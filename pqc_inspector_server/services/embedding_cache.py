@@ -0,0 +1,187 @@
+# File: pqc_inspector_server/services/embedding_cache.py
+# 💾 (임베딩 모델, sha256(텍스트)) 키로 임베딩 벡터를 재사용하는 영구 캐시입니다.
+# 벡터는 float32/float16으로 하나의 추가 전용(append-only) 파일에 이어 쓰고 mmap으로 읽으며,
+# 위치(오프셋, 차원, 형식)는 SQLite 인덱스에 기록합니다.
+# 지식 베이스 재구축과 반복되는 검색 쿼리 임베딩이 네트워크 호출 없이 처리됩니다.
+
+import hashlib
+import mmap
+import os
+import sqlite3
+import struct
+import threading
+import time
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Sequence
+from ..core.config import settings
+
+# 저장 형식 → struct 코드
+DTYPE_CODES = {"float32": "f", "float16": "e"}
+# SQLite IN (...) 절 한 번에 넣는 최대 키 수
+LOOKUP_BATCH = 500
+
+
+def text_hash(text: str) -> bytes:
+    return hashlib.sha256(text.encode("utf-8")).digest()
+
+
+class EmbeddingCache:
+    """SQLite 인덱스 + mmap 벡터 파일로 구성된 디스크 임베딩 캐시"""
+
+    def __init__(self, db_path: str, vectors_path: str, dtype: str = "float32", max_bytes: int = 0):
+        if dtype not in DTYPE_CODES:
+            raise ValueError(f"지원하지 않는 임베딩 캐시 형식: {dtype} (float32 또는 float16)")
+        self.db_path = db_path
+        self.vectors_path = vectors_path
+        self.code = DTYPE_CODES[dtype]
+        self.max_bytes = max_bytes  # 0이면 제한 없음
+        self.stats = {"hits": 0, "misses": 0, "stores": 0, "skipped_full": 0}
+        self._lock = threading.Lock()
+        self._mmap: Optional[mmap.mmap] = None
+
+        for path in (db_path, vectors_path):
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        # 여러 워커 프로세스가 같은 파일에 쓰므로 벡터는 항상 파일 끝에 추가합니다.
+        self._file = open(vectors_path, "a+b")
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embedding_cache (
+                model TEXT NOT NULL,
+                text_hash BLOB NOT NULL,
+                dim INTEGER NOT NULL,
+                offset INTEGER NOT NULL,
+                dtype TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (model, text_hash)
+            ) WITHOUT ROWID
+            """
+        )
+
+    def _view(self, required_size: int) -> Optional[mmap.mmap]:
+        """required_size 바이트까지 읽을 수 있는 mmap을 반환합니다 (파일이 커졌으면 다시 매핑)."""
+        if self._mmap is not None and len(self._mmap) >= required_size:
+            return self._mmap
+        size = os.fstat(self._file.fileno()).st_size
+        if size < required_size or size == 0:
+            return None
+        if self._mmap is not None:
+            self._mmap.close()
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mmap
+
+    def get_many(self, model: str, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        """텍스트별 캐시된 벡터 목록을 반환합니다 (없으면 None)."""
+        hashes = [text_hash(text) for text in texts]
+        rows: Dict[bytes, tuple] = {}
+        with self._lock:
+            unique = list(dict.fromkeys(hashes))
+            for start in range(0, len(unique), LOOKUP_BATCH):
+                batch = unique[start:start + LOOKUP_BATCH]
+                placeholders = ",".join("?" * len(batch))
+                for key, dim, offset, code in self._conn.execute(
+                    f"SELECT text_hash, dim, offset, dtype FROM embedding_cache "
+                    f"WHERE model = ? AND text_hash IN ({placeholders})",
+                    (model, *batch)
+                ):
+                    rows[key] = (dim, offset, code)
+
+            results: List[Optional[List[float]]] = []
+            view = self._view(max((offset + dim * struct.calcsize(code) for dim, offset, code in rows.values()), default=0))
+            for key in hashes:
+                row = rows.get(key)
+                if row is None or view is None:
+                    results.append(None)
+                    continue
+                dim, offset, code = row
+                results.append(list(struct.unpack_from(f"<{dim}{code}", view, offset)))
+
+        hits = sum(1 for vector in results if vector is not None)
+        self.stats["hits"] += hits
+        self.stats["misses"] += len(results) - hits
+        return results
+
+    def put_many(self, model: str, texts: Sequence[str], vectors: Sequence[List[float]]):
+        """벡터들을 파일 끝에 한 번에 쓰고 인덱스에 등록합니다."""
+        entries = {}
+        for text, vector in zip(texts, vectors):
+            if vector:
+                entries[text_hash(text)] = vector
+        if not entries:
+            return
+
+        with self._lock:
+            # BEGIN IMMEDIATE로 다른 프로세스의 쓰기와 직렬화하여 파일 끝 오프셋이 겹치지 않도록 합니다.
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                offset = os.fstat(self._file.fileno()).st_size
+                if self.max_bytes and offset >= self.max_bytes:
+                    self.stats["skipped_full"] += len(entries)
+                    self._conn.execute("ROLLBACK")
+                    return
+
+                chunks = []
+                rows = []
+                now = time.time()
+                for key, vector in entries.items():
+                    data = struct.pack(f"<{len(vector)}{self.code}", *vector)
+                    rows.append((model, key, len(vector), offset, self.code, now))
+                    chunks.append(data)
+                    offset += len(data)
+
+                # 벡터를 먼저 기록한 뒤 인덱스를 커밋합니다 (중간에 실패하면 참조되지 않는 바이트만 남음).
+                self._file.write(b"".join(chunks))
+                self._file.flush()
+                self._conn.executemany("INSERT OR IGNORE INTO embedding_cache VALUES (?, ?, ?, ?, ?, ?)", rows)
+                self._conn.execute("COMMIT")
+                self.stats["stores"] += len(rows)
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def clear(self):
+        with self._lock:
+            if self._mmap is not None:
+                self._mmap.close()
+                self._mmap = None
+            self._conn.execute("DELETE FROM embedding_cache")
+            self._file.truncate(0)
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM embedding_cache").fetchone()[0]
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "hit_rate": self.stats["hits"] / lookups if lookups else 0.0,
+            "entries": self.count(),
+            "vector_file_bytes": os.fstat(self._file.fileno()).st_size,
+            "dtype": next(name for name, code in DTYPE_CODES.items() if code == self.code)
+        }
+
+    def close(self):
+        with self._lock:
+            if self._mmap is not None:
+                self._mmap.close()
+            self._file.close()
+            self._conn.close()
+
+
+# 프로세스 전역에서 하나의 캐시만 사용하도록 캐싱합니다. 초기화에 실패하면 캐시 없이 동작합니다.
+@lru_cache()
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    if not settings.EMBEDDING_CACHE_ENABLED:
+        return None
+    try:
+        return EmbeddingCache(
+            db_path=settings.EMBEDDING_CACHE_DB_PATH,
+            vectors_path=settings.EMBEDDING_CACHE_VECTORS_PATH,
+            dtype=settings.EMBEDDING_CACHE_DTYPE,
+            max_bytes=settings.EMBEDDING_CACHE_MAX_MB * 1024 * 1024
+        )
+    except Exception as e:
+        print(f"⚠️ 임베딩 캐시 초기화 실패, 캐시 없이 동작합니다: {e}")
+        return None
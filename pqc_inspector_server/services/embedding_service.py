@@ -1,55 +1,194 @@
 # File: pqc_inspector_server/services/embedding_service.py
 # 🧠 텍스트/코드를 벡터로 변환하는 임베딩 서비스입니다.
 
-import httpx
-from typing import List, Dict, Any
+import asyncio
+from typing import List, Dict, Any, Optional, Tuple
 from ..core.config import settings
+from .embedding_cache import get_embedding_cache
+from .http_client_pool import get_http_client_pool
+from .local_embedding import get_local_embedding_backend
+from .rate_limiter import estimate_tokens, get_rate_limiter_registry
+from .resilience import get_retry_policy
+
+
+def split_embedding_batches(texts: List[str], max_texts: int, max_tokens: int) -> List[Tuple[int, int]]:
+    """
+    텍스트 목록을 제공자 요청 한도(요청당 입력 수, 추정 토큰 수)에 맞는 (시작, 끝) 구간들로 나눕니다.
+    토큰 한도보다 큰 텍스트 하나는 단독 배치가 됩니다.
+    """
+    batches: List[Tuple[int, int]] = []
+    start = 0
+    tokens = 0
+    for index, text in enumerate(texts):
+        text_tokens = estimate_tokens(text)
+        if index > start and (index - start >= max_texts or tokens + text_tokens > max_tokens):
+            batches.append((start, index))
+            start, tokens = index, 0
+        tokens += text_tokens
+    if start < len(texts):
+        batches.append((start, len(texts)))
+    return batches
+
+
+def get_embedding_model_name() -> str:
+    """현재 설정된 임베딩 백엔드의 모델 이름 (캐시 키와 벡터 DB 컬렉션 태그에 사용)"""
+    if settings.EMBEDDING_BACKEND == "local":
+        return settings.LOCAL_EMBEDDING_MODEL
+    return settings.OPENAI_EMBEDDING_MODEL
+
 
 class EmbeddingService:
     def __init__(self):
         self.openai_api_key = settings.OPENAI_API_KEY
         self.openai_base_url = "https://api.openai.com/v1"
-        self.embedding_model = "text-embedding-3-small"  # OpenAI 최신 임베딩 모델
+        self.backend = settings.EMBEDDING_BACKEND
+        self.embedding_model = get_embedding_model_name()
+        self.http_pool = get_http_client_pool()
+        # 로컬 백엔드는 프로세스 전역에서 공유합니다. 로드에 실패해도 OpenAI로 대체하지 않습니다
+        # (다른 모델의 벡터가 섞이지 않도록 임베딩 요청만 실패 처리).
+        self.local_backend = None
+        if self.backend == "local":
+            try:
+                self.local_backend = get_local_embedding_backend()
+            except Exception as e:
+                print(f"❌ 로컬 임베딩 백엔드 초기화 실패: {e}")
+        # (모델, 텍스트 해시) 키의 디스크 캐시 (비활성화 또는 초기화 실패 시 None)
+        self.cache = get_embedding_cache()
         print("EmbeddingService가 초기화되었습니다.")
 
     async def create_embeddings(self, texts: List[str]) -> List[List[float]]:
         """
         텍스트 목록을 임베딩 벡터로 변환합니다.
+        캐시에 있는 텍스트는 API를 호출하지 않으며, 새로 만든 벡터는 캐시에 저장합니다.
         """
+        results = await self._cache_lookup(texts)
+        missing = list(dict.fromkeys(text for text, vector in zip(texts, results) if vector is None))
+        if not missing:
+            print(f"💾 임베딩 캐시 적중: {len(texts)}개 텍스트")
+            return results
+
+        embeddings = await self._request_embeddings(missing)
+        if len(embeddings) != len(missing):
+            return []
+        await self._cache_store(missing, embeddings)
+
+        fetched = dict(zip(missing, embeddings))
+        return [vector if vector is not None else fetched[text] for text, vector in zip(texts, results)]
+
+    async def _request_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """설정된 백엔드로 임베딩을 한 번 생성합니다. 실패하면 빈 목록을 반환합니다."""
+        if self.backend == "local":
+            return await self._request_local_embeddings(texts)
         try:
             print(f"🧠 임베딩 생성 시작: {len(texts)}개 텍스트")
 
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.openai_base_url}/embeddings",
-                    headers={
-                        "Authorization": f"Bearer {self.openai_api_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": self.embedding_model,
-                        "input": texts
-                    },
-                    timeout=60.0
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    embeddings = [item["embedding"] for item in data["data"]]
-                    print(f"✅ 임베딩 생성 완료: {len(embeddings)}개 벡터")
-                    return embeddings
-                else:
-                    print(f"❌ OpenAI 임베딩 API 오류: {response.status_code} - {response.text}")
-                    return []
+            client = self.http_pool.get_client(self.openai_base_url)
+            response = await client.post(
+                f"{self.openai_base_url}/embeddings",
+                headers={
+                    "Authorization": f"Bearer {self.openai_api_key}",
+                    "Content-Type": "application/json"
+                },
+                json={
+                    "model": self.embedding_model,
+                    "input": texts
+                },
+                timeout=60.0
+            )
+
+            if response.status_code == 200:
+                data = response.json()
+                embeddings = [item["embedding"] for item in data["data"]]
+                print(f"✅ 임베딩 생성 완료: {len(embeddings)}개 벡터")
+                return embeddings
+            else:
+                print(f"❌ OpenAI 임베딩 API 오류: {response.status_code} - {response.text}")
+                return []
 
         except Exception as e:
             print(f"❌ 임베딩 생성 중 오류: {e}")
             return []
 
+    async def _request_local_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """로컬 모델로 임베딩합니다 (추론은 전용 실행기 스레드에서 실행)."""
+        if self.local_backend is None:
+            print("❌ 로컬 임베딩 백엔드를 사용할 수 없습니다 (sentence-transformers 설치 및 모델 경로 확인)")
+            return []
+        try:
+            embeddings = await self.local_backend.embed(texts)
+            print(f"✅ 로컬 임베딩 생성 완료: {len(embeddings)}개 벡터")
+            return embeddings
+        except Exception as e:
+            print(f"❌ 로컬 임베딩 생성 중 오류: {e}")
+            return []
+
+    async def create_embeddings_batched(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        많은 텍스트를 제공자 한도에 맞는 배치로 나누고, 여러 배치를 동시에 요청하여 임베딩합니다.
+        결과는 입력과 같은 순서이며, 재시도 후에도 실패한 배치의 항목은 None입니다.
+        """
+        results = await self._cache_lookup(texts)
+        # 캐시에 없는 텍스트만 (중복 없이) 배치로 요청합니다.
+        missing = list(dict.fromkeys(text for text, vector in zip(texts, results) if vector is None))
+        batches = split_embedding_batches(missing, settings.EMBEDDING_BATCH_SIZE, settings.EMBEDDING_BATCH_MAX_TOKENS)
+        semaphore = asyncio.Semaphore(max(1, settings.EMBEDDING_MAX_CONCURRENCY))
+        fetched: Dict[str, List[float]] = {}
+
+        async def run(start: int, end: int):
+            async with semaphore:
+                embeddings = await self._embed_batch_with_retry(missing[start:end])
+            if len(embeddings) == end - start:
+                fetched.update(zip(missing[start:end], embeddings))
+                await self._cache_store(missing[start:end], embeddings)
+
+        print(f"🧠 배치 임베딩: {len(texts)}개 텍스트 중 캐시 미적중 {len(missing)}개 → {len(batches)}개 배치 "
+              f"(동시 {settings.EMBEDDING_MAX_CONCURRENCY}개)")
+        await asyncio.gather(*(run(start, end) for start, end in batches))
+        return [vector if vector is not None else fetched.get(text) for text, vector in zip(texts, results)]
+
+    async def _embed_batch_with_retry(self, batch: List[str]) -> List[List[float]]:
+        """배치 하나를 요청 한도 안에서 임베딩하고, 실패하면 지수 백오프로 재시도합니다."""
+        policy = get_retry_policy()
+        for attempt in range(policy.max_attempts):
+            if settings.LLM_RATE_LIMIT_ENABLED and self.backend != "local":
+                limiter = get_rate_limiter_registry().get("openai", self.embedding_model)
+                async with limiter.limit(estimate_tokens(*batch)):
+                    embeddings = await self._request_embeddings(batch)
+            else:
+                embeddings = await self._request_embeddings(batch)
+
+            if len(embeddings) == len(batch):
+                return embeddings
+            if attempt + 1 < policy.max_attempts:
+                await asyncio.sleep(policy.backoff(attempt))
+        print(f"❌ 임베딩 배치 실패: {len(batch)}개 텍스트 ({policy.max_attempts}회 시도)")
+        return []
+
+    async def _cache_lookup(self, texts: List[str]) -> List[Optional[List[float]]]:
+        if self.cache is None or not texts:
+            return [None] * len(texts)
+        try:
+            return await asyncio.to_thread(self.cache.get_many, self.embedding_model, texts)
+        except Exception as e:
+            print(f"⚠️ 임베딩 캐시 조회 실패: {e}")
+            return [None] * len(texts)
+
+    async def _cache_store(self, texts: List[str], embeddings: List[List[float]]):
+        if self.cache is None:
+            return
+        try:
+            await asyncio.to_thread(self.cache.put_many, self.embedding_model, texts, embeddings)
+        except Exception as e:
+            print(f"⚠️ 임베딩 캐시 저장 실패: {e}")
+
     async def create_single_embedding(self, text: str) -> List[float]:
         """
         단일 텍스트를 임베딩 벡터로 변환합니다.
+        마이크로 배치가 켜져 있으면 동시에 들어온 다른 요청들과 합쳐 한 번에 임베딩합니다.
         """
+        if settings.EMBEDDING_MICROBATCH_ENABLED:
+            from .embedding_batcher import get_embedding_batcher
+            return await get_embedding_batcher().embed(text)
         embeddings = await self.create_embeddings([text])
         return embeddings[0] if embeddings else []
 
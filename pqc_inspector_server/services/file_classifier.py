@@ -0,0 +1,271 @@
+# File: pqc_inspector_server/services/file_classifier.py
+# 🗃️ LLM 호출 없이 파일 타입(source_code / assembly_binary / logs_config)을 판별하는 로컬 분류기입니다.
+# 매직 바이트(ELF/PE/Mach-O 등), 텍스트/바이너리 판별(제어 문자 비율, 엔트로피), 확장자,
+# 그리고 data/fine_tuning_data/orchestrator_classification.jsonl로 학습한 나이브 베이즈 모델을 결합합니다.
+# 신뢰도가 임계값보다 낮을 때만 오케스트레이터가 LLM 분류로 넘깁니다.
+
+import json
+import math
+import re
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from ..core.config import settings
+
+FILE_TYPES = ("source_code", "assembly_binary", "logs_config")
+
+EXTENSION_MAP = {
+    # 소스코드
+    '.py': 'source_code', '.java': 'source_code', '.c': 'source_code', '.cpp': 'source_code',
+    '.cc': 'source_code', '.h': 'source_code', '.hpp': 'source_code', '.cs': 'source_code',
+    '.go': 'source_code', '.js': 'source_code', '.ts': 'source_code', '.rs': 'source_code',
+    '.kt': 'source_code', '.swift': 'source_code', '.rb': 'source_code', '.php': 'source_code',
+    '.scala': 'source_code', '.m': 'source_code', '.sh': 'source_code',
+    # 실행 파일 / 라이브러리 / 어셈블리
+    '.exe': 'assembly_binary', '.dll': 'assembly_binary', '.so': 'assembly_binary', '.dylib': 'assembly_binary',
+    '.o': 'assembly_binary', '.a': 'assembly_binary', '.lib': 'assembly_binary', '.bin': 'assembly_binary',
+    '.elf': 'assembly_binary', '.asm': 'assembly_binary', '.s': 'assembly_binary', '.class': 'assembly_binary',
+    '.wasm': 'assembly_binary',
+    # 로그 / 설정
+    '.log': 'logs_config', '.conf': 'logs_config', '.txt': 'logs_config',
+    '.json': 'logs_config', '.yaml': 'logs_config', '.yml': 'logs_config', '.xml': 'logs_config',
+    '.toml': 'logs_config', '.ini': 'logs_config', '.cfg': 'logs_config', '.config': 'logs_config',
+    '.properties': 'logs_config', '.env': 'logs_config'
+}
+
+# 실행 파일/오브젝트 파일 헤더
+MAGIC_SIGNATURES = [
+    (b"\x7fELF", "ELF"),
+    (b"MZ", "PE"),
+    (b"\xfe\xed\xfa\xce", "Mach-O"),
+    (b"\xfe\xed\xfa\xcf", "Mach-O"),
+    (b"\xce\xfa\xed\xfe", "Mach-O"),
+    (b"\xcf\xfa\xed\xfe", "Mach-O"),
+    (b"\xca\xfe\xba\xbe", "Mach-O fat / Java class"),
+    (b"\x00asm", "WebAssembly"),
+    (b"!<arch>\n", "ar archive"),
+]
+
+# 텍스트 내용 휴리스틱 (정규식, 타입, 가중치) - 일치 횟수의 로그값에 가중치를 곱해 점수에 더합니다.
+# re.IGNORECASE와 선행 \b는 sre의 첫 글자 최적화를 막아 느려지므로 사용하지 않습니다.
+CONTENT_HINTS = [
+    (re.compile(r"^\s*(?:def|class|import|from|#include|#define|package|public|private|func|fn|using|namespace|return|const|let|function|struct)\b", re.M), "source_code", 1.0),
+    (re.compile(r";\s*$|\)\s*\{\s*$|\):\s*$", re.M), "source_code", 0.5),
+    (re.compile(r"^\s*(?:mov|push|pop|call|ret|jmp|lea|xor|add|sub|cmp)[a-z]*\b", re.M), "assembly_binary", 1.0),
+    (re.compile(r"^\s*(?:0x)?[0-9a-fA-F]{6,16}:?\s", re.M), "assembly_binary", 0.5),
+    (re.compile(r"^\s*(?:section|segment|SECTION|SEGMENT)\s+\.?(?:text|data|bss)|^\s*global\s+_?\w+\s*$", re.M), "assembly_binary", 1.0),
+    (re.compile(r"^\S*\s*\d{4}[-/]\d{2}[-/]\d{2}[ T]\d{2}:\d{2}", re.M), "logs_config", 1.0),
+    (re.compile(r"(?:INFO|WARN|ERROR|DEBUG|TRACE|FATAL)\b"), "logs_config", 0.5),
+    (re.compile(r"^\s*\[[\w .-]+\]\s*$|^[\w.-]+\s*=\s*[^\s(]*$", re.M), "logs_config", 0.5),
+    (re.compile(r'^\s*"[^"\n]+"\s*:|^\s*<\??[\w:-]+[ >]|^\s*[\w-]+:\s+\S', re.M), "logs_config", 0.7),
+]
+
+_TOKEN_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]{1,30}|[{}();=#<>:\[\]@$%]")
+_TEXT_BYTES = bytes(range(32, 127)) + b"\n\r\t\f\b"
+
+
+@dataclass
+class ClassificationResult:
+    file_type: str
+    confidence: float
+    source: str  # magic, binary, local, llm
+    reasons: List[str] = field(default_factory=list)
+    duration: float = 0.0
+
+
+class NaiveBayesTextModel:
+    """토큰 빈도 기반 다항 나이브 베이즈 (라플라스 평활화)"""
+
+    def __init__(self, labels: Iterable[str] = FILE_TYPES):
+        self.labels = list(labels)
+        self.doc_counts: Counter = Counter()
+        self.token_counts: Dict[str, Counter] = {label: Counter() for label in self.labels}
+        self.token_totals: Counter = Counter()
+        self.vocabulary: set = set()
+
+    @property
+    def trained(self) -> bool:
+        return sum(self.doc_counts.values()) > 0
+
+    @staticmethod
+    def tokenize(filename: str, text: str) -> List[str]:
+        tokens = [token.lower() for token in _TOKEN_RE.findall(text)]
+        if filename and "." in filename:
+            tokens.append("ext:" + filename.rsplit(".", 1)[-1].lower())
+        return tokens
+
+    def fit(self, samples: Iterable[Tuple[str, str, str]]):
+        """samples: (filename, text, label)"""
+        for filename, text, label in samples:
+            if label not in self.token_counts:
+                continue
+            tokens = self.tokenize(filename, text)
+            self.doc_counts[label] += 1
+            self.token_counts[label].update(tokens)
+            self.token_totals[label] += len(tokens)
+            self.vocabulary.update(tokens)
+
+    def predict_proba(self, filename: str, text: str) -> Dict[str, float]:
+        tokens = self.tokenize(filename, text)
+        total_docs = sum(self.doc_counts.values())
+        vocab_size = len(self.vocabulary) + 1
+        log_probs = {}
+        for label in self.labels:
+            log_prob = math.log((self.doc_counts[label] + 1) / (total_docs + len(self.labels)))
+            denominator = self.token_totals[label] + vocab_size
+            counts = self.token_counts[label]
+            for token in tokens:
+                log_prob += math.log((counts[token] + 1) / denominator)
+            log_probs[label] = log_prob
+        return _softmax(log_probs)
+
+
+def _softmax(scores: Dict[str, float]) -> Dict[str, float]:
+    peak = max(scores.values())
+    exps = {label: math.exp(score - peak) for label, score in scores.items()}
+    total = sum(exps.values())
+    return {label: value / total for label, value in exps.items()}
+
+
+def _shannon_entropy(sample: bytes) -> float:
+    if not sample:
+        return 0.0
+    length = len(sample)
+    return -sum((count / length) * math.log2(count / length) for count in Counter(sample).values())
+
+
+def load_training_samples(path: Path) -> List[Tuple[str, str, str]]:
+    """
+    분류 학습 데이터(JSONL)를 읽습니다. 두 가지 형식을 지원합니다.
+    - {"filename": ..., "content": ..., "file_type": ...}
+    - 미세조정용 채팅 형식 {"messages": [..., {"role": "user", ...}, {"role": "assistant", "content": "{\"file_type\": ...}"}]}
+    """
+    samples = []
+    if not path.exists():
+        return samples
+
+    with open(path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                row = json.loads(line)
+                if "messages" in row:
+                    user = next(m["content"] for m in row["messages"] if m.get("role") == "user")
+                    answer = next(m["content"] for m in row["messages"] if m.get("role") == "assistant")
+                    label = json.loads(answer[answer.find("{"):answer.rfind("}") + 1])["file_type"]
+                    name_match = re.search(r"파일명:\s*(\S+)", user)
+                    samples.append((name_match.group(1) if name_match else "", user, label))
+                else:
+                    samples.append((row.get("filename", ""), row.get("content", ""), row["file_type"]))
+            except (ValueError, KeyError, StopIteration) as e:
+                print(f"⚠️ 분류 학습 데이터 {line_number}행 건너뜀: {e}")
+    return samples
+
+
+class LocalFileClassifier:
+    # 신호별 가중치 - 타입별 점수를 합산한 뒤 softmax로 확률(신뢰도)을 계산합니다.
+    # 근거가 없으면 세 타입이 모두 1/3이 되어 자연스럽게 LLM으로 넘어갑니다.
+    EXTENSION_WEIGHT = 3.0
+    CONTENT_WEIGHT = 1.0
+    MODEL_WEIGHT = 3.0
+
+    def __init__(self, model: Optional[NaiveBayesTextModel] = None, sample_bytes: int = 2048):
+        self.model = model
+        self.sample_bytes = sample_bytes
+        self.stats = {"classified": 0, "by_source": Counter(), "total_seconds": 0.0}
+
+    def classify(self, filename: str, content: bytes) -> ClassificationResult:
+        start = time.perf_counter()
+        result = self._classify(filename or "", content[:self.sample_bytes])
+        result.duration = time.perf_counter() - start
+
+        self.stats["classified"] += 1
+        self.stats["by_source"][result.source] += 1
+        self.stats["total_seconds"] += result.duration
+        return result
+
+    def _classify(self, filename: str, sample: bytes) -> ClassificationResult:
+        # 1) 실행 파일 헤더
+        for magic, name in MAGIC_SIGNATURES:
+            if sample.startswith(magic):
+                # "MZ"는 짧아서 텍스트 파일도 우연히 일치할 수 있으므로 바이너리 여부를 함께 확인합니다.
+                if magic != b"MZ" or self._non_text_ratio(sample) > 0.1:
+                    return ClassificationResult("assembly_binary", 0.99, "magic", [f"매직 바이트: {name}"])
+
+        # 2) 바이너리 판별: NUL 바이트가 있거나 제어 문자 비율이 높음
+        non_text_ratio = self._non_text_ratio(sample)
+        if b"\x00" in sample or non_text_ratio > 0.3:
+            entropy = _shannon_entropy(sample)
+            return ClassificationResult(
+                "assembly_binary", 0.95, "binary",
+                [f"비텍스트 바이트 비율 {non_text_ratio:.2f}, 엔트로피 {entropy:.2f} bits/byte"]
+            )
+
+        # 3) 텍스트: 확장자 + 내용 휴리스틱 + 나이브 베이즈 점수 결합
+        text = sample.decode("utf-8", errors="replace")
+        scores = {file_type: 0.0 for file_type in FILE_TYPES}
+        reasons = []
+
+        extension = "." + filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
+        if extension in EXTENSION_MAP:
+            scores[EXTENSION_MAP[extension]] += self.EXTENSION_WEIGHT
+            reasons.append(f"확장자 {extension}")
+
+        hint_scores = {file_type: 0.0 for file_type in FILE_TYPES}
+        for pattern, file_type, weight in CONTENT_HINTS:
+            matches = len(pattern.findall(text))
+            if matches:
+                hint_scores[file_type] += weight * math.log1p(matches)
+        if any(hint_scores.values()):
+            for file_type, score in hint_scores.items():
+                scores[file_type] += self.CONTENT_WEIGHT * score
+            reasons.append("내용 패턴 " + ", ".join(f"{k}={v:.1f}" for k, v in hint_scores.items() if v))
+
+        if self.model is not None and self.model.trained:
+            probabilities = self.model.predict_proba(filename, text)
+            for file_type, probability in probabilities.items():
+                scores[file_type] += self.MODEL_WEIGHT * probability
+            best_model_type = max(probabilities, key=probabilities.get)
+            reasons.append(f"나이브 베이즈 {best_model_type}={probabilities[best_model_type]:.2f}")
+
+        probabilities = _softmax(scores)
+        file_type = max(probabilities, key=probabilities.get)
+        confidence = probabilities[file_type]
+        return ClassificationResult(file_type, round(confidence, 4), "local", reasons)
+
+    @staticmethod
+    def _non_text_ratio(sample: bytes) -> float:
+        if not sample:
+            return 0.0
+        # UTF-8 멀티바이트(한글 등)는 텍스트로 간주하도록 0x80 이상 바이트는 제외합니다.
+        non_text = sample.translate(None, _TEXT_BYTES + bytes(range(128, 256)))
+        return len(non_text) / len(sample)
+
+    def get_stats(self) -> Dict[str, Any]:
+        classified = self.stats["classified"]
+        return {
+            "classified": classified,
+            "by_source": dict(self.stats["by_source"]),
+            "avg_microseconds": self.stats["total_seconds"] / classified * 1e6 if classified else 0.0,
+            "model_trained": bool(self.model and self.model.trained),
+            "training_samples": sum(self.model.doc_counts.values()) if self.model else 0
+        }
+
+
+# 프로세스 전역에서 하나의 분류기만 사용하도록 캐싱합니다 (학습은 시작 시 한 번).
+@lru_cache()
+def get_file_classifier() -> LocalFileClassifier:
+    samples = load_training_samples(Path(settings.FILE_CLASSIFIER_TRAINING_DATA))
+    model = None
+    if samples:
+        model = NaiveBayesTextModel()
+        model.fit(samples)
+        print(f"🗃️ 로컬 파일 분류기 학습 완료: {len(samples)}개 샘플 ({dict(model.doc_counts)})")
+    else:
+        print("🗃️ 로컬 파일 분류기: 학습 데이터가 없어 매직 바이트/확장자/내용 패턴만 사용합니다.")
+    return LocalFileClassifier(model)
@@ -0,0 +1,81 @@
+# File: pqc_inspector_server/services/http_client_pool.py
+# 🔌 AI 제공자(base URL)별로 httpx.AsyncClient를 하나씩 공유하는 프로세스 전역 커넥션 풀입니다.
+# 호출마다 클라이언트를 새로 만들면 매번 TCP+TLS 핸드셰이크 비용이 발생하므로,
+# keep-alive 커넥션을 재사용하고 애플리케이션 종료(lifespan) 시 한 번에 정리합니다.
+
+import asyncio
+import httpx
+from functools import lru_cache
+from typing import Dict, Any
+from ..core.config import settings
+
+# HTTP/2 지원 여부 확인 (httpx[http2] 설치 필요)
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+class HTTPClientPool:
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False
+    ):
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+
+        if http2 and not HTTP2_AVAILABLE:
+            print("⚠️ HTTP/2가 요청되었지만 'h2' 패키지가 없어 HTTP/1.1을 사용합니다. (pip install 'httpx[http2]')")
+        self.http2 = http2 and HTTP2_AVAILABLE
+
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._created_count = 0
+
+    def get_client(self, base_url: str) -> httpx.AsyncClient:
+        """
+        base URL에 해당하는 공유 클라이언트를 반환합니다. 없거나 닫혀 있으면 새로 생성합니다.
+        """
+        client = self._clients.get(base_url)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(limits=self.limits, http2=self.http2)
+            self._clients[base_url] = client
+            self._created_count += 1
+            print(f"🔌 HTTP 클라이언트 풀 생성: {base_url} (HTTP/2: {self.http2})")
+        return client
+
+    async def aclose(self):
+        """풀에 있는 모든 클라이언트 연결을 종료합니다."""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        if clients:
+            await asyncio.gather(*(client.aclose() for client in clients), return_exceptions=True)
+            print(f"🔌 HTTP 클라이언트 풀 종료: {len(clients)}개 클라이언트")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """풀 상태를 반환합니다."""
+        return {
+            "base_urls": list(self._clients.keys()),
+            "clients_created": self._created_count,
+            "http2": self.http2,
+            "max_connections": self.limits.max_connections,
+            "max_keepalive_connections": self.limits.max_keepalive_connections,
+            "keepalive_expiry": self.limits.keepalive_expiry
+        }
+
+
+# 프로세스 전역에서 하나의 풀만 사용하도록 캐싱합니다.
+@lru_cache()
+def get_http_client_pool() -> HTTPClientPool:
+    return HTTPClientPool(
+        max_connections=settings.HTTP_POOL_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.HTTP_POOL_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=settings.HTTP_POOL_KEEPALIVE_EXPIRY,
+        http2=settings.HTTP_POOL_HTTP2
+    )
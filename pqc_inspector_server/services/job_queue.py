@@ -0,0 +1,396 @@
+# File: pqc_inspector_server/services/job_queue.py
+# 📬 API 서버와 별도 워커 프로세스(pqc_worker.py)가 공유하는 분석 작업 대기열입니다.
+# - SQLiteJobQueue: 로컬 파일 기반, 같은 머신의 여러 프로세스가 공유 (로컬 테스트용)
+# - RedisJobQueue: Redis 호환 서버 기반, 여러 머신의 워커가 공유 (redis 패키지 필요)
+# 워커는 작업을 임대(lease)하여 처리하고, 처리 중에는 임대를 연장(heartbeat)합니다.
+# 워커가 비정상 종료되면 가시성 타임아웃(visibility timeout)이 지난 뒤 다른 워커가 작업을 다시 가져갑니다.
+
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any, Dict, Optional
+from ..core.config import settings
+from .job_scheduler import JobPriority, QueueFullError
+
+# Redis 백엔드 사용 여부 확인 (pip install redis 필요)
+try:
+    import redis.asyncio as redis_asyncio
+    REDIS_AVAILABLE = True
+except ImportError:
+    redis_asyncio = None
+    REDIS_AVAILABLE = False
+
+
+class SharedJobQueue(ABC):
+    """
+    임대된 작업 형식:
+    {"job_id", "payload", "data", "attempts", "lease_token"}
+    """
+
+    def __init__(self, max_queue_size: int = 100, retry_after_seconds: int = 30):
+        self.max_queue_size = max_queue_size
+        self.retry_after_seconds = retry_after_seconds
+
+    async def enqueue(
+        self,
+        job_id: str,
+        payload: Dict[str, Any],
+        data: bytes = b"",
+        priority: int = JobPriority.INTERACTIVE
+    ) -> int:
+        """
+        작업을 대기열에 넣고 현재 대기 작업 수를 반환합니다.
+        대기 작업 수가 한도에 도달했으면 QueueFullError를 발생시킵니다.
+        """
+        depth = await self.depth()
+        if depth >= self.max_queue_size:
+            raise QueueFullError(self.retry_after_seconds)
+        await self._enqueue(job_id, payload, data, priority)
+        return depth + 1
+
+    @abstractmethod
+    async def _enqueue(self, job_id: str, payload: Dict[str, Any], data: bytes, priority: int):
+        pass
+
+    @abstractmethod
+    async def lease(self, worker_id: str, visibility_timeout: float) -> Optional[Dict[str, Any]]:
+        """
+        우선순위가 가장 높은 대기 작업(또는 임대가 만료된 작업)을 임대합니다.
+        가져올 작업이 없으면 None을 반환합니다.
+        """
+        pass
+
+    @abstractmethod
+    async def extend_lease(self, job_id: str, lease_token: str, visibility_timeout: float) -> bool:
+        """임대를 연장합니다. 임대를 잃었으면(만료 후 다른 워커가 가져감) False를 반환합니다."""
+        pass
+
+    @abstractmethod
+    async def ack(self, job_id: str, lease_token: str):
+        """처리가 끝난 작업을 대기열에서 제거합니다."""
+        pass
+
+    @abstractmethod
+    async def nack(self, job_id: str, lease_token: str, error: str, retry: bool = True):
+        """처리에 실패한 작업을 다시 대기열에 넣거나(retry) 실패 작업으로 보관합니다."""
+        pass
+
+    @abstractmethod
+    async def depth(self) -> int:
+        """대기 중인 작업 수"""
+        pass
+
+    @abstractmethod
+    async def get_stats(self) -> Dict[str, Any]:
+        pass
+
+    async def close(self):
+        pass
+
+
+class SQLiteJobQueue(SharedJobQueue):
+    """SQLite 파일(WAL 모드) 기반 공유 대기열. 임대는 BEGIN IMMEDIATE 트랜잭션으로 원자적으로 처리합니다."""
+
+    def __init__(self, db_path: str, **kwargs):
+        super().__init__(**kwargs)
+        self.db_path = db_path
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        # isolation_level=None: 트랜잭션을 직접 제어합니다. timeout: 다른 프로세스의 잠금 대기 시간
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, timeout=10.0, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS job_queue (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                job_id TEXT NOT NULL UNIQUE,
+                priority INTEGER NOT NULL,
+                payload TEXT NOT NULL,
+                data BLOB,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                lease_token TEXT,
+                lease_expires_at REAL,
+                worker_id TEXT,
+                error TEXT,
+                enqueued_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_job_queue_ready ON job_queue(status, priority, seq)"
+        )
+
+    async def _enqueue(self, job_id, payload, data, priority):
+        await asyncio.to_thread(self._enqueue_sync, job_id, payload, data, priority)
+
+    async def lease(self, worker_id, visibility_timeout):
+        return await asyncio.to_thread(self._lease_sync, worker_id, visibility_timeout)
+
+    async def extend_lease(self, job_id, lease_token, visibility_timeout):
+        now = time.time()
+        return await asyncio.to_thread(
+            self._execute_for_lease,
+            "UPDATE job_queue SET lease_expires_at = ?, updated_at = ? WHERE job_id = ? AND lease_token = ?",
+            (now + visibility_timeout, now, job_id, lease_token)
+        )
+
+    async def ack(self, job_id, lease_token):
+        await asyncio.to_thread(
+            self._execute_for_lease,
+            "DELETE FROM job_queue WHERE job_id = ? AND lease_token = ?",
+            (job_id, lease_token)
+        )
+
+    async def nack(self, job_id, lease_token, error, retry=True):
+        if retry:
+            sql = """
+            UPDATE job_queue SET status = 'queued', lease_token = NULL, lease_expires_at = NULL,
+                error = ?, updated_at = ?
+            WHERE job_id = ? AND lease_token = ?
+            """
+        else:
+            # 실패 작업은 다시 처리되지 않으므로 파일 내용(data)을 비워 DB가 무한히 커지지 않게 합니다.
+            sql = """
+            UPDATE job_queue SET status = 'dead', lease_token = NULL, lease_expires_at = NULL,
+                data = NULL, error = ?, updated_at = ?
+            WHERE job_id = ? AND lease_token = ?
+            """
+        await asyncio.to_thread(self._execute_for_lease, sql, (error, time.time(), job_id, lease_token))
+
+    async def depth(self) -> int:
+        return await asyncio.to_thread(self._count, "queued")
+
+    async def get_stats(self) -> Dict[str, Any]:
+        counts = await asyncio.to_thread(self._counts_by_status)
+        return {"backend": "sqlite", "db_path": self.db_path, "max_queue_size": self.max_queue_size, **counts}
+
+    def _enqueue_sync(self, job_id, payload, data, priority):
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO job_queue (job_id, priority, payload, data, status, enqueued_at, updated_at)
+                VALUES (?, ?, ?, ?, 'queued', ?, ?)
+                """,
+                (job_id, priority, json.dumps(payload, ensure_ascii=False), sqlite3.Binary(data), now, now)
+            )
+
+    def _lease_sync(self, worker_id: str, visibility_timeout: float) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        lease_token = uuid.uuid4().hex
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    """
+                    SELECT job_id, payload, data, attempts FROM job_queue
+                    WHERE status = 'queued' OR (status = 'leased' AND lease_expires_at < ?)
+                    ORDER BY priority, seq
+                    LIMIT 1
+                    """,
+                    (now,)
+                ).fetchone()
+                if row is None:
+                    self._conn.execute("COMMIT")
+                    return None
+
+                job_id, payload, data, attempts = row
+                self._conn.execute(
+                    """
+                    UPDATE job_queue SET status = 'leased', attempts = attempts + 1, lease_token = ?,
+                        lease_expires_at = ?, worker_id = ?, updated_at = ?
+                    WHERE job_id = ?
+                    """,
+                    (lease_token, now + visibility_timeout, worker_id, now, job_id)
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        return {
+            "job_id": job_id,
+            "payload": json.loads(payload),
+            "data": bytes(data) if data is not None else b"",
+            "attempts": attempts + 1,
+            "lease_token": lease_token
+        }
+
+    def _execute_for_lease(self, sql: str, params: tuple) -> bool:
+        """임대 토큰 조건이 붙은 쓰기를 실행하고, 반영된 행이 있는지 반환합니다."""
+        with self._lock:
+            cursor = self._conn.execute(sql, params)
+        return cursor.rowcount > 0
+
+    def _count(self, status: str) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM job_queue WHERE status = ?", (status,)
+            ).fetchone()[0]
+
+    def _counts_by_status(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM job_queue GROUP BY status").fetchall()
+        counts = {"queued": 0, "leased": 0, "dead": 0}
+        counts.update(dict(rows))
+        return counts
+
+    async def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+# Redis 스크립트: 만료된 임대를 대기열로 되돌린 뒤 가장 앞의 작업을 원자적으로 임대합니다.
+# KEYS[1]=ready(zset), KEYS[2]=leased(zset) / ARGV[1]=now, ARGV[2]=visibility, ARGV[3]=token, ARGV[4]=job key prefix
+_REDIS_LEASE_SCRIPT = """
+local expired = redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', ARGV[1], 'LIMIT', 0, 100)
+for _, id in ipairs(expired) do
+    redis.call('ZREM', KEYS[2], id)
+    redis.call('ZADD', KEYS[1], redis.call('HGET', ARGV[4] .. id, 'score'), id)
+end
+local item = redis.call('ZRANGE', KEYS[1], 0, 0)
+if #item == 0 then
+    return nil
+end
+local id = item[1]
+local key = ARGV[4] .. id
+redis.call('ZREM', KEYS[1], id)
+redis.call('ZADD', KEYS[2], tonumber(ARGV[1]) + tonumber(ARGV[2]), id)
+redis.call('HSET', key, 'token', ARGV[3])
+local attempts = redis.call('HINCRBY', key, 'attempts', 1)
+return {id, redis.call('HGET', key, 'payload'), redis.call('HGET', key, 'data'), attempts}
+"""
+
+# 임대 토큰이 일치할 때만 작업을 변경합니다. 실패(dead) 작업은 파일 내용(data)을 지워 메모리를 돌려받습니다.
+# KEYS[1]=ready, KEYS[2]=leased, KEYS[3]=job key, KEYS[4]=dead(set)
+# ARGV[1]=token, ARGV[2]=action(extend/ack/retry/dead), ARGV[3]=value, ARGV[4]=job_id
+_REDIS_LEASE_OP_SCRIPT = """
+if redis.call('HGET', KEYS[3], 'token') ~= ARGV[1] then
+    return 0
+end
+local id = ARGV[4]
+if ARGV[2] == 'extend' then
+    redis.call('ZADD', KEYS[2], tonumber(ARGV[3]), id)
+elseif ARGV[2] == 'ack' then
+    redis.call('ZREM', KEYS[2], id)
+    redis.call('DEL', KEYS[3])
+elseif ARGV[2] == 'retry' then
+    redis.call('ZREM', KEYS[2], id)
+    redis.call('HDEL', KEYS[3], 'token')
+    redis.call('HSET', KEYS[3], 'error', ARGV[3])
+    redis.call('ZADD', KEYS[1], redis.call('HGET', KEYS[3], 'score'), id)
+else
+    redis.call('ZREM', KEYS[2], id)
+    redis.call('HDEL', KEYS[3], 'token', 'data')
+    redis.call('HSET', KEYS[3], 'error', ARGV[3], 'status', 'dead')
+    redis.call('SADD', KEYS[4], id)
+end
+return 1
+"""
+
+
+class RedisJobQueue(SharedJobQueue):
+    """Redis 정렬 집합(sorted set) 기반 공유 대기열. 여러 머신의 워커가 함께 사용할 수 있습니다."""
+
+    def __init__(self, redis_url: str, prefix: str = "pqc:jobs:", **kwargs):
+        super().__init__(**kwargs)
+        if not REDIS_AVAILABLE:
+            raise RuntimeError("Redis 대기열을 사용하려면 redis 패키지가 필요합니다. (pip install redis)")
+        self.redis_url = redis_url
+        self.prefix = prefix
+        self._client = redis_asyncio.from_url(redis_url)
+        self._ready_key = f"{prefix}ready"
+        self._leased_key = f"{prefix}leased"
+        self._dead_key = f"{prefix}dead"
+        self._job_prefix = f"{prefix}job:"
+        self._lease_script = self._client.register_script(_REDIS_LEASE_SCRIPT)
+        self._lease_op_script = self._client.register_script(_REDIS_LEASE_OP_SCRIPT)
+
+    async def _enqueue(self, job_id, payload, data, priority):
+        # 우선순위가 같으면 먼저 들어온 작업이 앞에 오도록 (우선순위, 등록 시각)을 점수로 사용합니다.
+        score = priority * 1e13 + time.time() * 1000
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.hset(self._job_prefix + job_id, mapping={
+                "payload": json.dumps(payload, ensure_ascii=False),
+                "data": data,
+                "score": score,
+                "attempts": 0
+            })
+            pipe.zadd(self._ready_key, {job_id: score})
+            await pipe.execute()
+
+    async def lease(self, worker_id, visibility_timeout):
+        lease_token = uuid.uuid4().hex
+        result = await self._lease_script(
+            keys=[self._ready_key, self._leased_key],
+            args=[time.time(), visibility_timeout, lease_token, self._job_prefix]
+        )
+        if not result:
+            return None
+
+        job_id, payload, data, attempts = result
+        return {
+            "job_id": job_id.decode() if isinstance(job_id, bytes) else job_id,
+            "payload": json.loads(payload),
+            "data": data or b"",
+            "attempts": int(attempts),
+            "lease_token": lease_token
+        }
+
+    async def _lease_op(self, job_id: str, lease_token: str, action: str, value: Any = "") -> bool:
+        result = await self._lease_op_script(
+            keys=[self._ready_key, self._leased_key, self._job_prefix + job_id, self._dead_key],
+            args=[lease_token, action, value, job_id]
+        )
+        return bool(result)
+
+    async def extend_lease(self, job_id, lease_token, visibility_timeout):
+        return await self._lease_op(job_id, lease_token, "extend", time.time() + visibility_timeout)
+
+    async def ack(self, job_id, lease_token):
+        await self._lease_op(job_id, lease_token, "ack")
+
+    async def nack(self, job_id, lease_token, error, retry=True):
+        await self._lease_op(job_id, lease_token, "retry" if retry else "dead", error)
+
+    async def depth(self) -> int:
+        return await self._client.zcard(self._ready_key)
+
+    async def get_stats(self) -> Dict[str, Any]:
+        return {
+            "backend": "redis",
+            "max_queue_size": self.max_queue_size,
+            "queued": await self._client.zcard(self._ready_key),
+            "leased": await self._client.zcard(self._leased_key),
+            "dead": await self._client.scard(self._dead_key)
+        }
+
+    async def close(self):
+        await self._client.close()
+
+
+# 프로세스 전역에서 하나의 대기열만 사용하도록 캐싱합니다.
+# JOB_QUEUE_BACKEND가 "local"(또는 알 수 없는 값)이면 공유 대기열 없이 프로세스 내 스케줄러를 사용하므로 None을 반환합니다.
+@lru_cache()
+def get_job_queue() -> Optional[SharedJobQueue]:
+    options = {
+        "max_queue_size": settings.JOB_QUEUE_MAX_SIZE,
+        "retry_after_seconds": settings.JOB_QUEUE_RETRY_AFTER_SECONDS
+    }
+    if settings.JOB_QUEUE_BACKEND == "sqlite":
+        return SQLiteJobQueue(settings.JOB_QUEUE_DB_PATH, **options)
+    if settings.JOB_QUEUE_BACKEND == "redis":
+        return RedisJobQueue(settings.REDIS_URL, **options)
+    if settings.JOB_QUEUE_BACKEND != "local":
+        print(f"⚠️ 알 수 없는 JOB_QUEUE_BACKEND '{settings.JOB_QUEUE_BACKEND}', 프로세스 내 스케줄러를 사용합니다.")
+    return None
@@ -0,0 +1,197 @@
+# File: pqc_inspector_server/services/job_scheduler.py
+# 🗓️ 분석 작업을 제한된 크기의 우선순위 대기열에 넣고 고정된 수의 워커가 처리하는 프로세스 내 스케줄러입니다.
+# 대기열이 가득 차면 작업을 받지 않고 QueueFullError를 발생시켜 API가 429 + Retry-After로 응답하게 합니다.
+# 종료 시 처리되지 못한 작업은 결과 저장소에 실패로 기록하여 클라이언트가 pending 상태를 무한히 조회하지 않게 합니다.
+
+import asyncio
+import itertools
+import time
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from ..core.config import settings
+from .result_store import ResultStore, TaskStatus, get_result_store
+
+SHUTDOWN_ERROR = "서버 종료로 작업이 처리되지 못했습니다. 다시 요청하세요."
+
+
+class JobPriority:
+    """숫자가 작을수록 먼저 처리됩니다."""
+    INTERACTIVE = 0
+    BULK = 1
+
+    NAMES = {"interactive": INTERACTIVE, "bulk": BULK}
+
+    @classmethod
+    def from_name(cls, name: str) -> int:
+        if name not in cls.NAMES:
+            raise ValueError(f"지원하지 않는 우선순위: {name} (가능한 값: {', '.join(cls.NAMES)})")
+        return cls.NAMES[name]
+
+    @classmethod
+    def to_name(cls, priority: int) -> str:
+        for name, value in cls.NAMES.items():
+            if value == priority:
+                return name
+        return str(priority)
+
+
+class QueueFullError(Exception):
+    """대기열이 가득 차서 작업을 받을 수 없을 때 발생합니다."""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"작업 대기열이 가득 찼습니다. {retry_after}초 후 다시 시도하세요.")
+        self.retry_after = retry_after
+
+
+class JobScheduler:
+    def __init__(self, num_workers: int = 4, max_queue_size: int = 100, result_store: Optional[ResultStore] = None):
+        self.num_workers = max(1, num_workers)
+        self.max_queue_size = max(1, max_queue_size)
+        self.result_store = result_store
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._workers: List[asyncio.Task] = []
+        self._sequence = itertools.count()  # 같은 우선순위 안에서는 먼저 들어온 작업부터 처리
+        self._queued_by_priority: Dict[int, int] = {}
+        self._running_jobs: Dict[int, str] = {}  # 워커 번호 -> 실행 중인 작업 ID
+        self._avg_run_seconds: Optional[float] = None
+        self._dequeued = 0
+        self.stats = {
+            "submitted": 0,
+            "rejected": 0,
+            "completed": 0,
+            "failed": 0,
+            "dropped": 0,
+            "running": 0,
+            "total_wait_seconds": 0.0,
+            "max_wait_seconds": 0.0
+        }
+
+    def start(self):
+        """이벤트 루프 안에서 워커들을 시작합니다. 이미 시작되었으면 아무것도 하지 않습니다."""
+        if self._workers:
+            return
+        self._queue = asyncio.PriorityQueue(maxsize=self.max_queue_size)
+        self._workers = [
+            asyncio.ensure_future(self._worker(index))
+            for index in range(self.num_workers)
+        ]
+        print(f"🗓️ 작업 스케줄러 시작: 워커 {self.num_workers}개, 대기열 최대 {self.max_queue_size}개")
+
+    async def stop(self):
+        """
+        워커들을 중지합니다. 실행 중이던 작업과 대기 중이던 작업은 처리되지 않으므로
+        결과 저장소에 종료 오류와 함께 실패로 기록합니다.
+        """
+        workers, self._workers = self._workers, []
+        interrupted = list(self._running_jobs.values())
+        for worker in workers:
+            worker.cancel()
+        if workers:
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        dropped: List[str] = []
+        while self._queue is not None and not self._queue.empty():
+            _, _, job_id, _, _ = self._queue.get_nowait()
+            dropped.append(job_id)
+        if workers:
+            print(f"🗓️ 작업 스케줄러 종료 (중단된 작업 {len(interrupted)}개, 처리되지 않은 작업 {len(dropped)}개)")
+
+        self.stats["dropped"] += len(dropped)
+        self._running_jobs.clear()
+        self._queue = None
+        self._queued_by_priority.clear()
+        await self._mark_failed(interrupted + dropped)
+
+    async def _mark_failed(self, job_ids: List[str]):
+        if self.result_store is None:
+            return
+        for job_id in job_ids:
+            try:
+                await self.result_store.update(job_id, TaskStatus.FAILED, error=SHUTDOWN_ERROR)
+            except Exception as e:
+                print(f"⚠️ 작업 [{job_id}] 종료 상태 기록 실패: {e}")
+
+    def submit(
+        self,
+        job_id: str,
+        job: Callable[[], Awaitable[Any]],
+        priority: int = JobPriority.INTERACTIVE
+    ) -> int:
+        """
+        작업을 대기열에 넣고 현재 대기열 길이를 반환합니다.
+        대기열이 가득 찼으면 QueueFullError를 발생시킵니다.
+        """
+        self.start()
+        try:
+            self._queue.put_nowait((priority, next(self._sequence), job_id, job, time.monotonic()))
+        except asyncio.QueueFull:
+            self.stats["rejected"] += 1
+            raise QueueFullError(self.estimate_retry_after())
+
+        self.stats["submitted"] += 1
+        self._queued_by_priority[priority] = self._queued_by_priority.get(priority, 0) + 1
+        return self._queue.qsize()
+
+    def estimate_retry_after(self) -> int:
+        """대기열이 비기까지 걸릴 대략적인 시간(초)을 추정합니다."""
+        avg_run = self._avg_run_seconds if self._avg_run_seconds is not None else 5.0
+        depth = self._queue.qsize() if self._queue else 0
+        return int(min(300, max(1, avg_run * depth / self.num_workers)))
+
+    async def _worker(self, index: int):
+        while True:
+            priority, _, job_id, job, enqueued_at = await self._queue.get()
+            self._queued_by_priority[priority] -= 1
+            self._dequeued += 1
+
+            wait_seconds = time.monotonic() - enqueued_at
+            self.stats["total_wait_seconds"] += wait_seconds
+            self.stats["max_wait_seconds"] = max(self.stats["max_wait_seconds"], wait_seconds)
+
+            self.stats["running"] += 1
+            self._running_jobs[index] = job_id
+            started = time.monotonic()
+            try:
+                await job()
+                self.stats["completed"] += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.stats["failed"] += 1
+                print(f"❌ 작업 [{job_id}] 실행 중 오류 (워커 {index}): {e}")
+            finally:
+                self.stats["running"] -= 1
+                self._running_jobs.pop(index, None)
+                self._record_run(time.monotonic() - started)
+                self._queue.task_done()
+
+    def _record_run(self, seconds: float):
+        # 지수 이동 평균으로 최근 작업 소요 시간을 추적합니다.
+        if self._avg_run_seconds is None:
+            self._avg_run_seconds = seconds
+        else:
+            self._avg_run_seconds = 0.8 * self._avg_run_seconds + 0.2 * seconds
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "workers": self.num_workers,
+            "max_queue_size": self.max_queue_size,
+            "queue_depth": self._queue.qsize() if self._queue else 0,
+            "queue_depth_by_priority": {
+                JobPriority.to_name(priority): count
+                for priority, count in self._queued_by_priority.items()
+            },
+            "avg_wait_seconds": self.stats["total_wait_seconds"] / self._dequeued if self._dequeued else 0.0,
+            "avg_run_seconds": self._avg_run_seconds or 0.0
+        }
+
+
+# 프로세스 전역에서 하나의 스케줄러만 사용하도록 캐싱합니다.
+@lru_cache()
+def get_job_scheduler() -> JobScheduler:
+    return JobScheduler(
+        num_workers=settings.JOB_WORKERS,
+        max_queue_size=settings.JOB_QUEUE_MAX_SIZE,
+        result_store=get_result_store()
+    )
@@ -0,0 +1,93 @@
+# File: pqc_inspector_server/services/json_stream.py
+# 🧩 스트리밍으로 도착하는 LLM 출력에서 최상위 JSON 객체가 닫히는 시점을 감지하는 증분 파서입니다.
+# JSON 뒤에 붙는 설명 문장을 기다리지 않고 생성을 조기 종료할 수 있게 해줍니다.
+
+import json
+from typing import Any, Dict, Optional
+
+
+class IncrementalJSONObjectParser:
+    """
+    청크 단위로 텍스트를 받아 문자열/이스케이프를 고려한 중괄호 깊이를 추적합니다.
+    최상위 객체가 닫히고 json.loads로 파싱되면 complete가 True가 됩니다.
+    JSON 앞의 설명 문장에 포함된 중괄호처럼 파싱되지 않는 후보는 버리고 계속 탐색합니다.
+    """
+
+    def __init__(self):
+        self.text = ""
+        self.result: Optional[Dict[str, Any]] = None
+        self._pos = 0
+        self._start = -1
+        self._end = -1
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    @property
+    def complete(self) -> bool:
+        return self.result is not None
+
+    @property
+    def object_text(self) -> Optional[str]:
+        """완성된 최상위 JSON 객체 텍스트"""
+        return self.text[self._start:self._end] if self.complete else None
+
+    @property
+    def text_until_complete(self) -> str:
+        """객체가 닫힌 지점까지의 텍스트 (앞쪽 설명 포함, 뒤쪽 설명 제외)"""
+        return self.text[:self._end] if self.complete else self.text
+
+    def feed(self, chunk: str) -> bool:
+        """
+        청크를 추가하고 최상위 JSON 객체가 완성되었는지 반환합니다.
+        """
+        if self.complete or not chunk:
+            return self.complete
+
+        self.text += chunk
+        text = self.text
+        while self._pos < len(text):
+            char = text[self._pos]
+            self._pos += 1
+
+            if self._start < 0:
+                if char == "{":
+                    self._start = self._pos - 1
+                    self._depth = 1
+                continue
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+
+            if char == '"':
+                self._in_string = True
+            elif char == "{":
+                self._depth += 1
+            elif char == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    if self._try_parse():
+                        return True
+                    # 유효한 JSON이 아니면 이 후보의 여는 괄호 다음부터 다시 탐색합니다.
+                    self._pos = self._start + 1
+                    self._start = -1
+
+        return False
+
+    def _try_parse(self) -> bool:
+        candidate = self.text[self._start:self._pos]
+        try:
+            parsed = json.loads(candidate)
+        except json.JSONDecodeError:
+            return False
+        if not isinstance(parsed, dict):
+            return False
+        self.result = parsed
+        self._end = self._pos
+        return True
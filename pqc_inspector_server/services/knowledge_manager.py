@@ -7,6 +7,9 @@ from .vector_store import VectorStore
 from .embedding_service import EmbeddingService, get_embedding_service
 import os
 import json
+import asyncio
+import time
+import uuid
 
 class KnowledgeManager:
     def __init__(self, agent_type: str, vector_store: VectorStore):
@@ -22,13 +25,13 @@ class KnowledgeManager:
         """
         try:
             # 이미 데이터가 있고 강제 재로딩이 아니면 스킵
-            collection_info = self.vector_store.get_collection_info()
+            collection_info = await self.vector_store.get_collection_info()
             if collection_info["document_count"] > 0 and not force_reload:
                 print(f"✅ {self.agent_type} 지식 베이스가 이미 로드됨 ({collection_info['document_count']}개 문서)")
                 return True
 
             if force_reload:
-                self.vector_store.clear_collection()
+                await self.vector_store.clear_collection()
 
             # 기본 지식 베이스 로드
             success = await self._load_default_knowledge()
@@ -594,24 +597,82 @@ class KnowledgeManager:
             print(f"❌ 지식 추가 중 오류: {e}")
             return False
 
+    async def add_knowledge_bulk(self, items: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        여러 지식을 한 번에 추가합니다 (문서 수집용 대량 경로).
+        임베딩은 제공자 크기의 배치로 나누어 동시에 요청하고, 벡터 DB에는 큰 배치로 upsert합니다.
+
+        Args:
+            items: {"content", "type", "category", "confidence", "source", "metadata"(선택), "id"(선택)} 목록.
+                   id가 같으면 기존 문서를 덮어씁니다.
+
+        Returns:
+            전체/저장/실패 건수와 단계별 소요 시간, 초당 처리 청크 수
+        """
+        start = time.perf_counter()
+        embeddings = await self.embedding_service.create_embeddings_batched([item["content"] for item in items])
+        embed_seconds = time.perf_counter() - start
+
+        documents, vectors, metadatas, ids = [], [], [], []
+        for item, embedding in zip(items, embeddings):
+            if not embedding:
+                continue
+            metadata = {
+                "type": item["type"],
+                "category": item["category"],
+                "confidence": item.get("confidence", 1.0),
+                "source": item.get("source", "user_input")
+            }
+            metadata.update(item.get("metadata") or {})
+            documents.append(item["content"])
+            vectors.append(embedding)
+            metadatas.append(metadata)
+            ids.append(item.get("id") or str(uuid.uuid4()))
+
+        write_start = time.perf_counter()
+        stored = await self.vector_store.upsert_documents(documents, vectors, metadatas, ids) if documents else 0
+        write_seconds = time.perf_counter() - write_start
+
+        duration = time.perf_counter() - start
+        stats = {
+            "total": len(items),
+            "stored": stored,
+            "failed": len(items) - stored,
+            "embed_seconds": embed_seconds,
+            "write_seconds": write_seconds,
+            "duration": duration,
+            "chunks_per_second": stored / duration if duration > 0 else 0.0
+        }
+        print(f"✅ 대량 지식 추가: {stored}/{len(items)}개 저장 "
+              f"(임베딩 {embed_seconds:.2f}초, 저장 {write_seconds:.2f}초, {stats['chunks_per_second']:.1f}청크/초)")
+        return stats
+
 # 의존성 주입을 위한 팩토리
 class KnowledgeManagerFactory:
     _instances = {}
+    _locks = {}
 
     @classmethod
     async def get_manager(cls, agent_type: str) -> KnowledgeManager:
         """
         에이전트 타입별 지식 매니저를 반환합니다.
+        공유 에이전트에 동시 요청이 몰려도 지식 베이스는 한 번만 초기화됩니다.
         """
-        if agent_type not in cls._instances:
-            from .vector_store import VectorStoreFactory
-            vector_store = VectorStoreFactory.get_store(agent_type)
-            manager = KnowledgeManager(agent_type, vector_store)
+        if agent_type in cls._instances:
+            return cls._instances[agent_type]
+
+        lock = cls._locks.setdefault(agent_type, asyncio.Lock())
+        async with lock:
+            if agent_type not in cls._instances:
+                from .vector_store import VectorStoreFactory, run_in_chroma_executor
+                # Chroma 클라이언트/컬렉션 로드도 디스크 I/O이므로 벡터 DB 스레드 풀에서 수행합니다.
+                vector_store = await run_in_chroma_executor(VectorStoreFactory.get_store, agent_type)
+                manager = KnowledgeManager(agent_type, vector_store)
 
-            # 지식 베이스 초기화
-            await manager.initialize_knowledge_base()
+                # 지식 베이스 초기화
+                await manager.initialize_knowledge_base()
 
-            cls._instances[agent_type] = manager
+                cls._instances[agent_type] = manager
 
         return cls._instances[agent_type]
 
@@ -0,0 +1,302 @@
+# File: pqc_inspector_server/services/llm_cache.py
+# 🗃️ 동일한 (모델, 시스템 프롬프트, 프롬프트, temperature) 호출의 LLM 응답을 재사용하는 캐시입니다.
+# 메모리 LRU 계층과 SQLite 디스크 계층 두 단계로 구성되며, TTL 및 크기 기반으로 항목을 제거합니다.
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Any, Optional
+from ..core.config import settings
+
+
+def make_cache_key(model: str, prompt: str, system_prompt: Optional[str], temperature: float, **extra: Any) -> str:
+    """
+    호출 파라미터로부터 내용 기반(content-addressed) 캐시 키를 생성합니다.
+    """
+    payload = {
+        "model": model,
+        "system_prompt": system_prompt or "",
+        "prompt": prompt,
+        "temperature": round(float(temperature), 4)
+    }
+    payload.update(extra)
+    raw = json.dumps(payload, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class MemoryLRUCache:
+    """프로세스 메모리에 저장되는 LRU 캐시 계층"""
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 86400.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        created_at, value = entry
+        if time.time() - created_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Dict[str, Any], created_at: Optional[float] = None):
+        self._entries[key] = (created_at or time.time(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteResponseCache:
+    """SQLite 파일에 저장되는 영구 캐시 계층 (재시작 후에도 유지, 여러 워커 프로세스가 공유)"""
+
+    # 만료 항목 정리는 쓰기 N회마다 한 번 수행합니다.
+    PURGE_EVERY_WRITES = 100
+    # 조회 시각(last_access) 갱신은 모아 두었다가 N개가 쌓이거나 다음 쓰기 때 한 번에 반영합니다.
+    ACCESS_FLUSH_EVERY = 64
+
+    def __init__(self, db_path: str, max_bytes: int, ttl_seconds: float = 86400.0):
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._pending_access: Dict[str, float] = {}
+
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        # timeout: 다른 워커가 쓰는 중이면 잠금이 풀릴 때까지 대기합니다.
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, timeout=10.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_response_cache (
+                cache_key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                response TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_cache_last_access ON llm_response_cache(last_access)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_cache_created_at ON llm_response_cache(created_at)"
+        )
+        # 전체 크기는 트리거로 한 행에 누적하여, 쓰기마다 SUM(size) 전체 스캔을 하지 않습니다.
+        # (모든 프로세스의 변경이 같은 행에 반영되므로 워커 간에도 정확합니다.)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_response_cache_size (id INTEGER PRIMARY KEY CHECK (id = 0), total INTEGER NOT NULL)"
+        )
+        self._conn.execute(
+            "INSERT OR IGNORE INTO llm_response_cache_size "
+            "SELECT 0, COALESCE(SUM(size), 0) FROM llm_response_cache"
+        )
+        self._conn.executescript(
+            """
+            CREATE TRIGGER IF NOT EXISTS llm_cache_size_insert AFTER INSERT ON llm_response_cache
+            BEGIN UPDATE llm_response_cache_size SET total = total + NEW.size WHERE id = 0; END;
+            CREATE TRIGGER IF NOT EXISTS llm_cache_size_delete AFTER DELETE ON llm_response_cache
+            BEGIN UPDATE llm_response_cache_size SET total = total - OLD.size WHERE id = 0; END;
+            CREATE TRIGGER IF NOT EXISTS llm_cache_size_update AFTER UPDATE OF size ON llm_response_cache
+            BEGIN UPDATE llm_response_cache_size SET total = total + NEW.size - OLD.size WHERE id = 0; END;
+            """
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[tuple]:
+        """(created_at, 응답) 튜플을 반환합니다. 없거나 만료되었으면 None. 조회만으로는 커밋하지 않습니다."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM llm_response_cache WHERE cache_key = ?",
+                (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            response, created_at = row
+            if now - created_at > self.ttl_seconds:
+                return None  # 만료 항목은 주기적인 정리에서 삭제됩니다.
+
+            self._pending_access[key] = now
+            if len(self._pending_access) >= self.ACCESS_FLUSH_EVERY:
+                self._flush_access_locked()
+                self._conn.commit()
+        return created_at, json.loads(response)
+
+    def set(self, key: str, model: str, value: Dict[str, Any]):
+        raw = json.dumps(value, ensure_ascii=False)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO llm_response_cache VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(cache_key) DO UPDATE SET
+                    model = excluded.model, response = excluded.response, size = excluded.size,
+                    created_at = excluded.created_at, last_access = excluded.last_access
+                """,
+                (key, model, raw, len(raw), now, now)
+            )
+            self._flush_access_locked()
+            self._evict_locked(now)
+            self._conn.commit()
+
+    def _flush_access_locked(self):
+        if self._pending_access:
+            self._conn.executemany(
+                "UPDATE llm_response_cache SET last_access = ? WHERE cache_key = ?",
+                [(accessed_at, key) for key, accessed_at in self._pending_access.items()]
+            )
+            self._pending_access.clear()
+
+    def _evict_locked(self, now: float):
+        """주기적으로 만료 항목을 지우고, 전체 크기가 한도를 넘으면 오래 사용되지 않은 항목부터 제거합니다."""
+        self._writes += 1
+        if self._writes % self.PURGE_EVERY_WRITES == 0:
+            self._conn.execute(
+                "DELETE FROM llm_response_cache WHERE created_at < ?",
+                (now - self.ttl_seconds,)
+            )
+        total_size = self._total_size_locked()
+        if total_size <= self.max_bytes:
+            return
+
+        excess = total_size - self.max_bytes
+        freed = 0
+        victims = []
+        for cache_key, size in self._conn.execute(
+            "SELECT cache_key, size FROM llm_response_cache ORDER BY last_access ASC"
+        ):
+            victims.append((cache_key,))
+            freed += size
+            if freed >= excess:
+                break
+        self._conn.executemany("DELETE FROM llm_response_cache WHERE cache_key = ?", victims)
+
+    def _total_size_locked(self) -> int:
+        return self._conn.execute("SELECT total FROM llm_response_cache_size WHERE id = 0").fetchone()[0]
+
+    def size_bytes(self) -> int:
+        with self._lock:
+            return self._total_size_locked()
+
+    def clear(self):
+        with self._lock:
+            self._pending_access.clear()
+            self._conn.execute("DELETE FROM llm_response_cache")
+            self._conn.commit()
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM llm_response_cache").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._flush_access_locked()
+            self._conn.commit()
+            self._conn.close()
+
+
+class LLMResponseCache:
+    """메모리 LRU → SQLite 순서로 조회하는 2단계 응답 캐시"""
+
+    def __init__(self, memory_tier: MemoryLRUCache, disk_tier: Optional[SQLiteResponseCache] = None):
+        self.memory_tier = memory_tier
+        self.disk_tier = disk_tier
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "stores": 0, "errors": 0}
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 응답을 반환합니다. 디스크 계층에서 찾은 항목은 메모리 계층으로 승격됩니다.
+        """
+        value = self.memory_tier.get(key)
+        if value is not None:
+            self.stats["memory_hits"] += 1
+            return {**value, "cache_tier": "memory"}
+
+        if self.disk_tier is not None:
+            try:
+                entry = await asyncio.to_thread(self.disk_tier.get, key)
+            except Exception as e:
+                print(f"⚠️ LLM 디스크 캐시 조회 실패: {e}")
+                self.stats["errors"] += 1
+                entry = None
+
+            if entry is not None:
+                created_at, value = entry
+                self.memory_tier.set(key, value, created_at=created_at)
+                self.stats["disk_hits"] += 1
+                return {**value, "cache_tier": "disk"}
+
+        self.stats["misses"] += 1
+        return None
+
+    async def set(self, key: str, model: str, value: Dict[str, Any]):
+        """성공한 응답을 두 계층 모두에 저장합니다."""
+        self.memory_tier.set(key, value)
+        self.stats["stores"] += 1
+
+        if self.disk_tier is not None:
+            try:
+                await asyncio.to_thread(self.disk_tier.set, key, model, value)
+            except Exception as e:
+                print(f"⚠️ LLM 디스크 캐시 저장 실패: {e}")
+                self.stats["errors"] += 1
+
+    def close(self):
+        """디스크 계층에 모아 둔 마지막 접근 시각을 기록하고 연결을 닫습니다."""
+        if self.disk_tier is not None:
+            self.disk_tier.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        hits = self.stats["memory_hits"] + self.stats["disk_hits"]
+        lookups = hits + self.stats["misses"]
+        return {
+            **self.stats,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "memory_entries": len(self.memory_tier),
+            "disk_enabled": self.disk_tier is not None
+        }
+
+
+# 프로세스 전역에서 하나의 캐시만 사용하도록 캐싱합니다.
+@lru_cache()
+def get_llm_cache() -> LLMResponseCache:
+    memory_tier = MemoryLRUCache(
+        max_entries=settings.LLM_CACHE_MEMORY_MAX_ENTRIES,
+        ttl_seconds=settings.LLM_CACHE_TTL_SECONDS
+    )
+
+    disk_tier = None
+    if settings.LLM_CACHE_DISK_ENABLED:
+        try:
+            disk_tier = SQLiteResponseCache(
+                db_path=settings.LLM_CACHE_DB_PATH,
+                max_bytes=settings.LLM_CACHE_DISK_MAX_MB * 1024 * 1024,
+                ttl_seconds=settings.LLM_CACHE_TTL_SECONDS
+            )
+        except Exception as e:
+            print(f"⚠️ LLM 디스크 캐시 초기화 실패, 메모리 캐시만 사용합니다: {e}")
+
+    return LLMResponseCache(memory_tier, disk_tier)
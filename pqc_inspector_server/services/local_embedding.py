@@ -0,0 +1,120 @@
+# File: pqc_inspector_server/services/local_embedding.py
+# 🖥️ sentence-transformers 모델을 CPU에서 직접 실행하는 로컬 임베딩 백엔드입니다.
+# 네트워크 없이 동작하므로 RAG 검색 쿼리마다 발생하던 임베딩 API 왕복이 사라집니다.
+# 추론은 전용 스레드 풀 실행기에서 배치로 수행하여 이벤트 루프를 막지 않습니다.
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
+from ..core.config import settings
+
+# 선택적 의존성: sentence-transformers (torch 또는 onnxruntime 포함)
+try:
+    from sentence_transformers import SentenceTransformer
+    SENTENCE_TRANSFORMERS_AVAILABLE = True
+except ImportError:
+    SentenceTransformer = None
+    SENTENCE_TRANSFORMERS_AVAILABLE = False
+
+
+class LocalEmbeddingBackend:
+    """sentence-transformers 모델을 한 번만 로드하여 배치 추론하는 임베딩 백엔드"""
+
+    def __init__(self, model_name: str, device: str = "cpu", runtime: str = "torch",
+                 batch_size: int = 32, threads: int = 1):
+        if not SENTENCE_TRANSFORMERS_AVAILABLE:
+            raise RuntimeError("로컬 임베딩 백엔드를 사용하려면 sentence-transformers를 설치하세요 (pip install sentence-transformers)")
+        self.model_name = model_name
+        self.device = device
+        self.runtime = runtime
+        self.batch_size = max(1, batch_size)
+        self.stats = {"requests": 0, "texts": 0, "encode_seconds": 0.0, "load_seconds": 0.0}
+        self._model = None
+        self._load_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max(1, threads), thread_name_prefix="local-embedding")
+
+    def _load_model(self):
+        """모델을 처음 사용할 때 한 번만 로드합니다 (여러 스레드에서 동시에 호출되어도 안전)."""
+        if self._model is not None:
+            return self._model
+        with self._load_lock:
+            if self._model is None:
+                start = time.perf_counter()
+                options = {"device": self.device}
+                # ONNX/OpenVINO 런타임은 sentence-transformers 3.2 이상에서만 지원하므로 기본값일 때는 넘기지 않습니다.
+                if self.runtime != "torch":
+                    options["backend"] = self.runtime
+                self._model = SentenceTransformer(self.model_name, **options)
+                self.stats["load_seconds"] = time.perf_counter() - start
+                print(f"🖥️ 로컬 임베딩 모델 로드 완료: {self.model_name} ({self.runtime}/{self.device}, "
+                      f"{self.stats['load_seconds']:.1f}초)")
+        return self._model
+
+    def _encode(self, texts: List[str]) -> List[List[float]]:
+        model = self._load_model()
+        start = time.perf_counter()
+        vectors = model.encode(
+            texts,
+            batch_size=self.batch_size,
+            normalize_embeddings=True,  # 코사인 거리 검색에 맞게 단위 벡터로 정규화
+            convert_to_numpy=True,
+            show_progress_bar=False
+        )
+        self.stats["requests"] += 1
+        self.stats["texts"] += len(texts)
+        self.stats["encode_seconds"] += time.perf_counter() - start
+        return vectors.tolist()
+
+    async def embed(self, texts: List[str]) -> List[List[float]]:
+        """텍스트 목록을 실행기 스레드에서 배치로 임베딩합니다."""
+        if not texts:
+            return []
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._encode, list(texts))
+
+    async def warm_up(self):
+        """모델 로드와 첫 추론(그래프 초기화 등)을 미리 수행하여 첫 요청의 지연을 없앱니다."""
+        start = time.perf_counter()
+        await self.embed(["warm-up"])
+        print(f"🔥 로컬 임베딩 모델 워밍업 완료 ({time.perf_counter() - start:.1f}초)")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "model": self.model_name,
+            "runtime": self.runtime,
+            "device": self.device,
+            "loaded": self._model is not None,
+            **self.stats,
+            "texts_per_second": self.stats["texts"] / self.stats["encode_seconds"] if self.stats["encode_seconds"] else 0.0
+        }
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False)
+
+
+# 프로세스 전역에서 하나의 모델만 메모리에 올리도록 캐싱합니다.
+@lru_cache()
+def get_local_embedding_backend() -> LocalEmbeddingBackend:
+    return LocalEmbeddingBackend(
+        model_name=settings.LOCAL_EMBEDDING_MODEL,
+        device=settings.LOCAL_EMBEDDING_DEVICE,
+        runtime=settings.LOCAL_EMBEDDING_RUNTIME,
+        batch_size=settings.LOCAL_EMBEDDING_BATCH_SIZE,
+        threads=settings.LOCAL_EMBEDDING_THREADS
+    )
+
+
+async def warm_up_embedding_backend() -> Optional[LocalEmbeddingBackend]:
+    """로컬 임베딩 백엔드를 사용하도록 설정된 경우 시작 시 모델을 워밍업합니다. 실패해도 시작을 막지 않습니다."""
+    if settings.EMBEDDING_BACKEND != "local" or not settings.LOCAL_EMBEDDING_WARMUP:
+        return None
+    try:
+        backend = get_local_embedding_backend()
+        await backend.warm_up()
+        return backend
+    except Exception as e:
+        print(f"⚠️ 로컬 임베딩 모델 워밍업 실패: {e}")
+        return None
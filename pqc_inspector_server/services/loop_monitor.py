@@ -0,0 +1,84 @@
+# File: pqc_inspector_server/services/loop_monitor.py
+# ⏱️ 이벤트 루프 지연(lag)을 측정하는 모니터입니다.
+# 일정 간격으로 잠들었다 깨어나며 예정 시각보다 늦게 깨어난 만큼을 기록합니다.
+# 동기 호출(예: Chroma 검색/대량 추가)이 루프를 막으면 그 시간만큼 지연이 커지므로, 루프가 응답 가능한 상태인지 확인할 수 있습니다.
+
+import asyncio
+import time
+from collections import deque
+from functools import lru_cache
+from typing import Deque, Dict, Any, Optional
+from ..core.config import settings
+
+
+class EventLoopLagMonitor:
+    """이벤트 루프의 스케줄링 지연을 주기적으로 샘플링합니다."""
+
+    def __init__(self, interval_ms: float = 100.0, warn_ms: float = 200.0, window: int = 600):
+        self.interval = interval_ms / 1000.0
+        self.warn = warn_ms / 1000.0
+        # 최근 window개 샘플로 백분위수를 계산합니다 (기본 100ms 간격이면 약 1분).
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._task: Optional[asyncio.Task] = None
+        self.stats = {"samples": 0, "stalls": 0, "max_lag_seconds": 0.0, "total_lag_seconds": 0.0}
+
+    def start(self):
+        """현재 이벤트 루프에서 측정을 시작합니다. 이미 시작되었으면 아무것도 하지 않습니다."""
+        if self._task is not None:
+            return
+        self._task = asyncio.ensure_future(self._run())
+        print(f"⏱️ 이벤트 루프 지연 모니터 시작: {self.interval * 1000:g}ms 간격, 경고 {self.warn * 1000:g}ms")
+
+    async def stop(self):
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def _run(self):
+        while True:
+            scheduled = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            self.record(max(0.0, time.perf_counter() - scheduled))
+
+    def record(self, lag: float):
+        self._samples.append(lag)
+        self.stats["samples"] += 1
+        self.stats["total_lag_seconds"] += lag
+        self.stats["max_lag_seconds"] = max(self.stats["max_lag_seconds"], lag)
+        if lag >= self.warn:
+            self.stats["stalls"] += 1
+            print(f"⚠️ 이벤트 루프가 {lag * 1000:.0f}ms 동안 막혔습니다 (동기 작업이 루프에서 실행 중인지 확인하세요)")
+
+    def reset(self):
+        self._samples.clear()
+        self.stats = {"samples": 0, "stalls": 0, "max_lag_seconds": 0.0, "total_lag_seconds": 0.0}
+
+    def _percentile(self, ordered, fraction: float) -> float:
+        if not ordered:
+            return 0.0
+        return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+    def get_stats(self) -> Dict[str, Any]:
+        ordered = sorted(self._samples)
+        samples = self.stats["samples"]
+        return {
+            "running": self._task is not None,
+            "interval_ms": self.interval * 1000,
+            "samples": samples,
+            "stalls": self.stats["stalls"],
+            "avg_lag_ms": self.stats["total_lag_seconds"] / samples * 1000 if samples else 0.0,
+            "max_lag_ms": self.stats["max_lag_seconds"] * 1000,
+            "recent_p50_lag_ms": self._percentile(ordered, 0.5) * 1000,
+            "recent_p99_lag_ms": self._percentile(ordered, 0.99) * 1000,
+            "recent_max_lag_ms": (ordered[-1] if ordered else 0.0) * 1000
+        }
+
+
+# 프로세스 전역에서 하나의 모니터를 공유하도록 캐싱합니다.
+@lru_cache()
+def get_loop_lag_monitor() -> EventLoopLagMonitor:
+    return EventLoopLagMonitor(
+        interval_ms=settings.EVENT_LOOP_MONITOR_INTERVAL_MS,
+        warn_ms=settings.EVENT_LOOP_LAG_WARN_MS
+    )
@@ -0,0 +1,142 @@
+# File: pqc_inspector_server/services/model_cascade.py
+# 🪜 에이전트 LLM 호출을 저렴한 모델 → 강한 모델 순서로 수행하는 모델 캐스케이드입니다.
+# 저렴한 모델(빠른 API 모델 또는 로컬 Ollama)의 답이 JSON 파싱에 실패하거나, confidence_score가 낮거나,
+# 시그니처 정적 스캔과 어긋날 때만 에이전트의 기본(강한) 모델로 다시 호출합니다.
+# 단계별 채택률과 지연 시간을 기록하여 처리량 향상을 확인할 수 있습니다.
+
+import time
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Optional
+from .json_stream import IncrementalJSONObjectParser
+from .validation_policy import scan_disagreement
+from ..core.config import settings
+
+
+def get_cascade_model(agent_type: str) -> Optional[str]:
+    """에이전트별 1단계(저렴한) 모델. 캐스케이드가 꺼져 있거나 설정이 없으면 None."""
+    if not settings.LLM_CASCADE_ENABLED:
+        return None
+    return {
+        "source_code": settings.SOURCE_CODE_CASCADE_MODEL,
+        "assembly_binary": settings.BINARY_CASCADE_MODEL,
+        "logs_config": settings.LOG_CONF_CASCADE_MODEL
+    }.get(agent_type) or None
+
+
+def _parse_agent_json(content: str) -> Optional[Dict[str, Any]]:
+    parser = IncrementalJSONObjectParser()
+    parser.feed(content or "")
+    return parser.result
+
+
+class ModelCascade:
+    def __init__(self, min_confidence: float = 0.8):
+        self.min_confidence = min_confidence
+        self._stats: Dict[str, Dict[str, Any]] = {}
+
+    def _agent_stats(self, agent_type: str) -> Dict[str, Any]:
+        return self._stats.setdefault(agent_type, {
+            "calls": 0,
+            "cheap_accepted": 0,
+            "escalated": 0,
+            "escalation_reasons": Counter(),
+            "cheap_seconds": 0.0,
+            "strong_seconds": 0.0,
+            "strong_calls": 0
+        })
+
+    async def run(
+        self,
+        agent_type: str,
+        cheap_model: str,
+        strong_model: str,
+        call: Callable[[str], Awaitable[Dict[str, Any]]],
+        scan: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        call(model)로 저렴한 모델을 먼저 호출하고, 필요할 때만 강한 모델로 다시 호출합니다.
+
+        Args:
+            agent_type: 통계를 구분할 에이전트 타입
+            cheap_model / strong_model: 1단계 / 2단계 모델 이름
+            call: 모델 이름을 받아 AIService.generate_response 결과를 돌려주는 코루틴 함수
+            scan: 분석 대상의 SignatureScanner.scan() 결과 (없으면 정적 스캔 비교 생략)
+
+        Returns:
+            채택된 응답 (cascade_tier, cascade_escalation_reason 필드 추가)
+        """
+        stats = self._agent_stats(agent_type)
+        stats["calls"] += 1
+
+        start = time.perf_counter()
+        cheap_response = await call(cheap_model)
+        stats["cheap_seconds"] += time.perf_counter() - start
+
+        reason = self._escalation_reason(cheap_response, scan)
+        if reason is None:
+            stats["cheap_accepted"] += 1
+            print(f"   🪜 캐스케이드 1단계 채택: {cheap_model}")
+            return {**cheap_response, "cascade_tier": "cheap", "cascade_escalation_reason": None}
+
+        stats["escalated"] += 1
+        stats["escalation_reasons"][reason.split(":")[0]] += 1
+        print(f"   🪜 캐스케이드 2단계로 전환: {cheap_model} → {strong_model} (사유: {reason})")
+
+        start = time.perf_counter()
+        strong_response = await call(strong_model)
+        stats["strong_seconds"] += time.perf_counter() - start
+        stats["strong_calls"] += 1
+        return {**strong_response, "cascade_tier": "strong", "cascade_escalation_reason": reason}
+
+    def _escalation_reason(self, response: Dict[str, Any], scan: Optional[Dict[str, Any]]) -> Optional[str]:
+        if not response.get("success"):
+            return f"호출 실패: {response.get('error')}"
+
+        result = _parse_agent_json(response.get("content", ""))
+        if result is None:
+            return "JSON 파싱 실패"
+
+        try:
+            confidence = float(result.get("confidence_score") or 0.0)
+        except (TypeError, ValueError):
+            confidence = 0.0
+        if confidence < self.min_confidence:
+            return f"신뢰도 부족: {confidence:.2f} < {self.min_confidence:.2f}"
+
+        vulnerable = result.get("is_pqc_vulnerable")
+        if not isinstance(vulnerable, bool):
+            return "판정 필드 없음"
+
+        if scan is not None:
+            disagreement = scan_disagreement(vulnerable, scan, result.get("detected_algorithms") or [])
+            if disagreement:
+                return f"정적 스캔 불일치: {disagreement}"
+        return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        summary = {}
+        for agent_type, stats in self._stats.items():
+            calls = stats["calls"]
+            cheap_avg = stats["cheap_seconds"] / calls if calls else 0.0
+            strong_avg = stats["strong_seconds"] / stats["strong_calls"] if stats["strong_calls"] else None
+            total_avg = (stats["cheap_seconds"] + stats["strong_seconds"]) / calls if calls else 0.0
+            summary[agent_type] = {
+                "calls": calls,
+                "cheap_accepted": stats["cheap_accepted"],
+                "escalated": stats["escalated"],
+                "cheap_hit_rate": stats["cheap_accepted"] / calls if calls else 0.0,
+                "escalation_reasons": dict(stats["escalation_reasons"]),
+                "avg_cheap_seconds": cheap_avg,
+                "avg_strong_seconds": strong_avg,
+                "avg_seconds_per_call": total_avg,
+                # 강한 모델만 썼을 때 대비 호출 1회당 평균 소요 시간 비율 (강한 모델 지연 표본이 있을 때)
+                "speedup_vs_strong_only": strong_avg / total_avg if strong_avg and total_avg else None
+            }
+        return {"enabled": settings.LLM_CASCADE_ENABLED, "min_confidence": self.min_confidence, "agents": summary}
+
+
+# 프로세스 전역에서 하나의 캐스케이드 통계만 사용하도록 캐싱합니다.
+@lru_cache()
+def get_model_cascade() -> ModelCascade:
+    return ModelCascade(min_confidence=settings.LLM_CASCADE_MIN_CONFIDENCE)
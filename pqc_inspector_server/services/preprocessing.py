@@ -3,6 +3,20 @@
 
 import subprocess
 import platform
+import mmap
+import re
+from bisect import bisect_right
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
+
+# 문자열 추출 가속용 (chromadb 의존성으로 보통 설치되어 있음). 없으면 bytes 정규식으로 추출합니다.
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
 
 def extract_strings_from_binary(binary_content: bytes) -> str:
     """
@@ -32,4 +46,173 @@ def extract_strings_from_binary(binary_content: bytes) -> str:
         return "\n".join(s.decode('ascii', errors='ignore') for s in found_strings)
     except Exception as e:
         print(f"문자열 추출 중 예외 발생: {e}")
-        return ""
\ No newline at end of file
+        return ""
+
+
+# --- 벡터화된 문자열 추출 ---
+# 바이트 단위 파이썬 루프 대신 NumPy 마스크(없으면 bytes 정규식)로 파일 전체를 C 속도로 훑습니다.
+# bytes, bytearray, memoryview, mmap 모두 버퍼 프로토콜로 복사 없이 검사할 수 있습니다.
+BinaryBuffer = Union[bytes, bytearray, memoryview, mmap.mmap]
+# (섹션 이름, 파일 내 시작 오프셋, 끝 오프셋)
+SectionRange = Tuple[str, int, int]
+
+# NumPy 마스크를 만들 때 한 번에 처리하는 바이트 수 (임시 배열 메모리 상한)
+MASK_BLOCK_BYTES = 8 * 1024 * 1024
+
+
+@dataclass
+class ExtractedString:
+    offset: int  # 파일 내 바이트 오프셋
+    text: str
+    encoding: str  # "ascii" 또는 "utf-16le"
+    section: Optional[str] = None
+
+
+def _section_lookup(sections: Sequence[SectionRange]):
+    ordered = sorted(sections, key=lambda section: section[1])
+    starts = [start for _, start, _ in ordered]
+
+    def lookup(offset: int) -> Optional[str]:
+        index = bisect_right(starts, offset) - 1
+        if index >= 0 and offset < ordered[index][2]:
+            return ordered[index][0]
+        return None
+
+    return lookup
+
+
+def _mask_runs(blocks: Iterator[Tuple[int, "np.ndarray"]], min_length: int) -> List[Tuple[int, int]]:
+    """
+    연속된 블록 단위 불리언 마스크에서 길이가 min_length 이상인 True 구간 (시작, 끝) 목록을 구합니다.
+    블록 경계를 넘는 구간은 다음 블록으로 이어 붙입니다.
+    """
+    runs: List[Tuple[int, int]] = []
+    open_start = None
+    end = 0
+    for base, mask in blocks:
+        end = base + len(mask)
+        # 값이 바뀌는 위치만 찾으면 구간 시작/끝이 번갈아 나타납니다 (np.diff + 두 번의 비교보다 빠름).
+        edges = np.flatnonzero(mask[1:] != mask[:-1]) + 1
+        if mask[0]:
+            edges = np.concatenate(([0], edges))
+        if mask[-1]:
+            edges = np.concatenate((edges, [len(mask)]))
+        edges += base
+        starts, ends = edges[0::2], edges[1::2]
+        if open_start is not None:
+            if len(starts) and starts[0] == base:
+                starts[0] = open_start
+            elif base - open_start >= min_length:
+                runs.append((open_start, base))
+            open_start = None
+        if len(ends) and ends[-1] == end:
+            open_start = int(starts[-1])
+            starts, ends = starts[:-1], ends[:-1]
+        keep = (ends - starts) >= min_length
+        runs.extend(zip(starts[keep].tolist(), ends[keep].tolist()))
+    if open_start is not None and end - open_start >= min_length:
+        runs.append((open_start, end))
+    return runs
+
+
+def _printable(values: "np.ndarray") -> "np.ndarray":
+    return (values >= 0x20) & (values <= 0x7e)
+
+
+def _extract_with_numpy(view: memoryview, min_length: int, utf16: bool) -> List[ExtractedString]:
+    data = np.frombuffer(view, dtype=np.uint8)
+    size = len(data)
+
+    ascii_blocks = (
+        (base, _printable(data[base:base + MASK_BLOCK_BYTES]))
+        for base in range(0, size, MASK_BLOCK_BYTES)
+    )
+    strings = [
+        ExtractedString(start, str(view[start:end], "ascii"), "ascii")
+        for start, end in _mask_runs(ascii_blocks, min_length)
+    ]
+
+    if utf16:
+        # 짝수/홀수 정렬 각각에서 (출력 가능 문자, 0x00) 쌍이 이어지는 구간을 찾습니다.
+        # 두 정렬의 구간은 서로 겹칠 수 없습니다.
+        pairs_per_block = MASK_BLOCK_BYTES // 2
+        for alignment in (0, 1):
+            pairs = data[alignment:alignment + (size - alignment) // 2 * 2].reshape(-1, 2)
+            utf16_blocks = (
+                (base, _printable(pairs[base:base + pairs_per_block, 0]) & (pairs[base:base + pairs_per_block, 1] == 0))
+                for base in range(0, len(pairs), pairs_per_block)
+            )
+            strings += [
+                ExtractedString(
+                    alignment + start * 2,
+                    str(view[alignment + start * 2:alignment + end * 2], "utf-16-le"),
+                    "utf-16le"
+                )
+                for start, end in _mask_runs(utf16_blocks, min_length)
+            ]
+    return strings
+
+
+def _extract_with_regex(view: memoryview, min_length: int, utf16: bool) -> List[ExtractedString]:
+    ascii_pattern = re.compile(rb"[\x20-\x7e]{%d,}" % min_length)
+    strings = [
+        ExtractedString(match.start(), match.group().decode("ascii"), "ascii")
+        for match in ascii_pattern.finditer(view)
+    ]
+    if utf16:
+        # (?:X\x00){n,} 대신 앞부분을 풀어 쓰면 sre의 반복 그룹 오버헤드가 줄어 2배 이상 빠릅니다.
+        utf16_pattern = re.compile(rb"[\x20-\x7e]\x00" * min_length + rb"(?:[\x20-\x7e]\x00)*")
+        strings += [
+            ExtractedString(match.start(), match.group().decode("utf-16-le"), "utf-16le")
+            for match in utf16_pattern.finditer(view)
+        ]
+    return strings
+
+
+def extract_strings(
+    data: BinaryBuffer,
+    min_length: int = 4,
+    utf16: bool = True,
+    sections: Optional[Sequence[SectionRange]] = None
+) -> List[ExtractedString]:
+    """
+    바이너리 전체에서 출력 가능한 ASCII 문자열과 UTF-16LE 문자열을 오프셋 순서로 추출합니다.
+
+    Args:
+        data: 바이너리 내용 (bytes/bytearray/memoryview/mmap)
+        min_length: 최소 문자 수
+        utf16: UTF-16LE(Windows PE 리소스 등) 문자열도 추출할지 여부
+        sections: (이름, 시작, 끝) 오프셋 목록. 주어지면 각 문자열이 속한 섹션을 기록합니다.
+    """
+    view = memoryview(data).cast("B")
+    try:
+        extract = _extract_with_numpy if NUMPY_AVAILABLE else _extract_with_regex
+        strings = extract(view, min_length, utf16)
+    finally:
+        # mmap은 내보낸 버퍼가 남아 있으면 닫을 수 없으므로 바로 해제합니다.
+        view.release()
+
+    # ASCII/UTF-16LE 목록은 각각 정렬되어 있으므로 timsort가 거의 선형 시간에 병합합니다.
+    strings.sort(key=attrgetter("offset"))
+    if sections:
+        section_of = _section_lookup(sections)
+        for extracted in strings:
+            extracted.section = section_of(extracted.offset)
+    return strings
+
+
+def extract_strings_from_file(
+    file_path: str,
+    min_length: int = 4,
+    utf16: bool = True,
+    sections: Optional[Sequence[SectionRange]] = None
+) -> List[ExtractedString]:
+    """파일을 mmap으로 열어 메모리에 통째로 읽지 않고 문자열을 추출합니다."""
+    with open(file_path, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # 빈 파일은 mmap할 수 없습니다.
+            return []
+        with mapped:
+            return extract_strings(mapped, min_length=min_length, utf16=utf16, sections=sections)
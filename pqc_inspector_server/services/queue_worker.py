@@ -0,0 +1,122 @@
+# File: pqc_inspector_server/services/queue_worker.py
+# 👷 공유 작업 대기열에서 분석 작업을 임대하여 오케스트레이터로 처리하는 워커입니다.
+# pqc_worker.py 진입점에서 실행되며, API 서버와 독립적으로 코어/머신 수만큼 늘릴 수 있습니다.
+
+import asyncio
+import os
+import socket
+import time
+from typing import Any, Dict, List, Optional
+from .job_queue import SharedJobQueue
+from .result_store import ResultStore, TaskStatus
+
+
+class QueueWorker:
+    def __init__(
+        self,
+        queue: SharedJobQueue,
+        orchestrator,
+        result_store: ResultStore,
+        concurrency: int = 4,
+        visibility_timeout: float = 300.0,
+        max_attempts: int = 3,
+        poll_interval: float = 1.0,
+        worker_id: Optional[str] = None
+    ):
+        self.queue = queue
+        self.orchestrator = orchestrator
+        self.result_store = result_store
+        self.concurrency = max(1, concurrency)
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max(1, max_attempts)
+        self.poll_interval = poll_interval
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self._stop_event: Optional[asyncio.Event] = None
+        self.stats = {"processed": 0, "retried": 0, "dead": 0, "lease_lost": 0}
+
+    async def run(self):
+        """stop()이 호출될 때까지 concurrency개의 슬롯에서 작업을 처리합니다."""
+        self._stop_event = asyncio.Event()
+        print(f"👷 워커 시작: {self.worker_id} (동시 처리 {self.concurrency}개, 가시성 타임아웃 {self.visibility_timeout:g}초)")
+        slots: List[asyncio.Task] = [
+            asyncio.ensure_future(self._slot_loop(index))
+            for index in range(self.concurrency)
+        ]
+        try:
+            await asyncio.gather(*slots)
+        finally:
+            for slot in slots:
+                slot.cancel()
+            await asyncio.gather(*slots, return_exceptions=True)
+            print(f"👷 워커 종료: {self.worker_id} {self.stats}")
+
+    def stop(self):
+        """진행 중인 작업을 마친 뒤 종료하도록 요청합니다."""
+        if self._stop_event is not None:
+            print("🛑 워커 종료 요청: 진행 중인 작업을 마친 뒤 종료합니다.")
+            self._stop_event.set()
+
+    async def _slot_loop(self, index: int):
+        while not self._stop_event.is_set():
+            try:
+                job = await self.queue.lease(self.worker_id, self.visibility_timeout)
+            except Exception as e:
+                print(f"⚠️ 작업 임대 실패 (슬롯 {index}): {e}")
+                job = None
+
+            if job is None:
+                # 대기열이 비었으면 poll_interval만큼 기다리되, 종료 요청이 오면 즉시 깨어납니다.
+                try:
+                    await asyncio.wait_for(self._stop_event.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            await self._process(job)
+
+    async def _process(self, job: Dict[str, Any]):
+        job_id = job["job_id"]
+        lease_token = job["lease_token"]
+
+        if job["attempts"] > self.max_attempts:
+            # 처리 도중 워커가 반복해서 죽은 작업은 더 이상 재시도하지 않습니다.
+            error = f"최대 시도 횟수({self.max_attempts}회) 초과"
+            print(f"💀 작업 [{job_id}] 포기: {error}")
+            await self.result_store.update(job_id, TaskStatus.FAILED, error=error)
+            await self.queue.nack(job_id, lease_token, error, retry=False)
+            self.stats["dead"] += 1
+            return
+
+        payload = job["payload"]
+        print(f"📥 작업 [{job_id}] 임대 (시도 {job['attempts']}/{self.max_attempts}): {payload.get('filename')}")
+        heartbeat = asyncio.ensure_future(self._heartbeat(job_id, lease_token))
+        started = time.monotonic()
+        try:
+            await self.orchestrator.start_analysis_with_content(payload["filename"], job["data"], job_id)
+            await self.queue.ack(job_id, lease_token)
+            self.stats["processed"] += 1
+            print(f"📤 작업 [{job_id}] 완료 ({time.monotonic() - started:.2f}초)")
+        except Exception as e:
+            retry = job["attempts"] < self.max_attempts
+            print(f"❌ 작업 [{job_id}] 실패 ({'재시도 예정' if retry else '포기'}): {e}")
+            await self.queue.nack(job_id, lease_token, str(e), retry=retry)
+            if retry:
+                self.stats["retried"] += 1
+            else:
+                self.stats["dead"] += 1
+                await self.result_store.update(job_id, TaskStatus.FAILED, error=str(e))
+        finally:
+            heartbeat.cancel()
+
+    async def _heartbeat(self, job_id: str, lease_token: str):
+        """처리 중인 작업의 임대를 가시성 타임아웃의 1/3 간격으로 연장합니다."""
+        interval = max(1.0, self.visibility_timeout / 3)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if not await self.queue.extend_lease(job_id, lease_token, self.visibility_timeout):
+                    self.stats["lease_lost"] += 1
+                    print(f"⚠️ 작업 [{job_id}] 임대를 잃었습니다 (다른 워커가 재처리할 수 있음)")
+                    return
+            except Exception as e:
+                print(f"⚠️ 작업 [{job_id}] 임대 연장 실패: {e}")
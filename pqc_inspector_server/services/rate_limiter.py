@@ -0,0 +1,179 @@
+# File: pqc_inspector_server/services/rate_limiter.py
+# 🚦 AI 제공자/모델별 동시 요청 수, 분당 요청 수(RPM), 분당 토큰 수(TPM)를 제한하는 서비스입니다.
+# 한도를 넘는 요청은 429 오류로 실패하는 대신 비동기 토큰 버킷에서 잠시 대기한 뒤 전송됩니다.
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Dict, Any, Optional
+from ..core.config import settings
+
+
+def estimate_tokens(*texts: Optional[str]) -> int:
+    """문자 수 기반의 대략적인 토큰 수 추정 (약 4자 = 1토큰)"""
+    return sum(len(text) for text in texts if text) // 4 + 1
+
+
+class AsyncTokenBucket:
+    """
+    분당 rate_per_minute개의 속도로 토큰이 채워지는 비동기 토큰 버킷입니다.
+    대기자는 도착 순서(FIFO)대로 토큰을 받습니다.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        self.rate_per_second = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate_per_second)
+        self.updated_at = now
+
+    async def acquire(self, amount: float = 1.0):
+        """amount만큼의 토큰을 얻을 때까지 대기합니다."""
+        # 버킷 용량보다 큰 요청은 용량만큼만 요구하여 무한 대기를 방지합니다.
+        amount = min(amount, self.capacity)
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return
+                await asyncio.sleep((amount - self.tokens) / self.rate_per_second)
+
+    def adjust(self, delta: float):
+        """
+        실제 사용량이 추정치와 다를 때 차이만큼 토큰을 돌려주거나(음수) 추가로 차감합니다(양수).
+        """
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens - delta)
+
+
+class ProviderLimiter:
+    """하나의 제공자(또는 모델)에 대한 동시성 + RPM + TPM 제한"""
+
+    def __init__(self, name: str, max_concurrency: int = 0, rpm: int = 0, tpm: int = 0):
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.rpm = rpm
+        self.tpm = tpm
+
+        # 0 이하의 값은 제한 없음을 의미합니다.
+        self._semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency > 0 else None
+        self._request_bucket = AsyncTokenBucket(rpm) if rpm > 0 else None
+        self._token_bucket = AsyncTokenBucket(tpm) if tpm > 0 else None
+
+        self.stats = {
+            "requests": 0,
+            "queued_requests": 0,
+            "waiting": 0,
+            "in_flight": 0,
+            "total_wait_seconds": 0.0,
+            "max_wait_seconds": 0.0
+        }
+
+    @asynccontextmanager
+    async def limit(self, estimated_tokens: int = 0):
+        """
+        한도 내에서 요청을 실행할 수 있을 때까지 대기합니다.
+        대기 시간(초)은 yield 값으로 전달됩니다.
+        """
+        start = time.monotonic()
+        self.stats["waiting"] += 1
+        try:
+            if self._request_bucket:
+                await self._request_bucket.acquire(1)
+            if self._token_bucket and estimated_tokens > 0:
+                await self._token_bucket.acquire(estimated_tokens)
+            if self._semaphore:
+                await self._semaphore.acquire()
+        finally:
+            self.stats["waiting"] -= 1
+
+        wait_seconds = time.monotonic() - start
+        self._record_wait(wait_seconds)
+
+        self.stats["in_flight"] += 1
+        try:
+            yield wait_seconds
+        finally:
+            self.stats["in_flight"] -= 1
+            if self._semaphore:
+                self._semaphore.release()
+
+    def record_usage(self, estimated_tokens: int, actual_tokens: int):
+        """응답의 실제 토큰 사용량으로 TPM 버킷을 보정합니다."""
+        if self._token_bucket and actual_tokens > 0:
+            self._token_bucket.adjust(actual_tokens - estimated_tokens)
+
+    def _record_wait(self, wait_seconds: float):
+        self.stats["requests"] += 1
+        if wait_seconds > 0.001:
+            self.stats["queued_requests"] += 1
+        self.stats["total_wait_seconds"] += wait_seconds
+        self.stats["max_wait_seconds"] = max(self.stats["max_wait_seconds"], wait_seconds)
+
+    def get_stats(self) -> Dict[str, Any]:
+        requests = self.stats["requests"]
+        return {
+            **self.stats,
+            "avg_wait_seconds": self.stats["total_wait_seconds"] / requests if requests else 0.0,
+            "limits": {"max_concurrency": self.max_concurrency, "rpm": self.rpm, "tpm": self.tpm}
+        }
+
+
+class RateLimiterRegistry:
+    """
+    제공자별 기본 제한과 모델별 개별 제한(LLM_MODEL_LIMITS)을 관리합니다.
+    모델별 설정이 있으면 해당 모델 전용 리미터를, 없으면 제공자 공용 리미터를 사용합니다.
+    """
+
+    def __init__(self, provider_limits: Dict[str, Dict[str, int]], model_limits: Dict[str, Dict[str, int]]):
+        self.provider_limits = provider_limits
+        self.model_limits = model_limits
+        self._limiters: Dict[str, ProviderLimiter] = {}
+
+    def get(self, provider: str, model: str) -> ProviderLimiter:
+        if model in self.model_limits:
+            key, limits = f"model:{model}", self.model_limits[model]
+        else:
+            key, limits = provider, self.provider_limits.get(provider, {})
+
+        if key not in self._limiters:
+            self._limiters[key] = ProviderLimiter(
+                name=key,
+                max_concurrency=limits.get("max_concurrency", 0),
+                rpm=limits.get("rpm", 0),
+                tpm=limits.get("tpm", 0)
+            )
+        return self._limiters[key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {name: limiter.get_stats() for name, limiter in self._limiters.items()}
+
+
+# 프로세스 전역에서 하나의 레지스트리만 사용하도록 캐싱합니다.
+@lru_cache()
+def get_rate_limiter_registry() -> RateLimiterRegistry:
+    provider_limits = {
+        "openai": {
+            "max_concurrency": settings.OPENAI_MAX_CONCURRENCY,
+            "rpm": settings.OPENAI_RPM,
+            "tpm": settings.OPENAI_TPM
+        },
+        "google": {
+            "max_concurrency": settings.GOOGLE_MAX_CONCURRENCY,
+            "rpm": settings.GOOGLE_RPM,
+            "tpm": settings.GOOGLE_TPM
+        },
+        "ollama": {
+            "max_concurrency": settings.OLLAMA_MAX_CONCURRENCY,
+            "rpm": settings.OLLAMA_RPM,
+            "tpm": settings.OLLAMA_TPM
+        }
+    }
+    return RateLimiterRegistry(provider_limits, settings.LLM_MODEL_LIMITS)
@@ -0,0 +1,220 @@
+# File: pqc_inspector_server/services/resilience.py
+# 🛡️ AI 제공자 호출의 복원력(resilience)을 높이는 유틸리티 모음입니다.
+# - 지수 백오프 + 지터(jitter)를 적용한 제한적 재시도
+# - p95 지연 시간을 넘기면 두 번째 요청을 보내는 헤지(hedged) 요청
+# - 제공자 장애 시 즉시 실패시키는 제공자별 서킷 브레이커
+
+import asyncio
+import random
+import time
+from collections import deque
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Optional
+from ..core.config import settings
+
+# 재시도할 가치가 있는 HTTP 상태 코드 (타임아웃, 요청 한도 초과, 서버 오류)
+RETRYABLE_STATUS_CODES = {408, 409, 425, 429, 500, 502, 503, 504}
+
+
+def is_retryable(response: Dict[str, Any]) -> bool:
+    """실패한 응답이 재시도 가능한 일시적 오류인지 판단합니다."""
+    if response.get("success"):
+        return False
+    if response.get("transient"):
+        return True
+    return response.get("status_code") in RETRYABLE_STATUS_CODES
+
+
+def is_provider_failure(response: Dict[str, Any]) -> bool:
+    """
+    서킷 브레이커에 실패로 기록할 응답인지 판단합니다.
+    요청 한도 초과(429)는 제공자 장애가 아니므로 제외합니다.
+    """
+    return is_retryable(response) and response.get("status_code") != 429
+
+
+class RetryPolicy:
+    """지수 백오프 + full jitter 재시도 정책"""
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 0.5, max_delay: float = 8.0, budget_seconds: float = 120.0):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget_seconds = budget_seconds
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """attempt번째(0부터) 실패 후 대기 시간. 서버가 Retry-After를 주면 그 값을 우선합니다."""
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+class CircuitBreaker:
+    """
+    연속 실패가 임계값을 넘으면 열림(open) 상태가 되어 요청을 즉시 거부합니다.
+    reset_timeout이 지나면 반열림(half_open) 상태에서 한 번의 시험 요청을 허용합니다.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+        self.stats = {"rejected": 0, "opened": 0}
+
+    def allow_request(self) -> bool:
+        if self.state == self.CLOSED:
+            return True
+
+        if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+            self.state = self.HALF_OPEN
+            self._probe_in_flight = False
+
+        if self.state == self.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+
+        self.stats["rejected"] += 1
+        return False
+
+    def record_success(self):
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self):
+        self.consecutive_failures += 1
+        if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                self.stats["opened"] += 1
+                print(f"🔴 서킷 브레이커 열림: {self.name} (연속 실패 {self.consecutive_failures}회)")
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+            self._probe_in_flight = False
+
+    def release_probe(self):
+        """
+        성공/실패로 판정되지 않고 끝난 시험 요청(429, 기타 4xx, 취소)을 정리합니다.
+        반열림 상태를 유지하여 다음 요청이 다시 시험 요청이 될 수 있게 합니다.
+        """
+        if self.state == self.HALF_OPEN:
+            self._probe_in_flight = False
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "state": self.state, "consecutive_failures": self.consecutive_failures}
+
+
+class LatencyTracker:
+    """최근 성공 응답 지연 시간으로 백분위수를 계산합니다."""
+
+    def __init__(self, window: int = 200):
+        self._samples = deque(maxlen=window)
+
+    def record(self, seconds: float):
+        self._samples.append(seconds)
+
+    def percentile(self, q: float) -> Optional[float]:
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(q * len(ordered)))
+        return ordered[index]
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+
+async def hedged_call(
+    call: Callable[[], Awaitable[Dict[str, Any]]],
+    hedge_delay: float
+) -> Dict[str, Any]:
+    """
+    첫 요청이 hedge_delay 안에 끝나지 않으면 같은 요청을 하나 더 보내고,
+    먼저 성공한 응답을 반환합니다. 남은 요청은 취소됩니다.
+    """
+    first = asyncio.ensure_future(call())
+    second = None
+    pending = {first}
+    result = None
+    try:
+        done, _ = await asyncio.wait(pending, timeout=hedge_delay)
+        if done:
+            return first.result()
+
+        second = asyncio.ensure_future(call())
+        pending = {first, second}
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                result = task.result()
+                if result.get("success"):
+                    result["hedged"] = True
+                    result["hedge_won"] = task is second
+                    return result
+        return result
+    finally:
+        # 호출자가 대기 중에 취소되어도 보낸 요청이 남지 않도록 끝나지 않은 요청을 모두 취소합니다.
+        for task in (first, second):
+            if task is not None and not task.done():
+                task.cancel()
+
+
+class ResilienceRegistry:
+    """제공자별 서킷 브레이커와 모델별 지연 시간 추적기를 보관합니다."""
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._latencies: Dict[str, LatencyTracker] = {}
+        self.stats = {"retries": 0, "hedges": 0, "hedge_wins": 0, "circuit_rejections": 0, "failovers": 0}
+        self._answered_by: Dict[str, int] = {}
+
+    def breaker(self, provider: str) -> CircuitBreaker:
+        if provider not in self._breakers:
+            self._breakers[provider] = CircuitBreaker(provider, self.failure_threshold, self.reset_timeout)
+        return self._breakers[provider]
+
+    def latency(self, model: str) -> LatencyTracker:
+        if model not in self._latencies:
+            self._latencies[model] = LatencyTracker()
+        return self._latencies[model]
+
+    def record_answer(self, model: str, fallback_used: bool):
+        """실제로 응답한 모델과 폴백 사용 여부를 기록합니다."""
+        self._answered_by[model] = self._answered_by.get(model, 0) + 1
+        if fallback_used:
+            self.stats["failovers"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "answered_by": dict(self._answered_by),
+            "circuit_breakers": {name: breaker.get_stats() for name, breaker in self._breakers.items()},
+            "latency_p95": {model: tracker.percentile(0.95) for model, tracker in self._latencies.items()}
+        }
+
+
+# 프로세스 전역에서 하나의 레지스트리만 사용하도록 캐싱합니다.
+@lru_cache()
+def get_resilience_registry() -> ResilienceRegistry:
+    return ResilienceRegistry(
+        failure_threshold=settings.LLM_CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout=settings.LLM_CIRCUIT_RESET_SECONDS
+    )
+
+
+def get_retry_policy() -> RetryPolicy:
+    return RetryPolicy(
+        max_attempts=settings.LLM_RETRY_MAX_ATTEMPTS,
+        base_delay=settings.LLM_RETRY_BASE_DELAY,
+        max_delay=settings.LLM_RETRY_MAX_DELAY,
+        budget_seconds=settings.LLM_RETRY_BUDGET_SECONDS
+    )
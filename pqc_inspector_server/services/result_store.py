@@ -0,0 +1,326 @@
+# File: pqc_inspector_server/services/result_store.py
+# 🗂️ 백그라운드 분석 작업의 상태와 결과를 보관하는 저장소입니다.
+# - MemoryResultStore: TTL과 최대 항목 수로 크기가 제한되는 프로세스 내 저장소
+# - SQLiteResultStore: 여러 uvicorn 워커가 공유하고 재시작 후에도 유지되는 SQLite(WAL) 저장소
+# - RedisResultStore: 여러 머신의 API 서버/워커가 공유하는 Redis 저장소 (redis 패키지 필요)
+# 모든 백엔드는 task_id 기준 O(1) 조회를 제공합니다.
+
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Optional
+from ..core.config import settings
+
+
+class TaskStatus:
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class ResultStore(ABC):
+    """
+    작업 레코드 형식:
+    {"task_id", "status", "result", "error", "created_at", "updated_at"}
+    """
+
+    @abstractmethod
+    async def create(self, task_id: str) -> Dict[str, Any]:
+        """pending 상태의 작업 레코드를 만듭니다."""
+        pass
+
+    @abstractmethod
+    async def update(
+        self,
+        task_id: str,
+        status: str,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None
+    ):
+        """작업 상태를 갱신하고, 결과/오류가 있으면 함께 저장합니다."""
+        pass
+
+    @abstractmethod
+    async def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """작업 레코드를 반환합니다. 없거나 만료되었으면 None."""
+        pass
+
+    @abstractmethod
+    def get_stats(self) -> Dict[str, Any]:
+        pass
+
+    async def close(self):
+        """열린 연결을 닫습니다. 연결이 없는 저장소는 아무것도 하지 않습니다."""
+        pass
+
+
+class MemoryResultStore(ResultStore):
+    """TTL이 지났거나 최대 항목 수를 넘은 오래된 작업부터 제거하는 메모리 저장소"""
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: float = 86400.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._records: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.stats = {"evicted": 0, "expired": 0}
+
+    async def create(self, task_id: str) -> Dict[str, Any]:
+        now = time.time()
+        record = {
+            "task_id": task_id,
+            "status": TaskStatus.PENDING,
+            "result": None,
+            "error": None,
+            "created_at": now,
+            "updated_at": now
+        }
+        self._records[task_id] = record
+        self._records.move_to_end(task_id)
+        self._evict(now)
+        return dict(record)
+
+    async def update(self, task_id, status, result=None, error=None):
+        now = time.time()
+        record = self._records.get(task_id)
+        if record is None:
+            record = {"task_id": task_id, "result": None, "error": None, "created_at": now}
+            self._records[task_id] = record
+        record["status"] = status
+        record["updated_at"] = now
+        if result is not None:
+            record["result"] = result
+        if error is not None:
+            record["error"] = error
+        # 최근 갱신된 작업이 가장 늦게 제거되도록 순서를 옮깁니다.
+        self._records.move_to_end(task_id)
+        self._evict(now)
+
+    async def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        record = self._records.get(task_id)
+        if record is None:
+            return None
+        if time.time() - record["updated_at"] > self.ttl_seconds:
+            del self._records[task_id]
+            self.stats["expired"] += 1
+            return None
+        return dict(record)
+
+    def _evict(self, now: float):
+        # OrderedDict 앞쪽이 가장 오래 갱신되지 않은 작업이므로 앞에서부터 확인합니다.
+        while self._records:
+            task_id, record = next(iter(self._records.items()))
+            if now - record["updated_at"] > self.ttl_seconds:
+                self.stats["expired"] += 1
+            elif len(self._records) > self.max_entries:
+                self.stats["evicted"] += 1
+            else:
+                break
+            del self._records[task_id]
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "backend": "memory", "entries": len(self._records)}
+
+
+class SQLiteResultStore(ResultStore):
+    """SQLite 파일(WAL 모드)에 저장되어 여러 워커 프로세스가 공유하는 저장소"""
+
+    # 만료 작업 정리는 쓰기 N회마다 한 번 수행합니다.
+    PURGE_EVERY_WRITES = 100
+
+    def __init__(self, db_path: str, ttl_seconds: float = 86400.0):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._writes = 0
+        self.stats = {"expired": 0}
+
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        # timeout: 다른 워커가 쓰는 중이면 잠금이 풀릴 때까지 대기합니다.
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, timeout=10.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS task_results (
+                task_id TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                result TEXT,
+                error TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_task_results_updated_at ON task_results(updated_at)"
+        )
+        self._conn.commit()
+
+    async def create(self, task_id: str) -> Dict[str, Any]:
+        return await asyncio.to_thread(self._create, task_id)
+
+    async def update(self, task_id, status, result=None, error=None):
+        await asyncio.to_thread(self._update, task_id, status, result, error)
+
+    async def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        return await asyncio.to_thread(self._get, task_id)
+
+    def _create(self, task_id: str) -> Dict[str, Any]:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO task_results VALUES (?, ?, NULL, NULL, ?, ?)",
+                (task_id, TaskStatus.PENDING, now, now)
+            )
+            self._after_write_locked(now)
+            self._conn.commit()
+        return {
+            "task_id": task_id,
+            "status": TaskStatus.PENDING,
+            "result": None,
+            "error": None,
+            "created_at": now,
+            "updated_at": now
+        }
+
+    def _update(self, task_id: str, status: str, result: Optional[Dict[str, Any]], error: Optional[str]):
+        now = time.time()
+        raw_result = json.dumps(result, ensure_ascii=False) if result is not None else None
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO task_results VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(task_id) DO UPDATE SET
+                    status = excluded.status,
+                    result = COALESCE(excluded.result, task_results.result),
+                    error = COALESCE(excluded.error, task_results.error),
+                    updated_at = excluded.updated_at
+                """,
+                (task_id, status, raw_result, error, now, now)
+            )
+            self._after_write_locked(now)
+            self._conn.commit()
+
+    def _get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, result, error, created_at, updated_at FROM task_results WHERE task_id = ?",
+                (task_id,)
+            ).fetchone()
+        if row is None:
+            return None
+
+        status, raw_result, error, created_at, updated_at = row
+        if time.time() - updated_at > self.ttl_seconds:
+            self.stats["expired"] += 1
+            return None
+
+        return {
+            "task_id": task_id,
+            "status": status,
+            "result": json.loads(raw_result) if raw_result else None,
+            "error": error,
+            "created_at": created_at,
+            "updated_at": updated_at
+        }
+
+    def _after_write_locked(self, now: float):
+        self._writes += 1
+        if self._writes % self.PURGE_EVERY_WRITES == 0:
+            cursor = self._conn.execute(
+                "DELETE FROM task_results WHERE updated_at < ?",
+                (now - self.ttl_seconds,)
+            )
+            self.stats["expired"] += cursor.rowcount
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM task_results").fetchone()[0]
+        return {**self.stats, "backend": "sqlite", "entries": entries, "db_path": self.db_path}
+
+    async def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class RedisResultStore(ResultStore):
+    """작업마다 Redis 해시 하나를 사용하며, TTL은 Redis 만료(EXPIRE)로 처리합니다."""
+
+    def __init__(self, redis_url: str, ttl_seconds: float = 86400.0, prefix: str = "pqc:results:"):
+        from .job_queue import REDIS_AVAILABLE, redis_asyncio
+        if not REDIS_AVAILABLE:
+            raise RuntimeError("Redis 결과 저장소를 사용하려면 redis 패키지가 필요합니다. (pip install redis)")
+        self.ttl_seconds = int(ttl_seconds)
+        self.prefix = prefix
+        self._client = redis_asyncio.from_url(redis_url, decode_responses=True)
+
+    async def create(self, task_id: str) -> Dict[str, Any]:
+        now = time.time()
+        record = {"status": TaskStatus.PENDING, "created_at": now, "updated_at": now}
+        key = self.prefix + task_id
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            pipe.hset(key, mapping=record)
+            pipe.expire(key, self.ttl_seconds)
+            await pipe.execute()
+        return {"task_id": task_id, "result": None, "error": None, **record}
+
+    async def update(self, task_id, status, result=None, error=None):
+        now = time.time()
+        fields: Dict[str, Any] = {"status": status, "updated_at": now}
+        if result is not None:
+            fields["result"] = json.dumps(result, ensure_ascii=False)
+        if error is not None:
+            fields["error"] = error
+        key = self.prefix + task_id
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.hsetnx(key, "created_at", now)
+            pipe.hset(key, mapping=fields)
+            pipe.expire(key, self.ttl_seconds)
+            await pipe.execute()
+
+    async def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        data = await self._client.hgetall(self.prefix + task_id)
+        if not data:
+            return None
+        return {
+            "task_id": task_id,
+            "status": data.get("status"),
+            "result": json.loads(data["result"]) if data.get("result") else None,
+            "error": data.get("error"),
+            "created_at": float(data.get("created_at", 0)),
+            "updated_at": float(data.get("updated_at", 0))
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"backend": "redis"}
+
+    async def close(self):
+        await self._client.close()
+
+
+# 프로세스 전역에서 하나의 저장소만 사용하도록 캐싱합니다.
+@lru_cache()
+def get_result_store() -> ResultStore:
+    if settings.RESULT_STORE_BACKEND == "redis":
+        return RedisResultStore(settings.REDIS_URL, ttl_seconds=settings.RESULT_STORE_TTL_SECONDS)
+
+    if settings.RESULT_STORE_BACKEND == "sqlite":
+        try:
+            return SQLiteResultStore(
+                db_path=settings.RESULT_STORE_DB_PATH,
+                ttl_seconds=settings.RESULT_STORE_TTL_SECONDS
+            )
+        except Exception as e:
+            print(f"⚠️ SQLite 결과 저장소 초기화 실패, 메모리 저장소를 사용합니다: {e}")
+
+    return MemoryResultStore(
+        max_entries=settings.RESULT_STORE_MEMORY_MAX_ENTRIES,
+        ttl_seconds=settings.RESULT_STORE_TTL_SECONDS
+    )
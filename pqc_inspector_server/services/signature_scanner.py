@@ -0,0 +1,248 @@
+# File: pqc_inspector_server/services/signature_scanner.py
+# 🔎 LLM 호출 전에 파일에서 암호 관련 시그니처를 빠르게 찾는 결정적(deterministic) 사전 필터입니다.
+# data/rag_knowledge_base의 키워드(라이브러리 함수명, 암호 스위트, 상수 등)와 기본 정규식(RSA/ECDSA/DH 식별자,
+# OID, PEM 헤더 등)을 트라이 형태의 정규식으로 컴파일하여 원문/소문자 본문을 각각 한 번씩만 훑습니다.
+# 일치하는 시그니처가 없는 파일은 LLM을 거치지 않고 즉시 "비양자내성암호 미탐지" 판정을 받습니다.
+
+import json
+import re
+import time
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Union
+from ..core.config import settings
+
+# 지식 베이스 JSON에서 시그니처로 사용할 문자열 목록의 키
+KNOWLEDGE_BASE_LIST_KEYS = {
+    "keywords", "openssl", "windows_cng", "python_imports", "java_imports", "cpp_includes",
+    "algorithm_names", "function_names", "class_names", "values"
+}
+
+# 지식 베이스에 있지만 일반 단어라서 단독으로는 암호 사용의 근거가 되지 않는 키워드
+GENERIC_LITERALS = {
+    "[info]", "alg:", "alg=", "arx", "bind", "crt", "elb", "export", "failed", "high", "jwt", "keyid",
+    "macs", "modern", "movdqa", "mtls", "nist", "pshufb", "pxor", "saml", "sign", "tls {", "verify",
+    "vpxor", "xmm", "ymm"
+}
+
+# 지식 베이스와 무관하게 항상 검사하는 기본 시그니처 (대소문자 구분, 원문에 적용)
+# 패턴마다 따로 컴파일합니다. sre는 패턴의 첫 글자로 후보 위치를 빠르게 건너뛰는데,
+# 여러 패턴을 하나의 alternation으로 합치면 이 최적화가 사라져 오히려 느려집니다.
+CORE_SIGNATURES = [
+    # 공개키 알고리즘 식별자 (camelCase, 밑줄 구분 식별자 포함: generateRSAKey, EVP_PKEY_RSA)
+    r"RSA|DSA|ECDSA|ECDH|ECIES|ECC|EdDSA|Ed25519|Ed448|X25519|X448|ElGamal|KCDSA",
+    # OID (RSA PKCS#1, ANSI X9.62 ECDSA/EC 공개키, SEC 곡선, X9.57 DSA, X9.42 DH)
+    r"1\.(?:2\.840\.(?:113549\.1\.1|10045|10040|10046)|3\.132\.0)",
+    # PEM 헤더
+    r"-----BEGIN [A-Z ]*(?:PRIVATE KEY|PUBLIC KEY|CERTIFICATE)-----",
+    # TLS 암호 스위트 (IANA / OpenSSL 표기)
+    r"TLS_(?:ECDHE|ECDH|DHE|DH|RSA)_|(?:ECDHE|DHE)-(?:RSA|ECDSA|DSS)-",
+    # RSA 구조적 단서: 3-인자 pow (모듈러 거듭제곱)
+    r"pow\(\s*[^,()]+,\s*[^,()]+,\s*[^,()]+\)",
+]
+
+# 대소문자를 구분하지 않는 기본 시그니처 (소문자로 작성, 소문자로 변환한 본문에 적용)
+# re.IGNORECASE보다 본문을 한 번 소문자로 바꾸는 편이 훨씬 빠릅니다.
+CORE_SIGNATURES_NOCASE = [
+    # 단독으로 쓰인 짧은 알고리즘 이름 (ec, dh 등은 다른 단어의 일부가 아닐 때만)
+    r"(?<![a-z])(?:rsa|dsa|ecdsa|ecdh|ecdhe|dh|dhe|ec|elgamal|kcdsa)(?![a-z])",
+    r"diffie[-_ ]?hellman|elliptic[-_ ]?curve",
+    # 곡선 이름, SSH 키 타입
+    r"secp\d{3}[rk]1|prime\d{3}v1|nistp\d{3}|p-(?:192|224|256|384|521)|brainpool|curve25519|curve448",
+    r"ssh-(?:rsa|dss|ed25519)|ecdsa-sha2-",
+    # 일반 암호 용어 (미탐을 줄이기 위해 넓게 잡음)
+    r"crypt|cipher|ssl|tls|x\.?509|pkcs|asn\.?1|keypair|key_pair|pubkey|privkey|private[_ ]?key|public[_ ]?key",
+    r"hmac|md5|sha-?1|sha-?2\d\d|sha-?3|sha-?512|signature|keystore|bignum|modpow|mod_exp",
+    # RSA 공개 지수 65537
+    r"65537|0x0*10001",
+]
+
+# 키워드 경계 판정에 쓰는 문자 (밑줄은 구분자로 간주: rsa_sign은 rsa_sign_ex 안에서도 일치)
+_WORD_CHAR = "a-z0-9"
+_TRIE_END = ""
+
+
+def _build_trie_pattern(literals: Iterable[str]) -> str:
+    """
+    소문자 키워드 목록을 접두사 트라이 형태의 정규식으로 변환합니다.
+    단순 alternation은 위치마다 모든 키워드를 시도하지만, 트라이는 공통 접두사를 한 번만 검사하므로
+    키워드가 수백 개여도 스캔 속도가 거의 일정합니다.
+    '*'는 식별자 와일드카드(\\w*)이며, 영숫자로 끝나는 키워드는 다른 단어의 일부로 일치하지 않도록 경계를 둡니다.
+    """
+    trie: Dict[str, Any] = {}
+    for literal in literals:
+        node = trie
+        for ch in literal:
+            node = node.setdefault(r"\w*" if ch == "*" else re.escape(ch), {})
+        node[_TRIE_END] = literal[-1].isalnum()
+
+    def emit(node: Dict[str, Any]) -> str:
+        branches = [token + emit(child) for token, child in sorted(node.items()) if token != _TRIE_END]
+        if _TRIE_END in node:
+            end = f"(?![{_WORD_CHAR}])" if node[_TRIE_END] else ""
+            if not branches:
+                return end
+            # 더 긴 키워드를 먼저 시도합니다.
+            return f"(?:{'|'.join(branches)}|{end})" if end else f"(?:{'|'.join(branches)})?"
+        return branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+
+    return emit(trie) if trie else ""
+
+
+def _collect_knowledge_base_literals(knowledge_base_dir: Path) -> List[str]:
+    """지식 베이스 JSON 파일들에서 시그니처로 쓸 짧은 ASCII 문자열을 수집합니다."""
+    literals = set()
+
+    def add(value: Any):
+        if not isinstance(value, str):
+            return
+        value = value.strip()
+        # 설명 문장은 제외하고 식별자/짧은 구문만 사용합니다.
+        # 키 길이(2048 등) 같은 10진수 단독 값과 일반 단어도 제외합니다.
+        if (
+            3 <= len(value) <= 64 and value.isascii() and value.count(" ") <= 3
+            and not value.isdigit() and value.lower() not in GENERIC_LITERALS
+        ):
+            literals.add(value)
+
+    def walk(node: Any):
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key in KNOWLEDGE_BASE_LIST_KEYS and isinstance(value, list):
+                    for item in value:
+                        add(item)
+                elif key == "algorithm":
+                    add(value)
+                else:
+                    walk(value)
+        elif isinstance(node, list):
+            for item in node:
+                walk(item)
+
+    for json_file in sorted(knowledge_base_dir.rglob("*.json")):
+        try:
+            with open(json_file, "r", encoding="utf-8") as f:
+                walk(json.load(f))
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"⚠️ 시그니처 로드 실패 ({json_file}): {e}")
+
+    return sorted(literals)
+
+
+class SignatureScanner:
+    def __init__(
+        self,
+        literals: Iterable[str],
+        core_patterns: Iterable[str] = CORE_SIGNATURES,
+        core_patterns_nocase: Iterable[str] = CORE_SIGNATURES_NOCASE,
+        max_hits: int = 20
+    ):
+        self.literals = sorted({literal.lower() for literal in literals})
+        self.core_patterns = list(core_patterns)
+        self.core_patterns_nocase = list(core_patterns_nocase)
+        self.max_hits = max_hits
+
+        # 영숫자로 시작하는 키워드는 앞쪽 경계를 트라이 바깥에서 한 번만 검사합니다.
+        word_literals = [literal for literal in self.literals if literal[0].isalnum()]
+        other_literals = [literal for literal in self.literals if not literal[0].isalnum()]
+        nocase_parts = list(self.core_patterns_nocase)
+        if word_literals:
+            nocase_parts.append(f"(?<![{_WORD_CHAR}]){_build_trie_pattern(word_literals)}")
+        if other_literals:
+            nocase_parts.append(_build_trie_pattern(other_literals))
+
+        self._regexes = (
+            [(False, re.compile(pattern)) for pattern in self.core_patterns]
+            + [(True, re.compile(pattern)) for pattern in nocase_parts]
+        )
+
+        self.stats = {"scanned": 0, "clean": 0, "flagged": 0, "scanned_bytes": 0, "total_seconds": 0.0}
+
+    @property
+    def signature_count(self) -> int:
+        return len(self.literals) + len(self.core_patterns) + len(self.core_patterns_nocase)
+
+    def scan(self, content: Union[bytes, str], record_stats: bool = True) -> Dict[str, Any]:
+        """
+        내용에서 시그니처를 찾습니다. 바이트는 latin-1로 디코딩하여 바이너리 안의 ASCII 문자열도 검사합니다.
+        record_stats=False이면 사전 필터 통계(/metrics/prefilter)에 포함하지 않습니다.
+
+        Returns:
+            {"has_hits", "hits": [{"signature", "count"}], "scanned_bytes", "duration"}
+        """
+        start = time.perf_counter()
+        text = content.decode("latin-1") if isinstance(content, (bytes, bytearray)) else content
+        lowered = text.lower()
+
+        hits: Counter = Counter()
+        for nocase, regex in self._regexes:
+            for match in regex.finditer(lowered if nocase else text):
+                hits[match.group(0).lower()] += 1
+                if len(hits) >= self.max_hits:
+                    break
+            if len(hits) >= self.max_hits:
+                break
+
+        duration = time.perf_counter() - start
+        if record_stats:
+            self.stats["scanned"] += 1
+            self.stats["flagged" if hits else "clean"] += 1
+            self.stats["scanned_bytes"] += len(text)
+            self.stats["total_seconds"] += duration
+
+        return {
+            "has_hits": bool(hits),
+            "hits": [{"signature": signature, "count": count} for signature, count in hits.most_common()],
+            "scanned_bytes": len(text),
+            "duration": duration
+        }
+
+    def match_offsets(self, text: str) -> List[int]:
+        """
+        시그니처가 일치한 모든 위치(문자 오프셋)를 정렬하여 반환합니다 (통계에는 포함하지 않음).
+        긴 텍스트에서 암호 관련 부분을 골라낼 때 사용합니다.
+        """
+        lowered = text.lower()
+        return sorted(
+            match.start()
+            for nocase, regex in self._regexes
+            for match in regex.finditer(lowered if nocase else text)
+        )
+
+    def make_clean_result(self, file_name: str, scan: Dict[str, Any]) -> Dict[str, Any]:
+        """시그니처가 없는 파일에 대한 즉시 판정 결과 (AgentAnalysisResult 호환)"""
+        return {
+            "is_pqc_vulnerable": False,
+            "vulnerability_details": "사전 필터: 암호 관련 시그니처가 발견되지 않아 비양자내성암호가 탐지되지 않았습니다.",
+            "detected_algorithms": [],
+            "recommendations": "조치 불필요",
+            "evidence": (
+                f"{file_name}: 시그니처 {self.signature_count}개 검사, 일치 0건 "
+                f"({scan['scanned_bytes']:,} bytes, {scan['duration'] * 1000:.1f}ms)"
+            ),
+            "confidence_score": settings.PREFILTER_CLEAN_CONFIDENCE,
+            "verdict_source": "prefilter"
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        scanned = self.stats["scanned"]
+        return {
+            **self.stats,
+            "signatures": self.signature_count,
+            "clean_rate": self.stats["clean"] / scanned if scanned else 0.0
+        }
+
+
+# 프로세스 전역에서 하나의 스캐너만 사용하도록 캐싱합니다 (정규식 컴파일은 시작 시 한 번).
+@lru_cache()
+def get_signature_scanner() -> SignatureScanner:
+    literals = _collect_knowledge_base_literals(Path(settings.PREFILTER_KNOWLEDGE_BASE_DIR))
+    scanner = SignatureScanner(literals)
+    print(f"🔎 시그니처 스캐너 준비: 지식 베이스 키워드 {len(scanner.literals)}개 + 기본 패턴 {len(CORE_SIGNATURES) + len(CORE_SIGNATURES_NOCASE)}개")
+    return scanner
+
+
+def should_prefilter(file_type: str) -> bool:
+    """해당 파일 타입에 사전 필터를 적용할지 여부"""
+    return settings.PREFILTER_ENABLED and file_type in settings.PREFILTER_FILE_TYPES
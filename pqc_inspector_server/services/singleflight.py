@@ -0,0 +1,50 @@
+# File: pqc_inspector_server/services/singleflight.py
+# 🔗 동일한 키로 동시에 들어온 비동기 작업을 하나로 합치는(singleflight) 유틸리티입니다.
+# 첫 번째 호출자만 실제 작업을 실행하고, 나머지 호출자는 같은 결과를 함께 기다립니다.
+
+import asyncio
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+
+class SingleFlight:
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.stats = {"executed": 0, "coalesced": 0}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """
+        key에 해당하는 작업을 실행하거나 이미 진행 중인 작업에 합류합니다.
+
+        Returns:
+            (결과, 공유 여부) - 공유 여부가 True이면 다른 호출자가 실행한 결과입니다.
+        """
+        task = self._inflight.get(key)
+        if task is not None:
+            self.stats["coalesced"] += 1
+            # shield: 합류한 호출자가 취소되어도 공유 작업은 계속 진행됩니다.
+            return await asyncio.shield(task), True
+
+        # 작업을 별도 태스크로 실행하여 첫 호출자가 취소되더라도 다른 호출자가 결과를 받을 수 있게 합니다.
+        task = asyncio.ensure_future(fn())
+        self._inflight[key] = task
+        self.stats["executed"] += 1
+        task.add_done_callback(lambda t: self._on_done(key, t))
+
+        return await asyncio.shield(task), False
+
+    def _on_done(self, key: str, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 대기자가 모두 취소된 경우에도 "exception was never retrieved" 경고가 나지 않도록 소비합니다.
+        if not task.cancelled():
+            task.exception()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "in_flight": len(self._inflight)}
+
+
+# LLM 호출용 프로세스 전역 singleflight 그룹
+@lru_cache()
+def get_llm_singleflight() -> SingleFlight:
+    return SingleFlight()
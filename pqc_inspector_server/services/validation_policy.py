@@ -0,0 +1,176 @@
+# File: pqc_inspector_server/services/validation_policy.py
+# ⚖️ 에이전트 결과에 대해 오케스트레이터 LLM 검증(_validate_and_summarize_result)이 필요한지 결정하는 정책 엔진입니다.
+# 에이전트 신뢰도, 시그니처 사전 스캔과의 일치 여부, 파일 타입, QA 샘플링 비율을 기준으로 판단하며,
+# 신뢰도가 높고 사전 스캔과도 일치하는 판정은 두 번째 LLM 호출을 생략합니다.
+
+import random
+import re
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set
+from ..core.config import settings
+
+# 사전 스캔 시그니처 중 양자 컴퓨터에 취약한 공개키 알고리즘을 가리키는 것
+PUBLIC_KEY_HIT_RE = re.compile(
+    r"rsa|dsa|ecdh|ecies|ecc|ed25519|ed448|x25519|x448|elgamal|diffie|elliptic|secp|prime\d{3}v1|curve"
+    r"|nistp|brainpool|pow\(|65537|0x0*10001|^(?:ec|dh|dhe|ecdhe)$|1\.2\.840|1\.3\.132"
+)
+
+
+# 양자 컴퓨터에 취약한 공개키 알고리즘 계열별 패턴 (보고된 알고리즘 이름과 사전 스캔 시그니처 양쪽에 적용)
+# 상수 스캔 결과("const:rsa", "const:ecdsa_p256" 등)도 같은 패턴으로 계열을 판별합니다.
+PUBLIC_KEY_FAMILIES = {
+    "rsa": re.compile(r"rsa|pkcs ?#?1(?![0-9])|1\.2\.840\.113549|65537|0x0*10001|pow\("),
+    "ecc": re.compile(
+        r"ec(?:dsa|dh|ies|c)|eddsa|ed25519|ed448|x25519|x448|curve|elliptic|secp|prime\d{3}v1|nistp"
+        r"|p-(?:192|224|256|384|521)|brainpool|1\.2\.840\.10045|1\.3\.132|(?<![a-z])ec(?![a-z])"
+    ),
+    "dh": re.compile(r"diffie|ecdh|(?<![a-z])dhe?(?![a-z])|1\.2\.840\.10046"),
+    "dsa": re.compile(r"(?<![a-z])dsa|(?<![a-z])dss(?![a-z])|1\.2\.840\.10040"),
+    "elgamal": re.compile(r"elgamal"),
+    "kcdsa": re.compile(r"kcdsa"),
+}
+
+
+def public_key_families(text: str) -> Set[str]:
+    """알고리즘 이름이나 시그니처가 가리키는 공개키 알고리즘 계열 집합"""
+    lowered = text.lower()
+    return {family for family, pattern in PUBLIC_KEY_FAMILIES.items() if pattern.search(lowered)}
+
+
+def scan_disagreement(vulnerable: bool, scan: Dict[str, Any], algorithms: Optional[List[str]] = None) -> Optional[str]:
+    """
+    LLM 판정이 시그니처 사전 스캔과 어긋나면 그 설명을, 일치하면 None을 반환합니다.
+    취약 판정은 보고된 알고리즘(algorithms)과 같은 계열의 공개키 시그니처가 있어야 하고,
+    안전 판정은 공개키 시그니처가 없어야 합니다.
+    crypt, ssl, sha 같은 일반 암호 시그니처는 거의 모든 파일에 있으므로 취약 판정의 근거로 보지 않습니다.
+    """
+    if vulnerable:
+        hit_families: Set[str] = set()
+        for hit in scan["hits"]:
+            hit_families |= public_key_families(hit["signature"])
+        if not hit_families:
+            return "취약 판정이지만 공개키 시그니처 없음"
+        if algorithms is None:
+            return None
+
+        if isinstance(algorithms, str):
+            algorithms = [algorithms]
+        reported = [str(algorithm) for algorithm in algorithms if algorithm]
+        reported_families: Set[str] = set()
+        for algorithm in reported:
+            reported_families |= public_key_families(algorithm)
+        if not reported_families:
+            return f"취약 판정이지만 보고된 공개키 알고리즘 없음: {', '.join(reported[:3]) or '없음'}"
+        if not reported_families & hit_families:
+            return f"보고된 알고리즘({', '.join(reported[:3])})과 일치하는 시그니처 없음"
+        return None
+
+    public_key_hits = [hit["signature"] for hit in scan["hits"] if PUBLIC_KEY_HIT_RE.search(hit["signature"])]
+    if public_key_hits:
+        return f"안전 판정이지만 공개키 시그니처 발견: {', '.join(public_key_hits[:3])}"
+    return None
+
+
+@dataclass
+class ValidationDecision:
+    validate: bool
+    reason: str  # 통계 집계용 고정 사유
+    detail: str = ""
+
+    def describe(self) -> str:
+        return f"{self.reason} ({self.detail})" if self.detail else self.reason
+
+
+class ValidationPolicy:
+    def __init__(
+        self,
+        enabled: bool = True,
+        min_confidence: float = 0.85,
+        file_type_min_confidence: Optional[Dict[str, float]] = None,
+        always_validate_types: Optional[List[str]] = None,
+        qa_sample_rate: float = 0.05,
+        rng: Optional[random.Random] = None
+    ):
+        self.enabled = enabled
+        self.min_confidence = min_confidence
+        self.file_type_min_confidence = file_type_min_confidence or {}
+        self.always_validate_types = set(always_validate_types or [])
+        self.qa_sample_rate = qa_sample_rate
+        self._rng = rng or random.Random()
+        self.stats = {"decisions": 0, "validated": 0, "skipped": 0}
+        self._reasons: Counter = Counter()
+
+    def decide(
+        self,
+        file_type: str,
+        agent_result: Dict[str, Any],
+        scan: Optional[Dict[str, Any]] = None
+    ) -> ValidationDecision:
+        """
+        검증 여부를 결정하고 통계에 기록합니다.
+
+        Args:
+            file_type: 분류된 파일 타입
+            agent_result: 에이전트 분석 결과 (is_pqc_vulnerable, confidence_score 등)
+            scan: SignatureScanner.scan() 결과 (사전 필터가 꺼져 있으면 None)
+        """
+        decision = self._decide(file_type, agent_result, scan)
+        self.stats["decisions"] += 1
+        self.stats["validated" if decision.validate else "skipped"] += 1
+        self._reasons[decision.reason] += 1
+        return decision
+
+    def _decide(self, file_type, agent_result, scan) -> ValidationDecision:
+        if not self.enabled:
+            return ValidationDecision(True, "정책 비활성화")
+
+        # LLM이 신뢰도를 문자열("0.9")로 돌려주는 경우가 있어 숫자로 변환합니다.
+        try:
+            confidence = float(agent_result.get("confidence_score") or 0.0)
+        except (TypeError, ValueError):
+            confidence = 0.0
+        vulnerable = agent_result.get("is_pqc_vulnerable")
+        if not isinstance(vulnerable, bool) or confidence <= 0.0:
+            # 파싱 실패/오류로 만들어진 기본 결과는 항상 검증합니다.
+            return ValidationDecision(True, "에이전트 결과 불완전")
+
+        if file_type in self.always_validate_types:
+            return ValidationDecision(True, "항상 검증하는 파일 타입", file_type)
+
+        if self.qa_sample_rate > 0 and self._rng.random() < self.qa_sample_rate:
+            return ValidationDecision(True, "QA 샘플링")
+
+        threshold = self.file_type_min_confidence.get(file_type, self.min_confidence)
+        if confidence < threshold:
+            return ValidationDecision(True, "신뢰도 부족", f"{confidence:.2f} < {threshold:.2f}")
+
+        if scan is None:
+            return ValidationDecision(True, "사전 스캔 결과 없음")
+
+        disagreement = scan_disagreement(vulnerable, scan, agent_result.get("detected_algorithms") or [])
+        if disagreement:
+            return ValidationDecision(True, "사전 스캔 불일치", disagreement)
+
+        return ValidationDecision(False, "고신뢰 판정 + 사전 스캔 일치")
+
+    def get_stats(self) -> Dict[str, Any]:
+        decisions = self.stats["decisions"]
+        return {
+            **self.stats,
+            "skip_rate": self.stats["skipped"] / decisions if decisions else 0.0,
+            "reasons": dict(self._reasons)
+        }
+
+
+# 프로세스 전역에서 하나의 정책 객체만 사용하도록 캐싱합니다 (건너뛴 비율 집계 공유).
+@lru_cache()
+def get_validation_policy() -> ValidationPolicy:
+    return ValidationPolicy(
+        enabled=settings.VALIDATION_POLICY_ENABLED,
+        min_confidence=settings.VALIDATION_SKIP_MIN_CONFIDENCE,
+        file_type_min_confidence=settings.VALIDATION_FILE_TYPE_MIN_CONFIDENCE,
+        always_validate_types=settings.VALIDATION_ALWAYS_FILE_TYPES,
+        qa_sample_rate=settings.VALIDATION_QA_SAMPLE_RATE
+    )
@@ -1,16 +1,50 @@
 # File: pqc_inspector_server/services/vector_store.py
 # 🗄️ ChromaDB를 사용한 벡터 데이터베이스 서비스입니다.
 
+import asyncio
 import chromadb
 from chromadb.config import Settings
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Callable, List, Dict, Any, Optional, TypeVar
 import uuid
 import os
 from ..core.config import settings as app_settings
+from .embedding_service import get_embedding_model_name
+
+# 모델 태그가 없는 기존 컬렉션은 태그 도입 전 유일한 백엔드였던 OpenAI 모델로 만든 것으로 간주합니다.
+LEGACY_EMBEDDING_MODEL = "text-embedding-3-small"
+
+
+T = TypeVar("T")
+
+
+class EmbeddingModelMismatchError(ValueError):
+    """컬렉션을 만든 임베딩 모델과 다른 모델의 벡터로 검색/추가하려 할 때 발생합니다."""
+
+
+# Chroma 클라이언트 호출(HNSW 검색, 대량 add 등)은 동기식이므로 전용 스레드 풀에서 실행합니다.
+# 스레드 수를 제한하여 벡터 DB 작업이 몰려도 기본 실행기(asyncio.to_thread)를 쓰는 다른 작업을 굶기지 않습니다.
+@lru_cache()
+def get_chroma_executor() -> Optional[ThreadPoolExecutor]:
+    if app_settings.VECTOR_STORE_EXECUTOR_THREADS <= 0:
+        return None
+    return ThreadPoolExecutor(max_workers=app_settings.VECTOR_STORE_EXECUTOR_THREADS, thread_name_prefix="chroma")
+
+
+async def run_in_chroma_executor(func: Callable[..., T], *args, **kwargs) -> T:
+    """동기 Chroma 작업을 벡터 DB 전용 스레드 풀에서 실행하고 결과를 기다립니다 (스레드 수 0이면 직접 실행)."""
+    executor = get_chroma_executor()
+    if executor is None:
+        return func(*args, **kwargs)
+    return await asyncio.get_running_loop().run_in_executor(executor, partial(func, *args, **kwargs))
+
 
 class VectorStore:
-    def __init__(self, collection_name: str, persist_directory: str = None):
+    def __init__(self, collection_name: str, persist_directory: str = None, embedding_model: Optional[str] = None):
         self.collection_name = collection_name
+        # 이 스토어에 읽고 쓰는 벡터의 모델 (기본값: 현재 설정된 임베딩 백엔드의 모델)
+        self.expected_model = embedding_model or get_embedding_model_name()
 
         # 영구 저장 디렉토리 설정
         if persist_directory is None:
@@ -34,10 +68,40 @@ class VectorStore:
         except:
             self.collection = self.client.create_collection(
                 name=collection_name,
-                metadata={"description": f"PQC Inspector {collection_name} knowledge base"}
+                metadata={
+                    "description": f"PQC Inspector {collection_name} knowledge base",
+                    "embedding_model": self.expected_model
+                }
             )
             print(f"✅ 새 컬렉션 '{collection_name}' 생성됨")
 
+        if self.embedding_model != self.expected_model:
+            print(f"⚠️ 컬렉션 '{collection_name}'은(는) '{self.embedding_model}' 모델로 생성되었지만 "
+                  f"현재 임베딩 모델은 '{self.expected_model}'입니다. 검색/추가가 거부되므로 "
+                  f"scripts/rebuild_all_vector_dbs.py로 재구축하세요.")
+
+    @property
+    def embedding_model(self) -> str:
+        """컬렉션을 만든 임베딩 모델 (태그가 없으면 레거시 OpenAI 모델)"""
+        return (self.collection.metadata or {}).get("embedding_model", LEGACY_EMBEDDING_MODEL)
+
+    def _check_embedding_model(self, allow_retag: bool = False):
+        """
+        현재 모델이 컬렉션의 모델과 다르면 EmbeddingModelMismatchError를 발생시킵니다.
+        allow_retag이면 빈 컬렉션(초기화 직후 등)의 태그를 현재 모델로 바꿉니다.
+        """
+        if self.embedding_model == self.expected_model:
+            return
+        if allow_retag and self.collection.count() == 0:
+            metadata = {key: value for key, value in (self.collection.metadata or {}).items() if not key.startswith("hnsw:")}
+            metadata["embedding_model"] = self.expected_model
+            self.collection.modify(metadata=metadata)
+            print(f"🏷️ 빈 컬렉션 '{self.collection_name}'의 임베딩 모델 태그를 '{self.expected_model}'(으)로 변경")
+            return
+        raise EmbeddingModelMismatchError(
+            f"임베딩 모델 불일치: 컬렉션 '{self.collection_name}'={self.embedding_model}, 현재={self.expected_model}"
+        )
+
     async def add_documents(
         self,
         documents: List[str],
@@ -48,10 +112,14 @@ class VectorStore:
         """
         문서들을 벡터 데이터베이스에 추가합니다.
         """
+        return await run_in_chroma_executor(self._add_documents, documents, embeddings, metadatas, ids)
+
+    def _add_documents(self, documents, embeddings, metadatas, ids) -> bool:
         try:
             if ids is None:
                 ids = [str(uuid.uuid4()) for _ in documents]
 
+            self._check_embedding_model(allow_retag=True)
             print(f"📚 벡터 DB에 {len(documents)}개 문서 추가 중...")
 
             self.collection.add(
@@ -68,6 +136,47 @@ class VectorStore:
             print(f"❌ 문서 추가 중 오류: {e}")
             return False
 
+    async def upsert_documents(
+        self,
+        documents: List[str],
+        embeddings: List[List[float]],
+        metadatas: List[Dict[str, Any]],
+        ids: List[str],
+        batch_size: Optional[int] = None
+    ) -> int:
+        """
+        문서들을 큰 배치 단위로 upsert합니다 (같은 ID는 덮어쓰므로 재수집해도 중복되지 않음).
+        저장에 성공한 문서 수를 반환합니다.
+        """
+        return await run_in_chroma_executor(self._upsert_documents, documents, embeddings, metadatas, ids, batch_size)
+
+    def _upsert_documents(self, documents, embeddings, metadatas, ids, batch_size) -> int:
+        try:
+            self._check_embedding_model(allow_retag=True)
+        except Exception as e:
+            print(f"❌ 문서 저장 거부: {e}")
+            return 0
+
+        # Chroma가 허용하는 최대 배치 크기를 넘지 않도록 합니다.
+        # 쓰기 호출마다 GIL이 풀리므로 배치가 작을수록 이벤트 루프가 멈추는 시간도 짧아집니다.
+        batch_size = min(batch_size or app_settings.VECTOR_STORE_WRITE_BATCH_SIZE, self.client.get_max_batch_size())
+        stored = 0
+        for start in range(0, len(documents), batch_size):
+            end = start + batch_size
+            try:
+                self.collection.upsert(
+                    documents=documents[start:end],
+                    embeddings=embeddings[start:end],
+                    metadatas=metadatas[start:end],
+                    ids=ids[start:end]
+                )
+                stored += len(documents[start:end])
+            except Exception as e:
+                print(f"❌ 문서 배치 저장 중 오류 ({start}-{min(end, len(documents))}): {e}")
+
+        print(f"✅ {stored}/{len(documents)}개 문서가 '{self.collection_name}' 컬렉션에 저장됨")
+        return stored
+
     async def search_similar(
         self,
         query_embedding: List[float],
@@ -77,7 +186,11 @@ class VectorStore:
         """
         쿼리와 유사한 문서들을 검색합니다.
         """
+        return await run_in_chroma_executor(self._search_similar, query_embedding, top_k, where_filter)
+
+    def _search_similar(self, query_embedding, top_k, where_filter) -> Dict[str, Any]:
         try:
+            self._check_embedding_model()
             print(f"🔍 벡터 유사도 검색 시작 (top_k={top_k})")
 
             results = self.collection.query(
@@ -100,15 +213,20 @@ class VectorStore:
             print(f"❌ 벡터 검색 중 오류: {e}")
             return {"documents": [], "metadatas": [], "distances": [], "ids": []}
 
-    def get_collection_info(self) -> Dict[str, Any]:
+    async def get_collection_info(self) -> Dict[str, Any]:
         """
         컬렉션 정보를 반환합니다.
         """
+        return await run_in_chroma_executor(self._get_collection_info)
+
+    def _get_collection_info(self) -> Dict[str, Any]:
         try:
             count = self.collection.count()
             return {
                 "name": self.collection_name,
                 "document_count": count,
+                "embedding_model": self.embedding_model,
+                "model_mismatch": self.embedding_model != self.expected_model,
                 "status": "active"
             }
         except Exception as e:
@@ -118,13 +236,16 @@ class VectorStore:
                 "status": f"error: {e}"
             }
 
-    def clear_collection(self) -> bool:
+    async def clear_collection(self) -> bool:
         """
         컬렉션의 모든 데이터를 삭제합니다.
         """
+        return await run_in_chroma_executor(self._clear_collection)
+
+    def _clear_collection(self) -> bool:
         try:
-            # 모든 문서 ID 가져오기
-            all_results = self.collection.get()
+            # 모든 문서 ID 가져오기 (문서/임베딩 본문은 읽지 않음)
+            all_results = self.collection.get(include=[])
             if all_results["ids"]:
                 self.collection.delete(ids=all_results["ids"])
                 print(f"✅ 컬렉션 '{self.collection_name}' 초기화 완료")
@@ -0,0 +1,65 @@
+# File: pqc_worker.py
+# 👷 공유 작업 대기열(SQLite 또는 Redis)에서 분석 작업을 가져와 처리하는 워커 프로세스 진입점입니다.
+# API 서버(main.py)는 작업을 대기열에 넣기만 하고, 실제 분석은 이 워커들이 수행합니다.
+#
+# 사용법:
+#   JOB_QUEUE_BACKEND=sqlite python pqc_worker.py --concurrency 4
+#   JOB_QUEUE_BACKEND=redis REDIS_URL=redis://host:6379/0 python pqc_worker.py
+
+import argparse
+import asyncio
+import signal
+import sys
+from pqc_inspector_server.core.config import settings
+from pqc_inspector_server.core.container import get_container
+from pqc_inspector_server.services.job_queue import get_job_queue
+from pqc_inspector_server.services.local_embedding import warm_up_embedding_backend
+from pqc_inspector_server.services.loop_monitor import get_loop_lag_monitor
+from pqc_inspector_server.services.queue_worker import QueueWorker
+from pqc_inspector_server.services.result_store import get_result_store
+
+
+async def main(args) -> int:
+    queue = get_job_queue()
+    if queue is None:
+        print(f"❌ JOB_QUEUE_BACKEND가 '{settings.JOB_QUEUE_BACKEND}'입니다. 워커를 사용하려면 'sqlite' 또는 'redis'로 설정하세요.")
+        return 1
+
+    container = get_container()
+    container.startup()
+    await warm_up_embedding_backend()
+    if settings.EVENT_LOOP_MONITOR_ENABLED:
+        get_loop_lag_monitor().start()
+
+    worker = QueueWorker(
+        queue=queue,
+        orchestrator=container.get_orchestrator(),
+        result_store=get_result_store(),
+        concurrency=args.concurrency,
+        visibility_timeout=settings.JOB_LEASE_SECONDS,
+        max_attempts=settings.JOB_MAX_ATTEMPTS,
+        poll_interval=settings.WORKER_POLL_INTERVAL_SECONDS,
+        worker_id=args.worker_id
+    )
+
+    # Ctrl+C / SIGTERM 수신 시 진행 중인 작업을 마치고 종료합니다.
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, worker.stop)
+        except NotImplementedError:
+            pass  # Windows
+
+    try:
+        await worker.run()
+    finally:
+        await get_loop_lag_monitor().stop()
+        await container.shutdown()  # 공유 대기열 연결도 함께 닫습니다.
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="PQC Inspector 분석 워커")
+    parser.add_argument("--concurrency", type=int, default=settings.WORKER_CONCURRENCY, help="동시에 처리할 작업 수")
+    parser.add_argument("--worker-id", default=None, help="워커 식별자 (기본값: 호스트명:PID)")
+    sys.exit(asyncio.run(main(parser.parse_args())))
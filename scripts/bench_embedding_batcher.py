@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""동시 RAG 쿼리 임베딩 마이크로 배치 벤치마크 스크립트
+
+로컬 스텁 서버(OpenAI /v1/embeddings 형식 응답)를 띄우고, 여러 에이전트가 동시에 create_single_embedding을
+호출하는 상황을 모사하여 요청별 개별 호출과 마이크로 배치의 요청 수 및 소요 시간을 비교합니다.
+임베딩 캐시는 측정에서 제외합니다.
+
+사용법:
+    python scripts/bench_embedding_batcher.py
+    python scripts/bench_embedding_batcher.py --concurrency 200 --rounds 5 --wait-ms 5 --max-batch 64
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pqc_inspector_server.core.config import settings
+from pqc_inspector_server.services.embedding_batcher import get_embedding_batcher
+from pqc_inspector_server.services.embedding_service import EmbeddingService
+from pqc_inspector_server.services.http_client_pool import get_http_client_pool
+from bench_ingestion import EmbeddingStubServer, build_chunks
+
+
+async def run_rounds(service: EmbeddingService, queries, concurrency: int, rounds: int):
+    """rounds번에 걸쳐 concurrency개의 쿼리를 동시에 임베딩하고 (소요 시간, 실패 수)를 반환합니다."""
+    failed = 0
+    start = time.perf_counter()
+    for round_index in range(rounds):
+        batch = queries[round_index * concurrency:(round_index + 1) * concurrency]
+        results = await asyncio.gather(*(service.create_single_embedding(query) for query in batch))
+        failed += sum(1 for vector in results if not vector)
+    return time.perf_counter() - start, failed
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="임베딩 마이크로 배치 벤치마크")
+    parser.add_argument("--concurrency", type=int, default=100, help="동시에 임베딩을 요청하는 쿼리 수")
+    parser.add_argument("--rounds", type=int, default=5, help="동시 요청 묶음 반복 횟수")
+    parser.add_argument("--query-chars", type=int, default=300, help="쿼리 1개의 길이 (문자)")
+    parser.add_argument("--rtt-ms", type=float, default=150.0, help="임베딩 요청 1회의 왕복 지연 (ms)")
+    parser.add_argument("--per-text-ms", type=float, default=0.5, help="입력 텍스트 1개당 추가 지연 (ms)")
+    parser.add_argument("--dim", type=int, default=1536, help="임베딩 차원")
+    parser.add_argument("--wait-ms", type=float, default=settings.EMBEDDING_MICROBATCH_WAIT_MS, help="배치 대기 시간 (ms)")
+    parser.add_argument("--max-batch", type=int, default=settings.EMBEDDING_MICROBATCH_MAX_SIZE, help="최대 배치 크기")
+    args = parser.parse_args()
+
+    settings.EMBEDDING_CACHE_ENABLED = False
+    settings.EMBEDDING_MICROBATCH_WAIT_MS = args.wait_ms
+    settings.EMBEDDING_MICROBATCH_MAX_SIZE = args.max_batch
+
+    stub = EmbeddingStubServer(args.rtt_ms / 1000, args.per_text_ms / 1000, args.dim)
+    base_url = await stub.start()
+    queries = build_chunks(args.concurrency * args.rounds, args.query_chars, seed=1)
+    total = len(queries)
+
+    print(f"🔎 동시 쿼리 {args.concurrency}개 x {args.rounds}회, 왕복 {args.rtt_ms:g}ms + 텍스트당 {args.per_text_ms:g}ms")
+    print(f"   마이크로 배치: 대기 {args.wait_ms:g}ms / 최대 {args.max_batch}개")
+
+    rows = []
+    try:
+        service = EmbeddingService()
+        service.openai_base_url = base_url
+
+        settings.EMBEDDING_MICROBATCH_ENABLED = False
+        requests_before = stub.requests
+        seconds, failed = await run_rounds(service, queries, args.concurrency, args.rounds)
+        rows.append(("per-query", seconds, total - failed, stub.requests - requests_before))
+
+        settings.EMBEDDING_MICROBATCH_ENABLED = True
+        get_embedding_batcher.cache_clear()
+        batcher = get_embedding_batcher()
+        batcher.embed_batch.__self__.openai_base_url = base_url
+        requests_before = stub.requests
+        seconds, failed = await run_rounds(service, queries, args.concurrency, args.rounds)
+        rows.append(("micro-batch", seconds, total - failed, stub.requests - requests_before))
+        stats = batcher.get_stats()
+    finally:
+        # keep-alive 커넥션을 먼저 닫아야 스텁 서버가 깔끔하게 종료됩니다.
+        await get_http_client_pool().aclose()
+        await stub.stop()
+
+    print(f"\n{'방식':<12} | {'시간':>9} | {'성공':>6} | {'요청 수':>7} | {'쿼리/초':>9}")
+    print("-" * 58)
+    for name, seconds, succeeded, requests in rows:
+        print(f"{name:<12} | {seconds:>8.2f}s | {succeeded:>6} | {requests:>7} | {succeeded / seconds:>9.1f}")
+    print(f"\n➜ 평균 배치 {stats['avg_batch_size']:.1f}개, 평균 대기 {stats['avg_wait_ms']:.1f}ms")
+    print(f"➜ 요청 수 {rows[0][3] / max(1, rows[1][3]):.1f}배 감소, 처리량 {rows[0][1] / rows[1][1]:.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""로컬 파일 분류기 정확도/지연 시간 벤치마크 스크립트
+
+레이블이 있는 파일 묶음에 대해 로컬 분류기(매직 바이트 + 확장자 + 내용 패턴 + 나이브 베이즈)와
+기존 LLM 분류 경로(_classify_with_llm)의 정확도와 파일당 지연 시간을 비교합니다.
+
+평가 데이터:
+    - 기본: 저장소 안의 파일(소스코드, 설정/지식 베이스 JSON, 테스트 샘플)과 합성 로그/어셈블리,
+      현재 Python 실행 파일(바이너리). 확장자를 지운 사본도 함께 평가하여 내용 기반 분류를 확인합니다.
+    - --dataset: {"filename", "content", "file_type"} 형식의 JSONL 파일
+
+사용법:
+    python scripts/bench_file_classifier.py
+    python scripts/bench_file_classifier.py --with-llm --llm-limit 20
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pqc_inspector_server.core.config import settings
+from pqc_inspector_server.services.file_classifier import get_file_classifier
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+SYNTHETIC_LOG = "\n".join(
+    f"2024-05-{day:02d} 12:{minute:02d}:00 INFO [nginx] GET /api/v1/items 200 {minute * 7}ms"
+    for day in range(1, 4) for minute in range(0, 60, 7)
+)
+SYNTHETIC_ASM = """section .text
+global _start
+_start:
+    push rbp
+    mov rbp, rsp
+    mov rdi, 0x10001
+    call rsa_public_encrypt
+    xor eax, eax
+    pop rbp
+    ret
+"""
+
+
+def build_default_corpus():
+    """저장소 파일로 (filename, content, file_type) 목록을 만듭니다."""
+    corpus = []
+
+    def add_files(pattern, file_type, limit):
+        for path in sorted(PROJECT_ROOT.glob(pattern))[:limit]:
+            if path.is_file():
+                corpus.append((path.name, path.read_bytes(), file_type))
+
+    add_files("pqc_inspector_server/**/*.py", "source_code", 30)
+    add_files("test/*", "source_code", 10)
+    add_files("data/rag_knowledge_base/**/*.json", "logs_config", 20)
+    add_files("requirements.txt", "logs_config", 1)
+    add_files(".env.example", "logs_config", 1)
+
+    corpus.append(("access.log", SYNTHETIC_LOG.encode(), "logs_config"))
+    corpus.append(("crypto.asm", SYNTHETIC_ASM.encode(), "assembly_binary"))
+    corpus.append((os.path.basename(sys.executable), Path(sys.executable).read_bytes()[:65536], "assembly_binary"))
+
+    # 확장자가 없는 사본: 확장자 신호 없이 내용만으로 분류되는지 확인합니다.
+    corpus += [(name.rsplit(".", 1)[0] + "_noext", content, file_type) for name, content, file_type in list(corpus)]
+    return corpus
+
+
+def load_dataset(path: str):
+    corpus = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                row = json.loads(line)
+                corpus.append((row.get("filename", ""), row["content"].encode("utf-8"), row["file_type"]))
+    return corpus
+
+
+def bench_local(corpus, threshold: float, repeat: int):
+    classifier = get_file_classifier()
+    correct = 0
+    confident = 0
+    confident_correct = 0
+    errors = []
+    durations = []
+
+    for filename, content, expected in corpus:
+        result = classifier.classify(filename, content)
+        start = time.perf_counter()
+        for _ in range(repeat):
+            classifier.classify(filename, content)
+        durations.append((time.perf_counter() - start) / repeat)
+
+        correct += result.file_type == expected
+        if result.confidence >= threshold:
+            confident += 1
+            confident_correct += result.file_type == expected
+        if result.file_type != expected:
+            errors.append((filename, expected, result.file_type, result.confidence))
+
+    durations.sort()
+    total = len(corpus)
+    print("\n📊 [로컬 분류기]")
+    print(f"   - 전체 정확도: {correct}/{total} ({correct / total:.1%})")
+    print(f"   - 임계값({threshold}) 이상으로 로컬 처리: {confident}/{total} ({confident / total:.1%}), "
+          f"그중 정확도 {confident_correct / max(confident, 1):.1%}")
+    print(f"   - LLM으로 넘어가는 비율: {(total - confident) / total:.1%}")
+    print(f"   - 지연 시간: 중앙값 {durations[total // 2] * 1e6:.1f}µs, p95 {durations[int(total * 0.95)] * 1e6:.1f}µs")
+    for filename, expected, actual, confidence in errors[:10]:
+        print(f"   ❌ {filename}: 정답 {expected}, 예측 {actual} (신뢰도 {confidence:.2f})")
+    return correct / total
+
+
+async def bench_llm(corpus, limit: int):
+    from pqc_inspector_server.orchestrator.controller import OrchestratorController
+    from pqc_inspector_server.services.result_store import MemoryResultStore
+
+    controller = OrchestratorController(api_client=None, result_store=MemoryResultStore())
+    samples = corpus[:limit]
+    correct = 0
+    durations = []
+    for filename, content, expected in samples:
+        start = time.perf_counter()
+        predicted = await controller._classify_with_llm(filename, content)
+        durations.append(time.perf_counter() - start)
+        correct += predicted == expected
+
+    durations.sort()
+    total = len(samples)
+    print(f"\n📊 [LLM 분류 경로: {settings.ORCHESTRATOR_MODEL}]")
+    print(f"   - 정확도: {correct}/{total} ({correct / total:.1%})")
+    print(f"   - 지연 시간: 중앙값 {durations[total // 2] * 1e3:.0f}ms, p95 {durations[int(total * 0.95)] * 1e3:.0f}ms")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="로컬 파일 분류기 벤치마크")
+    parser.add_argument("--dataset", help="평가용 JSONL (filename, content, file_type)")
+    parser.add_argument("--threshold", type=float, default=settings.FILE_CLASSIFIER_CONFIDENCE_THRESHOLD)
+    parser.add_argument("--repeat", type=int, default=200, help="지연 시간 측정 반복 횟수")
+    parser.add_argument("--with-llm", action="store_true", help="LLM 분류 경로도 측정 (API 키 필요, 응답 캐시 사용)")
+    parser.add_argument("--llm-limit", type=int, default=20, help="LLM으로 평가할 최대 파일 수")
+    args = parser.parse_args()
+
+    corpus = load_dataset(args.dataset) if args.dataset else build_default_corpus()
+    print(f"🗂️ 평가 파일 {len(corpus)}개: {dict(Counter(file_type for _, _, file_type in corpus))}")
+
+    bench_local(corpus, args.threshold, args.repeat)
+    if args.with_llm:
+        await bench_llm(corpus, args.llm_limit)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
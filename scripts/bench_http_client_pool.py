@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""공유 HTTP 커넥션 풀 벤치마크 스크립트
+
+로컬 스텁 서버(OpenAI chat/completions 형식 응답)를 띄우고,
+호출마다 새 httpx.AsyncClient를 만드는 기존 방식과 공유 풀(HTTPClientPool)을 비교합니다.
+스텁 서버는 새 커넥션마다 --handshake-ms 만큼 지연하여 원격 TCP+TLS 핸드셰이크 비용을 모사합니다.
+
+사용법:
+    python scripts/bench_http_client_pool.py --requests 50 --handshake-ms 150
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+import httpx
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pqc_inspector_server.services.ai_service import AIService
+from pqc_inspector_server.services.http_client_pool import HTTPClientPool
+
+STUB_RESPONSE = json.dumps({
+    "choices": [{"message": {"content": '{"is_pqc_vulnerable": false}'}}],
+    "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15}
+}).encode()
+
+
+class StubServer:
+    """keep-alive를 지원하는 최소한의 HTTP/1.1 스텁 서버"""
+
+    def __init__(self, handshake_delay: float):
+        self.handshake_delay = handshake_delay
+        self.connections = 0
+        self.server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        # 새 커넥션 수립 비용 (TCP+TLS 핸드셰이크) 모사
+        await asyncio.sleep(self.handshake_delay)
+        try:
+            while True:
+                header_data = await reader.readuntil(b"\r\n\r\n")
+                content_length = 0
+                for line in header_data.split(b"\r\n"):
+                    if line.lower().startswith(b"content-length:"):
+                        content_length = int(line.split(b":", 1)[1].strip())
+                if content_length:
+                    await reader.readexactly(content_length)
+
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\n"
+                    b"Content-Type: application/json\r\n"
+                    b"Connection: keep-alive\r\n"
+                    + f"Content-Length: {len(STUB_RESPONSE)}\r\n\r\n".encode()
+                    + STUB_RESPONSE
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self) -> str:
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}/v1"
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+
+async def run_per_call_clients(base_url: str, count: int, concurrency: int):
+    """기존 방식: 호출마다 새 AsyncClient 생성"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one_call():
+        async with semaphore:
+            async with httpx.AsyncClient() as client:
+                response = await client.post(
+                    f"{base_url}/chat/completions",
+                    json={"model": "gpt-bench", "messages": [{"role": "user", "content": "ping"}]},
+                    timeout=60.0
+                )
+                response.raise_for_status()
+
+    await asyncio.gather(*(one_call() for _ in range(count)))
+
+
+async def run_pooled_ai_service(base_url: str, count: int, concurrency: int, http2: bool):
+    """개선 방식: 공유 풀을 사용하는 AIService._call_openai"""
+    pool = HTTPClientPool(http2=http2)
+    service = AIService()
+    service.openai_base_url = base_url
+    service.http_pool = pool
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one_call():
+        async with semaphore:
+            result = await service._call_openai("gpt-bench", "ping")
+            assert result["success"], result
+
+    try:
+        await asyncio.gather(*(one_call() for _ in range(count)))
+    finally:
+        await pool.aclose()
+
+
+async def bench(label: str, runner, server: StubServer, *args):
+    server.connections = 0
+    start = time.perf_counter()
+    await runner(*args)
+    elapsed = time.perf_counter() - start
+    count = args[1]
+    print(f"{label:<28} {elapsed:8.3f}s  {elapsed / count * 1000:8.2f} ms/req  커넥션 {server.connections:4d}개")
+    return elapsed
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="공유 HTTP 커넥션 풀 벤치마크")
+    parser.add_argument("--requests", type=int, default=50, help="요청 수")
+    parser.add_argument("--concurrency", type=int, default=1, help="동시 요청 수")
+    parser.add_argument("--handshake-ms", type=float, default=150.0, help="새 커넥션당 모사 핸드셰이크 지연 (ms)")
+    parser.add_argument("--http2", action="store_true", help="풀에서 HTTP/2 사용 (스텁은 HTTP/1.1만 지원)")
+    args = parser.parse_args()
+
+    server = StubServer(args.handshake_ms / 1000)
+    base_url = await server.start()
+
+    print("=" * 80)
+    print(f"🧪 HTTP 커넥션 풀 벤치마크 - 요청 {args.requests}개, 동시성 {args.concurrency}, 핸드셰이크 {args.handshake_ms:.0f}ms")
+    print("=" * 80)
+
+    try:
+        baseline = await bench("호출마다 새 클라이언트", run_per_call_clients, server,
+                               base_url, args.requests, args.concurrency)
+        pooled = await bench("공유 풀 (AIService)", run_pooled_ai_service, server,
+                             base_url, args.requests, args.concurrency, args.http2)
+    finally:
+        await server.stop()
+
+    saved = baseline - pooled
+    print("-" * 80)
+    print(f"⏱️ 절감 시간: {saved:.3f}s ({saved / args.requests * 1000:.2f} ms/req, {baseline / pooled:.1f}배 빠름)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
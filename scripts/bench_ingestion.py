@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""문서 수집(임베딩 + 벡터 DB 저장) 처리량 벤치마크 스크립트
+
+로컬 스텁 서버(OpenAI /v1/embeddings 형식 응답)를 띄우고, 임시 디렉토리의 Chroma 컬렉션에
+청크를 하나씩 추가하는 기존 방식(add_new_knowledge 반복)과 대량 경로(add_knowledge_bulk)를 비교합니다.
+스텁 서버는 요청마다 --rtt-ms, 입력 텍스트 1개마다 --per-text-ms 만큼 지연하여 원격 API 지연을 모사합니다.
+
+사용법:
+    python scripts/bench_ingestion.py
+    python scripts/bench_ingestion.py --chunks 600 --rtt-ms 250 --per-text-ms 2 --dim 1536
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pqc_inspector_server.core.config import settings
+from pqc_inspector_server.services.http_client_pool import get_http_client_pool
+from pqc_inspector_server.services.knowledge_manager import KnowledgeManager
+from pqc_inspector_server.services.vector_store import VectorStore
+
+WORDS = ["RSA", "ECDSA", "key", "exchange", "lattice", "Kyber", "Dilithium", "certificate", "TLS", "handshake",
+         "signature", "modulus", "curve", "secp256r1", "migration", "hybrid", "quantum", "Shor", "algorithm", "NIST"]
+
+
+class EmbeddingStubServer:
+    """keep-alive를 지원하는 최소한의 /v1/embeddings 스텁 서버"""
+
+    def __init__(self, rtt: float, per_text: float, dim: int):
+        self.rtt = rtt
+        self.per_text = per_text
+        self.dim = dim
+        self.requests = 0
+        self.server = None
+        rng = random.Random(0)
+        self._vector = json.dumps([round(rng.uniform(-1, 1), 6) for _ in range(dim)])
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                header_data = await reader.readuntil(b"\r\n\r\n")
+                content_length = 0
+                for line in header_data.split(b"\r\n"):
+                    if line.lower().startswith(b"content-length:"):
+                        content_length = int(line.split(b":", 1)[1].strip())
+                body = json.loads(await reader.readexactly(content_length)) if content_length else {}
+                inputs = body.get("input", [])
+                self.requests += 1
+
+                # 요청 왕복 지연 + 입력 수에 비례하는 처리 지연
+                await asyncio.sleep(self.rtt + self.per_text * len(inputs))
+                items = ",".join(
+                    f'{{"object":"embedding","index":{index},"embedding":{self._vector}}}' for index in range(len(inputs))
+                )
+                payload = f'{{"object":"list","data":[{items}],"usage":{{"prompt_tokens":0,"total_tokens":0}}}}'.encode()
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\n"
+                    b"Content-Type: application/json\r\n"
+                    b"Connection: keep-alive\r\n"
+                    + f"Content-Length: {len(payload)}\r\n\r\n".encode()
+                    + payload
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self) -> str:
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}/v1"
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+
+def build_chunks(count: int, chars: int, seed: int = 0):
+    """PDF 청크와 비슷한 길이의 합성 텍스트 청크를 만듭니다."""
+    rng = random.Random(seed)
+    chunks = []
+    for index in range(count):
+        words = []
+        while sum(len(word) + 1 for word in words) < chars:
+            words.append(rng.choice(WORDS))
+        chunks.append(f"[{index}] " + " ".join(words))
+    return chunks
+
+
+def make_manager(base_url: str, persist_directory: str, collection: str) -> KnowledgeManager:
+    manager = KnowledgeManager("source_code", VectorStore(collection, persist_directory=persist_directory))
+    manager.embedding_service.openai_base_url = base_url
+    return manager
+
+
+async def run_per_chunk(manager: KnowledgeManager, chunks) -> int:
+    """기존 방식: 청크마다 임베딩 요청 1회 + 벡터 DB add 1회"""
+    stored = 0
+    for chunk in chunks:
+        if await manager.add_new_knowledge(chunk, "document_chunk", "doc_bench", 0.9, "bench"):
+            stored += 1
+    return stored
+
+
+async def run_bulk(manager: KnowledgeManager, chunks) -> int:
+    """대량 경로: 배치 임베딩(동시 요청) + 큰 배치 upsert"""
+    items = [
+        {"content": chunk, "type": "document_chunk", "category": "doc_bench", "confidence": 0.9, "source": "bench",
+         "id": f"bench_{index}"}
+        for index, chunk in enumerate(chunks)
+    ]
+    stats = await manager.add_knowledge_bulk(items)
+    return stats["stored"]
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="문서 수집 처리량 벤치마크")
+    parser.add_argument("--chunks", type=int, default=300, help="수집할 청크 수 (300페이지 PDF ≈ 300~600개)")
+    parser.add_argument("--chunk-chars", type=int, default=1000, help="청크 1개의 길이 (문자)")
+    parser.add_argument("--rtt-ms", type=float, default=150.0, help="임베딩 요청 1회의 왕복 지연 (ms)")
+    parser.add_argument("--per-text-ms", type=float, default=1.0, help="입력 텍스트 1개당 추가 지연 (ms)")
+    parser.add_argument("--dim", type=int, default=1536, help="임베딩 차원")
+    parser.add_argument("--skip-per-chunk", action="store_true", help="기존 방식 측정 생략")
+    args = parser.parse_args()
+
+    # 요청 한도 대기는 측정에서 제외합니다.
+    settings.LLM_RATE_LIMIT_ENABLED = False
+
+    stub = EmbeddingStubServer(args.rtt_ms / 1000, args.per_text_ms / 1000, args.dim)
+    base_url = await stub.start()
+    persist_directory = tempfile.mkdtemp(prefix="bench_ingestion_")
+    chunks = build_chunks(args.chunks, args.chunk_chars)
+
+    print(f"📦 청크 {len(chunks)}개, 왕복 {args.rtt_ms:g}ms + 텍스트당 {args.per_text_ms:g}ms, {args.dim}차원")
+    print(f"   배치 {settings.EMBEDDING_BATCH_SIZE}개 / 동시 {settings.EMBEDDING_MAX_CONCURRENCY}개 / "
+          f"upsert {settings.VECTOR_STORE_WRITE_BATCH_SIZE}개")
+
+    rows = []
+    try:
+        if not args.skip_per_chunk:
+            manager = make_manager(base_url, persist_directory, "bench_per_chunk")
+            requests_before = stub.requests
+            start = time.perf_counter()
+            stored = await run_per_chunk(manager, chunks)
+            rows.append(("per-chunk", time.perf_counter() - start, stored, stub.requests - requests_before))
+
+        manager = make_manager(base_url, persist_directory, "bench_bulk")
+        requests_before = stub.requests
+        start = time.perf_counter()
+        stored = await run_bulk(manager, chunks)
+        rows.append(("bulk", time.perf_counter() - start, stored, stub.requests - requests_before))
+    finally:
+        # keep-alive 커넥션을 먼저 닫아야 스텁 서버가 깔끔하게 종료됩니다.
+        await get_http_client_pool().aclose()
+        await stub.stop()
+        shutil.rmtree(persist_directory, ignore_errors=True)
+
+    print(f"\n{'방식':<10} | {'시간':>9} | {'저장':>6} | {'요청 수':>7} | {'청크/초':>9}")
+    print("-" * 56)
+    for name, seconds, stored, requests in rows:
+        print(f"{name:<10} | {seconds:>8.2f}s | {stored:>6} | {requests:>7} | {stored / seconds:>9.1f}")
+    if len(rows) == 2:
+        print(f"\n➜ 처리량 향상: {rows[0][1] / rows[1][1]:.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
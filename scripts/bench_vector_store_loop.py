@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""벡터 DB 작업 중 이벤트 루프 응답성 벤치마크 스크립트
+
+임시 디렉토리의 Chroma 컬렉션에 대량 upsert(수집)와 유사도 검색을 동시에 실행하면서
+이벤트 루프 지연 모니터로 루프가 막힌 시간을 측정합니다.
+Chroma 호출을 이벤트 루프에서 직접 실행하는 방식(스레드 0개)과 전용 스레드 풀 방식을 비교합니다.
+
+사용법:
+    python scripts/bench_vector_store_loop.py
+    python scripts/bench_vector_store_loop.py --documents 20000 --searches 200 --dim 1536 --threads 4
+"""
+import argparse
+import asyncio
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pqc_inspector_server.core.config import settings
+from pqc_inspector_server.services.loop_monitor import EventLoopLagMonitor
+from pqc_inspector_server.services.vector_store import VectorStore, get_chroma_executor
+
+
+def random_vectors(count: int, dim: int, rng: random.Random):
+    return [[rng.uniform(-1, 1) for _ in range(dim)] for _ in range(count)]
+
+
+async def run_scenario(name: str, threads: int, args, persist_directory: str, vectors, queries):
+    """한 가지 실행 방식으로 수집 + 검색을 동시에 실행하고 (이름, 시간, 지연 지표)를 반환합니다."""
+    settings.VECTOR_STORE_EXECUTOR_THREADS = threads
+    get_chroma_executor.cache_clear()
+
+    store = VectorStore(f"bench_loop_{name}", persist_directory=persist_directory)
+    documents = [f"doc {index}" for index in range(len(vectors))]
+    metadatas = [{"category": f"c{index % 8}"} for index in range(len(vectors))]
+    ids = [f"{name}_{index}" for index in range(len(vectors))]
+
+    async def ingest():
+        for start in range(0, len(vectors), args.ingest_batch):
+            end = start + args.ingest_batch
+            await store.upsert_documents(documents[start:end], vectors[start:end], metadatas[start:end], ids[start:end])
+
+    async def search():
+        semaphore = asyncio.Semaphore(args.search_concurrency)
+
+        async def one(query):
+            async with semaphore:
+                await store.search_similar(query, top_k=5)
+
+        await asyncio.gather(*(one(query) for query in queries))
+
+    monitor = EventLoopLagMonitor(interval_ms=args.interval_ms, warn_ms=float("inf"))
+    monitor.start()
+    start = time.perf_counter()
+    await asyncio.gather(ingest(), search())
+    seconds = time.perf_counter() - start
+    await monitor.stop()
+    return name, seconds, monitor.get_stats()
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="벡터 DB 작업 중 이벤트 루프 응답성 벤치마크")
+    parser.add_argument("--documents", type=int, default=10000, help="수집할 문서 수")
+    parser.add_argument("--ingest-batch", type=int, default=1000, help="upsert_documents 1회 호출당 문서 수")
+    parser.add_argument("--searches", type=int, default=200, help="동시에 실행할 검색 수")
+    parser.add_argument("--search-concurrency", type=int, default=16, help="동시 검색 수 상한")
+    parser.add_argument("--dim", type=int, default=384, help="임베딩 차원")
+    parser.add_argument("--threads", type=int, default=4, help="벡터 DB 전용 스레드 수")
+    parser.add_argument("--interval-ms", type=float, default=10.0, help="지연 샘플링 간격 (ms)")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    vectors = random_vectors(args.documents, args.dim, rng)
+    queries = random_vectors(args.searches, args.dim, rng)
+    persist_directory = tempfile.mkdtemp(prefix="bench_vector_loop_")
+
+    print(f"🗄️ 문서 {args.documents}개 수집 ({args.ingest_batch}개씩, Chroma 쓰기 {settings.VECTOR_STORE_WRITE_BATCH_SIZE}개씩) "
+          f"+ 검색 {args.searches}개 동시 실행, {args.dim}차원")
+    rows = []
+    stdout = sys.stdout
+    try:
+        for name, threads in (("inline", 0), ("executor", args.threads)):
+            # 로그 출력이 측정에 섞이지 않도록 print를 잠시 끕니다.
+            sys.stdout = open(os.devnull, "w")
+            try:
+                rows.append(await run_scenario(name, threads, args, persist_directory, vectors, queries))
+            finally:
+                sys.stdout.close()
+                sys.stdout = stdout
+    finally:
+        shutil.rmtree(persist_directory, ignore_errors=True)
+
+    print(f"\n{'방식':<10} | {'시간':>8} | {'평균 지연':>9} | {'p99 지연':>9} | {'최대 지연':>9}")
+    print("-" * 60)
+    for name, seconds, stats in rows:
+        print(f"{name:<10} | {seconds:>7.2f}s | {stats['avg_lag_ms']:>7.1f}ms | "
+              f"{stats['recent_p99_lag_ms']:>7.1f}ms | {stats['max_lag_ms']:>7.1f}ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
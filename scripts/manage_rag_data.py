@@ -101,7 +101,7 @@ class RAGDataManager:
                 success = await manager.initialize_knowledge_base(force_reload=True)
 
                 if success:
-                    collection_info = manager.vector_store.get_collection_info()
+                    collection_info = await manager.vector_store.get_collection_info()
                     print(f"✅ {atype}: {collection_info['document_count']}개 문서 로드됨")
                 else:
                     print(f"❌ {atype}: 새로고침 실패")
@@ -118,7 +118,7 @@ class RAGDataManager:
             try:
                 # 벡터 스토어 정보
                 store = VectorStoreFactory.get_store(agent_type)
-                info = store.get_collection_info()
+                info = await store.get_collection_info()
 
                 # JSON 파일 정보
                 json_data = await self.load_json_files(agent_type)
@@ -170,7 +170,7 @@ class RAGDataManager:
         if confirm.lower() == 'y':
             try:
                 store = VectorStoreFactory.get_store(agent_type)
-                success = store.clear_collection()
+                success = await store.clear_collection()
 
                 if success:
                     print(f"✅ {agent_type} 벡터 DB 초기화 완료")
@@ -20,7 +20,7 @@ async def rebuild_binary_vector_db():
 
     # 2. 기존 컬렉션 삭제
     print("🗑️ 기존 벡터 DB 삭제 중...")
-    vector_store.clear_collection()
+    await vector_store.clear_collection()
     print("✅ 삭제 완료\n")
 
     # 3. KnowledgeManager로 재초기화
@@ -31,10 +31,10 @@ async def rebuild_binary_vector_db():
     await km.initialize_knowledge_base(force_reload=True)
 
     # 4. 결과 확인
-    collection_info = vector_store.get_collection_info()
+    collection_info = await vector_store.get_collection_info()
     print(f"\n✅ 재구성 완료!")
     print(f"   총 문서 수: {collection_info['document_count']}개")
-    print(f"   컬렉션 이름: {collection_info['collection_name']}")
+    print(f"   컬렉션 이름: {collection_info['name']}")
 
 if __name__ == "__main__":
     asyncio.run(rebuild_binary_vector_db())
@@ -0,0 +1,53 @@
+# File: tests/conftest.py
+# 🧪 테스트 공용 픽스처입니다. 비동기 코드는 외부 플러그인 없이 asyncio.run으로 실행합니다.
+
+import os
+
+import pytest
+
+# 상대 경로(data/...)를 쓰는 설정이 저장소 루트 기준으로 동작하도록 합니다.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 테스트가 저장소의 data/ 아래에 캐시/상태 DB를 만들지 않도록 쓰기 경로를 임시 디렉토리로 돌립니다.
+# (지식 베이스, 상수 데이터베이스 같은 읽기 전용 경로는 저장소 것을 그대로 사용합니다.)
+WRITABLE_DATA_PATHS = {
+    "LLM_CACHE_DB_PATH": "cache/llm_responses.sqlite3",
+    "EMBEDDING_CACHE_DB_PATH": "cache/embeddings.sqlite3",
+    "EMBEDDING_CACHE_VECTORS_PATH": "cache/embedding_vectors.bin",
+    "RESULT_STORE_DB_PATH": "state/task_results.sqlite3",
+    "JOB_QUEUE_DB_PATH": "state/job_queue.sqlite3"
+}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _isolated_data_paths(tmp_path_factory):
+    from pqc_inspector_server.core.config import settings as app_settings
+
+    data_dir = tmp_path_factory.mktemp("data")
+    original = {name: getattr(app_settings, name) for name in WRITABLE_DATA_PATHS}
+    for name, relative in WRITABLE_DATA_PATHS.items():
+        setattr(app_settings, name, str(data_dir / relative))
+    yield
+    for name, value in original.items():
+        setattr(app_settings, name, value)
+
+
+@pytest.fixture(autouse=True)
+def _repo_root_cwd(monkeypatch):
+    monkeypatch.chdir(ROOT)
+
+
+@pytest.fixture
+def settings(monkeypatch):
+    """테스트 안에서 settings 값을 바꾸고, 끝나면 원래 값으로 되돌립니다 (settings.set(NAME=value))."""
+    from pqc_inspector_server.core.config import settings as app_settings
+
+    class _Overrides:
+        def set(self, **values):
+            for name, value in values.items():
+                monkeypatch.setattr(app_settings, name, value)
+
+        def __getattr__(self, name):
+            return getattr(app_settings, name)
+
+    return _Overrides()
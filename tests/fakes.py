@@ -0,0 +1,132 @@
+# File: tests/fakes.py
+# 🧪 여러 테스트에서 공유하는 가짜(fake) 에이전트, AI 서비스, DB API 클라이언트입니다.
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+
+class FakeAgent:
+    """지정한 시간만큼 기다린 뒤 결과를 반환하거나 예외를 던지는 에이전트"""
+
+    def __init__(self, delay: float = 0.0, result: Optional[Dict[str, Any]] = None, error: Optional[Exception] = None):
+        self.delay = delay
+        self.result = result or {
+            "is_pqc_vulnerable": True,
+            "vulnerability_details": "RSA 사용",
+            "detected_algorithms": ["RSA"],
+            "recommendations": "ML-KEM으로 교체",
+            "evidence": "RSA_generate_key",
+            "confidence_score": 0.9
+        }
+        self.error = error
+        self.calls: List[str] = []
+        self.scans: List[Optional[Dict[str, Any]]] = []
+
+    async def analyze(self, file_content: bytes, file_name: str, scan: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        self.calls.append(file_name)
+        self.scans.append(scan)
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return dict(self.result)
+
+    def _get_default_result(self, file_name: str, error_detail: str) -> Dict[str, Any]:
+        return {
+            "is_pqc_vulnerable": False,
+            "vulnerability_details": error_detail,
+            "detected_algorithms": [],
+            "recommendations": "",
+            "evidence": "",
+            "confidence_score": 0.0
+        }
+
+
+class FakeAIService:
+    """generate_response 호출을 기록하고 미리 정한 응답을 돌려주는 AIService 대역"""
+
+    def __init__(self, content: str = "# 리포트", success: bool = True):
+        self.content = content
+        self.success = success
+        self.calls: List[Dict[str, Any]] = []
+
+    async def generate_response(self, **kwargs) -> Dict[str, Any]:
+        self.calls.append(kwargs)
+        if self.success:
+            return {"success": True, "content": self.content}
+        return {"success": False, "error": "fake failure"}
+
+
+class FakeAPIClient:
+    """DB API 클라이언트 대역"""
+
+    def __init__(self, data: Dict[str, Any]):
+        self.data = data
+        self.saved: List[Any] = []
+
+    async def get_all_file_data(self, file_id: int, scan_id: int) -> Dict[str, Any]:
+        return self.data
+
+    async def save_llm_analysis(self, file_id: int, scan_id: int, analysis: str) -> bool:
+        self.saved.append((file_id, scan_id, analysis))
+        return True
+
+
+class OpenAIStubServer:
+    """
+    keep-alive를 지원하는 최소한의 OpenAI 호환 스텁 서버입니다.
+    handler(path, body)가 (상태 코드, 응답 본문 dict, 추가 헤더, 지연 초)를 반환하며,
+    지정하지 않으면 모든 요청에 "ok" 응답을 돌려줍니다.
+    """
+
+    def __init__(self, handler=None):
+        self.handler = handler or (lambda path, body: (200, self.completion("ok"), {}, 0.0))
+        self.connections = 0
+        self.requests: List[Dict[str, Any]] = []
+        self.server = None
+
+    @staticmethod
+    def completion(content: str) -> Dict[str, Any]:
+        return {
+            "choices": [{"message": {"content": content}}],
+            "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2}
+        }
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        import json
+
+        self.connections += 1
+        try:
+            while True:
+                header_data = await reader.readuntil(b"\r\n\r\n")
+                request_line = header_data.split(b"\r\n", 1)[0].decode()
+                path = request_line.split(" ")[1]
+                content_length = 0
+                for line in header_data.split(b"\r\n"):
+                    if line.lower().startswith(b"content-length:"):
+                        content_length = int(line.split(b":", 1)[1].strip())
+                body = json.loads(await reader.readexactly(content_length)) if content_length else {}
+                self.requests.append({"path": path, "body": body})
+
+                status, payload, headers, delay = self.handler(path, body)
+                if delay:
+                    await asyncio.sleep(delay)
+                data = json.dumps(payload).encode()
+                extra = "".join(f"{name}: {value}\r\n" for name, value in headers.items())
+                writer.write(
+                    f"HTTP/1.1 {status} X\r\nContent-Type: application/json\r\nConnection: keep-alive\r\n{extra}"
+                    f"Content-Length: {len(data)}\r\n\r\n".encode() + data
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self) -> str:
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}/v1"
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
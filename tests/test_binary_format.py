@@ -0,0 +1,165 @@
+# File: tests/test_binary_format.py
+# 최소 ELF / PE / Mach-O 바이너리를 직접 만들어 라이브러리, 임포트, 익스포트, 섹션 추출을 검증하고
+# 손상되거나 잘린 입력에서도 parse_binary가 예외 없이 None 또는 BinaryInfo를 반환하는지 퍼징합니다.
+
+import random
+import struct
+
+import pytest
+
+from pqc_inspector_server.services.binary_format import BinaryInfo, detect_format, parse_binary
+
+
+def string_table(*names):
+    """NUL 종료 문자열 테이블과 이름별 오프셋을 반환합니다."""
+    table, offsets = b"\0", {}
+    for name in names:
+        offsets[name] = len(table)
+        table += name.encode() + b"\0"
+    return table, offsets
+
+
+def build_elf64() -> bytes:
+    """libcrypto.so.3을 링크하고 RSA_generate_key_ex를 임포트, sign_blob을 익스포트하는 ELF64 공유 라이브러리"""
+    shstrtab, shnames = string_table(".shstrtab", ".dynstr", ".dynsym", ".dynamic", ".text")
+    dynstr, names = string_table("libcrypto.so.3", "RSA_generate_key_ex", "sign_blob")
+    dynsym = bytes(24)  # 0번 심볼은 비어 있습니다.
+    dynsym += struct.pack("<IBBHQQ", names["RSA_generate_key_ex"], (1 << 4) | 2, 0, 0, 0, 0)  # 정의되지 않은 전역 함수
+    dynsym += struct.pack("<IBBHQQ", names["sign_blob"], (1 << 4) | 2, 0, 5, 0x1000, 16)  # .text에 정의된 전역 함수
+    dynamic = struct.pack("<qQ", 1, names["libcrypto.so.3"]) + struct.pack("<qQ", 0, 0)
+    text = b"\x90" * 16
+
+    body = b""
+    layout = {}
+    for name, data in (("shstrtab", shstrtab), ("dynstr", dynstr), ("dynsym", dynsym), ("dynamic", dynamic), ("text", text)):
+        layout[name] = (64 + len(body), len(data))
+        body += data
+    shoff = 64 + len(body)
+
+    def section(name, kind, key, link=0, entsize=0):
+        offset, size = layout[key]
+        return struct.pack("<IIQQQQIIQQ", shnames[name], kind, 0, 0, offset, size, link, 0, 1, entsize)
+
+    headers = bytes(64)
+    headers += section(".shstrtab", 3, "shstrtab")
+    headers += section(".dynstr", 3, "dynstr")
+    headers += section(".dynsym", 11, "dynsym", link=2, entsize=24)
+    headers += section(".dynamic", 6, "dynamic", link=2, entsize=16)
+    headers += section(".text", 1, "text")
+
+    ident = b"\x7fELF" + bytes([2, 1, 1]) + bytes(9)
+    header = ident + struct.pack("<HHIQQQIHHHHHH", 3, 0x3e, 1, 0, 0, shoff, 0, 64, 0, 0, 64, 6, 1)
+    return header + body + headers
+
+
+def build_pe64() -> bytes:
+    """bcrypt.dll에서 BCryptGenRandom과 서수 5번을 임포트하는 PE32+ DLL"""
+    pe_offset = 0x40
+    optional_size = 112 + 16 * 8
+    section_table = pe_offset + 24 + optional_size
+    data = bytearray(0x400)
+    data[0:2] = b"MZ"
+    struct.pack_into("<I", data, 0x3c, pe_offset)
+    data[pe_offset:pe_offset + 4] = b"PE\0\0"
+    struct.pack_into("<HHIIIHH", data, pe_offset + 4, 0x8664, 1, 0, 0, 0, optional_size, 0x2000)
+    optional = pe_offset + 24
+    struct.pack_into("<H", data, optional, 0x20b)
+    struct.pack_into("<Q", data, optional + 24, 0x180000000)
+    struct.pack_into("<I", data, optional + 108, 16)
+    struct.pack_into("<II", data, optional + 112 + 8, 0x1000, 40)  # 1번 디렉터리: 임포트
+    struct.pack_into("<8sIIII", data, section_table, b".rdata", 0x200, 0x1000, 0x200, 0x200)
+
+    def at(rva):
+        return rva - 0x1000 + 0x200
+
+    struct.pack_into("<IIIII", data, at(0x1000), 0x1040, 0, 0, 0x1080, 0x1040)
+    struct.pack_into("<QQQ", data, at(0x1040), 0x10a0, (1 << 63) | 5, 0)
+    data[at(0x1080):at(0x1080) + 11] = b"BCRYPT.dll\0"
+    data[at(0x10a2):at(0x10a2) + 16] = b"BCryptGenRandom\0"
+    return bytes(data)
+
+
+def build_macho64() -> bytes:
+    """libcrypto.3.dylib를 링크하고 _EVP_PKEY_sign을 임포트, _sign_blob을 익스포트하는 Mach-O 64비트 동적 라이브러리"""
+    dylib_path = b"/usr/lib/libcrypto.3.dylib\0"
+    dylib_path += bytes(-(24 + len(dylib_path)) % 8)
+    segment = struct.pack("<II16sQQQQiiII", 0x19, 72 + 80, b"__TEXT", 0, 0x1000, 0, 0x1000, 5, 5, 1, 0)
+    text_offset = 0x200
+    segment += struct.pack("<16s16sQQIIIIIIII", b"__text", b"__TEXT", 0, 16, text_offset, 0, 0, 0, 0x80000400, 0, 0, 0)
+    dylib = struct.pack("<IIIIII", 0xc, 24 + len(dylib_path), 24, 0, 0, 0) + dylib_path
+    strings, names = string_table("_EVP_PKEY_sign", "_sign_blob")
+    symbol_offset = 0x300
+    symtab = struct.pack("<IIIIII", 0x2, 24, symbol_offset, 2, symbol_offset + 32, len(strings))
+    commands = segment + dylib + symtab
+    header = struct.pack("<IiiIIIII", 0xfeedfacf, 0x0100000c, 0, 6, 3, len(commands), 0, 0)
+
+    data = bytearray(0x400)
+    data[:len(header) + len(commands)] = header + commands
+    data[text_offset:text_offset + 16] = b"\x1f\x20\x03\xd5" * 4
+    struct.pack_into("<IBBHQ", data, symbol_offset, names["_EVP_PKEY_sign"], 0x01, 0, 0, 0)
+    struct.pack_into("<IBBHQ", data, symbol_offset + 16, names["_sign_blob"], 0x0f, 1, 0, 0)
+    data[symbol_offset + 32:symbol_offset + 32 + len(strings)] = strings
+    return bytes(data)
+
+
+def test_parses_elf_libraries_symbols_and_sections():
+    info = parse_binary(build_elf64())
+    assert info.describe() == "ELF 64-bit x86-64 공유 라이브러리"
+    assert info.libraries == ["libcrypto.so.3"]
+    assert info.imports == ["RSA_generate_key_ex"]
+    assert info.exports == ["sign_blob"]
+    assert [name for name, _, _ in info.sections] == [".shstrtab", ".dynstr", ".dynsym", ".dynamic", ".text"]
+
+
+def test_parses_pe_imports_by_name_and_ordinal():
+    info = parse_binary(build_pe64())
+    assert info.describe() == "PE 64-bit x86-64 DLL"
+    assert info.libraries == ["bcrypt.dll"]
+    assert info.imports == ["bcrypt.dll!BCryptGenRandom", "bcrypt.dll!#5"]
+    assert info.sections == [(".rdata", 0x200, 0x400)]
+
+
+def test_parses_macho_dylibs_symbols_and_sections():
+    info = parse_binary(build_macho64())
+    assert info.describe() == "Mach-O 64-bit ARM64 동적 라이브러리"
+    assert info.libraries == ["/usr/lib/libcrypto.3.dylib"]
+    assert info.imports == ["EVP_PKEY_sign"]
+    assert info.exports == ["sign_blob"]
+    assert info.sections == [("__TEXT,__text", 0x200, 0x210)]
+
+
+def test_unknown_or_java_class_input_is_not_a_binary():
+    assert detect_format(b"#!/bin/sh\n") is None
+    assert parse_binary(b"") is None
+    # Java 클래스 파일은 유니버설 바이너리와 매직이 같지만 아키텍처 수로 구분됩니다.
+    assert parse_binary(b"\xca\xfe\xba\xbe\x00\x00\x00\x34" + bytes(64)) is None
+
+
+def test_accepts_memoryview_input():
+    data = bytearray(build_elf64())
+    assert parse_binary(memoryview(data)).libraries == ["libcrypto.so.3"]
+
+
+@pytest.mark.parametrize("build", [build_elf64, build_pe64, build_macho64])
+def test_corrupted_and_truncated_binaries_never_raise(build):
+    original = build()
+    rng = random.Random(len(original))
+    for _ in range(1500):
+        data = bytearray(original)
+        for _ in range(rng.randint(1, 8)):
+            position = rng.randrange(4, len(data))
+            data[position] = rng.choice((0x00, 0xff, 0x7f, 0x80, rng.randrange(256)))
+        if rng.random() < 0.3:
+            data = data[:rng.randint(4, len(data))]
+        info = parse_binary(bytes(data))
+        assert info is None or isinstance(info, BinaryInfo)
+
+
+def test_random_bytes_after_magic_never_raise():
+    rng = random.Random(11)
+    magics = [b"\x7fELF\x01\x01", b"\x7fELF\x02\x02", b"MZ", b"\xcf\xfa\xed\xfe", b"\xce\xfa\xed\xfe",
+              b"\xfe\xed\xfa\xcf", b"\xca\xfe\xba\xbe", b"\xca\xfe\xba\xbf"]
+    for _ in range(3000):
+        data = rng.choice(magics) + bytes(rng.randrange(256) for _ in range(rng.randint(0, 300)))
+        info = parse_binary(data)
+        assert info is None or isinstance(info, BinaryInfo)
@@ -0,0 +1,88 @@
+# File: tests/test_binary_strings.py
+# 바이너리 문자열 추출(NumPy/정규식 경로 일치, 블록 경계, UTF-16LE, 섹션)과
+# 바이너리 에이전트가 파일 전체 스캔(헤더 파싱, 문자열 추출, 암호 상수 스캔)을 이벤트 루프 밖에서 실행하는지 검증합니다.
+
+import asyncio
+import json
+import random
+import threading
+
+import pytest
+
+from pqc_inspector_server.agents import assembly_binary
+from pqc_inspector_server.agents.assembly_binary import AssemblyBinaryAgent
+from pqc_inspector_server.services import preprocessing
+from pqc_inspector_server.services.preprocessing import extract_strings, extract_strings_from_file
+from tests.fakes import FakeAIService
+
+
+def as_tuples(strings):
+    return [(extracted.offset, extracted.text, extracted.encoding, extracted.section) for extracted in strings]
+
+
+def test_extracts_ascii_and_utf16_in_offset_order():
+    data = b"\x00\x01RSA_generate_key\x00\xff" + "CertOpenStore".encode("utf-16-le") + b"\x00\x00ab\x00"
+    strings = extract_strings(data, min_length=4)
+    assert [(extracted.text, extracted.encoding) for extracted in strings] == [
+        ("RSA_generate_key", "ascii"), ("CertOpenStore", "utf-16le")
+    ]
+    assert strings[0].offset == 2
+    assert extract_strings(data, min_length=4, utf16=False)[-1].text == "RSA_generate_key"
+
+
+def test_sections_are_attached_by_offset():
+    data = b"AAAA\x00" + b"\x00" * 11 + b"BBBB\x00"
+    strings = extract_strings(data, sections=[(".text", 0, 8), (".rodata", 16, 32)])
+    assert [(extracted.text, extracted.section) for extracted in strings] == [("AAAA", ".text"), ("BBBB", ".rodata")]
+
+
+@pytest.mark.skipif(not preprocessing.NUMPY_AVAILABLE, reason="numpy 미설치")
+def test_numpy_and_regex_paths_agree_on_random_data(monkeypatch):
+    # 블록 크기를 작게 줄여 블록 경계를 넘는 문자열도 검사합니다.
+    monkeypatch.setattr(preprocessing, "MASK_BLOCK_BYTES", 64)
+    rng = random.Random(5)
+    alphabet = [b"\x00", b"\x07", b"\xff", b"A", b"z", b" ", b"~"]
+    for _ in range(300):
+        data = b"".join(rng.choice(alphabet) for _ in range(rng.randint(0, 600)))
+        min_length = rng.randint(1, 6)
+        view = memoryview(data)
+        expected = sorted(as_tuples(preprocessing._extract_with_regex(view, min_length, True)))
+        actual = sorted(as_tuples(preprocessing._extract_with_numpy(view, min_length, True)))
+        assert actual == expected
+
+
+def test_extract_from_file_uses_mmap_and_handles_empty_file(tmp_path):
+    path = tmp_path / "sample.bin"
+    path.write_bytes(b"\x00" * 10 + b"OpenSSL 3.0\x00")
+    assert [extracted.text for extracted in extract_strings_from_file(str(path))] == ["OpenSSL 3.0"]
+
+    empty = tmp_path / "empty.bin"
+    empty.write_bytes(b"")
+    assert extract_strings_from_file(str(empty)) == []
+
+
+def test_binary_agent_runs_whole_file_passes_off_the_event_loop(monkeypatch, settings):
+    settings.set(LLM_CASCADE_ENABLED=False, CONSTANT_SCAN_ENABLED=True, BINARY_FORMAT_PARSING_ENABLED=True)
+    answer = {"is_pqc_vulnerable": True, "vulnerability_details": "RSA", "detected_algorithms": ["RSA"],
+              "recommendations": "ML-KEM", "evidence": "RSA_generate_key", "confidence_score": 0.9}
+    agent = AssemblyBinaryAgent(ai_service=FakeAIService(content=json.dumps(answer)))
+    threads = {}
+
+    def recording(name, function):
+        def wrapper(*args, **kwargs):
+            threads[name] = threading.current_thread() is threading.main_thread()
+            return function(*args, **kwargs)
+        return wrapper
+
+    async def no_rag(*args, **kwargs):
+        return ""
+
+    agent._get_rag_context = no_rag
+    agent._extract_strings_from_binary = recording("strings", agent._extract_strings_from_binary)
+    monkeypatch.setattr(assembly_binary, "parse_binary", recording("headers", assembly_binary.parse_binary))
+    constant_scanner = assembly_binary.get_constant_scanner()
+    monkeypatch.setattr(constant_scanner, "scan", recording("constants", constant_scanner.scan))
+
+    result = asyncio.run(agent.analyze(b"\x7fELF" + b"\x00" * 64 + b"RSA_generate_key_ex\x00", "libfoo.so"))
+    assert result["is_pqc_vulnerable"] is True
+    assert threads == {"headers": False, "strings": False, "constants": False}
@@ -0,0 +1,121 @@
+# File: tests/test_bulk_ingest.py
+# 문서 청크 대량 수집 경로를 검증합니다: 제공자 한도에 맞춘 배치 분할, 동시 배치 수 제한과 재시도,
+# 대량 upsert(같은 ID 재수집 시 덮어쓰기)와 실패 청크 집계.
+
+import asyncio
+
+import pytest
+
+from pqc_inspector_server.services import embedding_service as embedding_module
+from pqc_inspector_server.services.embedding_cache import get_embedding_cache
+from pqc_inspector_server.services.embedding_service import EmbeddingService, split_embedding_batches
+from pqc_inspector_server.services.knowledge_manager import KnowledgeManager
+from pqc_inspector_server.services.rate_limiter import estimate_tokens
+from pqc_inspector_server.services.vector_store import VectorStore
+
+
+@pytest.fixture
+def service(settings):
+    """디스크 캐시와 요청 한도 없이 동작하는 임베딩 서비스"""
+    settings.set(EMBEDDING_CACHE_ENABLED=False, LLM_RATE_LIMIT_ENABLED=False, LLM_RETRY_BASE_DELAY=0.0,
+                 EMBEDDING_BACKEND="openai")
+    get_embedding_cache.cache_clear()
+    yield EmbeddingService()
+    get_embedding_cache.cache_clear()
+
+
+def vector_for(text: str):
+    return [float(len(text)), 1.0, 0.5]
+
+
+def test_split_respects_text_and_token_limits():
+    assert split_embedding_batches([], 3, 100) == []
+    assert split_embedding_batches(["a"] * 7, 3, 10000) == [(0, 3), (3, 6), (6, 7)]
+
+    texts = ["x" * 400, "y" * 400, "z" * 400]
+    per_text = estimate_tokens(texts[0])
+    assert split_embedding_batches(texts, 10, per_text * 2) == [(0, 2), (2, 3)]
+    # 토큰 한도보다 큰 텍스트 하나는 단독 배치가 됩니다.
+    assert split_embedding_batches(["a", "b" * 4000, "c"], 10, 50) == [(0, 1), (1, 2), (2, 3)]
+
+
+def test_batched_embeddings_dedupe_keep_order_and_cap_concurrency(service, settings):
+    settings.set(EMBEDDING_BATCH_SIZE=3, EMBEDDING_MAX_CONCURRENCY=2)
+    batches, in_flight, peak = [], [0], [0]
+
+    async def fake_request(texts):
+        batches.append(list(texts))
+        in_flight[0] += 1
+        peak[0] = max(peak[0], in_flight[0])
+        await asyncio.sleep(0.01)
+        in_flight[0] -= 1
+        return [vector_for(text) for text in texts]
+
+    service._request_embeddings = fake_request
+    texts = [f"chunk-{index}" for index in range(10)] + ["chunk-1", "chunk-2"]
+    results = asyncio.run(service.create_embeddings_batched(texts))
+
+    assert results == [vector_for(text) for text in texts]
+    assert sorted(len(batch) for batch in batches) == [1, 3, 3, 3]
+    assert sum(len(batch) for batch in batches) == 10
+    assert peak[0] == 2
+
+
+def test_failed_batch_is_retried_then_reported_as_none(service, settings):
+    settings.set(EMBEDDING_BATCH_SIZE=2, LLM_RETRY_MAX_ATTEMPTS=3)
+    attempts = []
+
+    async def fake_request(texts):
+        attempts.append(list(texts))
+        if "bad" in texts:
+            return []
+        return [vector_for(text) for text in texts]
+
+    service._request_embeddings = fake_request
+    results = asyncio.run(service.create_embeddings_batched(["ok-1", "ok-2", "bad", "ok-3"]))
+
+    assert results[:2] == [vector_for("ok-1"), vector_for("ok-2")]
+    assert results[2:] == [None, None]
+    assert attempts.count(["bad", "ok-3"]) == 3
+
+
+class FakeBatchedEmbeddings:
+    """create_embeddings_batched만 제공하며 'fail'이 들어간 텍스트는 None을 반환합니다."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def create_embeddings_batched(self, texts):
+        self.calls.append(list(texts))
+        return [None if "fail" in text else vector_for(text) for text in texts]
+
+
+def test_bulk_ingest_upserts_in_batches_and_overwrites_same_ids(service, settings, tmp_path):
+    settings.set(VECTOR_STORE_WRITE_BATCH_SIZE=2)
+    store = VectorStore("bulk_ingest_test", persist_directory=str(tmp_path), embedding_model="test-model")
+    manager = KnowledgeManager("source_code", store)
+    manager.embedding_service = FakeBatchedEmbeddings()
+    items = [
+        {"content": f"RSA chunk {index}", "type": "document_chunk", "category": "doc_test", "source": "test",
+         "metadata": {"chunk_index": index}, "id": f"file_{index}"}
+        for index in range(5)
+    ]
+    items.append({"content": "fail chunk", "type": "document_chunk", "category": "doc_test", "id": "file_fail"})
+
+    stats = asyncio.run(manager.add_knowledge_bulk(items))
+    assert (stats["total"], stats["stored"], stats["failed"]) == (6, 5, 1)
+    assert manager.embedding_service.calls == [[item["content"] for item in items]]
+
+    # 같은 파일을 다시 수집하면 같은 ID를 덮어쓰므로 문서 수가 늘지 않습니다.
+    asyncio.run(manager.add_knowledge_bulk(items))
+    assert store.collection.count() == 5
+    stored = store.collection.get(ids=["file_3"], include=["metadatas"])
+    assert stored["metadatas"][0]["chunk_index"] == 3
+    assert stored["metadatas"][0]["type"] == "document_chunk"
+
+
+def test_embedding_model_name_follows_backend(settings):
+    settings.set(EMBEDDING_BACKEND="local", LOCAL_EMBEDDING_MODEL="local-model")
+    assert embedding_module.get_embedding_model_name() == "local-model"
+    settings.set(EMBEDDING_BACKEND="openai", OPENAI_EMBEDDING_MODEL="text-embedding-3-large")
+    assert embedding_module.get_embedding_model_name() == "text-embedding-3-large"
@@ -0,0 +1,117 @@
+# File: tests/test_chroma_executor.py
+# Chroma 호출이 제한된 전용 스레드 풀에서 실행되는지와, 이벤트 루프 지연 모니터의 측정/통계를 검증합니다.
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from pqc_inspector_server.services.loop_monitor import EventLoopLagMonitor
+from pqc_inspector_server.services.vector_store import VectorStore, get_chroma_executor, run_in_chroma_executor
+
+
+@pytest.fixture
+def chroma_threads(settings):
+    """설정한 스레드 수로 Chroma 실행기를 새로 만들고, 끝나면 정리합니다."""
+
+    def configure(threads: int):
+        settings.set(VECTOR_STORE_EXECUTOR_THREADS=threads)
+        get_chroma_executor.cache_clear()
+
+    yield configure
+    executor = get_chroma_executor()
+    if executor is not None:
+        executor.shutdown(wait=True)
+    get_chroma_executor.cache_clear()
+
+
+def test_calls_run_on_bounded_chroma_threads(chroma_threads):
+    chroma_threads(2)
+    running, peak, lock = [0], [0], threading.Lock()
+
+    def blocking_call(value):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.02)
+        with lock:
+            running[0] -= 1
+        return value, threading.current_thread().name
+
+    async def scenario():
+        return await asyncio.gather(*(run_in_chroma_executor(blocking_call, index) for index in range(6)))
+
+    results = asyncio.run(scenario())
+    assert [value for value, _ in results] == list(range(6))
+    assert all(name.startswith("chroma") for _, name in results)
+    assert peak[0] == 2
+
+
+def test_zero_threads_runs_inline(chroma_threads):
+    chroma_threads(0)
+    assert get_chroma_executor() is None
+    on_main = asyncio.run(run_in_chroma_executor(lambda: threading.current_thread() is threading.main_thread()))
+    assert on_main is True
+
+
+def test_vector_store_search_keeps_loop_responsive(chroma_threads, tmp_path):
+    chroma_threads(2)
+    store = VectorStore("executor_test", persist_directory=str(tmp_path), embedding_model="model")
+    calls = []
+
+    def slow_search(*args):
+        calls.append(threading.current_thread().name)
+        time.sleep(0.2)
+        return {"documents": ["RSA"], "metadatas": [{}], "distances": [0.0], "ids": ["id-1"]}
+
+    store._search_similar = slow_search
+
+    async def scenario():
+        monitor = EventLoopLagMonitor(interval_ms=10, warn_ms=float("inf"))
+        monitor.start()
+        results = await asyncio.gather(store.search_similar([1.0]), store.search_similar([1.0]))
+        await monitor.stop()
+        return results, monitor.get_stats()
+
+    results, stats = asyncio.run(scenario())
+    assert [result["ids"] for result in results] == [["id-1"], ["id-1"]]
+    assert all(name.startswith("chroma") for name in calls)
+    # 검색이 루프에서 실행되었다면 200ms 가까이 막혔을 것입니다.
+    assert stats["samples"] > 0 and stats["max_lag_ms"] < 150
+
+
+def test_monitor_records_lag_statistics():
+    monitor = EventLoopLagMonitor(interval_ms=100, warn_ms=50, window=4)
+    for lag in (0.001, 0.002, 0.06, 0.003, 0.004):
+        monitor.record(lag)
+
+    stats = monitor.get_stats()
+    assert (stats["samples"], stats["stalls"], stats["running"]) == (5, 1, False)
+    assert stats["max_lag_ms"] == pytest.approx(60.0)
+    assert stats["avg_lag_ms"] == pytest.approx(14.0)
+    # 백분위수는 최근 window개 샘플만 사용합니다.
+    assert stats["recent_max_lag_ms"] == pytest.approx(60.0)
+    assert stats["recent_p50_lag_ms"] == pytest.approx(4.0)
+
+    monitor.reset()
+    assert monitor.get_stats()["samples"] == 0 and monitor.get_stats()["recent_p99_lag_ms"] == 0.0
+
+
+def test_monitor_detects_a_blocked_loop():
+    monitor = EventLoopLagMonitor(interval_ms=10, warn_ms=100)
+
+    async def scenario():
+        monitor.start()
+        monitor.start()  # 두 번 시작해도 작업은 하나입니다.
+        await asyncio.sleep(0.03)
+        time.sleep(0.2)  # 루프를 막는 동기 호출
+        await asyncio.sleep(0.03)
+        running = monitor.get_stats()["running"]
+        await monitor.stop()
+        return running
+
+    assert asyncio.run(scenario()) is True
+    stats = monitor.get_stats()
+    assert stats["running"] is False
+    assert stats["stalls"] >= 1 and stats["max_lag_ms"] >= 100
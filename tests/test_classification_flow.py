@@ -0,0 +1,84 @@
+# File: tests/test_classification_flow.py
+# 파일 분류를 한 번만 수행하고, 로컬 분류기가 확신하지 못하면 AI 분류 결과로 사전 필터와 에이전트를 고르는지 검증합니다.
+
+import asyncio
+
+from pqc_inspector_server.orchestrator import controller as controller_module
+from pqc_inspector_server.orchestrator.controller import OrchestratorController
+from pqc_inspector_server.services.file_classifier import ClassificationResult
+from pqc_inspector_server.services.result_store import MemoryResultStore
+from tests.fakes import FakeAgent, FakeAIService, FakeAPIClient
+
+CLEAN_TEXT = b"hello world\nnothing to see here\n"
+
+
+class StubClassifier:
+    def __init__(self, file_type: str, confidence: float):
+        self.result = ClassificationResult(file_type, confidence, "local", ["stub"])
+        self.calls = 0
+
+    def classify(self, filename, content):
+        self.calls += 1
+        return self.result
+
+
+def run_analysis(monkeypatch, classifier, llm_type="logs_config", content=CLEAN_TEXT, filename="notes.py"):
+    monkeypatch.setattr(controller_module, "get_file_classifier", lambda: classifier)
+    ai_service = FakeAIService(content=f'{{"file_type": "{llm_type}", "confidence": 0.9, "reasoning": "stub"}}')
+    agents = {name: FakeAgent() for name in ("source_code", "assembly_binary", "logs_config")}
+    store = MemoryResultStore()
+    controller = OrchestratorController(FakeAPIClient({}), agents=agents, ai_service=ai_service, result_store=store)
+
+    async def scenario():
+        await store.create("t1")
+        await controller._run_analysis(filename, content, "t1")
+        return await store.get("t1")
+
+    record = asyncio.run(scenario())
+    return record, ai_service, agents
+
+
+def test_confident_local_classification_skips_llm(monkeypatch, settings):
+    settings.set(FILE_CLASSIFIER_ENABLED=True, FILE_CLASSIFIER_CONFIDENCE_THRESHOLD=0.8)
+    classifier = StubClassifier("source_code", 0.95)
+    record, ai_service, _ = run_analysis(monkeypatch, classifier)
+
+    assert classifier.calls == 1
+    assert ai_service.calls == []
+    assert record["result"]["file_type"] == "source_code"
+    assert record["result"]["verdict_source"] == "prefilter"
+
+
+def test_unsure_local_classification_falls_back_to_llm_before_prefilter(monkeypatch, settings):
+    settings.set(FILE_CLASSIFIER_ENABLED=True, FILE_CLASSIFIER_CONFIDENCE_THRESHOLD=0.8)
+    classifier = StubClassifier("source_code", 0.3)
+    record, ai_service, _ = run_analysis(monkeypatch, classifier, llm_type="logs_config")
+
+    assert classifier.calls == 1
+    assert len(ai_service.calls) == 1 and ai_service.calls[0]["role"] == "orchestrator"
+    # 사전 필터 판정도 AI가 정한 타입으로 기록되어야 합니다.
+    assert record["result"]["file_type"] == "logs_config"
+
+
+def test_disabled_classifier_is_not_used(monkeypatch, settings):
+    settings.set(FILE_CLASSIFIER_ENABLED=False)
+    classifier = StubClassifier("source_code", 1.0)
+    record, ai_service, _ = run_analysis(monkeypatch, classifier, llm_type="logs_config")
+
+    assert classifier.calls == 0
+    assert len(ai_service.calls) == 1
+    assert record["result"]["file_type"] == "logs_config"
+
+
+def test_unprefiltered_file_uses_the_same_classification(monkeypatch, settings):
+    settings.set(FILE_CLASSIFIER_ENABLED=True, FILE_CLASSIFIER_CONFIDENCE_THRESHOLD=0.8)
+    classifier = StubClassifier("source_code", 0.95)
+    record, ai_service, agents = run_analysis(
+        monkeypatch, classifier, content=b"key = RSA.generate(2048)\n", filename="keys.py"
+    )
+
+    assert classifier.calls == 1
+    assert agents["source_code"].calls == ["keys.py"]
+    assert agents["logs_config"].calls == [] and agents["assembly_binary"].calls == []
+    assert record["result"]["file_type"] == "source_code"
+    assert not any("파일 분류 전문가" in call.get("system_prompt", "") for call in ai_service.calls)
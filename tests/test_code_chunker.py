@@ -0,0 +1,149 @@
+# File: tests/test_code_chunker.py
+# 소스코드 청크 분할(경계/크기/줄 번호), 관련도 선별, 청크 결과 병합 규칙과
+# 에이전트가 청크 분할/스캔을 이벤트 루프 밖에서, 사전 필터 통계 없이 한 번만 수행하는지 검증합니다.
+
+import asyncio
+import json
+import random
+import threading
+
+from pqc_inspector_server.agents.source_code import SourceCodeAgent
+from pqc_inspector_server.services.code_chunker import (
+    CodeChunk, merge_chunk_results, score_chunks, select_chunks, split_code_chunks
+)
+from pqc_inspector_server.services.signature_scanner import SignatureScanner, get_signature_scanner
+from tests.fakes import FakeAIService
+
+SOURCE = '''import os
+
+
+def helper(x):
+    return x + 1
+
+
+class KeyManager:
+    def generate(self):
+        return RSA.generate(2048)
+
+
+def unrelated():
+    print("hello")
+'''
+
+
+def lines_of(chunk: CodeChunk, text: str):
+    return "".join(text.splitlines(keepends=True)[chunk.start_line - 1:chunk.end_line])
+
+
+def test_split_on_boundaries_with_correct_line_ranges():
+    chunks = split_code_chunks(SOURCE, max_chars=60)
+    assert len(chunks) > 1
+    assert "".join(chunk.text for chunk in chunks).strip() == SOURCE.strip()
+    for chunk in chunks:
+        assert lines_of(chunk, SOURCE).strip() == chunk.text.strip()
+    assert any(chunk.text.lstrip().startswith("class KeyManager") for chunk in chunks)
+
+
+def test_small_segments_are_merged_into_one_chunk():
+    chunks = split_code_chunks(SOURCE, max_chars=10000)
+    assert len(chunks) == 1 and chunks[0].start_line == 1
+
+
+def test_random_text_chunks_respect_size_and_cover_input():
+    rng = random.Random(3)
+    words = ["def f():", "class C:", "    x = 1", "return y", "", "func g() {", "}", "a" * 300]
+    for _ in range(100):
+        text = "\n".join(rng.choice(words) for _ in range(rng.randint(0, 60)))
+        max_chars = rng.randint(20, 200)
+        chunks = split_code_chunks(text, max_chars=max_chars)
+        assert all(len(chunk.text) <= max_chars for chunk in chunks)
+        assert "".join(chunk.text for chunk in chunks).replace(" ", "").replace("\n", "") == \
+            text.replace(" ", "").replace("\n", "")
+        assert [chunk.index for chunk in chunks] == list(range(len(chunks)))
+        for chunk in chunks:
+            assert chunk.start_line <= chunk.end_line
+
+
+def test_score_and_select_prefer_public_key_chunks():
+    scanner = SignatureScanner([])
+    chunks = score_chunks(split_code_chunks(SOURCE, max_chars=60), scanner)
+    selected = select_chunks(chunks, max_chunks=1, token_budget=1000)
+    assert len(selected) == 1 and "RSA" in selected[0].text
+    assert all(chunk.score == 0 for chunk in chunks if "hello" in chunk.text)
+    # 청크 스캔은 사전 필터 통계에 들어가지 않고, 결과는 청크에 남아 캐스케이드 판단에 재사용됩니다.
+    assert scanner.stats["scanned"] == 0
+    assert all(chunk.scan is not None and chunk.scan["has_hits"] == bool(chunk.score) for chunk in chunks)
+
+
+def test_select_respects_budget_and_file_order():
+    chunks = [CodeChunk(index, index + 1, index + 1, "x" * 40, score=score) for index, score in enumerate([1, 5, 3, 0])]
+    selected = select_chunks(chunks, max_chunks=3, token_budget=25)
+    assert [chunk.index for chunk in selected] == [1, 2]
+    assert select_chunks(chunks, max_chunks=5, token_budget=1000)[-1].index == 2
+
+
+def make_chunks(count):
+    return [CodeChunk(index, index * 10 + 1, index * 10 + 9, "code") for index in range(count)]
+
+
+def test_merge_prefers_vulnerable_chunks_and_deduplicates():
+    results = [
+        {"is_pqc_vulnerable": False, "confidence_score": 0.9, "detected_algorithms": []},
+        {"is_pqc_vulnerable": True, "confidence_score": 0.7, "detected_algorithms": ["RSA"], "recommendations": "ML-KEM"},
+        {"is_pqc_vulnerable": True, "confidence_score": 0.8, "detected_algorithms": ["RSA", "ECDSA"], "recommendations": "ML-KEM"},
+    ]
+    merged = merge_chunk_results(results, make_chunks(3), total_chunks=5)
+    assert merged["is_pqc_vulnerable"] is True
+    assert merged["confidence_score"] == 0.8
+    assert merged["detected_algorithms"] == ["RSA", "ECDSA"]
+    assert merged["recommendations"] == "ML-KEM"
+    assert "[L11-19]" in merged["evidence"] and "3/3개 성공" in merged["vulnerability_details"]
+
+
+def test_merge_all_safe_uses_minimum_confidence():
+    results = [{"is_pqc_vulnerable": False, "confidence_score": 0.9}, {"is_pqc_vulnerable": False, "confidence_score": 0.6}]
+    merged = merge_chunk_results(results, make_chunks(2), total_chunks=2)
+    assert merged["is_pqc_vulnerable"] is False and merged["confidence_score"] == 0.6
+
+
+def test_merge_accepts_string_confidence_and_skips_invalid_results():
+    results = [
+        {"is_pqc_vulnerable": True, "confidence_score": "0.85", "detected_algorithms": ["RSA"]},
+        {"is_pqc_vulnerable": True, "confidence_score": "high"},
+        {"is_pqc_vulnerable": "unknown", "confidence_score": 0.9},
+        {"is_pqc_vulnerable": False, "confidence_score": 0.0},
+    ]
+    merged = merge_chunk_results(results, make_chunks(4), total_chunks=4)
+    assert merged["is_pqc_vulnerable"] is True and merged["confidence_score"] == 0.85
+    assert "1/4개 성공" in merged["vulnerability_details"]
+
+
+def test_merge_without_valid_results_returns_none():
+    assert merge_chunk_results([{"confidence_score": 0.9}], make_chunks(1), total_chunks=1) is None
+
+
+def test_agent_chunks_off_loop_and_scans_each_chunk_once(settings, monkeypatch):
+    settings.set(SOURCE_CODE_CHUNKING_ENABLED=True, SOURCE_CODE_CHUNK_MAX_CHARS=60, SOURCE_CODE_MAX_CHUNKS=3,
+                 LLM_CASCADE_ENABLED=True, SOURCE_CODE_CASCADE_MODEL="cheap-model")
+    body = json.dumps({"is_pqc_vulnerable": True, "confidence_score": 0.95, "detected_algorithms": ["RSA"]})
+    agent = SourceCodeAgent(ai_service=FakeAIService(content=body))
+
+    async def no_rag(*args, **kwargs):
+        return ""
+
+    monkeypatch.setattr(agent, "_get_rag_context", no_rag)
+    scanner = get_signature_scanner()
+    original_scan, scans = scanner.scan, []
+
+    def recording_scan(content, record_stats=True):
+        scans.append((threading.current_thread() is threading.main_thread(), record_stats))
+        return original_scan(content, record_stats=record_stats)
+
+    monkeypatch.setattr(scanner, "scan", recording_scan)
+    before = dict(scanner.stats)
+    result = asyncio.run(agent.analyze(SOURCE.encode(), "keys.py"))
+
+    assert result["is_pqc_vulnerable"] is True
+    assert scans and all(scan == (False, False) for scan in scans)
+    assert len(scans) == len(split_code_chunks(SOURCE, max_chars=60))  # 캐스케이드가 청크를 다시 스캔하지 않습니다.
+    assert scanner.stats == before
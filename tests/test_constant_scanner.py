@@ -0,0 +1,150 @@
+# File: tests/test_constant_scanner.py
+# 암호 상수 스캐너의 패턴 생성, 엔디언별 탐지, NumPy/bytes.find 경로 일치와
+# 사전 필터가 상수 스캔을 이벤트 루프 밖에서 한 번만 실행하고 결과를 에이전트와 공유하는지 검증합니다.
+
+import asyncio
+import json
+import random
+import threading
+
+import pytest
+
+from pqc_inspector_server.agents.assembly_binary import AssemblyBinaryAgent
+from pqc_inspector_server.orchestrator.controller import OrchestratorController
+from pqc_inspector_server.services import constant_scanner
+from pqc_inspector_server.services.constant_scanner import (
+    ConstantPattern, ConstantScanner, constant_signature_hits, format_constant_evidence, load_constant_patterns
+)
+from tests.fakes import FakeAgent, FakeAIService, FakeAPIClient
+
+DATABASE = "data/rag_knowledge_base/assembly_binary/crypto_constants_database.json"
+P256_PRIME = bytes.fromhex("ffffffff00000001000000000000000000000000ffffffffffffffffffffffff")
+SHA256_H0 = bytes.fromhex("6a09e667")
+
+
+def noise(size: int, seed: int = 0) -> bytes:
+    # 0x00과 0x90만 사용하여 데이터베이스의 상수와 우연히 일치하지 않게 합니다.
+    rng = random.Random(seed)
+    return bytes(rng.choice((0x00, 0x90)) for _ in range(size))
+
+
+def synthetic_pattern(pattern: bytes, algorithm: str = "X") -> ConstantPattern:
+    return ConstantPattern(pattern, "test", algorithm, pattern.hex(), "big-endian", True, 0.9, False)
+
+
+def test_database_patterns_cover_both_byte_orders():
+    patterns = load_constant_patterns(DATABASE)
+    encodings = {(constant.algorithm, constant.encoding) for constant in patterns}
+    assert {("SHA-256", "big-endian"), ("SHA-256", "little-endian"), ("RSA", "little-endian")} <= encodings
+    assert all(len(constant.pattern) >= constant_scanner.MIN_PATTERN_BYTES for constant in patterns)
+    # 0x00010001은 바이트 종류가 적어 약한 패턴으로 분류됩니다.
+    assert all(constant.weak for constant in patterns if constant.value == "0x00010001")
+
+
+def test_detects_big_and_little_endian_constants_with_offsets():
+    scanner = ConstantScanner(load_constant_patterns(DATABASE))
+    data = noise(100) + P256_PRIME + noise(37, 1) + SHA256_H0[::-1] + noise(20, 2)
+    scan = scanner.scan(data)
+
+    by_encoding = {(hit["algorithm"], hit["encoding"]): hit for hit in scan["hits"]}
+    assert by_encoding[("ECDSA_P256", "big-endian")]["offsets"] == [100]
+    assert by_encoding[("SHA-256", "little-endian")]["offsets"] == [100 + len(P256_PRIME) + 37]
+    assert scan["algorithms"]["ECDSA_P256"]["quantum_vulnerable"] is True
+    assert scan["scanned_bytes"] == len(data)
+    assert {"const:ecdsa_p256", "const:sha-256"} <= {hit["signature"] for hit in constant_signature_hits(scan)}
+
+
+def test_weak_only_hits_are_not_signature_hits():
+    scanner = ConstantScanner(load_constant_patterns(DATABASE))
+    scan = scanner.scan(noise(64) + (65537).to_bytes(4, "little") + noise(64, 1))
+    assert scan["has_hits"] and scan["algorithms"]["RSA"]["strong_hits"] == 0
+    assert constant_signature_hits(scan) == []
+    assert "약한 패턴" in format_constant_evidence(scan)[0]
+
+
+def test_evidence_lists_strong_hits_first():
+    scanner = ConstantScanner(load_constant_patterns(DATABASE))
+    scan = scanner.scan((65537).to_bytes(4, "big") + noise(16) + P256_PRIME)
+    lines = format_constant_evidence(scan)
+    assert lines[0].startswith("ECDSA_P256")
+    assert lines[-1].startswith("RSA")
+
+
+def test_accepts_memoryview_and_empty_input():
+    scanner = ConstantScanner([synthetic_pattern(b"\x11\x22\x33\x44\x55")])
+    data = bytearray(b"\x00\x11\x22\x33\x44\x55\x00")
+    assert scanner.scan(memoryview(data))["hits"][0]["offsets"] == [1]
+    empty = scanner.scan(b"")
+    assert (empty["has_hits"], empty["hits"], empty["scanned_bytes"]) == (False, [], 0)
+    assert ConstantScanner([]).scan(data)["has_hits"] is False
+
+
+@pytest.mark.skipif(not constant_scanner.NUMPY_AVAILABLE, reason="numpy 미설치")
+def test_numpy_and_find_paths_agree_on_random_data(monkeypatch):
+    # 블록 크기를 작게 줄여 블록 경계에 걸친 패턴도 검사합니다.
+    monkeypatch.setattr(constant_scanner, "SCAN_BLOCK_BYTES", 16)
+    rng = random.Random(3)
+    alphabet = b"\x00\x01\x02\x03"
+    for _ in range(200):
+        patterns = [
+            synthetic_pattern(bytes(rng.choice(alphabet) for _ in range(rng.randint(4, 7))))
+            for _ in range(rng.randint(1, 4))
+        ]
+        scanner = ConstantScanner(patterns)
+        data = memoryview(bytes(rng.choice(alphabet) for _ in range(rng.randint(0, 300))))
+        assert sorted(scanner._match_positions_numpy(data)) == sorted(scanner._match_positions_find(data))
+
+
+def test_prefilter_passes_binary_with_constants_only_and_scans_off_the_loop(settings):
+    settings.set(PREFILTER_ENABLED=True, CONSTANT_SCAN_ENABLED=True)
+    controller = OrchestratorController(FakeAPIClient({}), agents={"assembly_binary": FakeAgent()},
+                                        ai_service=FakeAIService())
+    threads = []
+    scan_signatures = controller._scan_signatures
+
+    def recording(*args, **kwargs):
+        threads.append(threading.current_thread() is threading.main_thread())
+        return scan_signatures(*args, **kwargs)
+
+    controller._scan_signatures = recording
+    scan, prefilter_result = asyncio.run(
+        controller._prefilter(noise(256) + P256_PRIME + noise(256, 1), "stripped.bin", "assembly_binary")
+    )
+
+    assert threads == [False]
+    assert prefilter_result is None
+    assert "const:ecdsa_p256" in {hit["signature"] for hit in scan["hits"]}
+
+    _, clean_result = asyncio.run(controller._prefilter(noise(256), "empty.bin", "assembly_binary"))
+    assert clean_result["verdict_source"] == "prefilter"
+
+
+def test_binary_is_constant_scanned_once_per_analysis(settings, monkeypatch):
+    settings.set(PREFILTER_ENABLED=True, CONSTANT_SCAN_ENABLED=True, LLM_CASCADE_ENABLED=False)
+    answer = {"is_pqc_vulnerable": True, "detected_algorithms": ["ECDSA"], "confidence_score": 0.9}
+    agent = AssemblyBinaryAgent(ai_service=FakeAIService(content=json.dumps(answer)))
+
+    async def no_rag(*args, **kwargs):
+        return ""
+
+    agent._get_rag_context = no_rag
+    controller = OrchestratorController(FakeAPIClient({}), agents={"assembly_binary": agent},
+                                        ai_service=FakeAIService())
+    scanner = constant_scanner.get_constant_scanner()
+    original_scan, calls = scanner.scan, []
+
+    def counting_scan(data):
+        calls.append(len(data))
+        return original_scan(data)
+
+    monkeypatch.setattr(scanner, "scan", counting_scan)
+    before = scanner.stats["scanned"]
+    content = noise(256).decode("latin-1") + "RSA_generate_key_ex" + P256_PRIME.decode("latin-1")
+
+    stage = asyncio.run(controller._run_agent_stage("assembly_binary", content, "stripped.bin"))
+    assert stage["status"] == "success" and stage["result"]["is_pqc_vulnerable"] is True
+    assert len(calls) == 1 and scanner.stats["scanned"] == before + 1
+
+    # 사전 스캔 없이 직접 호출하면 에이전트가 스스로 스캔합니다.
+    asyncio.run(agent.analyze(P256_PRIME, "direct.bin"))
+    assert len(calls) == 2
@@ -0,0 +1,84 @@
+# File: tests/test_container.py
+# 애플리케이션 컨테이너가 만든 하나의 AIService를 오케스트레이터와 모든 에이전트가 공유하는지와,
+# 종료 시 생성된 적 있는 저장소/캐시/임베딩 모델 싱글턴만 닫는지 검증합니다.
+
+import asyncio
+import sqlite3
+
+import pytest
+
+from pqc_inspector_server.agents.assembly_binary import AssemblyBinaryAgent
+from pqc_inspector_server.agents.logs_config import LogsConfigAgent
+from pqc_inspector_server.agents.source_code import SourceCodeAgent
+from pqc_inspector_server.core.container import AppContainer
+from pqc_inspector_server.orchestrator.controller import OrchestratorController
+from pqc_inspector_server.services import local_embedding
+from pqc_inspector_server.services.embedding_cache import get_embedding_cache
+from pqc_inspector_server.services.job_scheduler import get_job_scheduler
+from pqc_inspector_server.services.llm_cache import get_llm_cache
+from pqc_inspector_server.services.local_embedding import get_local_embedding_backend
+from pqc_inspector_server.services.result_store import get_result_store
+from tests.fakes import FakeAIService, FakeAPIClient
+
+
+def test_agents_use_injected_ai_service():
+    service = FakeAIService()
+    for agent_class in (SourceCodeAgent, AssemblyBinaryAgent, LogsConfigAgent):
+        assert agent_class(ai_service=service).ai_service is service
+
+
+def test_default_orchestrator_agents_share_its_ai_service():
+    service = FakeAIService()
+    controller = OrchestratorController(FakeAPIClient({}), ai_service=service)
+    assert all(agent.ai_service is service for agent in controller.agents.values())
+
+
+def test_container_shares_one_ai_service():
+    container = AppContainer()
+    container.startup()
+    try:
+        service = container.get_ai_service()
+        assert container.get_orchestrator().ai_service is service
+        assert {name: agent.ai_service is service for name, agent in container.agents.items()} == {
+            "source_code": True, "assembly_binary": True, "logs_config": True
+        }
+    finally:
+        asyncio.run(container.shutdown())
+
+
+def test_shutdown_closes_only_created_singletons(settings, tmp_path, monkeypatch):
+    settings.set(
+        RESULT_STORE_BACKEND="sqlite", RESULT_STORE_DB_PATH=str(tmp_path / "results.sqlite3"),
+        LLM_CACHE_DISK_ENABLED=True, LLM_CACHE_DB_PATH=str(tmp_path / "llm.sqlite3"),
+        EMBEDDING_CACHE_ENABLED=True, EMBEDDING_CACHE_DB_PATH=str(tmp_path / "embeddings.sqlite3"),
+        EMBEDDING_CACHE_VECTORS_PATH=str(tmp_path / "vectors.bin")
+    )
+    monkeypatch.setattr(local_embedding, "SENTENCE_TRANSFORMERS_AVAILABLE", True)
+    singletons = (get_result_store, get_llm_cache, get_embedding_cache, get_local_embedding_backend)
+    for singleton in singletons:
+        singleton.cache_clear()
+
+    result_store, llm_cache = get_result_store(), get_llm_cache()
+    embedding_cache, backend = get_embedding_cache(), get_local_embedding_backend()
+    llm_cache.disk_tier.set("key", "model", {"content": "RSA"})
+    llm_cache.disk_tier._conn.execute("UPDATE llm_response_cache SET last_access = 0")
+    llm_cache.disk_tier._conn.commit()
+    assert llm_cache.disk_tier.get("key") is not None  # 접근 시각은 아직 버퍼에만 있습니다.
+
+    container = AppContainer()
+    container.startup()
+    asyncio.run(container.shutdown())
+
+    assert [singleton.cache_info().currsize for singleton in singletons] == [0, 0, 0, 0]
+    # 닫힌 저장소를 쓰는 스케줄러가 다음 startup에서 재사용되지 않습니다.
+    assert get_job_scheduler.cache_info().currsize == 0
+    with sqlite3.connect(str(tmp_path / "llm.sqlite3")) as conn:
+        assert conn.execute("SELECT last_access FROM llm_response_cache").fetchone()[0] > 0
+    for closed in (result_store._conn, embedding_cache._conn):
+        with pytest.raises(sqlite3.ProgrammingError):
+            closed.execute("SELECT 1")
+    assert backend._executor._shutdown
+
+    # 만들어진 적 없는 싱글턴은 종료 과정에서 새로 만들지 않습니다.
+    asyncio.run(AppContainer().shutdown())
+    assert [singleton.cache_info().currsize for singleton in singletons] == [0, 0, 0, 0]
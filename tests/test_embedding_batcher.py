@@ -0,0 +1,114 @@
+# File: tests/test_embedding_batcher.py
+# 임베딩 마이크로 배처가 동시 단일 요청을 대기 시간/최대 크기 기준으로 묶고, 같은 텍스트는 한 번만 요청하며,
+# 실패 시 빈 벡터를 돌려주고, create_single_embedding이 배처를 거치는지 검증합니다.
+
+import asyncio
+import time
+
+from pqc_inspector_server.services import embedding_batcher
+from pqc_inspector_server.services.embedding_batcher import EmbeddingMicroBatcher
+from pqc_inspector_server.services.embedding_cache import get_embedding_cache
+from pqc_inspector_server.services.embedding_service import EmbeddingService
+
+
+class RecordingEmbedder:
+    """요청받은 배치를 기록하고 텍스트 길이로 벡터를 만드는 가짜 배치 임베딩 함수"""
+
+    def __init__(self, error=None, drop_last=False):
+        self.batches = []
+        self.error = error
+        self.drop_last = drop_last
+
+    async def __call__(self, texts):
+        self.batches.append(list(texts))
+        await asyncio.sleep(0)
+        if self.error is not None:
+            raise self.error
+        vectors = [[float(len(text))] for text in texts]
+        return vectors[:-1] if self.drop_last else vectors
+
+
+def test_concurrent_requests_within_wait_window_share_one_batch():
+    embedder = RecordingEmbedder()
+    batcher = EmbeddingMicroBatcher(embedder, max_wait_ms=20, max_batch_size=64)
+
+    async def scenario():
+        return await asyncio.gather(*(batcher.embed("q" * length) for length in range(1, 11)))
+
+    results = asyncio.run(scenario())
+    assert results == [[float(length)] for length in range(1, 11)]
+    assert len(embedder.batches) == 1 and len(embedder.batches[0]) == 10
+    stats = batcher.get_stats()
+    assert (stats["requests"], stats["batches"], stats["max_batch"], stats["pending"]) == (10, 1, 10, 0)
+    assert stats["avg_batch_size"] == 10.0
+
+
+def test_full_batch_is_sent_without_waiting():
+    embedder = RecordingEmbedder()
+    batcher = EmbeddingMicroBatcher(embedder, max_wait_ms=10_000, max_batch_size=3)
+
+    async def scenario():
+        start = time.monotonic()
+        results = await asyncio.gather(*(batcher.embed(f"text-{index}") for index in range(6)))
+        return results, time.monotonic() - start
+
+    results, seconds = asyncio.run(scenario())
+    assert [len(batch) for batch in embedder.batches] == [3, 3]
+    assert results == [[6.0]] * 6
+    assert seconds < 1.0
+
+
+def test_duplicate_texts_are_requested_once():
+    embedder = RecordingEmbedder()
+    batcher = EmbeddingMicroBatcher(embedder, max_wait_ms=5)
+
+    async def scenario():
+        return await asyncio.gather(batcher.embed("rsa"), batcher.embed("ecdsa"), batcher.embed("rsa"))
+
+    assert asyncio.run(scenario()) == [[3.0], [5.0], [3.0]]
+    assert embedder.batches == [["rsa", "ecdsa"]]
+    assert batcher.stats["texts"] == 2
+
+
+def test_failed_or_short_batches_return_empty_vectors():
+    for embedder in (RecordingEmbedder(error=RuntimeError("boom")), RecordingEmbedder(drop_last=True)):
+        batcher = EmbeddingMicroBatcher(embedder, max_wait_ms=5)
+
+        async def scenario():
+            return await asyncio.gather(batcher.embed("a"), batcher.embed("bb"))
+
+        assert asyncio.run(scenario()) == [[], []]
+        assert batcher.stats["failed_batches"] == 1
+
+
+def test_cancelled_caller_does_not_break_the_batch():
+    embedder = RecordingEmbedder()
+    batcher = EmbeddingMicroBatcher(embedder, max_wait_ms=20)
+
+    async def scenario():
+        cancelled = asyncio.ensure_future(batcher.embed("gone"))
+        kept = asyncio.ensure_future(batcher.embed("kept"))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        return await kept
+
+    assert asyncio.run(scenario()) == [4.0]
+    assert embedder.batches == [["gone", "kept"]]
+
+
+def test_single_embedding_goes_through_the_shared_batcher(settings, monkeypatch):
+    settings.set(EMBEDDING_MICROBATCH_ENABLED=True, EMBEDDING_CACHE_ENABLED=False, EMBEDDING_BACKEND="openai")
+    embedder = RecordingEmbedder()
+    batcher = EmbeddingMicroBatcher(embedder, max_wait_ms=5)
+    monkeypatch.setattr(embedding_batcher, "get_embedding_batcher", lambda: batcher)
+    get_embedding_cache.cache_clear()
+    try:
+        service = EmbeddingService()
+    finally:
+        get_embedding_cache.cache_clear()
+
+    async def scenario():
+        return await asyncio.gather(service.create_single_embedding("rsa"), service.create_single_embedding("dh"))
+
+    assert asyncio.run(scenario()) == [[3.0], [2.0]]
+    assert embedder.batches == [["rsa", "dh"]]
@@ -0,0 +1,119 @@
+# File: tests/test_embedding_cache.py
+# 디스크 임베딩 캐시(SQLite 인덱스 + mmap 벡터 파일)의 저장/조회, 모델별 키 분리, 재시작 후 재사용,
+# 여러 인스턴스의 동시 추가, 용량 상한과, 캐시 적중 시 임베딩 요청이 생략되는지 검증합니다.
+
+import asyncio
+
+import pytest
+
+from pqc_inspector_server.services.embedding_cache import EmbeddingCache, get_embedding_cache
+from pqc_inspector_server.services.embedding_service import EmbeddingService
+
+
+def open_cache(tmp_path, **options) -> EmbeddingCache:
+    return EmbeddingCache(str(tmp_path / "index.sqlite3"), str(tmp_path / "vectors.bin"), **options)
+
+
+def test_round_trip_is_keyed_by_model_and_text(tmp_path):
+    cache = open_cache(tmp_path)
+    cache.put_many("model-a", ["rsa", "ecdsa"], [[0.5, -1.25, 2.0], [1.0, 0.0]])
+
+    assert cache.get_many("model-a", ["ecdsa", "missing", "rsa", "rsa"]) == [
+        [1.0, 0.0], None, [0.5, -1.25, 2.0], [0.5, -1.25, 2.0]
+    ]
+    assert cache.get_many("model-b", ["rsa"]) == [None]
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["misses"], stats["stores"], stats["entries"]) == (3, 2, 2, 2)
+    assert stats["vector_file_bytes"] == 5 * 4
+    cache.close()
+
+
+def test_float16_halves_storage_with_small_error(tmp_path):
+    cache = open_cache(tmp_path, dtype="float16")
+    vector = [0.1234, -0.5678, 0.9]
+    cache.put_many("model", ["text"], [vector])
+
+    cached = cache.get_many("model", ["text"])[0]
+    assert cached == pytest.approx(vector, abs=1e-3)
+    assert cache.get_stats()["vector_file_bytes"] == 3 * 2
+    cache.close()
+
+    with pytest.raises(ValueError):
+        open_cache(tmp_path, dtype="int8")
+
+
+def test_entries_survive_reopen_and_are_shared_between_instances(tmp_path):
+    first = open_cache(tmp_path)
+    first.put_many("model", ["a"], [[1.0, 2.0]])
+    # 다른 워커 프로세스처럼 같은 파일을 여는 두 번째 인스턴스가 파일 끝에 이어 씁니다.
+    second = open_cache(tmp_path)
+    second.put_many("model", ["b"], [[3.0, 4.0]])
+    first.put_many("model", ["c"], [[5.0, 6.0]])
+
+    assert first.get_many("model", ["a", "b", "c"]) == [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]
+    assert second.get_many("model", ["a", "b", "c"]) == [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]
+    first.close()
+    second.close()
+
+    reopened = open_cache(tmp_path)
+    assert reopened.count() == 3
+    assert reopened.get_many("model", ["b"]) == [[3.0, 4.0]]
+    reopened.close()
+
+
+def test_empty_vectors_are_not_stored_and_full_cache_skips_writes(tmp_path):
+    cache = open_cache(tmp_path, max_bytes=8)
+    cache.put_many("model", ["empty"], [[]])
+    assert cache.count() == 0
+
+    cache.put_many("model", ["first"], [[1.0, 2.0]])
+    cache.put_many("model", ["second"], [[3.0, 4.0]])
+    assert cache.get_many("model", ["first", "second"]) == [[1.0, 2.0], None]
+    assert cache.stats["skipped_full"] == 1
+
+    cache.clear()
+    assert cache.count() == 0 and cache.get_stats()["vector_file_bytes"] == 0
+    cache.put_many("model", ["second"], [[3.0, 4.0]])
+    assert cache.get_many("model", ["second"]) == [[3.0, 4.0]]
+    cache.close()
+
+
+@pytest.fixture
+def cached_service(settings, tmp_path):
+    settings.set(
+        EMBEDDING_CACHE_ENABLED=True, EMBEDDING_CACHE_DB_PATH=str(tmp_path / "index.sqlite3"),
+        EMBEDDING_CACHE_VECTORS_PATH=str(tmp_path / "vectors.bin"), EMBEDDING_CACHE_DTYPE="float32",
+        EMBEDDING_CACHE_MAX_MB=0, EMBEDDING_BACKEND="openai", LLM_RATE_LIMIT_ENABLED=False
+    )
+    get_embedding_cache.cache_clear()
+    service = EmbeddingService()
+    requests = []
+
+    async def fake_request(texts):
+        requests.append(list(texts))
+        return [[float(len(text)), 1.0] for text in texts]
+
+    service._request_embeddings = fake_request
+    yield service, requests
+    service.cache.close()
+    get_embedding_cache.cache_clear()
+
+
+def test_repeated_embeddings_cost_no_requests(cached_service):
+    service, requests = cached_service
+    first = asyncio.run(service.create_embeddings(["alpha", "beta", "alpha"]))
+    second = asyncio.run(service.create_embeddings(["beta", "alpha"]))
+
+    assert requests == [["alpha", "beta"]]
+    assert first == [[5.0, 1.0], [4.0, 1.0], [5.0, 1.0]]
+    assert second == [[4.0, 1.0], [5.0, 1.0]]
+
+
+def test_batched_embeddings_only_request_cache_misses(cached_service):
+    service, requests = cached_service
+    asyncio.run(service.create_embeddings(["known"]))
+    results = asyncio.run(service.create_embeddings_batched(["known", "new-1", "new-2"]))
+
+    assert requests == [["known"], ["new-1", "new-2"]]
+    assert results == [[5.0, 1.0], [5.0, 1.0], [5.0, 1.0]]
+    assert service.cache.count() == 3
@@ -0,0 +1,96 @@
+# File: tests/test_failover.py
+# 역할별 폴백 체인을 따라 다른 제공자로 전환하고, 폴백 응답은 캐시하지 않는지 검증합니다.
+
+import asyncio
+
+from pqc_inspector_server.services.ai_service import AIService
+from pqc_inspector_server.services.llm_cache import LLMResponseCache, MemoryLRUCache
+from pqc_inspector_server.services.resilience import ResilienceRegistry
+from pqc_inspector_server.services.singleflight import SingleFlight
+
+
+def make_service(outcomes):
+    """모델 이름별 결과(응답 dict 또는 지연 초)를 돌려주는 가짜 호출을 끼운 AIService"""
+    service = AIService()
+    service.cache = LLMResponseCache(MemoryLRUCache())
+    service.singleflight = SingleFlight()
+    service.resilience = ResilienceRegistry(failure_threshold=5, reset_timeout=30.0)
+    service.calls = []
+
+    async def fake_call(provider, model, prompt, system_prompt, temperature, stop_at_json=False):
+        service.calls.append((provider, model))
+        outcome = outcomes[model]
+        if isinstance(outcome, (int, float)):
+            await asyncio.sleep(outcome)
+            return {"success": True, "content": f"slow {model}"}
+        return dict(outcome)
+
+    service._call_with_resilience = fake_call
+    return service
+
+
+def test_model_chain_appends_role_fallbacks_without_duplicates(settings):
+    settings.set(LLM_FAILOVER_ENABLED=True, SOURCE_CODE_FALLBACK_MODELS=["gpt-4-turbo", "gpt-4o", "", "llama3:8b"])
+    service = AIService()
+    assert service._get_model_chain("gpt-4o", "source_code") == ["gpt-4o", "gpt-4-turbo", "llama3:8b"]
+    assert service._get_model_chain("gpt-4o", None) == ["gpt-4o"]
+    assert service._get_model_chain("gpt-4o", "unknown") == ["gpt-4o"]
+
+    settings.set(LLM_FAILOVER_ENABLED=False)
+    assert service._get_model_chain("gpt-4o", "source_code") == ["gpt-4o"]
+
+
+def test_fails_over_to_next_provider(settings):
+    settings.set(LLM_FAILOVER_ENABLED=True, SOURCE_CODE_FALLBACK_MODELS=["llama3:8b"])
+    service = make_service({
+        "gpt-4o": {"success": False, "status_code": 503, "error": "unavailable"},
+        "llama3:8b": {"success": True, "content": "ok"}
+    })
+
+    response = asyncio.run(service.generate_response("gpt-4o", "prompt", role="source_code"))
+    assert response["success"] and response["content"] == "ok"
+    assert response["model"] == "llama3:8b" and response["provider"] == "ollama"
+    assert response["fallback_used"] and response["requested_model"] == "gpt-4o"
+    assert response["failover_path"] == [{"model": "gpt-4o", "error": "unavailable"}]
+    assert service.calls == [("openai", "gpt-4o"), ("ollama", "llama3:8b")]
+    assert service.resilience.get_stats()["failovers"] == 1
+
+
+def test_fallback_answers_are_not_cached(settings):
+    settings.set(LLM_FAILOVER_ENABLED=True, LLM_CACHE_ENABLED=True, SOURCE_CODE_FALLBACK_MODELS=["llama3:8b"])
+    service = make_service({
+        "gpt-4o": {"success": False, "status_code": 503, "error": "unavailable"},
+        "llama3:8b": {"success": True, "content": "ok"}
+    })
+
+    async def scenario():
+        await service.generate_response("gpt-4o", "prompt", role="source_code")
+        return await service.generate_response("gpt-4o", "prompt", role="source_code")
+
+    second = asyncio.run(scenario())
+    assert not second.get("cached")
+    assert len(service.calls) == 4
+
+
+def test_slow_candidate_is_abandoned_after_attempt_timeout(settings):
+    settings.set(LLM_FAILOVER_ENABLED=True, LLM_FAILOVER_ATTEMPT_TIMEOUT_SECONDS=0.05,
+                 SOURCE_CODE_FALLBACK_MODELS=["llama3:8b"])
+    service = make_service({"gpt-4o": 5.0, "llama3:8b": {"success": True, "content": "ok"}})
+
+    response = asyncio.run(asyncio.wait_for(service.generate_response("gpt-4o", "prompt", role="source_code"), 2.0))
+    assert response["model"] == "llama3:8b"
+    assert "응답 지연" in response["failover_path"][0]["error"]
+
+
+def test_all_candidates_failing_returns_last_error(settings):
+    settings.set(LLM_FAILOVER_ENABLED=True, SOURCE_CODE_FALLBACK_MODELS=["gpt-4-turbo", "unknown-model"])
+    service = make_service({
+        "gpt-4o": {"success": False, "status_code": 503, "error": "first"},
+        "gpt-4-turbo": {"success": False, "status_code": 500, "error": "second"}
+    })
+
+    response = asyncio.run(service.generate_response("gpt-4o", "prompt", role="source_code"))
+    assert not response["success"] and not response["fallback_used"]
+    # 지원하지 않는 모델은 예외 대신 실패 단계로 기록됩니다.
+    assert [step["model"] for step in response["failover_path"]] == ["gpt-4o", "gpt-4-turbo", "unknown-model"]
+    assert "지원하지 않는 모델" in response["error"]
@@ -0,0 +1,57 @@
+# File: tests/test_http_client_pool.py
+# AI API 호출용 공유 HTTP 클라이언트 풀의 재사용/재생성/종료와 keep-alive 커넥션 재사용을 검증합니다.
+
+import asyncio
+
+from pqc_inspector_server.services.ai_service import AIService
+from pqc_inspector_server.services.http_client_pool import HTTPClientPool
+from tests.fakes import OpenAIStubServer
+
+
+def test_one_client_per_base_url():
+    async def scenario():
+        pool = HTTPClientPool()
+        first = pool.get_client("https://a.example/v1")
+        assert pool.get_client("https://a.example/v1") is first
+        assert pool.get_client("https://b.example/v1") is not first
+        assert pool.get_stats()["clients_created"] == 2
+        await pool.aclose()
+
+    asyncio.run(scenario())
+
+
+def test_closed_client_is_recreated_and_aclose_clears():
+    async def scenario():
+        pool = HTTPClientPool()
+        client = pool.get_client("https://a.example/v1")
+        await client.aclose()
+        replacement = pool.get_client("https://a.example/v1")
+        assert replacement is not client and not replacement.is_closed
+
+        await pool.aclose()
+        assert replacement.is_closed
+        assert pool.get_stats()["base_urls"] == []
+
+    asyncio.run(scenario())
+
+
+def test_sequential_calls_reuse_one_keepalive_connection(settings):
+    settings.set(LLM_CACHE_ENABLED=False, LLM_RATE_LIMIT_ENABLED=False, LLM_STREAMING_ENABLED=False)
+
+    async def scenario():
+        stub = OpenAIStubServer()
+        base_url = await stub.start()
+        service = AIService()
+        service.http_pool = HTTPClientPool()
+        service.openai_base_url = base_url
+        try:
+            for index in range(3):
+                response = await service.generate_response("gpt-4.1", f"prompt {index}", use_cache=False)
+                assert response["success"] and response["content"] == "ok"
+        finally:
+            await service.http_pool.aclose()
+            await stub.stop()
+        assert len(stub.requests) == 3
+        assert stub.connections == 1
+
+    asyncio.run(scenario())
@@ -0,0 +1,167 @@
+# File: tests/test_job_queue.py
+# SQLite 공유 대기열의 우선순위 임대, 임대 토큰 보호, 만료 후 재임대, 실패 작업 정리와
+# 대기열 등록 실패/알 수 없는 대기열 설정에서 작업이 pending으로 남지 않는지 검증합니다.
+
+import asyncio
+import io
+
+import pytest
+from fastapi import HTTPException, UploadFile
+
+from pqc_inspector_server.api import endpoints
+from pqc_inspector_server.core.container import get_container
+from pqc_inspector_server.services.job_queue import SQLiteJobQueue, get_job_queue
+from pqc_inspector_server.services.job_scheduler import JobPriority, QueueFullError
+from pqc_inspector_server.services.queue_worker import QueueWorker
+from pqc_inspector_server.services.result_store import MemoryResultStore, TaskStatus
+
+
+@pytest.fixture
+def queue(tmp_path):
+    job_queue = SQLiteJobQueue(str(tmp_path / "jobs.db"), max_queue_size=3)
+    yield job_queue
+    asyncio.run(job_queue.close())
+
+
+def test_leases_by_priority_then_fifo(queue):
+    async def scenario():
+        await queue.enqueue("bulk", {"filename": "b"}, b"b", priority=JobPriority.BULK)
+        await queue.enqueue("first", {"filename": "1"}, b"1")
+        await queue.enqueue("second", {"filename": "2"}, b"2")
+        return [(await queue.lease("w", 60))["job_id"] for _ in range(3)], await queue.lease("w", 60)
+
+    order, empty = asyncio.run(scenario())
+    assert order == ["first", "second", "bulk"]
+    assert empty is None
+
+
+def test_lease_returns_payload_data_and_attempts(queue):
+    async def scenario():
+        await queue.enqueue("job", {"filename": "a.bin"}, b"\x00\x01binary")
+        return await queue.lease("w", 60)
+
+    job = asyncio.run(scenario())
+    assert job["payload"] == {"filename": "a.bin"}
+    assert job["data"] == b"\x00\x01binary"
+    assert job["attempts"] == 1 and job["lease_token"]
+
+
+def test_enqueue_rejects_when_full(queue):
+    async def scenario():
+        for index in range(3):
+            assert await queue.enqueue(f"j{index}", {}) == index + 1
+        await queue.enqueue("overflow", {})
+
+    with pytest.raises(QueueFullError):
+        asyncio.run(scenario())
+
+
+def test_expired_lease_is_taken_over_and_old_token_is_rejected(queue):
+    async def scenario():
+        await queue.enqueue("job", {})
+        first = await queue.lease("crashed", visibility_timeout=-1)
+        second = await queue.lease("healthy", visibility_timeout=60)
+        assert second["job_id"] == "job" and second["attempts"] == 2
+
+        # 임대를 잃은 워커는 연장/완료 처리를 할 수 없습니다.
+        assert not await queue.extend_lease("job", first["lease_token"], 60)
+        await queue.ack("job", first["lease_token"])
+        assert (await queue.get_stats())["leased"] == 1
+
+        assert await queue.extend_lease("job", second["lease_token"], 60)
+        await queue.ack("job", second["lease_token"])
+        return await queue.get_stats()
+
+    stats = asyncio.run(scenario())
+    assert stats["queued"] == 0 and stats["leased"] == 0
+
+
+def test_nack_retry_requeues_job(queue):
+    async def scenario():
+        await queue.enqueue("job", {}, b"data")
+        job = await queue.lease("w", 60)
+        await queue.nack("job", job["lease_token"], "boom", retry=True)
+        return await queue.lease("w", 60)
+
+    job = asyncio.run(scenario())
+    assert job["attempts"] == 2 and job["data"] == b"data"
+
+
+def test_dead_job_payload_is_cleared(queue):
+    async def scenario():
+        await queue.enqueue("job", {"filename": "big.bin"}, b"x" * 100000)
+        job = await queue.lease("w", 60)
+        await queue.nack("job", job["lease_token"], "boom", retry=False)
+        return await queue.get_stats()
+
+    stats = asyncio.run(scenario())
+    assert stats["dead"] == 1 and stats["queued"] == 0
+    data, error = queue._conn.execute("SELECT data, error FROM job_queue WHERE job_id = 'job'").fetchone()
+    assert data is None and error == "boom"
+
+
+class _FailingOrchestrator:
+    async def start_analysis_with_content(self, filename, content, task_id):
+        raise RuntimeError("analysis failed")
+
+
+def test_worker_gives_up_after_max_attempts(queue):
+    store = MemoryResultStore()
+    worker = QueueWorker(queue, _FailingOrchestrator(), store, concurrency=1, max_attempts=2)
+
+    async def scenario():
+        await store.create("job")
+        await queue.enqueue("job", {"filename": "a.py"}, b"print(1)")
+        for _ in range(2):
+            await worker._process(await queue.lease(worker.worker_id, 60))
+        return await store.get("job"), await queue.get_stats()
+
+    record, stats = asyncio.run(scenario())
+    assert worker.stats["retried"] == 1 and worker.stats["dead"] == 1
+    assert record["status"] == TaskStatus.FAILED and record["error"] == "analysis failed"
+    assert stats["dead"] == 1
+
+
+class BrokenQueue:
+    async def enqueue(self, *args, **kwargs):
+        raise ConnectionError("redis down")
+
+
+class StubOrchestrator:
+    def __init__(self):
+        self.result_store = MemoryResultStore()
+
+    async def submit_task(self, task_id):
+        await self.result_store.create(task_id)
+
+
+def test_enqueue_error_marks_task_failed(monkeypatch):
+    monkeypatch.setattr(endpoints, "get_job_queue", lambda: BrokenQueue())
+    orchestrator = StubOrchestrator()
+
+    async def scenario():
+        upload = UploadFile(file=io.BytesIO(b"RSA_generate_key"), filename="key.c")
+        with pytest.raises(HTTPException) as error:
+            await endpoints.analyze_file(file=upload, priority="interactive", orchestrator=orchestrator, scheduler=None)
+        return error.value.status_code
+
+    assert asyncio.run(scenario()) == 503
+    records = list(orchestrator.result_store._records.values())
+    assert [record["status"] for record in records] == [TaskStatus.FAILED]
+    assert "redis down" in records[0]["error"]
+
+
+def test_unknown_backend_starts_in_process_scheduler(settings):
+    import main
+
+    settings.set(JOB_QUEUE_BACKEND="sqllite", EVENT_LOOP_MONITOR_ENABLED=False)
+    get_job_queue.cache_clear()
+
+    async def scenario():
+        async with main.lifespan(main.app):
+            return get_job_queue() is None and bool(get_container().scheduler._workers)
+
+    try:
+        assert asyncio.run(scenario()) is True
+    finally:
+        get_job_queue.cache_clear()
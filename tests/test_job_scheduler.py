@@ -0,0 +1,105 @@
+# File: tests/test_job_scheduler.py
+# 작업 스케줄러의 우선순위 처리, 대기열 상한(429), 오류 격리, 종료 시 미처리 작업 기록을 검증합니다.
+
+import asyncio
+
+import pytest
+
+from pqc_inspector_server.services.job_scheduler import (
+    SHUTDOWN_ERROR, JobPriority, JobScheduler, QueueFullError
+)
+from pqc_inspector_server.services.result_store import MemoryResultStore, TaskStatus
+
+
+def test_priority_names_round_trip():
+    assert JobPriority.from_name("interactive") == JobPriority.INTERACTIVE
+    assert JobPriority.to_name(JobPriority.BULK) == "bulk"
+    with pytest.raises(ValueError):
+        JobPriority.from_name("urgent")
+
+
+def test_interactive_jobs_run_before_bulk_jobs():
+    order = []
+
+    async def scenario():
+        scheduler = JobScheduler(num_workers=1, max_queue_size=10)
+        gate = asyncio.Event()
+
+        async def blocker():
+            await gate.wait()
+
+        def job(name):
+            async def run():
+                order.append(name)
+            return run
+
+        scheduler.submit("blocker", blocker)
+        await asyncio.sleep(0)
+        scheduler.submit("bulk-1", job("bulk-1"), priority=JobPriority.BULK)
+        scheduler.submit("bulk-2", job("bulk-2"), priority=JobPriority.BULK)
+        scheduler.submit("interactive", job("interactive"))
+        assert scheduler.get_stats()["queue_depth_by_priority"] == {"bulk": 2, "interactive": 1}
+        gate.set()
+        await scheduler._queue.join()
+        await scheduler.stop()
+
+    asyncio.run(scenario())
+    assert order == ["interactive", "bulk-1", "bulk-2"]
+
+
+def test_full_queue_raises_with_retry_after():
+    async def scenario():
+        scheduler = JobScheduler(num_workers=1, max_queue_size=1)
+        gate = asyncio.Event()
+        scheduler.submit("running", gate.wait)
+        await asyncio.sleep(0)
+        scheduler.submit("queued", gate.wait)
+        try:
+            scheduler.submit("rejected", gate.wait)
+        finally:
+            gate.set()
+            await scheduler.stop()
+
+    with pytest.raises(QueueFullError) as exc_info:
+        asyncio.run(scenario())
+    assert exc_info.value.retry_after >= 1
+
+
+def test_failing_job_does_not_stop_worker():
+    async def scenario():
+        scheduler = JobScheduler(num_workers=1, max_queue_size=10)
+
+        async def fail():
+            raise RuntimeError("boom")
+
+        async def succeed():
+            pass
+
+        scheduler.submit("bad", fail)
+        scheduler.submit("good", succeed)
+        await scheduler._queue.join()
+        stats = scheduler.get_stats()
+        await scheduler.stop()
+        return stats
+
+    stats = asyncio.run(scenario())
+    assert stats["failed"] == 1 and stats["completed"] == 1 and stats["running"] == 0
+
+
+def test_stop_marks_running_and_queued_jobs_failed():
+    store = MemoryResultStore()
+
+    async def scenario():
+        scheduler = JobScheduler(num_workers=1, max_queue_size=10, result_store=store)
+        for task_id in ("running", "queued-1", "queued-2"):
+            await store.create(task_id)
+            scheduler.submit(task_id, lambda: asyncio.sleep(10))
+        await asyncio.sleep(0.01)
+        await scheduler.stop()
+        return scheduler, [await store.get(task_id) for task_id in ("running", "queued-1", "queued-2")]
+
+    scheduler, records = asyncio.run(scenario())
+    assert [record["status"] for record in records] == [TaskStatus.FAILED] * 3
+    assert all(record["error"] == SHUTDOWN_ERROR for record in records)
+    stats = scheduler.get_stats()
+    assert stats["dropped"] == 2 and stats["queue_depth"] == 0
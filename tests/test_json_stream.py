@@ -0,0 +1,105 @@
+# File: tests/test_json_stream.py
+# 스트리밍 청크에서 최상위 JSON 객체가 닫히는 시점을 정확히 감지하는지 검증합니다.
+
+import json
+import random
+
+import pytest
+
+from pqc_inspector_server.services.ai_service import AIService
+from pqc_inspector_server.services.json_stream import IncrementalJSONObjectParser
+
+
+def feed_in_chunks(text: str, sizes) -> IncrementalJSONObjectParser:
+    parser = IncrementalJSONObjectParser()
+    position = 0
+    for size in sizes:
+        if parser.feed(text[position:position + size]):
+            break
+        position += size
+    return parser
+
+
+def test_detects_object_and_excludes_trailing_text():
+    text = '분석 결과입니다: {"is_pqc_vulnerable": true, "algorithms": ["RSA"]} 이상으로 설명을 마칩니다.'
+    parser = IncrementalJSONObjectParser()
+    assert parser.feed(text)
+    assert parser.result == {"is_pqc_vulnerable": True, "algorithms": ["RSA"]}
+    assert parser.object_text == '{"is_pqc_vulnerable": true, "algorithms": ["RSA"]}'
+    assert parser.text_until_complete.endswith('["RSA"]}')
+
+
+@pytest.mark.parametrize("text", [
+    '{"note": "brace } inside", "x": {"y": 1}}',
+    '{"quote": "he said \\"}\\" loudly", "ok": 1}',
+    '{"backslash": "C:\\\\", "ok": 2}',
+])
+def test_braces_and_escapes_inside_strings_are_ignored(text):
+    parser = IncrementalJSONObjectParser()
+    assert parser.feed(text)
+    assert parser.result == json.loads(text)
+
+
+def test_skips_invalid_brace_candidates_in_preamble():
+    text = 'Use {placeholder} syntax. Result: {"ok": true}'
+    parser = IncrementalJSONObjectParser()
+    assert parser.feed(text)
+    assert parser.result == {"ok": True}
+
+
+def test_incomplete_object_is_not_complete():
+    parser = IncrementalJSONObjectParser()
+    assert not parser.feed('{"a": {"b": 1}')
+    assert not parser.complete
+    assert parser.object_text is None
+    assert parser.text_until_complete == '{"a": {"b": 1}'
+
+
+def test_feed_after_completion_is_ignored():
+    parser = IncrementalJSONObjectParser()
+    parser.feed('{"a": 1}')
+    assert parser.feed('{"b": 2}')
+    assert parser.result == {"a": 1}
+
+
+def test_every_split_point_gives_same_result():
+    text = 'prefix {"k": "v}{\\"", "n": [1, {"m": null}]} suffix'
+    expected = {"k": 'v}{"', "n": [1, {"m": None}]}
+    for split in range(len(text) + 1):
+        parser = feed_in_chunks(text, [split, len(text)])
+        assert parser.result == expected, split
+
+
+def _random_value(rng: random.Random, depth: int = 0):
+    kind = rng.randrange(6 if depth < 3 else 3)
+    if kind == 0:
+        return rng.randint(-1000, 1000)
+    if kind == 1:
+        return "".join(rng.choice('ab{}[]"\\: 가\n') for _ in range(rng.randrange(8)))
+    if kind == 2:
+        return rng.choice([True, False, None])
+    if kind == 3:
+        return [_random_value(rng, depth + 1) for _ in range(rng.randrange(4))]
+    return {f"k{i}": _random_value(rng, depth + 1) for i in range(rng.randrange(4))}
+
+
+def test_random_objects_with_random_chunking():
+    rng = random.Random(1234)
+    for _ in range(300):
+        obj = {"root": _random_value(rng)}
+        text = "설명 {not json} " + json.dumps(obj, ensure_ascii=rng.random() < 0.5) + " 뒤쪽 설명 }"
+        sizes = [rng.randint(1, 7) for _ in range(len(text))]
+        parser = feed_in_chunks(text, sizes)
+        assert parser.result == obj
+
+
+def test_parse_stream_line_per_provider():
+    service = AIService()
+    assert service._parse_stream_line("openai", 'data: {"choices": [{"delta": {"content": "{\\"a"}}]}') == ('{"a', {})
+    assert service._parse_stream_line("openai", "data: [DONE]") is None
+    assert service._parse_stream_line("openai", ": keep-alive") is None
+    assert service._parse_stream_line("google", 'data: {"candidates": [{"content": {"parts": [{"text": "x"}, {"text": "y"}]}}]}') == ("xy", {})
+
+    text, usage = service._parse_stream_line("ollama", '{"message": {"content": ""}, "done": true, "prompt_eval_count": 3, "eval_count": 4}')
+    assert text == "" and usage["total_tokens"] == 7
+    assert service._parse_stream_line("ollama", "not json") is None
@@ -0,0 +1,123 @@
+# File: tests/test_llm_cache.py
+# LLM 응답 캐시의 키 생성, 메모리 LRU, SQLite 디스크 계층(크기 추적/축출/TTL/배치 조회 시각 갱신),
+# AIService 연동(적중 시 API 미호출)을 검증합니다.
+
+import asyncio
+import sqlite3
+import time
+
+from pqc_inspector_server.services.ai_service import AIService
+from pqc_inspector_server.services.http_client_pool import HTTPClientPool
+from pqc_inspector_server.services.llm_cache import (
+    LLMResponseCache, MemoryLRUCache, SQLiteResponseCache, make_cache_key
+)
+from tests.fakes import OpenAIStubServer
+
+
+def test_cache_key_depends_on_every_parameter():
+    base = make_cache_key("gpt-4.1", "p", "s", 0.1)
+    assert base == make_cache_key("gpt-4.1", "p", "s", 0.1)
+    assert base != make_cache_key("gpt-4.1", "p", "s", 0.2)
+    assert base != make_cache_key("gpt-4.1", "p", None, 0.1)
+    assert base != make_cache_key("gemini-2.5-flash", "p", "s", 0.1)
+    assert base != make_cache_key("gpt-4.1", "p", "s", 0.1, stop_at_json=True)
+
+
+def test_memory_lru_evicts_least_recently_used_and_expires():
+    cache = MemoryLRUCache(max_entries=2, ttl_seconds=60)
+    cache.set("a", {"v": 1})
+    cache.set("b", {"v": 2})
+    cache.get("a")
+    cache.set("c", {"v": 3})
+    assert cache.get("b") is None and cache.get("a") == {"v": 1}
+
+    cache.set("old", {"v": 0}, created_at=time.time() - 120)
+    assert cache.get("old") is None
+
+
+def test_disk_tier_tracks_size_incrementally(tmp_path):
+    cache = SQLiteResponseCache(str(tmp_path / "c.sqlite3"), max_bytes=10 ** 6)
+    cache.set("a", "m", {"content": "x" * 100})
+    cache.set("b", "m", {"content": "y" * 50})
+    cache.set("a", "m", {"content": "z" * 10})  # 같은 키 덮어쓰기
+    conn = sqlite3.connect(cache.db_path)
+    actual = conn.execute("SELECT SUM(size) FROM llm_response_cache").fetchone()[0]
+    assert cache.size_bytes() == actual
+
+    cache.clear()
+    assert cache.size_bytes() == 0
+
+
+def test_disk_tier_evicts_least_recently_accessed(tmp_path):
+    entry_size = len('{"content": "' + "x" * 100 + '"}')
+    cache = SQLiteResponseCache(str(tmp_path / "c.sqlite3"), max_bytes=entry_size * 3)
+    for key in ("a", "b", "c"):
+        cache.set(key, "m", {"content": "x" * 100})
+        time.sleep(0.01)
+    assert cache.get("a") is not None  # a를 최근 사용으로 만듭니다 (다음 쓰기 때 반영)
+    cache.set("d", "m", {"content": "x" * 100})
+
+    assert cache.get("b") is None
+    assert all(cache.get(key) is not None for key in ("a", "c", "d"))
+    assert cache.size_bytes() <= cache.max_bytes
+
+
+def test_disk_tier_read_does_not_commit(tmp_path):
+    cache = SQLiteResponseCache(str(tmp_path / "c.sqlite3"), max_bytes=10 ** 6)
+    cache.set("a", "m", {"content": "x"})
+    changes_before = cache._conn.total_changes
+    for _ in range(cache.ACCESS_FLUSH_EVERY - 1):
+        assert cache.get("a") is not None
+    assert cache._conn.total_changes == changes_before
+
+
+def test_disk_tier_ttl_and_index(tmp_path):
+    cache = SQLiteResponseCache(str(tmp_path / "c.sqlite3"), max_bytes=10 ** 6, ttl_seconds=0.05)
+    cache.set("a", "m", {"content": "x"})
+    time.sleep(0.1)
+    assert cache.get("a") is None
+
+    plan = " ".join(str(row) for row in cache._conn.execute(
+        "EXPLAIN QUERY PLAN DELETE FROM llm_response_cache WHERE created_at < 0"
+    ))
+    assert "idx_llm_cache_created_at" in plan
+
+
+def test_disk_hit_is_promoted_to_memory(tmp_path):
+    disk = SQLiteResponseCache(str(tmp_path / "c.sqlite3"), max_bytes=10 ** 6)
+
+    async def scenario():
+        writer = LLMResponseCache(MemoryLRUCache(), disk)
+        await writer.set("k", "m", {"content": "cached"})
+        reader = LLMResponseCache(MemoryLRUCache(), disk)  # 재시작한 프로세스
+        first = await reader.get("k")
+        second = await reader.get("k")
+        return first, second, reader.get_stats()
+
+    first, second, stats = asyncio.run(scenario())
+    assert first["cache_tier"] == "disk" and second["cache_tier"] == "memory"
+    assert stats["disk_hits"] == 1 and stats["memory_hits"] == 1
+
+
+def test_generate_response_hits_cache_without_calling_api(settings, tmp_path):
+    settings.set(LLM_CACHE_ENABLED=True, LLM_RATE_LIMIT_ENABLED=False, LLM_STREAMING_ENABLED=False)
+
+    async def scenario():
+        stub = OpenAIStubServer()
+        service = AIService()
+        service.http_pool = HTTPClientPool()
+        service.openai_base_url = await stub.start()
+        service.cache = LLMResponseCache(MemoryLRUCache(), None)
+        try:
+            first = await service.generate_response("gpt-4.1", "same prompt")
+            second = await service.generate_response("gpt-4.1", "same prompt")
+            bypass = await service.generate_response("gpt-4.1", "same prompt", use_cache=False)
+        finally:
+            await service.http_pool.aclose()
+            await stub.stop()
+        return first, second, bypass, len(stub.requests)
+
+    first, second, bypass, requests = asyncio.run(scenario())
+    assert not first.get("cached") and second["cached"] and not bypass.get("cached")
+    assert second["content"] == first["content"]
+    assert requests == 2
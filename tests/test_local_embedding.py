@@ -0,0 +1,144 @@
+# File: tests/test_local_embedding.py
+# 로컬(sentence-transformers) 임베딩 백엔드의 지연 로드, 실행기 스레드 추론, 런타임 옵션, 워밍업과
+# 벡터 DB 컬렉션의 임베딩 모델 태그(불일치 시 검색/저장 거부, 빈 컬렉션 재태깅)를 검증합니다.
+# sentence-transformers 없이 실행되도록 가짜 모델 클래스를 주입합니다.
+
+import asyncio
+import threading
+
+import numpy as np
+import pytest
+
+from pqc_inspector_server.services import local_embedding
+from pqc_inspector_server.services.embedding_cache import get_embedding_cache
+from pqc_inspector_server.services.embedding_service import EmbeddingService
+from pqc_inspector_server.services.local_embedding import LocalEmbeddingBackend, warm_up_embedding_backend
+from pqc_inspector_server.services.vector_store import LEGACY_EMBEDDING_MODEL, VectorStore
+
+
+class FakeSentenceTransformer:
+    """SentenceTransformer처럼 encode()가 정규화된 numpy 배열을 반환하는 가짜 모델"""
+
+    instances = []
+
+    def __init__(self, model_name, **options):
+        self.model_name = model_name
+        self.options = options
+        self.encode_calls = []
+        FakeSentenceTransformer.instances.append(self)
+
+    def encode(self, texts, **options):
+        self.encode_calls.append((list(texts), options, threading.current_thread() is threading.main_thread()))
+        return np.array([[1.0, 0.0] if "rsa" in text else [0.0, 1.0] for text in texts])
+
+
+@pytest.fixture
+def fake_model(monkeypatch):
+    FakeSentenceTransformer.instances = []
+    monkeypatch.setattr(local_embedding, "SentenceTransformer", FakeSentenceTransformer)
+    monkeypatch.setattr(local_embedding, "SENTENCE_TRANSFORMERS_AVAILABLE", True)
+    return FakeSentenceTransformer
+
+
+def test_missing_dependency_raises(monkeypatch):
+    monkeypatch.setattr(local_embedding, "SENTENCE_TRANSFORMERS_AVAILABLE", False)
+    with pytest.raises(RuntimeError):
+        LocalEmbeddingBackend("model")
+
+
+def test_model_loads_once_and_encodes_in_executor_thread(fake_model):
+    backend = LocalEmbeddingBackend("all-MiniLM", batch_size=16, threads=2)
+
+    async def scenario():
+        assert await backend.embed([]) == []
+        return await asyncio.gather(backend.embed(["rsa key"]), backend.embed(["hello", "rsa"]))
+
+    first, second = asyncio.run(scenario())
+    backend.shutdown()
+
+    assert first == [[1.0, 0.0]] and second == [[0.0, 1.0], [1.0, 0.0]]
+    assert len(fake_model.instances) == 1
+    model = fake_model.instances[0]
+    assert model.options == {"device": "cpu"}
+    assert all(not on_main for _, _, on_main in model.encode_calls)
+    assert all(options["batch_size"] == 16 and options["normalize_embeddings"] for _, options, _ in model.encode_calls)
+    stats = backend.get_stats()
+    assert stats["loaded"] and (stats["requests"], stats["texts"]) == (2, 3)
+
+
+def test_non_torch_runtime_is_passed_as_backend(fake_model):
+    backend = LocalEmbeddingBackend("all-MiniLM", runtime="onnx")
+    asyncio.run(backend.embed(["x"]))
+    backend.shutdown()
+    assert fake_model.instances[0].options == {"device": "cpu", "backend": "onnx"}
+
+
+def test_warm_up_only_runs_for_local_backend(fake_model, settings, monkeypatch):
+    settings.set(EMBEDDING_BACKEND="openai", LOCAL_EMBEDDING_WARMUP=True)
+    assert asyncio.run(warm_up_embedding_backend()) is None
+
+    backend = LocalEmbeddingBackend("all-MiniLM")
+    monkeypatch.setattr(local_embedding, "get_local_embedding_backend", lambda: backend)
+    settings.set(EMBEDDING_BACKEND="local")
+    assert asyncio.run(warm_up_embedding_backend()) is backend
+    assert fake_model.instances[0].encode_calls[0][0] == ["warm-up"]
+    backend.shutdown()
+
+    def broken():
+        raise RuntimeError("model not found")
+
+    monkeypatch.setattr(local_embedding, "get_local_embedding_backend", broken)
+    assert asyncio.run(warm_up_embedding_backend()) is None
+
+
+def test_local_backend_failure_does_not_fall_back_to_openai(settings, monkeypatch):
+    settings.set(EMBEDDING_BACKEND="local", EMBEDDING_CACHE_ENABLED=False, LOCAL_EMBEDDING_MODEL="all-MiniLM")
+    get_embedding_cache.cache_clear()
+    monkeypatch.setattr(local_embedding, "SENTENCE_TRANSFORMERS_AVAILABLE", False)
+    local_embedding.get_local_embedding_backend.cache_clear()
+    try:
+        service = EmbeddingService()
+    finally:
+        local_embedding.get_local_embedding_backend.cache_clear()
+        get_embedding_cache.cache_clear()
+
+    assert service.local_backend is None and service.embedding_model == "all-MiniLM"
+    assert asyncio.run(service.create_embeddings(["rsa"])) == []
+
+
+def test_collection_is_tagged_and_mismatched_model_is_rejected(tmp_path):
+    path = str(tmp_path)
+    store = VectorStore("model_tag_test", persist_directory=path, embedding_model="model-a")
+    assert asyncio.run(store.add_documents(["RSA"], [[1.0, 0.0]], [{"type": "t"}]))
+    assert store.embedding_model == "model-a"
+
+    other = VectorStore("model_tag_test", persist_directory=path, embedding_model="model-b")
+    info = asyncio.run(other.get_collection_info())
+    assert info["embedding_model"] == "model-a" and info["model_mismatch"] is True
+    assert asyncio.run(other.search_similar([1.0, 0.0], top_k=1))["documents"] == []
+    assert asyncio.run(other.add_documents(["ECDSA"], [[0.0, 1.0]], [{"type": "t"}])) is False
+    assert asyncio.run(other.upsert_documents(["ECDSA"], [[0.0, 1.0]], [{"type": "t"}], ["id-1"])) == 0
+    assert asyncio.run(store.search_similar([1.0, 0.0], top_k=1))["documents"] == ["RSA"]
+
+
+def test_cleared_collection_is_retagged_on_first_write(tmp_path):
+    path = str(tmp_path)
+    original = VectorStore("retag_test", persist_directory=path, embedding_model="model-a")
+    assert asyncio.run(original.add_documents(["RSA"], [[1.0, 0.0]], [{"type": "t"}]))
+    store = VectorStore("retag_test", persist_directory=path, embedding_model="model-b")
+    assert asyncio.run(store.clear_collection())
+
+    assert asyncio.run(store.upsert_documents(["RSA"], [[1.0, 0.0]], [{"type": "t"}], ["id-1"])) == 1
+    assert store.embedding_model == "model-b"
+    assert asyncio.run(store.search_similar([1.0, 0.0], top_k=1))["ids"] == ["id-1"]
+
+
+def test_untagged_collection_is_treated_as_legacy_openai_model(tmp_path):
+    path = str(tmp_path)
+    # 태그 도입 전에 만든 컬렉션처럼 메타데이터 없이 직접 생성합니다.
+    VectorStore("other_test", persist_directory=path).client.create_collection("legacy_test")
+
+    legacy = VectorStore("legacy_test", persist_directory=path, embedding_model=LEGACY_EMBEDDING_MODEL)
+    assert legacy.embedding_model == LEGACY_EMBEDDING_MODEL
+    mismatched = VectorStore("legacy_test", persist_directory=path, embedding_model="all-MiniLM")
+    assert asyncio.run(mismatched.get_collection_info())["model_mismatch"] is True
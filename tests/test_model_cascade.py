@@ -0,0 +1,123 @@
+# File: tests/test_model_cascade.py
+# 저렴한 모델의 답을 채택하거나 강한 모델로 다시 호출하는 캐스케이드 판단과,
+# 에이전트가 오케스트레이터의 사전 스캔 결과를 재사용하는지 검증합니다.
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+from pqc_inspector_server.agents.logs_config import LogsConfigAgent
+from pqc_inspector_server.orchestrator.controller import OrchestratorController
+from pqc_inspector_server.services.model_cascade import ModelCascade, get_cascade_model
+from pqc_inspector_server.services.signature_scanner import get_signature_scanner
+from tests.fakes import FakeAgent, FakeAIService, FakeAPIClient
+
+
+def answer(vulnerable=True, confidence=0.9, algorithms=("RSA",), trailer=" 이상입니다."):
+    body = {"is_pqc_vulnerable": vulnerable, "confidence_score": confidence, "detected_algorithms": list(algorithms)}
+    return {"success": True, "content": "결과: " + json.dumps(body) + trailer}
+
+
+def run_cascade(cheap_response, scan=None, strong_response=None):
+    cascade = ModelCascade(min_confidence=0.8)
+    calls = []
+
+    async def call(model):
+        calls.append(model)
+        return cheap_response if model == "cheap" else (strong_response or answer(confidence=0.99))
+
+    response = asyncio.run(cascade.run("source_code", "cheap", "strong", call, scan))
+    return cascade, calls, response
+
+
+def scan_of(*signatures):
+    return {"has_hits": bool(signatures), "hits": [{"signature": signature, "count": 1} for signature in signatures]}
+
+
+def test_confident_cheap_answer_is_accepted():
+    cascade, calls, response = run_cascade(answer(), scan_of("rsa_generate_key"))
+    assert calls == ["cheap"]
+    assert response["cascade_tier"] == "cheap" and response["cascade_escalation_reason"] is None
+    assert cascade.get_stats()["agents"]["source_code"]["cheap_hit_rate"] == 1.0
+
+
+@pytest.mark.parametrize("cheap_response, scan, reason", [
+    ({"success": False, "error": "down"}, None, "호출 실패"),
+    ({"success": True, "content": "JSON이 아닌 답"}, None, "JSON 파싱 실패"),
+    (answer(confidence=0.5), None, "신뢰도 부족"),
+    (answer(confidence="not a number"), None, "신뢰도 부족"),
+    ({"success": True, "content": '{"confidence_score": 0.9}'}, None, "판정 필드 없음"),
+    (answer(), scan_of("crypt", "ssl"), "정적 스캔 불일치"),
+    (answer(algorithms=("RSA",)), scan_of("secp256r1"), "정적 스캔 불일치"),
+    (answer(vulnerable=False, algorithms=()), scan_of("rsa"), "정적 스캔 불일치"),
+])
+def test_escalates_to_strong_model(cheap_response, scan, reason):
+    cascade, calls, response = run_cascade(cheap_response, scan)
+    assert calls == ["cheap", "strong"]
+    assert response["cascade_tier"] == "strong"
+    assert response["cascade_escalation_reason"].startswith(reason)
+    stats = cascade.get_stats()["agents"]["source_code"]
+    assert stats["escalated"] == 1 and stats["escalation_reasons"] == {reason: 1}
+
+
+def test_string_confidence_is_accepted():
+    _, calls, _ = run_cascade(answer(confidence="0.95"), scan_of("rsa"))
+    assert calls == ["cheap"]
+
+
+def test_cascade_model_selection(settings):
+    settings.set(LLM_CASCADE_ENABLED=True, SOURCE_CODE_CASCADE_MODEL="llama3:8b", LOG_CONF_CASCADE_MODEL="")
+    assert get_cascade_model("source_code") == "llama3:8b"
+    assert get_cascade_model("logs_config") is None
+    assert get_cascade_model("unknown") is None
+
+    settings.set(LLM_CASCADE_ENABLED=False)
+    assert get_cascade_model("source_code") is None
+
+
+@pytest.fixture
+def cascade_agent(settings):
+    """저렴한 모델이 '취약하지 않음'으로 확신하는 답을 돌려주는 캐스케이드 모드 에이전트"""
+    settings.set(LLM_CASCADE_ENABLED=True, LOG_CONF_CASCADE_MODEL="cheap-model")
+    body = json.dumps({"is_pqc_vulnerable": False, "confidence_score": 0.95, "detected_algorithms": []})
+    service = FakeAIService(content=body)
+    return LogsConfigAgent(ai_service=service), service
+
+
+def test_agent_uses_the_given_scan_without_rescanning(cascade_agent, monkeypatch):
+    agent, service = cascade_agent
+    monkeypatch.setattr(get_signature_scanner(), "scan", lambda *args, **kwargs: pytest.fail("다시 스캔함"))
+
+    response = asyncio.run(agent._call_llm("prompt", file_content="ssl_protocols TLSv1.3;", scan=scan_of("rsa")))
+    assert [call["model"] for call in service.calls] == ["cheap-model", agent.model_name]
+    assert response["cascade_escalation_reason"].startswith("정적 스캔 불일치")
+
+
+def test_agent_without_scan_scans_off_loop_and_skips_prefilter_stats(cascade_agent, monkeypatch):
+    agent, _ = cascade_agent
+    scanner = get_signature_scanner()
+    original_scan, seen = scanner.scan, []
+
+    def recording_scan(content, record_stats=True):
+        seen.append((threading.current_thread() is threading.main_thread(), record_stats))
+        return original_scan(content, record_stats=record_stats)
+
+    monkeypatch.setattr(scanner, "scan", recording_scan)
+    before = dict(scanner.stats)
+    response = asyncio.run(agent._call_llm("prompt", file_content="RSA_generate_key_ex(rsa, 2048, e, NULL);"))
+
+    assert seen == [(False, False)]
+    assert scanner.stats == before
+    assert response["cascade_escalation_reason"].startswith("정적 스캔 불일치")
+
+
+def test_orchestrator_passes_its_prefilter_scan_to_the_agent(settings):
+    settings.set(PREFILTER_ENABLED=True, PREFILTER_FILE_TYPES=["source_code"])
+    agent = FakeAgent()
+    controller = OrchestratorController(FakeAPIClient({}), agents={"source_code": agent}, ai_service=FakeAIService())
+
+    stage = asyncio.run(controller._run_agent_stage("source_code", "RSA_generate_key_ex(rsa, 2048);", "key.c"))
+    assert stage["status"] == "success"
+    assert agent.scans[0]["has_hits"] and "rsa" in [hit["signature"] for hit in agent.scans[0]["hits"]]
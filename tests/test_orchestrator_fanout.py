@@ -0,0 +1,80 @@
+# File: tests/test_orchestrator_fanout.py
+# analyze_from_db의 에이전트 동시 실행, 에이전트별 타임아웃/오류 격리를 검증합니다.
+
+import asyncio
+
+from pqc_inspector_server.orchestrator.controller import OrchestratorController
+from pqc_inspector_server.services.result_store import MemoryResultStore
+from tests.fakes import FakeAgent, FakeAIService, FakeAPIClient
+
+DB_DATA = {
+    "assembly_text": "call RSA_public_encrypt",
+    "generated_code": "from Crypto.PublicKey import RSA\nkey = RSA.generate(2048)",
+    "logs": "TLS handshake ECDHE-RSA-AES128-GCM-SHA256"
+}
+
+
+def make_controller(agents, ai_service=None, data=None):
+    return OrchestratorController(
+        api_client=FakeAPIClient(DB_DATA if data is None else data),
+        agents=agents,
+        ai_service=ai_service or FakeAIService(),
+        result_store=MemoryResultStore()
+    )
+
+
+def test_agents_run_concurrently(settings):
+    settings.set(AGENT_CONCURRENT_FANOUT=True, PREFILTER_ENABLED=False)
+    agents = {name: FakeAgent(delay=0.3) for name in ("assembly_binary", "source_code", "logs_config")}
+
+    result = asyncio.run(make_controller(agents).analyze_from_db(1, 2))
+
+    assert result["success"]
+    # 순차 실행이면 0.9초 이상 걸립니다.
+    assert result["timings"]["agent_stage"] < 0.75
+    assert all(status["status"] == "success" for status in result["agent_statuses"].values())
+
+
+def test_sequential_mode_runs_one_after_another(settings):
+    settings.set(AGENT_CONCURRENT_FANOUT=False, PREFILTER_ENABLED=False)
+    agents = {name: FakeAgent(delay=0.1) for name in ("assembly_binary", "source_code", "logs_config")}
+
+    result = asyncio.run(make_controller(agents).analyze_from_db(1, 2))
+
+    assert result["timings"]["agent_stage"] >= 0.3
+
+
+def test_timeout_and_error_are_isolated_per_agent(settings):
+    settings.set(AGENT_CONCURRENT_FANOUT=True, PREFILTER_ENABLED=False, AGENT_TIMEOUT_SECONDS=0.2)
+    agents = {
+        "assembly_binary": FakeAgent(delay=5.0),
+        "source_code": FakeAgent(error=RuntimeError("boom")),
+        "logs_config": FakeAgent()
+    }
+    ai_service = FakeAIService()
+
+    result = asyncio.run(make_controller(agents, ai_service).analyze_from_db(1, 2))
+
+    statuses = result["agent_statuses"]
+    assert statuses["assembly_binary"]["status"] == "timeout"
+    assert statuses["source_code"] == {"status": "error", "error": "boom"}
+    assert statuses["logs_config"]["status"] == "success"
+    assert result["success"]
+    assert result["timings"]["agent_stage"] < 1.0
+    assert len(ai_service.calls) == 1
+
+
+def test_missing_inputs_are_not_dispatched(settings):
+    settings.set(PREFILTER_ENABLED=False)
+    agents = {name: FakeAgent() for name in ("assembly_binary", "source_code", "logs_config")}
+
+    result = asyncio.run(make_controller(agents, data={"generated_code": "import rsa"}).analyze_from_db(1, 2))
+
+    assert list(result["agent_statuses"]) == ["source_code"]
+    assert agents["assembly_binary"].calls == [] and agents["logs_config"].calls == []
+
+
+def test_no_data_returns_error():
+    agents = {name: FakeAgent() for name in ("assembly_binary", "source_code", "logs_config")}
+    result = asyncio.run(make_controller(agents, data={}).analyze_from_db(1, 2))
+    assert result == {"success": False, "error": "DB에 분석할 데이터가 없습니다."}
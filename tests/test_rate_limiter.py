@@ -0,0 +1,135 @@
+# File: tests/test_rate_limiter.py
+# 제공자별 동시성/RPM/TPM 제한이 요청을 실패시키지 않고 대기시키는지 검증합니다.
+
+import asyncio
+import time
+
+from pqc_inspector_server.services.rate_limiter import (
+    AsyncTokenBucket, ProviderLimiter, RateLimiterRegistry, estimate_tokens
+)
+
+
+def test_estimate_tokens_counts_roughly_four_chars_per_token():
+    assert estimate_tokens() == 1
+    assert estimate_tokens("a" * 400) == 101
+    assert estimate_tokens("a" * 200, None, "b" * 200) == 101
+
+
+def test_token_bucket_waits_for_refill():
+    async def scenario():
+        # 분당 600개 = 초당 10개, 용량 1 → 두 번째 획득은 약 0.1초 대기해야 합니다.
+        bucket = AsyncTokenBucket(600, capacity=1)
+        await bucket.acquire(1)
+        start = time.monotonic()
+        await bucket.acquire(1)
+        return time.monotonic() - start
+
+    assert 0.07 <= asyncio.run(scenario()) < 0.5
+
+
+def test_token_bucket_caps_oversized_requests_at_capacity():
+    async def scenario():
+        bucket = AsyncTokenBucket(60000, capacity=10)
+        await asyncio.wait_for(bucket.acquire(1000), timeout=1.0)
+        return bucket.tokens
+
+    assert asyncio.run(scenario()) < 1
+
+
+def test_token_bucket_adjust_refunds_and_charges():
+    async def scenario():
+        bucket = AsyncTokenBucket(60, capacity=100)
+        await bucket.acquire(50)
+        bucket.adjust(-30)  # 실제 사용량이 추정치보다 적으면 돌려받습니다.
+        refunded = bucket.tokens
+        bucket.adjust(200)  # 더 많이 썼으면 추가로 차감합니다 (음수까지 허용).
+        return refunded, bucket.tokens
+
+    refunded, charged = asyncio.run(scenario())
+    assert 79 < refunded <= 81
+    assert charged < -100
+
+
+def test_limiter_caps_concurrency():
+    async def scenario():
+        limiter = ProviderLimiter("test", max_concurrency=2)
+        active = peak = 0
+
+        async def call():
+            nonlocal active, peak
+            async with limiter.limit():
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.02)
+                active -= 1
+
+        await asyncio.gather(*(call() for _ in range(6)))
+        return peak, limiter.get_stats()
+
+    peak, stats = asyncio.run(scenario())
+    assert peak == 2
+    assert stats["requests"] == 6
+    assert stats["queued_requests"] >= 4
+    assert stats["in_flight"] == 0 and stats["waiting"] == 0
+
+
+def test_limiter_releases_slot_on_error():
+    async def scenario():
+        limiter = ProviderLimiter("test", max_concurrency=1)
+        try:
+            async with limiter.limit():
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+        async with limiter.limit() as waited:
+            return waited
+
+    assert asyncio.run(asyncio.wait_for(scenario(), timeout=1.0)) < 0.05
+
+
+def test_limiter_rpm_queues_requests_instead_of_failing():
+    async def scenario():
+        # 분당 1200회 = 초당 20회, 버킷 용량 1200이므로 미리 비워 두고 측정합니다.
+        limiter = ProviderLimiter("test", rpm=1200)
+        limiter._request_bucket.tokens = 0
+        start = time.monotonic()
+        for _ in range(3):
+            async with limiter.limit():
+                pass
+        return time.monotonic() - start
+
+    assert 0.1 <= asyncio.run(scenario()) < 1.0
+
+
+def test_limiter_tpm_waits_for_token_budget():
+    async def scenario():
+        limiter = ProviderLimiter("test", tpm=6000)  # 초당 100토큰
+        limiter._token_bucket.tokens = 0
+        async with limiter.limit(estimated_tokens=20) as waited:
+            return waited
+
+    assert 0.15 <= asyncio.run(scenario()) < 1.0
+
+
+def test_unlimited_limiter_does_not_wait():
+    async def scenario():
+        limiter = ProviderLimiter("test")
+        async with limiter.limit(estimated_tokens=10 ** 9) as waited:
+            return waited
+
+    assert asyncio.run(scenario()) < 0.01
+
+
+def test_registry_prefers_model_limits_and_shares_provider_limiter():
+    registry = RateLimiterRegistry(
+        provider_limits={"openai": {"max_concurrency": 4, "rpm": 100}},
+        model_limits={"gpt-4o": {"max_concurrency": 1}}
+    )
+    shared = registry.get("openai", "gpt-4o-mini")
+    assert registry.get("openai", "gpt-4.1-mini") is shared
+    assert shared.max_concurrency == 4 and shared.rpm == 100
+
+    dedicated = registry.get("openai", "gpt-4o")
+    assert dedicated is not shared
+    assert dedicated.name == "model:gpt-4o" and dedicated.max_concurrency == 1
+    assert set(registry.get_stats()) == {"openai", "model:gpt-4o"}
@@ -0,0 +1,250 @@
+# File: tests/test_resilience.py
+# 재시도 정책, 서킷 브레이커 상태 전이, 헤지 요청과 AIService의 복원력 호출 경로를 검증합니다.
+
+import asyncio
+
+import pytest
+
+from pqc_inspector_server.services.ai_service import AIService
+from pqc_inspector_server.services.resilience import (
+    CircuitBreaker, LatencyTracker, ResilienceRegistry, RetryPolicy, hedged_call,
+    is_provider_failure, is_retryable
+)
+
+
+def make_service(failures: int = 1, reset_timeout: float = 0.0) -> AIService:
+    service = AIService()
+    service.resilience = ResilienceRegistry(failure_threshold=failures, reset_timeout=reset_timeout)
+    return service
+
+
+def open_breaker(service: AIService, provider: str = "openai") -> CircuitBreaker:
+    breaker = service.resilience.breaker(provider)
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    return breaker
+
+
+def test_retryable_and_provider_failure_classification():
+    assert is_retryable({"success": False, "status_code": 503})
+    assert is_retryable({"success": False, "transient": True})
+    assert not is_retryable({"success": False, "status_code": 400})
+    assert not is_retryable({"success": True, "status_code": 503})
+
+    assert is_provider_failure({"success": False, "status_code": 500})
+    # 요청 한도 초과는 재시도하지만 제공자 장애로 보지 않습니다.
+    assert is_retryable({"success": False, "status_code": 429})
+    assert not is_provider_failure({"success": False, "status_code": 429})
+
+
+def test_backoff_is_bounded_and_respects_retry_after():
+    policy = RetryPolicy(max_attempts=5, base_delay=0.5, max_delay=4.0)
+    for attempt in range(10):
+        assert 0.0 <= policy.backoff(attempt) <= min(4.0, 0.5 * 2 ** attempt)
+    assert policy.backoff(0, retry_after=2.5) == 2.5
+    assert policy.backoff(0, retry_after=60) == 4.0
+
+
+def test_breaker_opens_after_threshold_and_recovers_through_half_open():
+    breaker = CircuitBreaker("p", failure_threshold=2, reset_timeout=0.0)
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED and breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    # reset_timeout 경과 후 시험 요청 하나만 허용합니다.
+    assert breaker.allow_request()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow_request()
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow_request() and breaker.allow_request()
+
+
+def test_breaker_rejects_while_open_and_reopens_on_failed_probe():
+    breaker = CircuitBreaker("p", failure_threshold=1, reset_timeout=60.0)
+    breaker.record_failure()
+    assert not breaker.allow_request()
+    assert breaker.get_stats()["rejected"] == 1
+
+    breaker.opened_at -= 60.0
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+
+
+def test_release_probe_allows_next_trial_request():
+    breaker = CircuitBreaker("p", failure_threshold=1, reset_timeout=0.0)
+    breaker.record_failure()
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+
+    breaker.release_probe()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow_request()
+
+
+def test_release_probe_is_noop_when_closed():
+    breaker = CircuitBreaker("p")
+    breaker.release_probe()
+    assert breaker.state == CircuitBreaker.CLOSED and breaker.allow_request()
+
+
+def test_latency_tracker_percentile():
+    tracker = LatencyTracker(window=100)
+    assert tracker.percentile(0.95) is None
+    for value in range(1, 101):
+        tracker.record(value / 100)
+    assert tracker.percentile(0.95) == 0.96
+    assert len(tracker) == 100
+
+
+def test_hedged_call_returns_fast_first_response_without_hedging():
+    calls = []
+
+    async def call():
+        calls.append(1)
+        return {"success": True, "content": "fast"}
+
+    response = asyncio.run(hedged_call(call, hedge_delay=1.0))
+    assert response["content"] == "fast" and "hedged" not in response
+    assert len(calls) == 1
+
+
+def test_hedged_call_second_request_wins_and_first_is_cancelled():
+    cancelled = []
+    delays = [1.0, 0.01]
+
+    async def call():
+        delay = delays.pop(0)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled.append(delay)
+            raise
+        return {"success": True, "content": delay}
+
+    response = asyncio.run(hedged_call(call, hedge_delay=0.02))
+    assert response["hedged"] and response["hedge_won"]
+    assert response["content"] == 0.01
+    assert cancelled == [1.0]
+
+
+def test_cancelled_caller_during_hedge_delay_cancels_first_request():
+    started, cancelled = [], []
+
+    async def call():
+        started.append(1)
+        try:
+            await asyncio.sleep(1.0)
+        except asyncio.CancelledError:
+            cancelled.append(1)
+            raise
+        return {"success": True}
+
+    async def scenario():
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(hedged_call(call, hedge_delay=0.5), 0.1)
+        await asyncio.sleep(0.01)  # asyncio.run이 남은 작업을 정리하기 전에 확인합니다.
+        return len(started), len(cancelled)
+
+    assert asyncio.run(scenario()) == (1, 1)
+
+
+def test_retries_transient_errors_then_succeeds(settings):
+    settings.set(LLM_RETRY_MAX_ATTEMPTS=3, LLM_RETRY_BASE_DELAY=0.0, LLM_HEDGE_ENABLED=False)
+    service = make_service(failures=5)
+    responses = [{"success": False, "status_code": 503, "error": "unavailable"},
+                 {"success": True, "content": "ok"}]
+
+    async def fake_call(*args, **kwargs):
+        return responses.pop(0)
+
+    service._call_limited = fake_call
+    response = asyncio.run(service._call_with_resilience("openai", "gpt-4o-mini", "p", None, 0.1))
+    assert response["success"] and response["attempts"] == 2
+    assert service.resilience.stats["retries"] == 1
+
+
+def test_does_not_retry_client_errors(settings):
+    settings.set(LLM_RETRY_MAX_ATTEMPTS=3, LLM_RETRY_BASE_DELAY=0.0, LLM_HEDGE_ENABLED=False)
+    service = make_service(failures=5)
+    calls = []
+
+    async def fake_call(*args, **kwargs):
+        calls.append(1)
+        return {"success": False, "status_code": 400, "error": "bad request"}
+
+    service._call_limited = fake_call
+    response = asyncio.run(service._call_with_resilience("openai", "gpt-4o-mini", "p", None, 0.1))
+    assert not response["success"] and response["attempts"] == 1
+    assert len(calls) == 1
+
+
+def test_open_breaker_short_circuits_without_calling_provider(settings):
+    settings.set(LLM_HEDGE_ENABLED=False)
+    service = make_service(failures=1, reset_timeout=60.0)
+    open_breaker(service)
+
+    async def fake_call(*args, **kwargs):
+        raise AssertionError("제공자를 호출하면 안 됩니다")
+
+    service._call_limited = fake_call
+    response = asyncio.run(service._call_with_resilience("openai", "gpt-4o-mini", "p", None, 0.1))
+    assert response["circuit_open"]
+    assert service.resilience.stats["circuit_rejections"] == 1
+
+
+def test_rate_limited_probe_does_not_wedge_breaker(settings):
+    settings.set(LLM_RETRY_MAX_ATTEMPTS=1, LLM_HEDGE_ENABLED=False)
+    service = make_service(failures=1, reset_timeout=0.0)
+    breaker = open_breaker(service)
+    responses = [{"success": False, "status_code": 429, "error": "rate limited"},
+                 {"success": True, "content": "ok"}]
+
+    async def fake_call(*args, **kwargs):
+        return responses.pop(0)
+
+    service._call_limited = fake_call
+
+    async def scenario():
+        first = await service._call_with_resilience("openai", "gpt-4o-mini", "p", None, 0.1)
+        # 429로 끝난 시험 요청 뒤에도 반열림 상태로 남아 다음 요청이 다시 시험될 수 있어야 합니다.
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        second = await service._call_with_resilience("openai", "gpt-4o-mini", "p", None, 0.1)
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert first["status_code"] == 429
+    assert second["success"]
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_cancelled_probe_does_not_wedge_breaker(settings):
+    settings.set(LLM_RETRY_MAX_ATTEMPTS=1, LLM_HEDGE_ENABLED=False)
+    service = make_service(failures=1, reset_timeout=0.0)
+    breaker = open_breaker(service)
+
+    async def slow_call(*args, **kwargs):
+        await asyncio.sleep(10)
+
+    async def fast_call(*args, **kwargs):
+        return {"success": True, "content": "ok"}
+
+    async def scenario():
+        service._call_limited = slow_call
+        # 실패 전환(failover)의 시도별 타임아웃처럼 바깥에서 시험 요청을 취소합니다.
+        try:
+            await asyncio.wait_for(service._call_with_resilience("openai", "gpt-4o-mini", "p", None, 0.1), 0.05)
+        except asyncio.TimeoutError:
+            pass
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+
+        service._call_limited = fast_call
+        return await service._call_with_resilience("openai", "gpt-4o-mini", "p", None, 0.1)
+
+    response = asyncio.run(scenario())
+    assert response["success"]
+    assert breaker.state == CircuitBreaker.CLOSED
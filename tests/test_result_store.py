@@ -0,0 +1,112 @@
+# File: tests/test_result_store.py
+# 작업 결과 저장소(메모리/SQLite)의 생성·갱신·조회, TTL 만료, 크기 제한을 검증합니다.
+
+import asyncio
+import time
+
+import pytest
+
+from pqc_inspector_server.services.result_store import MemoryResultStore, SQLiteResultStore, TaskStatus
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        yield MemoryResultStore(max_entries=100, ttl_seconds=60.0)
+    else:
+        sqlite_store = SQLiteResultStore(str(tmp_path / "results.db"), ttl_seconds=60.0)
+        yield sqlite_store
+        asyncio.run(sqlite_store.close())
+
+
+def test_create_update_get_round_trip(store):
+    async def scenario():
+        created = await store.create("t1")
+        assert created["status"] == TaskStatus.PENDING and created["result"] is None
+        await store.update("t1", TaskStatus.RUNNING)
+        await store.update("t1", TaskStatus.DONE, result={"score": 0.9, "이름": "결과"})
+        return await store.get("t1")
+
+    record = asyncio.run(scenario())
+    assert record["status"] == TaskStatus.DONE
+    assert record["result"] == {"score": 0.9, "이름": "결과"}
+    assert record["error"] is None
+    assert record["updated_at"] >= record["created_at"]
+
+
+def test_status_update_keeps_earlier_result_and_error(store):
+    async def scenario():
+        await store.create("t1")
+        await store.update("t1", TaskStatus.FAILED, error="boom")
+        await store.update("t1", TaskStatus.FAILED)
+        return await store.get("t1")
+
+    record = asyncio.run(scenario())
+    assert record["status"] == TaskStatus.FAILED and record["error"] == "boom"
+
+
+def test_update_without_create_inserts_record(store):
+    async def scenario():
+        await store.update("orphan", TaskStatus.RUNNING)
+        return await store.get("orphan")
+
+    assert asyncio.run(scenario())["status"] == TaskStatus.RUNNING
+
+
+def test_unknown_and_expired_tasks_return_none(store):
+    async def scenario():
+        assert await store.get("missing") is None
+        await store.create("old")
+        store.ttl_seconds = -1.0  # 이미 만료된 것으로 취급
+        return await store.get("old")
+
+    assert asyncio.run(scenario()) is None
+    assert store.get_stats()["expired"] >= 1
+
+
+def test_memory_store_evicts_least_recently_updated():
+    store = MemoryResultStore(max_entries=3, ttl_seconds=60.0)
+
+    async def scenario():
+        for task_id in ("a", "b", "c"):
+            await store.create(task_id)
+        await store.update("a", TaskStatus.RUNNING)  # a가 가장 최근 갱신
+        await store.create("d")
+        return [await store.get(task_id) is not None for task_id in ("a", "b", "c", "d")]
+
+    assert asyncio.run(scenario()) == [True, False, True, True]
+    assert store.get_stats()["evicted"] == 1 and store.get_stats()["entries"] == 3
+
+
+def test_sqlite_store_is_shared_between_instances(tmp_path):
+    path = str(tmp_path / "shared.db")
+    writer, reader = SQLiteResultStore(path), SQLiteResultStore(path)
+    try:
+        async def scenario():
+            await writer.create("t1")
+            await writer.update("t1", TaskStatus.DONE, result={"ok": True})
+            return await reader.get("t1")
+
+        assert asyncio.run(scenario())["result"] == {"ok": True}
+    finally:
+        asyncio.run(writer.close())
+        asyncio.run(reader.close())
+
+
+def test_sqlite_store_purges_expired_rows_periodically(tmp_path):
+    store = SQLiteResultStore(str(tmp_path / "purge.db"), ttl_seconds=60.0)
+    try:
+        old = time.time() - 3600
+        store._conn.execute("INSERT INTO task_results VALUES ('stale', 'done', NULL, NULL, ?, ?)", (old, old))
+        store._conn.commit()
+
+        async def scenario():
+            for index in range(SQLiteResultStore.PURGE_EVERY_WRITES):
+                await store.create(f"t{index}")
+
+        asyncio.run(scenario())
+        stats = store.get_stats()
+        assert stats["expired"] == 1
+        assert stats["entries"] == SQLiteResultStore.PURGE_EVERY_WRITES
+    finally:
+        asyncio.run(store.close())
@@ -0,0 +1,99 @@
+# File: tests/test_singleflight.py
+# 동일 키의 동시 호출이 하나의 실행으로 합쳐지고, 취소/예외가 다른 호출자에게 올바르게 전달되는지 검증합니다.
+
+import asyncio
+
+from pqc_inspector_server.services.ai_service import AIService
+from pqc_inspector_server.services.http_client_pool import HTTPClientPool
+from pqc_inspector_server.services.singleflight import SingleFlight
+from tests.fakes import OpenAIStubServer
+
+
+def test_concurrent_calls_share_one_execution():
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "result"
+
+    async def scenario():
+        group = SingleFlight()
+        results = await asyncio.gather(*(group.do("k", work) for _ in range(10)))
+        return group, results
+
+    group, results = asyncio.run(scenario())
+    assert len(calls) == 1
+    assert [value for value, _ in results] == ["result"] * 10
+    assert sum(shared for _, shared in results) == 9
+    assert group.get_stats() == {"executed": 1, "coalesced": 9, "in_flight": 0}
+
+
+def test_different_keys_and_sequential_calls_run_separately():
+    calls = []
+
+    async def work():
+        calls.append(1)
+        return len(calls)
+
+    async def scenario():
+        group = SingleFlight()
+        await asyncio.gather(group.do("a", work), group.do("b", work))
+        await group.do("a", work)
+
+    asyncio.run(scenario())
+    assert len(calls) == 3
+
+
+def test_cancelled_leader_does_not_cancel_followers():
+    async def work():
+        await asyncio.sleep(0.05)
+        return "done"
+
+    async def scenario():
+        group = SingleFlight()
+        leader = asyncio.ensure_future(group.do("k", work))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(group.do("k", work))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await follower
+
+    assert asyncio.run(scenario()) == ("done", True)
+
+
+def test_exception_is_delivered_to_every_caller():
+    async def work():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def scenario():
+        group = SingleFlight()
+        results = await asyncio.gather(group.do("k", work), group.do("k", work), return_exceptions=True)
+        return group, results
+
+    group, results = asyncio.run(scenario())
+    assert all(isinstance(result, ValueError) for result in results)
+    assert group.get_stats()["in_flight"] == 0
+
+
+def test_identical_llm_calls_send_one_request(settings):
+    settings.set(LLM_CACHE_ENABLED=False, LLM_SINGLEFLIGHT_ENABLED=True, LLM_RATE_LIMIT_ENABLED=False,
+                 LLM_STREAMING_ENABLED=False)
+
+    async def scenario():
+        stub = OpenAIStubServer(lambda path, body: (200, OpenAIStubServer.completion("ok"), {}, 0.1))
+        service = AIService()
+        service.http_pool = HTTPClientPool()
+        service.singleflight = SingleFlight()
+        service.openai_base_url = await stub.start()
+        try:
+            responses = await asyncio.gather(*(service.generate_response("gpt-4.1", "same") for _ in range(5)))
+        finally:
+            await service.http_pool.aclose()
+            await stub.stop()
+        return responses, len(stub.requests)
+
+    responses, requests = asyncio.run(scenario())
+    assert requests == 1
+    assert sum(1 for response in responses if response.get("coalesced")) == 4
@@ -0,0 +1,105 @@
+# File: tests/test_validation_policy.py
+# 오케스트레이터 검증 생략 정책이 신뢰도, 파일 타입, 사전 스캔과 보고된 알고리즘의 일치 여부에 따라 결정되는지 검증합니다.
+
+import random
+
+import pytest
+
+from pqc_inspector_server.services.validation_policy import (
+    ValidationPolicy, public_key_families, scan_disagreement
+)
+
+
+def scan_of(*signatures):
+    hits = [{"signature": signature, "count": 1} for signature in signatures]
+    return {"has_hits": bool(hits), "hits": hits}
+
+
+def agent_result(vulnerable=True, confidence=0.95, algorithms=("RSA-2048",)):
+    return {"is_pqc_vulnerable": vulnerable, "confidence_score": confidence, "detected_algorithms": list(algorithms)}
+
+
+def policy(**options):
+    options.setdefault("qa_sample_rate", 0.0)
+    return ValidationPolicy(min_confidence=0.85, **options)
+
+
+@pytest.mark.parametrize("text, families", [
+    ("RSA-2048", {"rsa"}),
+    ("ECDSA (P-256)", {"ecc"}),
+    ("Diffie-Hellman", {"dh"}),
+    ("const:curve25519", {"ecc"}),
+    ("evp_pkey_rsa", {"rsa"}),
+    ("AES-256", set()),
+    ("crypt", set()),
+    ("ssl", set()),
+    ("sha256", set()),
+])
+def test_public_key_families(text, families):
+    assert public_key_families(text) == families
+
+
+def test_generic_crypto_hits_do_not_confirm_vulnerable_verdict():
+    reason = scan_disagreement(True, scan_of("crypt", "ssl", "hmac", "sha256"), ["RSA"])
+    assert reason == "취약 판정이지만 공개키 시그니처 없음"
+
+
+def test_vulnerable_verdict_needs_hit_from_reported_family():
+    assert scan_disagreement(True, scan_of("rsa_generate_key_ex", "ssl"), ["RSA-2048"]) is None
+    assert scan_disagreement(True, scan_of("const:rsa"), "RSA") is None
+    reason = scan_disagreement(True, scan_of("secp256r1"), ["RSA-2048"])
+    assert reason.startswith("보고된 알고리즘(RSA-2048)과 일치하는 시그니처 없음")
+
+
+def test_vulnerable_verdict_without_public_key_algorithm_disagrees():
+    reason = scan_disagreement(True, scan_of("rsa"), ["AES-128", "SHA-1"])
+    assert reason.startswith("취약 판정이지만 보고된 공개키 알고리즘 없음")
+    assert scan_disagreement(True, scan_of("rsa"), []).startswith("취약 판정이지만 보고된 공개키 알고리즘 없음")
+
+
+def test_safe_verdict_disagrees_with_public_key_hits():
+    assert scan_disagreement(False, scan_of("sha256", "ssl"), []) is None
+    assert "rsa" in scan_disagreement(False, scan_of("rsa"), [])
+
+
+def test_high_confidence_matching_verdict_skips_validation():
+    decision = policy().decide("source_code", agent_result(), scan_of("rsa", "crypt"))
+    assert not decision.validate
+
+
+def test_high_confidence_vulnerable_verdict_with_only_generic_hits_is_validated():
+    decision = policy().decide("source_code", agent_result(), scan_of("crypt", "tls", "sha256"))
+    assert decision.validate and decision.reason == "사전 스캔 불일치"
+
+
+def test_string_confidence_is_converted():
+    decision = policy().decide("source_code", agent_result(confidence="0.95"), scan_of("rsa"))
+    assert not decision.validate
+
+    decision = policy().decide("source_code", agent_result(confidence="high"), scan_of("rsa"))
+    assert decision.validate and decision.reason == "에이전트 결과 불완전"
+
+
+@pytest.mark.parametrize("result, file_type, scan, options, reason", [
+    ({"is_pqc_vulnerable": "yes", "confidence_score": 0.9}, "source_code", scan_of("rsa"), {}, "에이전트 결과 불완전"),
+    (agent_result(confidence=0.5), "source_code", scan_of("rsa"), {}, "신뢰도 부족"),
+    (agent_result(confidence=0.88), "assembly_binary", scan_of("rsa"),
+     {"file_type_min_confidence": {"assembly_binary": 0.9}}, "신뢰도 부족"),
+    (agent_result(), "logs_config", scan_of("rsa"), {"always_validate_types": ["logs_config"]}, "항상 검증하는 파일 타입"),
+    (agent_result(), "source_code", None, {}, "사전 스캔 결과 없음"),
+    (agent_result(), "source_code", scan_of("rsa"), {"enabled": False}, "정책 비활성화"),
+])
+def test_validation_reasons(result, file_type, scan, options, reason):
+    decision = policy(**options).decide(file_type, result, scan)
+    assert decision.validate and decision.reason == reason
+
+
+def test_qa_sampling_and_stats():
+    sampled = ValidationPolicy(qa_sample_rate=1.0, rng=random.Random(0))
+    assert sampled.decide("source_code", agent_result(), scan_of("rsa")).reason == "QA 샘플링"
+
+    engine = policy()
+    engine.decide("source_code", agent_result(), scan_of("rsa"))
+    engine.decide("source_code", agent_result(confidence=0.1), scan_of("rsa"))
+    stats = engine.get_stats()
+    assert stats["decisions"] == 2 and stats["skipped"] == 1 and stats["skip_rate"] == 0.5